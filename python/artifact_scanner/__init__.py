@@ -36,16 +36,19 @@ from artifact_scanner.errors import (
     ArchitecturalViolationError,
     ImmutabilityViolationError,
 )
-from artifact_scanner.scanner import Scanner
+from artifact_scanner.scanner import Scanner, ImmutabilityMode
 from artifact_scanner.loader import ArtifactLoader
 from artifact_scanner.aggregator import SignalAggregator
+from artifact_scanner.cache import ScanCache
 
 __all__ = [
     # Main Scanner
     "Scanner",
+    "ImmutabilityMode",
     # Supporting classes
     "ArtifactLoader",
     "SignalAggregator",
+    "ScanCache",
     # Types
     "SignalType",
     "Signal",
@@ -8,14 +8,71 @@ INVARIANTS:
 - No classification assigned
 - No confidence scoring
 
+Optional compaction collapses near-identical signals: endpoints are
+normalized to route templates (numeric, UUID and hash path segments become
+placeholders) and identical signals per template are merged into one
+signal carrying an occurrence count and sample URLs.
+
 This system assists humans. It does not autonomously hunt, judge, or earn.
 """
 
 from collections import defaultdict
+from typing import Any, Optional
+from urllib.parse import parse_qsl, urlsplit
+import json
+import re
 
 from artifact_scanner.types import Signal, FindingCandidate
 
 
+# Path segment patterns replaced by placeholders in route templates
+_NUMERIC_SEGMENT = re.compile(r"^\d+$")
+_UUID_SEGMENT = re.compile(
+    r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
+)
+_HASH_SEGMENT = re.compile(r"^[0-9a-fA-F]{16,}$")
+
+# Evidence keys that carry the concrete URL (moved into sample_urls)
+_URL_EVIDENCE_KEYS = ("url",)
+
+
+def template_url(url: str) -> str:
+    """Normalize a URL into a route template.
+    
+    Numeric, UUID and hex-hash path segments become ``{id}``, ``{uuid}``
+    and ``{hash}``. Query values are dropped and parameter names sorted;
+    the fragment is dropped. Values that are not absolute URLs (e.g.
+    "unknown") are returned unchanged.
+    
+    Args:
+        url: URL to normalize
+    
+    Returns:
+        Route template string
+    """
+    parts = urlsplit(url)
+    if not parts.scheme or not parts.netloc:
+        return url
+    
+    segments = []
+    for segment in parts.path.split("/"):
+        if _NUMERIC_SEGMENT.match(segment):
+            segments.append("{id}")
+        elif _UUID_SEGMENT.match(segment):
+            segments.append("{uuid}")
+        elif _HASH_SEGMENT.match(segment):
+            segments.append("{hash}")
+        else:
+            segments.append(segment)
+    template = f"{parts.scheme}://{parts.netloc}{'/'.join(segments)}"
+    
+    if parts.query:
+        names = sorted({name for name, _ in parse_qsl(parts.query, keep_blank_values=True)})
+        if names:
+            template += "?" + "&".join(f"{name}={{}}" for name in names)
+    return template
+
+
 class SignalAggregator:
     """Aggregates signals into finding candidates.
     
@@ -25,6 +82,88 @@ class SignalAggregator:
     - No confidence scoring
     """
     
+    def __init__(self, max_sample_urls: int = 5) -> None:
+        """Initialize aggregator.
+        
+        Args:
+            max_sample_urls: Concrete URLs kept per compacted signal
+        """
+        if max_sample_urls < 1:
+            raise ValueError("max_sample_urls must be >= 1")
+        self._max_sample_urls = max_sample_urls
+    
+    def compact(self, signals: list[Signal]) -> list[Signal]:
+        """Collapse identical signals per route template.
+        
+        Signals are identical when they share signal type, source artifact,
+        description, endpoint template and evidence (ignoring the concrete
+        URL). Each group of two or more becomes one signal whose endpoint
+        is the template and whose evidence adds ``url_template``,
+        ``occurrences`` and ``sample_urls``. Signals that do not repeat are
+        returned unchanged. Output keeps first-occurrence order.
+        
+        Args:
+            signals: Signals to compact
+        
+        Returns:
+            Compacted list of signals
+        """
+        groups: dict[tuple, list[Signal]] = {}
+        templates: dict[Optional[str], Optional[str]] = {}
+        
+        for signal in signals:
+            endpoint = signal.endpoint
+            template = templates.get(endpoint)
+            if template is None and endpoint is not None:
+                template = templates[endpoint] = template_url(endpoint)
+            key = (
+                signal.signal_type,
+                signal.source_artifact,
+                signal.description,
+                template,
+                self._evidence_key(signal.evidence),
+            )
+            groups.setdefault(key, []).append(signal)
+        
+        compacted: list[Signal] = []
+        for (_, _, _, template, _), group in groups.items():
+            if len(group) == 1:
+                compacted.append(group[0])
+            else:
+                compacted.append(self._merge(group, template))
+        return compacted
+    
+    @staticmethod
+    def _evidence_key(evidence: dict[str, Any]) -> str:
+        stripped = {k: v for k, v in evidence.items() if k not in _URL_EVIDENCE_KEYS}
+        return json.dumps(stripped, sort_keys=True, default=str)
+    
+    def _merge(self, group: list[Signal], template: Optional[str]) -> Signal:
+        """Build one signal standing for a group of identical signals."""
+        first = group[0]
+        samples: list[str] = []
+        for signal in group:
+            url = signal.evidence.get("url") or signal.endpoint
+            if url and url not in samples:
+                samples.append(url)
+                if len(samples) >= self._max_sample_urls:
+                    break
+        evidence = {
+            k: v for k, v in first.evidence.items() if k not in _URL_EVIDENCE_KEYS
+        }
+        evidence.update({
+            "url_template": template,
+            "occurrences": len(group),
+            "sample_urls": samples,
+        })
+        return Signal.create(
+            signal_type=first.signal_type,
+            source_artifact=first.source_artifact,
+            description=first.description,
+            evidence=evidence,
+            endpoint=template,
+        )
+    
     def aggregate(self, signals: list[Signal]) -> list[FindingCandidate]:
         """Group signals by endpoint into finding candidates.
         
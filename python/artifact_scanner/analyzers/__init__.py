@@ -12,12 +12,46 @@ INVARIANTS:
 This system assists humans. It does not autonomously hunt, judge, or earn.
 """
 
+from functools import lru_cache
+import hashlib
+
+from artifact_scanner.analyzers import console, har
 from artifact_scanner.analyzers.har import HARAnalyzer
 from artifact_scanner.analyzers.console import ConsoleAnalyzer
 from artifact_scanner.analyzers.trace import TraceAnalyzer
 
+# Bump whenever analyzer logic changes in a way that changes the signals
+# produced for the same input (pattern table edits are picked up
+# automatically by pattern_set_version()).
+ANALYZER_REVISION = 1
+
+
+@lru_cache(maxsize=None)
+def pattern_set_version() -> str:
+    """Version identifier for the analyzers' detection rules.
+    
+    SHA-256 over ANALYZER_REVISION and every pattern table, so cached
+    analysis results are invalidated when any rule changes.
+    """
+    def regex(pattern) -> str:
+        return f"{pattern.pattern}/{pattern.flags}"
+    
+    parts = [
+        f"revision={ANALYZER_REVISION}",
+        *(f"har.sensitive.{k}={regex(v)}" for k, v in sorted(har.SENSITIVE_PATTERNS.items())),
+        *(f"har.header.{k}={v}" for k, v in sorted(har.SECURITY_HEADERS.items())),
+        f"har.cors={regex(har.CORS_WILDCARD_PATTERN)}",
+        *(f"console.path={regex(p)}" for p in console.PATH_PATTERNS),
+        *(f"console.dom={regex(p)}" for p in console.DOM_ERROR_PATTERNS),
+        *(f"console.csp={regex(p)}" for p in console.CSP_VIOLATION_PATTERNS),
+    ]
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
 __all__ = [
     "HARAnalyzer",
     "ConsoleAnalyzer",
     "TraceAnalyzer",
+    "ANALYZER_REVISION",
+    "pattern_set_version",
 ]
@@ -12,7 +12,7 @@ This system assists humans. It does not autonomously hunt, judge, or earn.
 """
 
 import re
-from typing import Optional
+from typing import Iterable, Optional
 
 from artifact_scanner.loader import HARData, HAREntry
 from artifact_scanner.types import Signal, SignalType
@@ -77,12 +77,26 @@ class HARAnalyzer:
         Args:
             har_data: Parsed HAR data
         
+        Returns:
+            List of detected signals
+        """
+        return self.analyze_entries(har_data.entries)
+    
+    def analyze_entries(self, entries: Iterable[HAREntry]) -> list[Signal]:
+        """Extract signals from HAR entries, consuming them one at a time.
+        
+        Accepts any iterable, including ArtifactLoader.iter_har_entries, so
+        only the current entry needs to be held in memory.
+        
+        Args:
+            entries: HAR entries
+        
         Returns:
             List of detected signals
         """
         signals: list[Signal] = []
         
-        for entry in har_data.entries:
+        for entry in entries:
             # Detect sensitive data in responses
             signals.extend(self.detect_sensitive_data(entry))
             
@@ -0,0 +1,122 @@
+"""
+Phase-5 Scan Result Cache
+
+Content-addressed on-disk cache of per-artifact analysis results.
+
+An entry is keyed by the artifact's SHA-256, the analyzer kind chosen for
+it (HAR, console, trace) and the analyzers' pattern-set version. It holds
+the serialized Signal list for that artifact. A changed artifact has a new
+hash and so misses only its own entry; a rule change moves every lookup to
+a new version directory.
+
+INVARIANTS:
+- READ-ONLY with respect to artifacts: only the cache directory is written
+- Cached signals are re-issued with fresh ids and timestamps, exactly as
+  a new analysis would produce them
+
+This system assists humans. It does not autonomously hunt, judge, or earn.
+"""
+
+from pathlib import Path
+from typing import Optional
+import json
+import os
+import shutil
+import tempfile
+
+from artifact_scanner.analyzers import pattern_set_version
+from artifact_scanner.types import Signal
+
+
+class ScanCache:
+    """On-disk cache of analysis signals per artifact content hash.
+
+    Layout: ``<cache_dir>/<pattern version>/<hash[:2]>/<hash>.<kind>.json``
+    """
+
+    def __init__(self, cache_dir: str, pattern_version: Optional[str] = None) -> None:
+        """Initialize cache.
+
+        Args:
+            cache_dir: Directory for cache entries (must not be inside the
+                artifacts directory being scanned)
+            pattern_version: Override for the analyzers' pattern-set version
+        """
+        self._cache_dir = Path(cache_dir)
+        self._pattern_version = pattern_version or pattern_set_version()
+        self._version_dir = self._cache_dir / self._pattern_version[:16]
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def pattern_version(self) -> str:
+        return self._pattern_version
+
+    def _entry_path(self, content_hash: str, kind: str) -> Path:
+        return self._version_dir / content_hash[:2] / f"{content_hash}.{kind}.json"
+
+    def get(self, content_hash: str, kind: str, source_artifact: str) -> Optional[list[Signal]]:
+        """Look up cached signals for an artifact.
+
+        Args:
+            content_hash: SHA-256 of the artifact content
+            kind: Analyzer kind used for the artifact
+            source_artifact: Artifact path to attribute the signals to
+
+        Returns:
+            Freshly issued signals, or None on a miss (including unreadable
+            or corrupt entries)
+        """
+        try:
+            with open(self._entry_path(content_hash, kind), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            if entry["pattern_version"] != self._pattern_version:
+                raise ValueError("pattern version mismatch")
+            signals = [
+                Signal.create(
+                    signal_type=cached.signal_type,
+                    source_artifact=source_artifact,
+                    description=cached.description,
+                    evidence=cached.evidence,
+                    endpoint=cached.endpoint,
+                )
+                for cached in (Signal.from_dict(s) for s in entry["signals"])
+            ]
+        except (OSError, ValueError, KeyError, TypeError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return signals
+
+    def put(self, content_hash: str, kind: str, signals: list[Signal]) -> None:
+        """Store signals for an artifact (atomic replace; errors ignored).
+
+        Args:
+            content_hash: SHA-256 of the artifact content that was analyzed
+            kind: Analyzer kind used for the artifact
+            signals: Signals produced by the analysis
+        """
+        path = self._entry_path(content_hash, kind)
+        entry = {
+            "pattern_version": self._pattern_version,
+            "content_hash": content_hash,
+            "kind": kind,
+            "signals": [s.to_dict() for s in signals],
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(entry, f)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError):
+            # A cache write failure only costs a re-analysis next time
+            pass
+
+    def clear(self) -> None:
+        """Remove all cache entries for every pattern version."""
+        shutil.rmtree(self._cache_dir, ignore_errors=True)
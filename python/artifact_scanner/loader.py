@@ -14,9 +14,12 @@ This system assists humans. It does not autonomously hunt, judge, or earn.
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterator, NamedTuple, Optional
+import codecs
 import hashlib
 import json
+import os
+import re
 
 from artifact_scanner.errors import (
     ArtifactNotFoundError,
@@ -55,6 +58,33 @@ class HAREntry:
     response_headers: dict[str, str]
     response_content: str
     response_mime_type: str
+    
+    @classmethod
+    def from_dict(cls, entry: dict[str, Any]) -> "HAREntry":
+        """Parse one element of HAR log.entries."""
+        request = entry.get("request", {})
+        response = entry.get("response", {})
+        content = response.get("content", {})
+        
+        # Parse headers into dict
+        req_headers = {
+            h.get("name", ""): h.get("value", "")
+            for h in request.get("headers", [])
+        }
+        resp_headers = {
+            h.get("name", ""): h.get("value", "")
+            for h in response.get("headers", [])
+        }
+        
+        return cls(
+            request_url=request.get("url", ""),
+            request_method=request.get("method", ""),
+            request_headers=req_headers,
+            response_status=response.get("status", 0),
+            response_headers=resp_headers,
+            response_content=content.get("text", ""),
+            response_mime_type=content.get("mimeType", ""),
+        )
 
 
 @dataclass
@@ -65,36 +95,143 @@ class HARData:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "HARData":
         """Parse HAR JSON structure."""
-        entries = []
         log = data.get("log", {})
-        for entry in log.get("entries", []):
-            request = entry.get("request", {})
-            response = entry.get("response", {})
-            content = response.get("content", {})
-            
-            # Parse headers into dict
-            req_headers = {
-                h.get("name", ""): h.get("value", "")
-                for h in request.get("headers", [])
-            }
-            resp_headers = {
-                h.get("name", ""): h.get("value", "")
-                for h in response.get("headers", [])
-            }
-            
-            entries.append(HAREntry(
-                request_url=request.get("url", ""),
-                request_method=request.get("method", ""),
-                request_headers=req_headers,
-                response_status=response.get("status", 0),
-                response_headers=resp_headers,
-                response_content=content.get("text", ""),
-                response_mime_type=content.get("mimeType", ""),
-            ))
-        
-        return cls(entries=entries)
+        return cls(entries=[HAREntry.from_dict(entry) for entry in log.get("entries", [])])
 
 
+class _HARStreamReader:
+    """Incremental reader for HAR log.entries.
+    
+    Walks the top-level object and the "log" object structurally and
+    decodes one entry at a time with JSONDecoder.raw_decode over a sliding
+    text buffer, so only the current entry is materialized. Values other
+    than log.entries (creator, pages, ...) are decoded and discarded.
+    The raw bytes are hashed as they are read.
+    """
+    
+    _WHITESPACE = " \t\n\r"
+    # Only number characters from here to the end of the buffer
+    _NUMBER_TAIL = re.compile(r"[0-9.eE+-]*\Z")
+    
+    def __init__(self, f: Any, chunk_size: int) -> None:
+        self._f = f
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._utf8 = codecs.getincrementaldecoder("utf-8-sig")()
+        self._hasher = hashlib.sha256()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+    
+    @property
+    def content_hash(self) -> str:
+        return self._hasher.hexdigest()
+    
+    def _refill(self, min_size: int = 0) -> bool:
+        """Read more text into the buffer; False at end of file."""
+        if self._eof:
+            return False
+        # Drop consumed text before growing the buffer
+        self._buf = self._buf[self._pos:]
+        self._pos = 0
+        raw = self._f.read(max(self._chunk_size, min_size))
+        self._hasher.update(raw)
+        if not raw:
+            self._eof = True
+            self._buf += self._utf8.decode(b"", final=True)
+            return False
+        self._buf += self._utf8.decode(raw)
+        return True
+    
+    def _peek(self) -> str:
+        """Next non-whitespace character without consuming it ('' at EOF)."""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in self._WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._refill():
+                return ""
+    
+    def _expect(self, char: str) -> None:
+        if self._peek() != char:
+            raise ArtifactParseError(f"Invalid HAR JSON: expected '{char}'")
+        self._pos += 1
+    
+    def _decode_value(self) -> Any:
+        """Decode the next complete JSON value."""
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError as e:
+                # Possibly truncated by the buffer edge: read more and retry
+                if self._refill(len(self._buf)):
+                    continue
+                raise ArtifactParseError(f"Invalid HAR JSON: {e}")
+            # A number touching the buffer edge may continue in the next
+            # chunk; so may one cut just after its "." or "e", which
+            # raw_decode accepts short
+            truncated = end == len(self._buf) or (
+                isinstance(value, (int, float))
+                and self._NUMBER_TAIL.match(self._buf, end) is not None
+            )
+            if truncated and self._refill(len(self._buf)):
+                continue
+            self._pos = end
+            return value
+    
+    def _iter_object(self) -> Iterator[str]:
+        """Yield keys of the object at the cursor; caller consumes each value."""
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self._decode_value()
+            if not isinstance(key, str):
+                raise ArtifactParseError("Invalid HAR JSON: object key must be a string")
+            self._expect(":")
+            yield key
+            if self._peek() == ",":
+                self._pos += 1
+                continue
+            self._expect("}")
+            return
+    
+    def iter_entries(self) -> Iterator[dict[str, Any]]:
+        """Yield each element of log.entries as a dict."""
+        if self._peek() != "{":
+            raise ArtifactParseError("Failed to parse HAR: top level must be an object")
+        for key in self._iter_object():
+            if key != "log":
+                self._decode_value()
+                continue
+            if self._peek() != "{":
+                raise ArtifactParseError("Failed to parse HAR: 'log' must be an object")
+            for log_key in self._iter_object():
+                if log_key != "entries":
+                    self._decode_value()
+                    continue
+                if self._peek() != "[":
+                    raise ArtifactParseError("Failed to parse HAR: 'entries' must be an array")
+                self._pos += 1
+                if self._peek() == "]":
+                    self._pos += 1
+                    continue
+                while True:
+                    entry = self._decode_value()
+                    if not isinstance(entry, dict):
+                        raise ArtifactParseError("Failed to parse HAR: entry must be an object")
+                    yield entry
+                    if self._peek() == ",":
+                        self._pos += 1
+                        continue
+                    self._expect("]")
+                    break
+        if self._peek() != "":
+            raise ArtifactParseError("Invalid HAR JSON: extra data after top-level object")
+
 @dataclass
 class ConsoleLogEntry:
     """Single console log entry."""
@@ -178,6 +315,29 @@ class ScreenshotMetadata:
     content_hash: str
 
 
+class FileFingerprint(NamedTuple):
+    """Cheap stat-based identity of a file's content.
+    
+    Any write through the filesystem changes size or mtime_ns; replacing
+    the file changes inode. Used to skip re-hashing unchanged artifacts.
+    """
+    size: int
+    mtime_ns: int
+    inode: int
+    
+    @classmethod
+    def from_stat(cls, st: os.stat_result) -> "FileFingerprint":
+        return cls(size=st.st_size, mtime_ns=st.st_mtime_ns, inode=st.st_ino)
+
+
+@dataclass(frozen=True)
+class ReadRecord:
+    """Hash and fingerprints captured while an artifact was parsed."""
+    content_hash: str
+    fingerprint_before: FileFingerprint  # fstat just before the read
+    fingerprint_after: FileFingerprint  # fstat just after the read
+
+
 class ArtifactLoader:
     """READ-ONLY artifact loader.
     
@@ -190,6 +350,7 @@ class ArtifactLoader:
     def __init__(self, artifacts_dir: str) -> None:
         """Initialize loader with artifacts directory path."""
         self._artifacts_path = Path(artifacts_dir)
+        self._read_records: dict[str, ReadRecord] = {}
     
     def compute_file_hash(self, path: str) -> str:
         """Compute SHA-256 hash for immutability verification.
@@ -213,6 +374,93 @@ class ArtifactLoader:
                 sha256.update(chunk)
         return sha256.hexdigest()
     
+    def file_fingerprint(self, path: str) -> FileFingerprint:
+        """Get (size, mtime_ns, inode) fingerprint without reading the file.
+        
+        Args:
+            path: Path to file (relative to artifacts_dir or absolute)
+        
+        Returns:
+            FileFingerprint of the file
+        
+        Raises:
+            ArtifactNotFoundError: If file does not exist
+        """
+        file_path = self._resolve_path(path)
+        try:
+            return FileFingerprint.from_stat(file_path.stat())
+        except FileNotFoundError:
+            raise ArtifactNotFoundError(f"Artifact not found: {path}")
+    
+    def get_read_record(self, path: str) -> Optional[ReadRecord]:
+        """Get the hash captured when the artifact was last parsed.
+        
+        Args:
+            path: Path to artifact as passed to a load_* method
+        
+        Returns:
+            ReadRecord, or None if the artifact has not been parsed
+        """
+        return self._read_records.get(str(self._resolve_path(path)))
+    
+    def store_read_record(self, path: str, record: ReadRecord) -> None:
+        """Store a ReadRecord captured by another loader (e.g. a worker process)."""
+        self._read_records[str(self._resolve_path(path))] = record
+    
+    def clear_read_records(self) -> None:
+        """Forget hashes captured by previous parse reads."""
+        self._read_records.clear()
+    
+    def hash_artifact(self, path: str) -> str:
+        """Hash an artifact and keep the result as its ReadRecord.
+        
+        Used when the content hash is needed without parsing (e.g. cache
+        lookups); immutability checks then treat it like a parse read.
+        
+        Args:
+            path: Path to file (relative to artifacts_dir or absolute)
+        
+        Returns:
+            SHA-256 hex digest
+        
+        Raises:
+            ArtifactNotFoundError: If file does not exist
+        """
+        file_path = self._resolve_path(path)
+        sha256 = hashlib.sha256()
+        try:
+            with open(file_path, "rb") as f:
+                fingerprint_before = FileFingerprint.from_stat(os.fstat(f.fileno()))
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    sha256.update(chunk)
+                fingerprint_after = FileFingerprint.from_stat(os.fstat(f.fileno()))
+        except (FileNotFoundError, IsADirectoryError):
+            raise ArtifactNotFoundError(f"Artifact not found: {path}")
+        content_hash = sha256.hexdigest()
+        self._read_records[str(file_path)] = ReadRecord(
+            content_hash=content_hash,
+            fingerprint_before=fingerprint_before,
+            fingerprint_after=fingerprint_after,
+        )
+        return content_hash
+    
+    def _read_bytes(self, file_path: Path) -> bytes:
+        """Read a whole file, hashing it in the same pass.
+        
+        The hash and surrounding fstat fingerprints are kept as a ReadRecord
+        so immutability checks need no separate hashing read.
+        """
+        with open(file_path, "rb") as f:
+            fingerprint_before = FileFingerprint.from_stat(os.fstat(f.fileno()))
+            content = f.read()
+            fingerprint_after = FileFingerprint.from_stat(os.fstat(f.fileno()))
+        self._read_records[str(file_path)] = ReadRecord(
+            content_hash=hashlib.sha256(content).hexdigest(),
+            fingerprint_before=fingerprint_before,
+            fingerprint_after=fingerprint_after,
+        )
+        return content
+    
     def load_manifest(self, execution_id: str) -> ExecutionManifest:
         """Load and validate execution manifest.
         
@@ -257,14 +505,56 @@ class ArtifactLoader:
             raise ArtifactNotFoundError(f"HAR file not found: {path}")
         
         try:
-            with open(file_path, "r") as f:
-                data = json.load(f)
+            data = json.loads(self._read_bytes(file_path))
             return HARData.from_dict(data)
         except json.JSONDecodeError as e:
             raise ArtifactParseError(f"Invalid HAR JSON: {e}")
         except Exception as e:
             raise ArtifactParseError(f"Failed to parse HAR: {e}")
     
+    def iter_har_entries(self, path: str, chunk_size: int = 1 << 20) -> Iterator[HAREntry]:
+        """Stream HAR entries one at a time in bounded memory.
+        
+        Yields the same entries as load_har(path).entries without building
+        the whole document. The content hash is recorded (see
+        get_read_record) once the file has been read to the end.
+        
+        Args:
+            path: Path to HAR file
+            chunk_size: Bytes read per refill
+        
+        Returns:
+            Iterator of HAREntry instances
+        
+        Raises:
+            ArtifactNotFoundError: If file does not exist
+            ArtifactParseError: If file is invalid (raised during iteration)
+        """
+        file_path = self._resolve_path(path)
+        if not file_path.exists():
+            raise ArtifactNotFoundError(f"HAR file not found: {path}")
+        return self._iter_har_entries(file_path, chunk_size)
+    
+    def _iter_har_entries(self, file_path: Path, chunk_size: int) -> Iterator[HAREntry]:
+        with open(file_path, "rb") as f:
+            fingerprint_before = FileFingerprint.from_stat(os.fstat(f.fileno()))
+            reader = _HARStreamReader(f, chunk_size)
+            try:
+                for entry in reader.iter_entries():
+                    yield HAREntry.from_dict(entry)
+            except (ArtifactParseError, GeneratorExit):
+                raise
+            except UnicodeDecodeError as e:
+                raise ArtifactParseError(f"Invalid HAR JSON: {e}")
+            except Exception as e:
+                raise ArtifactParseError(f"Failed to parse HAR: {e}")
+            fingerprint_after = FileFingerprint.from_stat(os.fstat(f.fileno()))
+        self._read_records[str(file_path)] = ReadRecord(
+            content_hash=reader.content_hash,
+            fingerprint_before=fingerprint_before,
+            fingerprint_after=fingerprint_after,
+        )
+    
     def load_console_logs(self, path: str) -> list[ConsoleLogEntry]:
         """Load console log entries.
         
@@ -283,8 +573,7 @@ class ArtifactLoader:
             raise ArtifactNotFoundError(f"Console log not found: {path}")
         
         try:
-            with open(file_path, "r") as f:
-                data = json.load(f)
+            data = json.loads(self._read_bytes(file_path))
             
             if isinstance(data, list):
                 return [ConsoleLogEntry.from_dict(entry) for entry in data]
@@ -313,8 +602,7 @@ class ArtifactLoader:
             raise ArtifactNotFoundError(f"Execution trace not found: {path}")
         
         try:
-            with open(file_path, "r") as f:
-                data = json.load(f)
+            data = json.loads(self._read_bytes(file_path))
             return ExecutionTrace.from_dict(data)
         except json.JSONDecodeError as e:
             raise ArtifactParseError(f"Invalid trace JSON: {e}")
@@ -12,14 +12,23 @@ INVARIANTS:
 This system assists humans. It does not autonomously hunt, judge, or earn.
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
+from enum import Enum
 from typing import Optional
 
-from artifact_scanner.loader import ArtifactLoader, HARData, ExecutionTrace
+from artifact_scanner.loader import (
+    ArtifactLoader,
+    FileFingerprint,
+    HARData,
+    ExecutionTrace,
+    ReadRecord,
+)
 from artifact_scanner.analyzers.har import HARAnalyzer
 from artifact_scanner.analyzers.console import ConsoleAnalyzer
 from artifact_scanner.analyzers.trace import TraceAnalyzer
 from artifact_scanner.aggregator import SignalAggregator
+from artifact_scanner.cache import ScanCache
 from artifact_scanner.types import Signal, FindingCandidate, ScanResult
 from artifact_scanner.errors import (
     ScannerError,
@@ -32,6 +41,44 @@ from artifact_scanner.errors import (
 )
 
 
+def _artifact_kind(path: str) -> Optional[str]:
+    """Analyzer used for an artifact path, or None for unknown types."""
+    path_lower = path.lower()
+    if path_lower.endswith(".har"):
+        return "har"
+    if "console" in path_lower and path_lower.endswith(".json"):
+        return "console"
+    if "trace" in path_lower and path_lower.endswith(".json"):
+        return "trace"
+    return None
+
+
+def _analyze_artifact_in_worker(
+    artifacts_dir: str,
+    path: str,
+) -> tuple[Optional[list[Signal]], Optional[ReadRecord]]:
+    """Process-pool entry point: analyze one artifact.
+    
+    Returns the (picklable) signals, or None on a recoverable error, plus the
+    hash captured during the parse read so the parent can verify immutability.
+    """
+    scanner = Scanner(artifacts_dir)
+    signals = scanner._analyze_artifact_or_none(path)
+    return signals, scanner._loader.get_read_record(path)
+
+
+class ImmutabilityMode(str, Enum):
+    """How Scanner verifies that artifacts were not modified during a scan.
+    
+    STRICT: full SHA-256 before and after analysis (three reads per file).
+    FINGERPRINT: compare (size, mtime_ns, inode) before and after; the
+    content hash is taken during the parse read and a full re-hash is done
+    only for artifacts whose fingerprint changed.
+    """
+    STRICT = "strict"
+    FINGERPRINT = "fingerprint"
+
+
 class Scanner:
     """Main scanner orchestrator.
     
@@ -42,15 +89,34 @@ class Scanner:
     - NO CLASSIFICATION: Signals only
     """
     
-    def __init__(self, artifacts_dir: str) -> None:
+    def __init__(
+        self,
+        artifacts_dir: str,
+        immutability_mode: ImmutabilityMode = ImmutabilityMode.FINGERPRINT,
+        max_workers: int = 1,
+        compact_signals: bool = False,
+        cache_dir: Optional[str] = None,
+    ) -> None:
         """Initialize scanner with artifacts directory.
         
         Args:
             artifacts_dir: Path to artifacts directory
+            immutability_mode: How artifact immutability is verified
+            max_workers: Worker processes for artifact analysis (1 = serial)
+            compact_signals: Collapse identical signals per URL route
+                template (see SignalAggregator.compact)
+            cache_dir: Directory for the content-addressed analysis cache
+                (None = no caching); must be outside artifacts_dir
         """
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
         self._artifacts_dir = artifacts_dir
         self._loader = ArtifactLoader(artifacts_dir)
         self._aggregator = SignalAggregator()
+        self._immutability_mode = ImmutabilityMode(immutability_mode)
+        self._max_workers = max_workers
+        self._compact_signals = compact_signals
+        self._cache = ScanCache(cache_dir) if cache_dir is not None else None
     
     def scan(self, execution_id: str) -> ScanResult:
         """Scan all artifacts for an execution.
@@ -81,11 +147,17 @@ class Scanner:
         if not artifact_paths:
             raise NoArtifactsError(f"No artifacts found for execution: {execution_id}")
         
-        # Compute hashes before scan for immutability verification
+        # Record state before scan for immutability verification
+        strict = self._immutability_mode == ImmutabilityMode.STRICT
         hashes_before: dict[str, str] = {}
+        fingerprints_before: dict[str, FileFingerprint] = {}
+        self._loader.clear_read_records()
         for path in artifact_paths:
             try:
-                hashes_before[path] = self._loader.compute_file_hash(path)
+                if strict:
+                    hashes_before[path] = self._loader.compute_file_hash(path)
+                else:
+                    fingerprints_before[path] = self._loader.file_fingerprint(path)
             except ArtifactNotFoundError:
                 pass  # Will be tracked as failed artifact
         
@@ -94,17 +166,14 @@ class Scanner:
         artifacts_scanned: list[str] = []
         artifacts_failed: list[str] = []
         
-        for path in artifact_paths:
-            try:
-                signals = self._analyze_artifact(path)
-                all_signals.extend(signals)
-                artifacts_scanned.append(path)
-            except (ArtifactNotFoundError, ArtifactParseError) as e:
+        # Results are merged in manifest order regardless of completion order
+        for path, signals in zip(artifact_paths, self._analyze_all(artifact_paths)):
+            if signals is None:
                 # Graceful degradation - continue with other artifacts
                 artifacts_failed.append(path)
-            except ScannerError:
-                # Re-raise non-recoverable errors
-                raise
+            else:
+                all_signals.extend(signals)
+                artifacts_scanned.append(path)
         
         # If all artifacts failed, raise NoArtifactsError
         if not artifacts_scanned:
@@ -113,10 +182,16 @@ class Scanner:
             )
         
         # Verify immutability
-        immutability_verified = self._verify_immutability(
-            list(hashes_before.keys()),
-            hashes_before,
-        )
+        if strict:
+            immutability_verified = self._verify_immutability(
+                list(hashes_before.keys()),
+                hashes_before,
+            )
+        else:
+            immutability_verified = self._verify_fingerprints(fingerprints_before)
+        
+        if self._compact_signals:
+            all_signals = self._aggregator.compact(all_signals)
         
         # Aggregate signals into finding candidates
         finding_candidates = self._aggregator.aggregate(all_signals)
@@ -131,6 +206,94 @@ class Scanner:
             immutability_verified=immutability_verified,
         )
     
+    @property
+    def cache(self) -> Optional[ScanCache]:
+        return self._cache
+    
+    def _analyze_all(self, paths: list[str]) -> list[Optional[list[Signal]]]:
+        """Analyze artifacts, reusing cached signals for unchanged content.
+        
+        Each cacheable artifact is hashed first; a hit skips parsing and
+        analysis. Misses are analyzed and stored under the hash taken
+        during their parse read.
+        
+        Args:
+            paths: Artifact paths in manifest order
+        
+        Returns:
+            Signals per path (same order), None where the artifact failed
+            with a recoverable error
+        
+        Raises:
+            ScannerError: Non-recoverable errors from any artifact
+        """
+        if self._cache is None:
+            return self._analyze_uncached(paths)
+        
+        results: list[Optional[list[Signal]]] = [None] * len(paths)
+        pending: list[int] = []
+        for index, path in enumerate(paths):
+            kind = _artifact_kind(path)
+            cached = None
+            if kind is not None:
+                try:
+                    content_hash = self._loader.hash_artifact(path)
+                    cached = self._cache.get(content_hash, kind, path)
+                except ArtifactNotFoundError:
+                    pass  # Analysis reports it as failed
+            if cached is None:
+                pending.append(index)
+            else:
+                results[index] = cached
+        
+        analyzed = self._analyze_uncached([paths[i] for i in pending])
+        for index, signals in zip(pending, analyzed):
+            results[index] = signals
+            path = paths[index]
+            kind = _artifact_kind(path)
+            record = self._loader.get_read_record(path)
+            if signals is not None and kind is not None and record is not None:
+                self._cache.put(record.content_hash, kind, signals)
+        return results
+    
+    def _analyze_uncached(self, paths: list[str]) -> list[Optional[list[Signal]]]:
+        """Analyze artifacts serially or on a process pool.
+        
+        Args:
+            paths: Artifact paths in manifest order
+        
+        Returns:
+            Signals per path (same order), None where the artifact failed
+            with a recoverable error
+        
+        Raises:
+            ScannerError: Non-recoverable errors from any artifact
+        """
+        if self._max_workers == 1 or len(paths) < 2:
+            return [self._analyze_artifact_or_none(path) for path in paths]
+        
+        workers = min(self._max_workers, len(paths))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_analyze_artifact_in_worker, self._artifacts_dir, path)
+                for path in paths
+            ]
+            # Collect in submission order; future.result() re-raises worker errors
+            results: list[Optional[list[Signal]]] = []
+            for path, future in zip(paths, futures):
+                signals, record = future.result()
+                if record is not None:
+                    self._loader.store_read_record(path, record)
+                results.append(signals)
+        return results
+    
+    def _analyze_artifact_or_none(self, path: str) -> Optional[list[Signal]]:
+        """Analyze one artifact, returning None on recoverable errors."""
+        try:
+            return self._analyze_artifact(path)
+        except (ArtifactNotFoundError, ArtifactParseError):
+            return None
+    
     def _analyze_artifact(self, path: str) -> list[Signal]:
         """Analyze a single artifact.
         
@@ -144,13 +307,13 @@ class Scanner:
             ArtifactNotFoundError: If artifact not found
             ArtifactParseError: If artifact cannot be parsed
         """
-        path_lower = path.lower()
+        kind = _artifact_kind(path)
         
-        if path_lower.endswith(".har"):
+        if kind == "har":
             return self._analyze_har(path)
-        elif "console" in path_lower and path_lower.endswith(".json"):
+        elif kind == "console":
             return self._analyze_console(path)
-        elif "trace" in path_lower and path_lower.endswith(".json"):
+        elif kind == "trace":
             return self._analyze_trace(path)
         else:
             # Unknown artifact type - skip
@@ -165,9 +328,9 @@ class Scanner:
         Returns:
             List of signals
         """
-        har_data = self._loader.load_har(path)
+        entries = self._loader.iter_har_entries(path)
         analyzer = HARAnalyzer(path)
-        return analyzer.analyze(har_data)
+        return analyzer.analyze_entries(entries)
     
     def _analyze_console(self, path: str) -> list[Signal]:
         """Analyze console log.
@@ -230,6 +393,64 @@ class Scanner:
         
         return True
     
+    def _verify_fingerprints(
+        self,
+        fingerprints_before: dict[str, FileFingerprint],
+    ) -> bool:
+        """Verify no artifacts were modified, hashing only on fingerprint change.
+        
+        The reference hash is the one taken during the parse read. It is only
+        trusted if the file's fingerprint at read time matched the pre-scan
+        fingerprint; otherwise the file changed before it was read.
+        
+        Args:
+            fingerprints_before: Dict of path -> fingerprint before scan
+        
+        Returns:
+            True if all artifacts unchanged
+        
+        Raises:
+            ImmutabilityViolationError: If any artifact was modified
+        """
+        for path, fingerprint_before in fingerprints_before.items():
+            try:
+                fingerprint_after = self._loader.file_fingerprint(path)
+            except ArtifactNotFoundError:
+                raise ImmutabilityViolationError(
+                    f"Artifact was deleted during scan: {path}"
+                )
+            
+            record = self._loader.get_read_record(path)
+            if record is not None and record.fingerprint_before != fingerprint_before:
+                raise ImmutabilityViolationError(
+                    f"Artifact was modified during scan: {path}"
+                )
+            
+            unchanged = fingerprint_after == fingerprint_before and (
+                record is None or record.fingerprint_after == fingerprint_before
+            )
+            if unchanged:
+                continue
+            
+            # Fingerprint changed: fall back to comparing content hashes.
+            # Without a parse-read hash there is nothing to compare against.
+            if record is None:
+                raise ImmutabilityViolationError(
+                    f"Artifact was modified during scan: {path}"
+                )
+            try:
+                hash_after = self._loader.compute_file_hash(path)
+            except ArtifactNotFoundError:
+                raise ImmutabilityViolationError(
+                    f"Artifact was deleted during scan: {path}"
+                )
+            if hash_after != record.content_hash:
+                raise ImmutabilityViolationError(
+                    f"Artifact was modified during scan: {path}"
+                )
+        
+        return True
+    
     # =========================================================================
     # FORBIDDEN METHODS - Raise ArchitecturalViolationError
     # =========================================================================
@@ -11,7 +11,7 @@ All tests use synthetic data (no real Phase-4 artifacts).
 import pytest
 from hypothesis import given, strategies as st
 
-from artifact_scanner.aggregator import SignalAggregator
+from artifact_scanner.aggregator import SignalAggregator, template_url
 from artifact_scanner.types import Signal, SignalType
 
 
@@ -176,3 +176,99 @@ class TestFindingCandidateCreation:
         assert candidates[0].severity is None
         assert candidates[0].classification is None
         assert candidates[0].confidence is None
+
+
+# =============================================================================
+# Signal Compaction
+# =============================================================================
+
+def make_header_signal(url: str, header: str = "Content-Security-Policy",
+                       status: int = 200, source_artifact: str = "test.har") -> Signal:
+    """Helper mirroring HARAnalyzer.detect_header_misconfig output."""
+    return Signal.create(
+        signal_type=SignalType.HEADER_MISCONFIG,
+        source_artifact=source_artifact,
+        description=f"Missing security header: {header}",
+        evidence={"missing_header": header, "url": url, "status": status},
+        endpoint=url,
+    )
+
+
+class TestURLTemplating:
+    """Tests for route template normalization."""
+    
+    @pytest.mark.parametrize("url,expected", [
+        ("https://a.com/users/123", "https://a.com/users/{id}"),
+        ("https://a.com/users/123/posts/9", "https://a.com/users/{id}/posts/{id}"),
+        ("https://a.com/o/550e8400-e29b-41d4-a716-446655440000/x",
+         "https://a.com/o/{uuid}/x"),
+        ("https://a.com/static/d41d8cd98f00b204e9800998ecf8427e.js",
+         "https://a.com/static/d41d8cd98f00b204e9800998ecf8427e.js"),
+        ("https://a.com/blob/d41d8cd98f00b204e9800998ecf8427e", "https://a.com/blob/{hash}"),
+        ("https://a.com/search?q=abc&page=2", "https://a.com/search?page={}&q={}"),
+        ("https://a.com/v2/users", "https://a.com/v2/users"),
+        ("https://a.com:8443/a/#frag", "https://a.com:8443/a/"),
+        ("unknown", "unknown"),
+    ])
+    def test_template_url(self, url, expected):
+        assert template_url(url) == expected
+
+
+class TestSignalCompaction:
+    """Tests for collapsing identical signals per route template."""
+    
+    def test_identical_signals_collapse_per_template(self):
+        signals = [make_header_signal(f"https://a.com/users/{i}") for i in range(100)]
+        aggregator = SignalAggregator(max_sample_urls=3)
+        
+        compacted = aggregator.compact(signals)
+        
+        assert len(compacted) == 1
+        merged = compacted[0]
+        assert merged.endpoint == "https://a.com/users/{id}"
+        assert merged.evidence["occurrences"] == 100
+        assert merged.evidence["sample_urls"] == [
+            "https://a.com/users/0", "https://a.com/users/1", "https://a.com/users/2",
+        ]
+        assert merged.evidence["missing_header"] == "Content-Security-Policy"
+        assert "url" not in merged.evidence
+        assert merged.severity is None
+    
+    def test_distinct_signals_kept_apart(self):
+        signals = [
+            make_header_signal("https://a.com/users/1"),
+            make_header_signal("https://a.com/users/2", header="X-Frame-Options"),
+            make_header_signal("https://a.com/users/3", status=500),
+            make_header_signal("https://a.com/users/4", source_artifact="other.har"),
+            make_header_signal("https://a.com/orders/5"),
+            make_header_signal("https://a.com/users/6"),
+        ]
+        compacted = SignalAggregator().compact(signals)
+        
+        assert len(compacted) == 5
+        assert compacted[0].evidence["occurrences"] == 2
+        assert compacted[1:] == signals[1:5]
+    
+    def test_signal_count_preserved(self):
+        signals = [make_header_signal(f"https://a.com/u/{i % 7}/p/{i}") for i in range(50)]
+        signals += [make_signal(endpoint=None), make_signal(endpoint=None)]
+        compacted = SignalAggregator().compact(signals)
+        
+        total = sum(s.evidence.get("occurrences", 1) for s in compacted)
+        assert total == len(signals)
+    
+    def test_compacted_candidates_grouped_by_template(self):
+        signals = [make_header_signal(f"https://a.com/users/{i}", header=h)
+                   for i in range(20) for h in ("A", "B")]
+        aggregator = SignalAggregator()
+        
+        candidates = aggregator.aggregate(aggregator.compact(signals))
+        
+        assert len(candidates) == 1
+        assert candidates[0].endpoint == "https://a.com/users/{id}"
+        assert len(candidates[0].signals) == 2
+    
+    def test_invalid_sample_count(self):
+        with pytest.raises(ValueError):
+            SignalAggregator(max_sample_urls=0)
+
@@ -12,9 +12,11 @@ All tests use synthetic artifacts (no real Phase-4 data).
 import pytest
 import tempfile
 import json
+import hashlib
+import tracemalloc
 from pathlib import Path
 from datetime import datetime, timezone
-from hypothesis import given, strategies as st
+from hypothesis import given, settings, HealthCheck, strategies as st
 
 from artifact_scanner.loader import (
     ArtifactLoader,
@@ -312,6 +314,115 @@ class TestHARLoading:
         assert len(har.entries) == 0
 
 
+# =============================================================================
+# Streaming HAR Loading Tests
+# =============================================================================
+
+har_text = st.text(alphabet=st.characters(blacklist_categories=("Cs",)), max_size=40)
+har_headers = st.lists(st.fixed_dictionaries({"name": har_text, "value": har_text}), max_size=3)
+har_entries = st.lists(
+    st.fixed_dictionaries({
+        "request": st.fixed_dictionaries({
+            "url": har_text,
+            "method": st.sampled_from(["GET", "POST"]),
+            "headers": har_headers,
+        }),
+        "response": st.fixed_dictionaries({
+            "status": st.integers(min_value=0, max_value=10**12),
+            "headers": har_headers,
+            "content": st.fixed_dictionaries({"text": har_text, "mimeType": har_text}),
+        }),
+    }),
+    max_size=8,
+)
+
+
+class TestHARStreaming:
+    """ArtifactLoader.iter_har_entries yields the same entries as load_har."""
+    
+    @given(entries=har_entries, chunk_size=st.integers(min_value=1, max_value=64),
+           indent=st.sampled_from([None, 2]))
+    @settings(suppress_health_check=[HealthCheck.function_scoped_fixture])
+    def test_stream_matches_load_har(self, temp_artifacts_dir, loader, entries, chunk_size, indent):
+        file_path = temp_artifacts_dir / "stream.har"
+        har = {"log": {"version": "1.2", "creator": {"name": "x"}, "entries": entries,
+                       "pages": [{"id": "p1"}]}}
+        file_path.write_text(json.dumps(har, indent=indent, ensure_ascii=False), encoding="utf-8")
+        
+        streamed = list(loader.iter_har_entries("stream.har", chunk_size=chunk_size))
+        
+        assert streamed == loader.load_har("stream.har").entries
+    
+    def test_numbers_split_at_every_chunk_boundary(self, temp_artifacts_dir, loader):
+        """Numeric siblings of entries parse whatever chunk boundary cuts them."""
+        content = ('{"log": {"version": 1.25, "entries": [{"request": {}}], '
+                   '"size": -3e+2, "ratio": 0.5E-1}, "post": 0.1, "n": 10}')
+        (temp_artifacts_dir / "numbers.har").write_text(content)
+        expected = loader.load_har("numbers.har").entries
+        assert len(expected) == 1
+        
+        for chunk_size in range(1, len(content) + 1):
+            streamed = list(loader.iter_har_entries("numbers.har", chunk_size=chunk_size))
+            assert streamed == expected, chunk_size
+    
+    def test_stream_records_content_hash(self, temp_artifacts_dir, loader):
+        file_path = create_har_file(temp_artifacts_dir, "stream.har", [
+            {"request": {"url": "https://example.com"}, "response": {"status": 200}},
+        ])
+        
+        assert loader.get_read_record("stream.har") is None
+        list(loader.iter_har_entries("stream.har", chunk_size=7))
+        
+        record = loader.get_read_record("stream.har")
+        assert record.content_hash == hashlib.sha256(file_path.read_bytes()).hexdigest()
+    
+    def test_stream_missing_log_or_entries(self, temp_artifacts_dir, loader):
+        (temp_artifacts_dir / "a.har").write_text('{"other": [1, 2]}')
+        (temp_artifacts_dir / "b.har").write_text('{"log": {"version": "1.2"}}')
+        (temp_artifacts_dir / "c.har").write_text('{"log": {"entries": []}}')
+        
+        for name in ("a.har", "b.har", "c.har"):
+            assert list(loader.iter_har_entries(name)) == []
+    
+    @pytest.mark.parametrize("content", [
+        "{invalid json",
+        '{"log": {"entries": [{"request": {}}',
+        '{"log": {"entries": [{}]}} trailing',
+        '[1, 2, 3]',
+        '{"log": []}',
+        '{"log": {"entries": {}}}',
+        '{"log": {"entries": [1]}}',
+    ])
+    def test_stream_invalid_har(self, temp_artifacts_dir, loader, content):
+        (temp_artifacts_dir / "bad.har").write_text(content)
+        
+        with pytest.raises(ArtifactParseError):
+            list(loader.iter_har_entries("bad.har", chunk_size=4))
+    
+    def test_stream_not_found(self, loader):
+        with pytest.raises(ArtifactNotFoundError):
+            loader.iter_har_entries("missing.har")
+    
+    def test_stream_memory_is_bounded(self, temp_artifacts_dir, loader):
+        body = "x" * 4096
+        create_har_file(temp_artifacts_dir, "big.har", [
+            {"request": {"url": f"https://example.com/{i}"},
+             "response": {"status": 200, "content": {"text": body}}}
+            for i in range(2000)
+        ])
+        file_size = (temp_artifacts_dir / "big.har").stat().st_size
+        
+        tracemalloc.start()
+        try:
+            count = sum(1 for _ in loader.iter_har_entries("big.har", chunk_size=64 * 1024))
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        
+        assert count == 2000
+        assert peak < file_size / 4
+
+
 # =============================================================================
 # Console Log Loading Tests
 # =============================================================================
@@ -0,0 +1,146 @@
+"""
+Phase-5 Scan Cache Tests
+
+Tests for the content-addressed analysis cache.
+Validates:
+- Cached ScanResult matches an uncached scan
+- Unchanged artifacts are not re-analyzed
+- A changed artifact invalidates only its own entry
+- Pattern-set version changes invalidate every entry
+
+All tests use synthetic artifacts (no real Phase-4 data).
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from artifact_scanner.cache import ScanCache
+from artifact_scanner.scanner import Scanner, ImmutabilityMode
+from artifact_scanner.analyzers.har import HARAnalyzer
+from artifact_scanner.analyzers.console import ConsoleAnalyzer
+from artifact_scanner.tests.test_scanner import temp_artifacts_dir, create_har
+from artifact_scanner.tests.test_scanner_parallel import build_execution, comparable
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    return str(tmp_path / "scan-cache")
+
+
+def count_analyses(monkeypatch) -> list[str]:
+    """Record every HAR/console analysis performed."""
+    calls: list[str] = []
+    har_analyze = HARAnalyzer.analyze_entries
+    console_analyze = ConsoleAnalyzer.analyze
+
+    def har(self, entries):
+        calls.append(self._source_artifact)
+        return har_analyze(self, entries)
+
+    def console(self, logs):
+        calls.append(self._source_artifact)
+        return console_analyze(self, logs)
+
+    monkeypatch.setattr(HARAnalyzer, "analyze_entries", har)
+    monkeypatch.setattr(ConsoleAnalyzer, "analyze", console)
+    return calls
+
+
+class TestScanCache:
+    """Cached scans reuse per-artifact signals keyed by content hash."""
+
+    @pytest.mark.parametrize("mode", list(ImmutabilityMode))
+    def test_cached_scan_matches_uncached(self, temp_artifacts_dir, cache_dir, mode):
+        build_execution(temp_artifacts_dir, "exec-1", har_count=3, entries_per_har=10)
+        uncached = Scanner(str(temp_artifacts_dir), immutability_mode=mode).scan("exec-1")
+
+        cold = Scanner(str(temp_artifacts_dir), immutability_mode=mode, cache_dir=cache_dir)
+        first = cold.scan("exec-1")
+        warm = Scanner(str(temp_artifacts_dir), immutability_mode=mode, cache_dir=cache_dir)
+        second = warm.scan("exec-1")
+
+        assert comparable(first) == comparable(uncached)
+        assert comparable(second) == comparable(uncached)
+        assert cold.cache.hits == 0
+        # 3 HARs + console + trace; the missing HAR is never looked up
+        assert warm.cache.hits == 5
+        # Cached signals are re-issued, not replayed with stale ids
+        assert not {s.signal_id for s in first.signals} & {s.signal_id for s in second.signals}
+
+    def test_unchanged_artifacts_not_reanalyzed(self, temp_artifacts_dir, cache_dir, monkeypatch):
+        build_execution(temp_artifacts_dir, "exec-1", har_count=3, entries_per_har=5)
+        Scanner(str(temp_artifacts_dir), cache_dir=cache_dir).scan("exec-1")
+
+        calls = count_analyses(monkeypatch)
+        Scanner(str(temp_artifacts_dir), cache_dir=cache_dir).scan("exec-1")
+        assert calls == []
+
+    def test_changed_artifact_invalidates_only_its_entry(
+        self, temp_artifacts_dir, cache_dir, monkeypatch
+    ):
+        build_execution(temp_artifacts_dir, "exec-1", har_count=3, entries_per_har=5)
+        Scanner(str(temp_artifacts_dir), cache_dir=cache_dir).scan("exec-1")
+
+        create_har(temp_artifacts_dir, "exec-1/network_001.har", [{
+            "request": {"url": "https://example.com/changed", "method": "GET", "headers": []},
+            "response": {"status": 200, "headers": [], "content": {"text": "ok"}},
+        }])
+        calls = count_analyses(monkeypatch)
+        result = Scanner(str(temp_artifacts_dir), cache_dir=cache_dir).scan("exec-1")
+
+        assert calls == ["exec-1/network_001.har"]
+        assert comparable(result) == comparable(Scanner(str(temp_artifacts_dir)).scan("exec-1"))
+
+    def test_same_content_at_new_path_reuses_entry(self, temp_artifacts_dir, cache_dir, monkeypatch):
+        build_execution(temp_artifacts_dir, "exec-1", har_count=2, entries_per_har=5)
+        build_execution(temp_artifacts_dir, "exec-2", har_count=2, entries_per_har=5)
+        Scanner(str(temp_artifacts_dir), cache_dir=cache_dir).scan("exec-1")
+
+        calls = count_analyses(monkeypatch)
+        result = Scanner(str(temp_artifacts_dir), cache_dir=cache_dir).scan("exec-2")
+
+        # HAR contents are identical; console/trace embed the execution id
+        assert "exec-2/network_000.har" not in calls
+        assert {s.source_artifact for s in result.signals} <= set(result.artifacts_scanned)
+
+    def test_pattern_version_change_invalidates(self, temp_artifacts_dir, cache_dir, monkeypatch):
+        build_execution(temp_artifacts_dir, "exec-1", har_count=2, entries_per_har=5)
+        Scanner(str(temp_artifacts_dir), cache_dir=cache_dir).scan("exec-1")
+
+        monkeypatch.setattr(
+            "artifact_scanner.cache.pattern_set_version", lambda: "f" * 64
+        )
+        scanner = Scanner(str(temp_artifacts_dir), cache_dir=cache_dir)
+        scanner.scan("exec-1")
+        assert scanner.cache.hits == 0
+
+    def test_corrupt_entry_is_a_miss(self, temp_artifacts_dir, cache_dir):
+        build_execution(temp_artifacts_dir, "exec-1", har_count=1, entries_per_har=5)
+        Scanner(str(temp_artifacts_dir), cache_dir=cache_dir).scan("exec-1")
+        entries = list(Path(cache_dir).rglob("*.har.json"))
+        assert len(entries) == 1
+        entries[0].write_text("{not json")
+
+        scanner = Scanner(str(temp_artifacts_dir), cache_dir=cache_dir)
+        result = scanner.scan("exec-1")
+        assert scanner.cache.misses == 1
+        assert comparable(result) == comparable(Scanner(str(temp_artifacts_dir)).scan("exec-1"))
+        # Entry rewritten by the re-analysis
+        assert json.loads(entries[0].read_text())["kind"] == "har"
+
+    def test_cache_with_process_pool(self, temp_artifacts_dir, cache_dir):
+        build_execution(temp_artifacts_dir, "exec-1", har_count=4, entries_per_har=5)
+        serial = Scanner(str(temp_artifacts_dir)).scan("exec-1")
+        Scanner(str(temp_artifacts_dir), cache_dir=cache_dir, max_workers=2).scan("exec-1")
+        warm = Scanner(str(temp_artifacts_dir), cache_dir=cache_dir, max_workers=2)
+        assert comparable(warm.scan("exec-1")) == comparable(serial)
+        assert warm.cache.hits == 6
+
+    def test_clear(self, temp_artifacts_dir, cache_dir):
+        build_execution(temp_artifacts_dir, "exec-1", har_count=1, entries_per_har=5)
+        scanner = Scanner(str(temp_artifacts_dir), cache_dir=cache_dir)
+        scanner.scan("exec-1")
+        scanner.cache.clear()
+        assert ScanCache(cache_dir).get("0" * 64, "har", "x.har") is None
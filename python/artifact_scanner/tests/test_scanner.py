@@ -12,10 +12,11 @@ All tests use synthetic artifacts (no real Phase-4 data).
 import pytest
 import tempfile
 import json
+import os
 from pathlib import Path
 from datetime import datetime, timezone
 
-from artifact_scanner.scanner import Scanner
+from artifact_scanner.scanner import Scanner, ImmutabilityMode
 from artifact_scanner.types import SignalType
 from artifact_scanner.errors import (
     NoArtifactsError,
@@ -270,6 +271,158 @@ class TestFullScanPipeline:
         assert result.scan_completed_at >= result.scan_started_at
 
 
+# =============================================================================
+# Signal Compaction Tests
+# =============================================================================
+
+class TestSignalCompactionInScan:
+    """Scanner(compact_signals=True) collapses signals per route template."""
+    
+    def test_compacted_scan(self, temp_artifacts_dir):
+        entries = [
+            {
+                "request": {"url": f"https://example.com/users/{i}", "method": "GET", "headers": []},
+                "response": {"status": 200, "headers": [], "content": {"text": "ok"}},
+            }
+            for i in range(50)
+        ]
+        create_har(temp_artifacts_dir, "exec-1/network.har", entries)
+        create_manifest(temp_artifacts_dir, "exec-1", ["exec-1/network.har"])
+        
+        full = Scanner(str(temp_artifacts_dir)).scan("exec-1")
+        compacted = Scanner(str(temp_artifacts_dir), compact_signals=True).scan("exec-1")
+        
+        assert len(full.finding_candidates) == 50
+        assert len(compacted.finding_candidates) == 1
+        assert compacted.finding_candidates[0].endpoint == "https://example.com/users/{id}"
+        assert len(compacted.signals) * 50 == len(full.signals)
+        assert all(s.evidence["occurrences"] == 50 for s in compacted.signals)
+
+
+# =============================================================================
+# Immutability Verification Modes
+# =============================================================================
+
+SIMPLE_ENTRY = {
+    "request": {"url": "https://example.com", "method": "GET", "headers": []},
+    "response": {"status": 200, "headers": [], "content": {"text": "ok"}},
+}
+
+
+def count_hashes(scanner, monkeypatch) -> list[str]:
+    """Record every full-hash read the scanner's loader performs."""
+    calls: list[str] = []
+    original = scanner._loader.compute_file_hash
+    
+    def counting(path):
+        calls.append(path)
+        return original(path)
+    
+    monkeypatch.setattr(scanner._loader, "compute_file_hash", counting)
+    return calls
+
+
+def modify_during_analysis(scanner, monkeypatch, path: Path, content: bytes) -> None:
+    """Rewrite an artifact right after it has been parsed."""
+    original = scanner._analyze_har
+    
+    def analyze_then_modify(artifact_path):
+        signals = original(artifact_path)
+        path.write_bytes(content)
+        return signals
+    
+    monkeypatch.setattr(scanner, "_analyze_har", analyze_then_modify)
+
+
+class TestImmutabilityModes:
+    """Fingerprint (default) and strict immutability verification."""
+    
+    def test_fingerprint_mode_skips_full_hash_when_unchanged(
+        self, temp_artifacts_dir, scanner, monkeypatch
+    ):
+        create_manifest(temp_artifacts_dir, "exec-1", ["exec-1/network.har"])
+        create_har(temp_artifacts_dir, "exec-1/network.har", [SIMPLE_ENTRY])
+        calls = count_hashes(scanner, monkeypatch)
+        
+        result = scanner.scan("exec-1")
+        
+        assert result.immutability_verified is True
+        assert calls == []
+    
+    def test_strict_mode_hashes_before_and_after(self, temp_artifacts_dir, monkeypatch):
+        scanner = Scanner(str(temp_artifacts_dir), immutability_mode=ImmutabilityMode.STRICT)
+        create_manifest(temp_artifacts_dir, "exec-1", ["exec-1/network.har"])
+        create_har(temp_artifacts_dir, "exec-1/network.har", [SIMPLE_ENTRY])
+        calls = count_hashes(scanner, monkeypatch)
+        
+        result = scanner.scan("exec-1")
+        
+        assert result.immutability_verified is True
+        assert calls == ["exec-1/network.har", "exec-1/network.har"]
+    
+    @pytest.mark.parametrize("mode", list(ImmutabilityMode))
+    def test_modification_during_scan_detected(self, temp_artifacts_dir, monkeypatch, mode):
+        scanner = Scanner(str(temp_artifacts_dir), immutability_mode=mode)
+        create_manifest(temp_artifacts_dir, "exec-1", ["exec-1/network.har"])
+        create_har(temp_artifacts_dir, "exec-1/network.har", [SIMPLE_ENTRY])
+        har_path = temp_artifacts_dir / "exec-1/network.har"
+        modify_during_analysis(scanner, monkeypatch, har_path, b'{"log": {"entries": []}}')
+        
+        with pytest.raises(ImmutabilityViolationError):
+            scanner.scan("exec-1")
+    
+    def test_metadata_only_change_falls_back_to_hash(
+        self, temp_artifacts_dir, scanner, monkeypatch
+    ):
+        create_manifest(temp_artifacts_dir, "exec-1", ["exec-1/network.har"])
+        create_har(temp_artifacts_dir, "exec-1/network.har", [SIMPLE_ENTRY])
+        har_path = temp_artifacts_dir / "exec-1/network.har"
+        original = scanner._analyze_har
+        
+        def analyze_then_touch(artifact_path):
+            signals = original(artifact_path)
+            mtime_ns = har_path.stat().st_mtime_ns + 10**9
+            os.utime(har_path, ns=(mtime_ns, mtime_ns))
+            return signals
+        
+        monkeypatch.setattr(scanner, "_analyze_har", analyze_then_touch)
+        calls = count_hashes(scanner, monkeypatch)
+        
+        result = scanner.scan("exec-1")
+        
+        assert result.immutability_verified is True
+        assert calls == ["exec-1/network.har"]
+    
+    def test_unparsed_artifact_change_detected(self, temp_artifacts_dir, scanner, monkeypatch):
+        create_manifest(temp_artifacts_dir, "exec-1", [
+            "exec-1/network.har",
+            "exec-1/screenshot.png",
+        ])
+        create_har(temp_artifacts_dir, "exec-1/network.har", [SIMPLE_ENTRY])
+        png_path = temp_artifacts_dir / "exec-1/screenshot.png"
+        png_path.write_bytes(b"\x89PNG original")
+        modify_during_analysis(scanner, monkeypatch, png_path, b"\x89PNG replaced!")
+        
+        with pytest.raises(ImmutabilityViolationError):
+            scanner.scan("exec-1")
+    
+    def test_deleted_artifact_detected(self, temp_artifacts_dir, scanner, monkeypatch):
+        create_manifest(temp_artifacts_dir, "exec-1", ["exec-1/network.har"])
+        create_har(temp_artifacts_dir, "exec-1/network.har", [SIMPLE_ENTRY])
+        har_path = temp_artifacts_dir / "exec-1/network.har"
+        original = scanner._analyze_har
+        
+        def analyze_then_delete(artifact_path):
+            signals = original(artifact_path)
+            har_path.unlink()
+            return signals
+        
+        monkeypatch.setattr(scanner, "_analyze_har", analyze_then_delete)
+        
+        with pytest.raises(ImmutabilityViolationError):
+            scanner.scan("exec-1")
+
+
 # =============================================================================
 # Error Handling Tests
 # =============================================================================
@@ -0,0 +1,135 @@
+"""
+Phase-5 Parallel Scanner Tests
+
+Tests for process-pool artifact analysis.
+Validates:
+- Parallel ScanResult matches the serial ScanResult
+- Deterministic merge order
+- Benchmark across 1, 4 and 8 workers (set ARTIFACT_SCANNER_BENCHMARK=1)
+
+All tests use synthetic artifacts (no real Phase-4 data).
+"""
+
+import os
+import time
+import pytest
+
+from artifact_scanner.scanner import Scanner, ImmutabilityMode
+from artifact_scanner.tests.test_scanner import (
+    temp_artifacts_dir,
+    create_manifest,
+    create_har,
+    create_console_log,
+    create_trace,
+)
+
+
+def build_execution(artifacts_dir, execution_id: str, har_count: int, entries_per_har: int) -> None:
+    """Create an execution with many HARs plus console and trace artifacts."""
+    paths = []
+    for h in range(har_count):
+        path = f"{execution_id}/network_{h:03d}.har"
+        paths.append(path)
+        create_har(artifacts_dir, path, [
+            {
+                "request": {
+                    "url": f"https://example.com/api/{h}/{i}?q=probe{i}",
+                    "method": "GET",
+                    "headers": [],
+                },
+                "response": {
+                    "status": 500 if i % 7 == 0 else 200,
+                    "headers": [{"name": "Content-Type", "value": "text/html"}],
+                    "content": {
+                        "text": f"<p>probe{i}</p> at /var/www/app/file{i}.py "
+                                f'{{"api_key": "sk_test_{h:04d}{i:012d}"}}',
+                        "mimeType": "text/html",
+                    },
+                },
+            }
+            for i in range(entries_per_har)
+        ])
+    paths.append(f"{execution_id}/console.json")
+    create_console_log(artifacts_dir, f"{execution_id}/console.json", [
+        {"level": "error", "message": "Uncaught TypeError: x is undefined"},
+    ])
+    paths.append(f"{execution_id}/trace.json")
+    create_trace(artifacts_dir, f"{execution_id}/trace.json", execution_id, [
+        {"action_id": "a1", "action_type": "navigate", "target": "https://example.com",
+         "parameters": {}, "outcome": "error", "error": "timeout"},
+    ])
+    paths.append(f"{execution_id}/missing.har")
+    create_manifest(artifacts_dir, execution_id, paths)
+
+
+def comparable(result) -> dict:
+    """ScanResult content without generated ids and timestamps."""
+    return {
+        "signals": [
+            (s.signal_type, s.source_artifact, s.endpoint, s.description, s.evidence)
+            for s in result.signals
+        ],
+        "candidates": [
+            (c.endpoint, len(c.signals), c.artifact_references)
+            for c in result.finding_candidates
+        ],
+        "scanned": result.artifacts_scanned,
+        "failed": result.artifacts_failed,
+        "immutability_verified": result.immutability_verified,
+    }
+
+
+class TestParallelScan:
+    """Parallel scan produces the same ScanResult as the serial scan."""
+
+    @pytest.mark.parametrize("mode", list(ImmutabilityMode))
+    def test_parallel_matches_serial(self, temp_artifacts_dir, mode):
+        build_execution(temp_artifacts_dir, "exec-1", har_count=6, entries_per_har=20)
+
+        serial = Scanner(str(temp_artifacts_dir), immutability_mode=mode).scan("exec-1")
+        parallel = Scanner(
+            str(temp_artifacts_dir), immutability_mode=mode, max_workers=4
+        ).scan("exec-1")
+
+        assert comparable(parallel) == comparable(serial)
+        assert len(parallel.signals) > 0
+        assert parallel.artifacts_failed == ("exec-1/missing.har",)
+
+    def test_parallel_fingerprint_mode_needs_no_full_hash(self, temp_artifacts_dir, monkeypatch):
+        build_execution(temp_artifacts_dir, "exec-1", har_count=3, entries_per_har=5)
+        scanner = Scanner(str(temp_artifacts_dir), max_workers=2)
+        calls = []
+        monkeypatch.setattr(scanner._loader, "compute_file_hash", lambda p: calls.append(p))
+
+        result = scanner.scan("exec-1")
+
+        assert result.immutability_verified is True
+        assert calls == []
+
+    def test_invalid_worker_count(self, temp_artifacts_dir):
+        with pytest.raises(ValueError):
+            Scanner(str(temp_artifacts_dir), max_workers=0)
+
+
+@pytest.mark.skipif(
+    os.environ.get("ARTIFACT_SCANNER_BENCHMARK") != "1",
+    reason="Benchmark requires ARTIFACT_SCANNER_BENCHMARK=1",
+)
+def test_benchmark_parallel_scan(temp_artifacts_dir):
+    """Scan time for 1, 4 and 8 workers over 32 HARs of 2,000 entries each."""
+    build_execution(temp_artifacts_dir, "exec-bench", har_count=32, entries_per_har=2000)
+
+    timings = {}
+    baseline = None
+    for workers in (1, 4, 8):
+        scanner = Scanner(str(temp_artifacts_dir), max_workers=workers)
+        start = time.perf_counter()
+        result = scanner.scan("exec-bench")
+        timings[workers] = time.perf_counter() - start
+        if baseline is None:
+            baseline = comparable(result)
+        assert comparable(result) == baseline
+
+    print("\nartifact_scanner parallel scan (32 HARs x 2,000 entries):")
+    for workers, elapsed in timings.items():
+        print(f"  workers={workers}: {elapsed:.2f}s ({timings[1] / elapsed:.1f}x)")
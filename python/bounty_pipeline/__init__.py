@@ -62,15 +62,23 @@ from bounty_pipeline.errors import (
     is_recoverable,
 )
 from bounty_pipeline.validator import FindingValidator
-from bounty_pipeline.scope import LegalScopeValidator
+from bounty_pipeline.scope import LegalScopeValidator, CompiledScope
 from bounty_pipeline.review import HumanReviewGate
 from bounty_pipeline.report import ReportGenerator
-from bounty_pipeline.audit import AuditTrail
+from bounty_pipeline.audit import (
+    AuditTrail,
+    AuditExport,
+    MerkleProof,
+    build_merkle_tree,
+    verify_inclusion_proof,
+)
 from bounty_pipeline.duplicate import DuplicateDetector
 from bounty_pipeline.pipeline import BountyPipeline
 from bounty_pipeline.adapters import (
     PlatformType,
     EncryptedCredentials,
+    DerivedKeyCache,
+    get_derived_key_cache,
     AuthSession,
     PlatformSchema,
     PlatformAdapter,
@@ -90,6 +98,8 @@ from bounty_pipeline.status import (
 )
 from bounty_pipeline.recovery import (
     RecoveryManager,
+    StateJournal,
+    RetryQueue,
     PipelineState,
     PendingAction,
     ActionResult,
@@ -110,9 +120,14 @@ __all__ = [
     # Components
     "FindingValidator",
     "LegalScopeValidator",
+    "CompiledScope",
     "HumanReviewGate",
     "ReportGenerator",
     "AuditTrail",
+    "AuditExport",
+    "MerkleProof",
+    "build_merkle_tree",
+    "verify_inclusion_proof",
     "DuplicateDetector",
     "SubmissionManager",
     "StatusTracker",
@@ -121,6 +136,8 @@ __all__ = [
     # Platform Adapters
     "PlatformType",
     "EncryptedCredentials",
+    "DerivedKeyCache",
+    "get_derived_key_cache",
     "AuthSession",
     "PlatformSchema",
     "PlatformAdapter",
@@ -134,6 +151,8 @@ __all__ = [
     # Status
     "TrackedSubmission",
     # Recovery
+    "StateJournal",
+    "RetryQueue",
     "PipelineState",
     "PendingAction",
     "ActionResult",
@@ -11,14 +11,18 @@ and NEVER logged. Key rotation is supported via key versioning.
 """
 
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Optional
+import atexit
 import base64
 import hashlib
+import hmac
 import secrets
 import os
+import threading
 
 # Use cryptography library for REAL authenticated encryption
 try:
@@ -79,6 +83,93 @@ def _derive_fernet_key(master_secret: bytes, salt: bytes) -> bytes:
     return base64.urlsafe_b64encode(key)
 
 
+class DerivedKeyCache:
+    """Bounded, process-local LRU cache of PBKDF2-derived Fernet keys.
+    
+    Key derivation costs 480,000 PBKDF2 iterations per call. Pipelines that
+    decrypt the same credentials repeatedly reuse the derived key instead.
+    
+    SECURITY:
+    - The master secret is never stored. Entries are keyed by salt and an
+      HMAC fingerprint of the secret under a random per-process key, so the
+      cache holds nothing that can be brute-forced offline.
+    - Cached keys live in bytearrays and are overwritten with zeros on
+      eviction, clear() and interpreter shutdown.
+    - Only keys that successfully decrypted something are cached.
+    """
+    
+    def __init__(self, max_entries: int = 32) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self._max_entries = max_entries
+        self._fingerprint_key = secrets.token_bytes(32)
+        self._entries: OrderedDict[tuple[bytes, bytes], bytearray] = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def __repr__(self) -> str:
+        return f"DerivedKeyCache(entries={len(self)}, max_entries={self._max_entries})"
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def _cache_key(self, master_secret: bytes, salt: bytes) -> tuple[bytes, bytes]:
+        fingerprint = hmac.new(self._fingerprint_key, master_secret, hashlib.sha256).digest()
+        return (bytes(salt), fingerprint)
+    
+    @staticmethod
+    def _zeroize(key: bytearray) -> None:
+        for i in range(len(key)):
+            key[i] = 0
+    
+    def get(self, master_secret: bytes, salt: bytes) -> Optional[bytes]:
+        """Return the cached Fernet key, or None on a miss."""
+        cache_key = self._cache_key(master_secret, salt)
+        with self._lock:
+            key = self._entries.get(cache_key)
+            if key is None:
+                return None
+            self._entries.move_to_end(cache_key)
+            return bytes(key)
+    
+    def put(self, master_secret: bytes, salt: bytes, fernet_key: bytes) -> None:
+        """Cache a derived key, evicting the least recently used entry if full."""
+        cache_key = self._cache_key(master_secret, salt)
+        with self._lock:
+            old = self._entries.pop(cache_key, None)
+            if old is not None:
+                self._zeroize(old)
+            self._entries[cache_key] = bytearray(fernet_key)
+            while len(self._entries) > self._max_entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._zeroize(evicted)
+    
+    def evict(self, master_secret: bytes, salt: bytes) -> bool:
+        """Remove and zeroize one entry. Returns True if it was cached."""
+        cache_key = self._cache_key(master_secret, salt)
+        with self._lock:
+            key = self._entries.pop(cache_key, None)
+            if key is None:
+                return False
+            self._zeroize(key)
+            return True
+    
+    def clear(self) -> None:
+        """Remove and zeroize every entry."""
+        with self._lock:
+            for key in self._entries.values():
+                self._zeroize(key)
+            self._entries.clear()
+
+
+_derived_key_cache = DerivedKeyCache()
+atexit.register(_derived_key_cache.clear)
+
+
+def get_derived_key_cache() -> DerivedKeyCache:
+    """Get the process-wide derived key cache used by EncryptedCredentials."""
+    return _derived_key_cache
+
+
 @dataclass(frozen=True)
 class EncryptedCredentials:
     """Encrypted credentials for platform authentication.
@@ -150,6 +241,7 @@ class EncryptedCredentials:
         # Encrypt credentials
         plaintext = f"{api_key}:{api_secret}".encode("utf-8")
         encrypted = fernet.encrypt(plaintext)
+        _derived_key_cache.put(master_secret, salt, fernet_key)
 
         return EncryptedCredentials(
             platform=platform,
@@ -175,12 +267,17 @@ class EncryptedCredentials:
             raise CryptoUnavailableError()
         
         try:
-            # Derive Fernet key from master secret
-            fernet_key = _derive_fernet_key(master_secret, self.salt)
+            # Derive Fernet key from master secret (reuse a cached derivation)
+            fernet_key = _derived_key_cache.get(master_secret, self.salt)
+            cached = fernet_key is not None
+            if fernet_key is None:
+                fernet_key = _derive_fernet_key(master_secret, self.salt)
             fernet = Fernet(fernet_key)
             
             # Decrypt and verify integrity
             decrypted = fernet.decrypt(self.encrypted_data)
+            if not cached:
+                _derived_key_cache.put(master_secret, self.salt, fernet_key)
             plaintext = decrypted.decode("utf-8")
             
             api_key, api_secret = plaintext.split(":", 1)
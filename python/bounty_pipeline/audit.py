@@ -4,6 +4,10 @@ Audit Trail - Immutable, tamper-evident log of all actions.
 This module implements an append-only, hash-chained audit trail
 that records every action taken by Bounty Pipeline.
 
+Compliance exports also carry a Merkle root over the exported records
+and an inclusion proof per record, so a single record can be verified
+offline in O(log n) with verify_inclusion_proof().
+
 CRITICAL: Audit records are IMMUTABLE.
 Once created, they cannot be modified or deleted.
 Hash chaining provides tamper evidence.
@@ -23,6 +27,147 @@ from bounty_pipeline.types import AuditRecord
 # Genesis hash for the first record in the chain
 GENESIS_HASH = "0" * 64
 
+# Merkle root of an export with no records
+EMPTY_MERKLE_ROOT = hashlib.sha256(b"").hexdigest()
+
+# Domain separation between leaf and interior Merkle nodes
+_LEAF_PREFIX = b"\x00"
+_NODE_PREFIX = b"\x01"
+
+
+def _merkle_leaf(record_hash: str) -> str:
+    """Merkle leaf hash for an audit record hash."""
+    return hashlib.sha256(_LEAF_PREFIX + bytes.fromhex(record_hash)).hexdigest()
+
+
+def _merkle_node(left: str, right: str) -> str:
+    """Merkle interior node hash."""
+    return hashlib.sha256(
+        _NODE_PREFIX + bytes.fromhex(left) + bytes.fromhex(right)
+    ).hexdigest()
+
+
+@dataclass(frozen=True)
+class MerkleProof:
+    """Inclusion proof for one record in a Merkle tree of audit records.
+
+    The tree pairs nodes left to right at each level; an unpaired last
+    node is carried up unchanged. The sibling positions therefore follow
+    from leaf_index and tree_size, so only sibling hashes are stored.
+    """
+
+    leaf_index: int
+    tree_size: int
+    siblings: tuple[str, ...]
+
+    def __post_init__(self) -> None:
+        """Validate proof shape."""
+        if self.tree_size < 1:
+            raise ValueError("tree_size must be at least 1")
+        if not 0 <= self.leaf_index < self.tree_size:
+            raise ValueError("leaf_index must be within tree_size")
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for a JSON export."""
+        return {
+            "leaf_index": self.leaf_index,
+            "tree_size": self.tree_size,
+            "siblings": list(self.siblings),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "MerkleProof":
+        """Deserialize from a JSON export."""
+        return cls(
+            leaf_index=data["leaf_index"],
+            tree_size=data["tree_size"],
+            siblings=tuple(data["siblings"]),
+        )
+
+
+def build_merkle_tree(record_hashes: list[str]) -> tuple[str, list[MerkleProof]]:
+    """
+    Build a Merkle tree over audit record hashes.
+
+    Args:
+        record_hashes: Record hashes in export order
+
+    Returns:
+        Tuple of (root hash, inclusion proof for each record in order)
+    """
+    if not record_hashes:
+        return EMPTY_MERKLE_ROOT, []
+
+    size = len(record_hashes)
+    level = [_merkle_leaf(h) for h in record_hashes]
+    siblings: list[list[str]] = [[] for _ in range(size)]
+    # Position of each leaf's ancestor within the current level
+    positions = list(range(size))
+
+    while len(level) > 1:
+        for leaf, position in enumerate(positions):
+            sibling = position ^ 1
+            if sibling < len(level):
+                siblings[leaf].append(level[sibling])
+        level = [
+            _merkle_node(level[i], level[i + 1]) if i + 1 < len(level) else level[i]
+            for i in range(0, len(level), 2)
+        ]
+        positions = [p // 2 for p in positions]
+
+    proofs = [
+        MerkleProof(leaf_index=i, tree_size=size, siblings=tuple(path))
+        for i, path in enumerate(siblings)
+    ]
+    return level[0], proofs
+
+
+def verify_inclusion_proof(record: AuditRecord, proof: MerkleProof, merkle_root: str) -> bool:
+    """
+    Verify one audit record against an export's Merkle root (offline).
+
+    The record's hash is recomputed from its fields, so a record whose
+    content was altered fails even if its stored record_hash was not.
+
+    Args:
+        record: The audit record to verify
+        proof: The record's inclusion proof from the export
+        merkle_root: The export's Merkle root
+
+    Returns:
+        True if the record is included unmodified under merkle_root
+    """
+    expected_hash = AuditRecord.compute_hash(
+        record_id=record.record_id,
+        timestamp=record.timestamp,
+        action_type=record.action_type,
+        actor=record.actor,
+        outcome=record.outcome,
+        details=record.details,
+        previous_hash=record.previous_hash,
+    )
+    if record.record_hash != expected_hash:
+        return False
+
+    try:
+        node = _merkle_leaf(expected_hash)
+        siblings = iter(proof.siblings)
+        index, size = proof.leaf_index, proof.tree_size
+        while size > 1:
+            if index % 2 == 1:
+                node = _merkle_node(next(siblings), node)
+            elif index + 1 < size:
+                node = _merkle_node(node, next(siblings))
+            index //= 2
+            size = (size + 1) // 2
+    except (StopIteration, ValueError):
+        # Too few siblings, or a sibling that is not a hex digest
+        return False
+
+    if next(siblings, None) is not None:
+        return False
+    return node == merkle_root
+
 
 @dataclass
 class AuditExport:
@@ -35,6 +180,12 @@ class AuditExport:
     chain_verified: bool
     export_hash: str
     exported_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    merkle_root: str = EMPTY_MERKLE_ROOT
+    inclusion_proofs: dict[str, MerkleProof] = field(default_factory=dict)
+
+    def get_inclusion_proof(self, record_id: str) -> Optional[MerkleProof]:
+        """Get the inclusion proof for an exported record."""
+        return self.inclusion_proofs.get(record_id)
 
 
 class AuditTrail:
@@ -218,7 +369,8 @@ class AuditTrail:
             end: End of time range
 
         Returns:
-            AuditExport with records in range
+            AuditExport with records in range, their Merkle root and
+            a per-record inclusion proof
         """
         # Filter records by time range
         filtered = [
@@ -241,6 +393,8 @@ class AuditTrail:
         )
         export_hash = hashlib.sha256(export_content.encode()).hexdigest()
 
+        merkle_root, proofs = build_merkle_tree([r.record_hash for r in filtered])
+
         return AuditExport(
             records=filtered,
             start_time=start,
@@ -248,6 +402,8 @@ class AuditTrail:
             total_records=len(filtered),
             chain_verified=chain_verified,
             export_hash=export_hash,
+            merkle_root=merkle_root,
+            inclusion_proofs={r.record_id: p for r, p in zip(filtered, proofs)},
         )
 
     def get_records_by_actor(self, actor: str) -> list[AuditRecord]:
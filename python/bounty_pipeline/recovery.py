@@ -8,14 +8,25 @@ CRITICAL CONSTRAINTS:
 - Save state on interrupted reviews
 - Queue actions when network unavailable
 - Alert human when recovery fails
+
+DURABILITY:
+- With a storage directory, every saved state is appended to a write-ahead
+  log as a delta (only audit records added since the previous checkpoint)
+- The log is periodically compacted into a snapshot written atomically
+- Restart replays snapshot + log tail and verifies each state's hash
+- Pending actions are kept in a due-time heap with exponential backoff and
+  their state changes are appended to an action log
 """
 
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Any, Callable, Optional
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
 import hashlib
+import heapq
 import json
+import os
 
 
 from bounty_pipeline.errors import RecoveryError
@@ -52,6 +63,9 @@ class PendingAction:
     max_retries: int = 3
     last_error: Optional[str] = None
     last_attempt_at: Optional[datetime] = None
+    next_attempt_at: Optional[datetime] = None
+    # Set when an attempt was interrupted; held until a human resolves it
+    needs_human_review: bool = False
 
     @property
     def can_retry(self) -> bool:
@@ -59,6 +73,42 @@ class PendingAction:
         return (
             self.retry_count < self.max_retries
             and self.status in (ActionStatus.PENDING, ActionStatus.FAILED)
+            and not self.needs_human_review
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert action to dictionary for serialization."""
+        return {
+            "action_id": self.action_id,
+            "action_type": self.action_type.value,
+            "payload": self.payload,
+            "created_at": self.created_at.isoformat(),
+            "status": self.status.value,
+            "retry_count": self.retry_count,
+            "max_retries": self.max_retries,
+            "last_error": self.last_error,
+            "last_attempt_at": self.last_attempt_at.isoformat() if self.last_attempt_at else None,
+            "next_attempt_at": self.next_attempt_at.isoformat() if self.next_attempt_at else None,
+            "needs_human_review": self.needs_human_review,
+        }
+
+    @staticmethod
+    def from_dict(data: dict[str, Any]) -> "PendingAction":
+        """Create action from dictionary."""
+        last_attempt = data.get("last_attempt_at")
+        next_attempt = data.get("next_attempt_at")
+        return PendingAction(
+            action_id=data["action_id"],
+            action_type=ActionType(data["action_type"]),
+            payload=data.get("payload", {}),
+            created_at=datetime.fromisoformat(data["created_at"]),
+            status=ActionStatus(data.get("status", ActionStatus.PENDING.value)),
+            retry_count=data.get("retry_count", 0),
+            max_retries=data.get("max_retries", 3),
+            last_error=data.get("last_error"),
+            last_attempt_at=datetime.fromisoformat(last_attempt) if last_attempt else None,
+            next_attempt_at=datetime.fromisoformat(next_attempt) if next_attempt else None,
+            needs_human_review=data.get("needs_human_review", False),
         )
 
 
@@ -116,6 +166,454 @@ class PipelineState:
         return hashlib.sha256(content.encode()).hexdigest()
 
 
+class StateJournal:
+    """
+    File-backed write-ahead log of PipelineState checkpoints.
+
+    Each checkpoint is one NDJSON line carrying the state's scalar fields,
+    the audit records appended since the previous checkpoint and the
+    state's compute_hash(). Audit trails only grow, so a save writes the
+    delta instead of the whole history. When the previous checkpoint's
+    audit records are not a prefix of the new state's, the full list is
+    written.
+
+    Every ``snapshot_interval`` checkpoints the log is compacted into a
+    snapshot (same delta encoding, one entry per state id) and truncated.
+    A torn final line from a crash mid-write is discarded on load; any
+    other corrupt line is a RecoveryError.
+
+    Layout inside the directory:
+    - states.snapshot.json: compacted checkpoints up to ``last_seq``
+    - states.wal: checkpoints after the snapshot, one per line
+    """
+
+    SNAPSHOT_FILE = "states.snapshot.json"
+    WAL_FILE = "states.wal"
+
+    def __init__(
+        self,
+        directory: str | Path,
+        snapshot_interval: int = 100,
+        fsync: bool = True,
+    ) -> None:
+        """
+        Initialize journal.
+
+        Args:
+            directory: Directory holding the snapshot and log files
+            snapshot_interval: Log entries written before compaction
+            fsync: Flush each write to stable storage before returning
+
+        Raises:
+            ValueError: If snapshot_interval < 1
+        """
+        if snapshot_interval < 1:
+            raise ValueError("snapshot_interval must be >= 1")
+        self._dir = Path(directory)
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self._snapshot_path = self._dir / self.SNAPSHOT_FILE
+        self._wal_path = self._dir / self.WAL_FILE
+        self._snapshot_interval = snapshot_interval
+        self._fsync = fsync
+        self._seq = 0
+        self._wal_entries = 0
+        # Serialized audit records of the previous checkpoint, for delta encoding
+        self._prev_audit: list[str] = []
+
+    @property
+    def directory(self) -> Path:
+        return self._dir
+
+    @property
+    def wal_entries(self) -> int:
+        """Checkpoints in the log since the last snapshot."""
+        return self._wal_entries
+
+    @property
+    def needs_compaction(self) -> bool:
+        return self._wal_entries >= self._snapshot_interval
+
+    @staticmethod
+    def _canonical(value: Any) -> str:
+        return json.dumps(value, sort_keys=True)
+
+    @staticmethod
+    def _checksum(record: dict[str, Any]) -> str:
+        return hashlib.sha256(StateJournal._canonical(record).encode()).hexdigest()
+
+    def _encode(self, state: PipelineState) -> dict[str, Any]:
+        """Delta-encode a state against the previous checkpoint."""
+        audit = [self._canonical(r) for r in state.audit_records]
+        base = len(self._prev_audit)
+        if len(audit) < base or audit[:base] != self._prev_audit:
+            base = 0
+
+        data = state.to_dict()
+        del data["audit_records"]
+        self._seq += 1
+        record = {
+            "seq": self._seq,
+            "state": data,
+            "audit_base": base,
+            "audit_append": state.audit_records[base:],
+            "state_hash": state.compute_hash(),
+        }
+
+        self._prev_audit = audit
+        return record
+
+    def _write_line(self, f: Any, record: dict[str, Any]) -> None:
+        line = {"record": record, "checksum": self._checksum(record)}
+        f.write(self._canonical(line) + "\n")
+
+    def _sync(self, f: Any) -> None:
+        f.flush()
+        if self._fsync:
+            os.fsync(f.fileno())
+
+    def append(self, state: PipelineState) -> None:
+        """
+        Append a checkpoint for state to the log.
+
+        Raises:
+            RecoveryError: If the log cannot be written
+        """
+        record = self._encode(state)
+        try:
+            with open(self._wal_path, "a", encoding="utf-8") as f:
+                self._write_line(f, record)
+                self._sync(f)
+        except OSError as e:
+            raise RecoveryError(f"Failed to append state checkpoint: {e}") from e
+        self._wal_entries += 1
+
+    def compact(self, states: Iterable[PipelineState]) -> None:
+        """
+        Write a snapshot of states and truncate the log.
+
+        The snapshot is written to a temporary file and renamed into place,
+        so a crash leaves either the old or the new snapshot. Log entries
+        already covered by the snapshot are skipped on load, so a crash
+        between rename and truncation is harmless.
+
+        Raises:
+            RecoveryError: If the snapshot cannot be written
+        """
+        self._prev_audit = []
+        records = [self._encode(state) for state in states]
+        tmp_path = self._snapshot_path.with_suffix(".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(self._canonical({"last_seq": self._seq}) + "\n")
+                for record in records:
+                    self._write_line(f, record)
+                self._sync(f)
+            os.replace(tmp_path, self._snapshot_path)
+            with open(self._wal_path, "w", encoding="utf-8") as f:
+                self._sync(f)
+        except OSError as e:
+            raise RecoveryError(f"Failed to write state snapshot: {e}") from e
+        self._wal_entries = 0
+
+    def _read_records(self, path: Path, header: bool) -> list[dict[str, Any]]:
+        """
+        Read and checksum-verify the records of one journal file.
+
+        A torn final log line (crash mid-append) is cut off so later
+        appends start on a clean line. Snapshots are renamed into place
+        complete, so any bad snapshot line is corruption.
+        """
+        with open(path, "rb") as f:
+            data = f.read()
+        lines = data.split(b"\n")
+        complete = lines[:-1]
+        tail = lines[-1]
+        if tail:
+            # No trailing newline: the last write did not finish
+            complete.append(tail)
+
+        records = []
+        offset = 0
+        for i, raw in enumerate(complete[1:] if header else complete):
+            try:
+                line = json.loads(raw)
+                record = line["record"]
+                valid = line["checksum"] == self._checksum(record)
+            except (ValueError, KeyError, TypeError):
+                valid = False
+            is_last = i == len(complete) - (2 if header else 1)
+            if not valid or (is_last and tail):
+                if not header and is_last:
+                    with open(path, "r+b") as f:
+                        f.truncate(offset)
+                    break
+                raise RecoveryError(f"Corrupt journal entry {i + 1} in {path.name}")
+            records.append(record)
+            offset += len(raw) + 1
+        return records
+
+    def load(self) -> tuple[dict[str, PipelineState], dict[str, str]]:
+        """
+        Rebuild saved states from snapshot and log.
+
+        Audit lists are reassembled from deltas; hashes are returned rather
+        than checked here so callers can verify each state on first use.
+
+        Returns:
+            (states by id, expected compute_hash() by id)
+
+        Raises:
+            RecoveryError: If a journal file is corrupt or inconsistent
+        """
+        last_seq = 0
+        records: list[dict[str, Any]] = []
+        if self._snapshot_path.exists():
+            with open(self._snapshot_path, "r", encoding="utf-8") as f:
+                header = f.readline()
+            try:
+                last_seq = json.loads(header)["last_seq"]
+            except (ValueError, KeyError, TypeError) as e:
+                raise RecoveryError("Corrupt state snapshot header") from e
+            records = self._read_records(self._snapshot_path, header=True)
+
+        wal_records = []
+        if self._wal_path.exists():
+            wal_records = [
+                r for r in self._read_records(self._wal_path, header=False)
+                if r["seq"] > last_seq
+            ]
+
+        # Log entries continue the delta chain from the snapshot's last entry
+        states: dict[str, PipelineState] = {}
+        hashes: dict[str, str] = {}
+        prev_audit: list[dict[str, Any]] = []
+        for record in records + wal_records:
+            base = record["audit_base"]
+            if base > len(prev_audit):
+                raise RecoveryError(f"Journal entry {record['seq']} has no delta base")
+            audit = prev_audit[:base] + record["audit_append"]
+            state = PipelineState.from_dict(dict(record["state"], audit_records=audit))
+            states[state.state_id] = state
+            hashes[state.state_id] = record["state_hash"]
+            prev_audit = audit
+            last_seq = max(last_seq, record["seq"])
+
+        self._seq = last_seq
+        self._wal_entries = len(wal_records)
+        self._prev_audit = [self._canonical(r) for r in prev_audit]
+        return states, hashes
+
+
+class RetryQueue:
+    """
+    Due-time ordered queue of pending actions with exponential backoff.
+
+    Actions are indexed by a heap of (next_attempt_at, sequence, action_id).
+    Rescheduling pushes a new heap entry; superseded entries are dropped
+    lazily when they reach the top, so schedule and pull are O(log n).
+
+    With a log path, every action state change is appended to the log as
+    one NDJSON line and the latest line per action wins on load. Completed
+    actions are reloaded but never rescheduled, so they are not re-run
+    after restart. Actions interrupted mid-attempt are reloaded as FAILED
+    and held for human review: the attempt may have reached the platform,
+    so they are never pulled again until a human resolves them.
+    """
+
+    def __init__(
+        self,
+        log_path: Optional[str | Path] = None,
+        base_delay_seconds: float = 30.0,
+        max_delay_seconds: float = 3600.0,
+        fsync: bool = True,
+    ) -> None:
+        """
+        Initialize retry queue.
+
+        Args:
+            log_path: Action log file (None = memory only)
+            base_delay_seconds: Delay before the first retry
+            max_delay_seconds: Upper bound on the backoff delay
+            fsync: Flush log writes to stable storage
+
+        Raises:
+            ValueError: If delays are negative or max < base
+        """
+        if base_delay_seconds < 0:
+            raise ValueError("base_delay_seconds must be >= 0")
+        if max_delay_seconds < base_delay_seconds:
+            raise ValueError("max_delay_seconds must be >= base_delay_seconds")
+        self._log_path = Path(log_path) if log_path is not None else None
+        self._base_delay = base_delay_seconds
+        self._max_delay = max_delay_seconds
+        self._fsync = fsync
+        self._heap: list[tuple[datetime, int, str]] = []
+        self._sequence = 0
+        self._log_lines = 0
+        self._actions: dict[str, PendingAction] = {}
+
+    @property
+    def actions(self) -> dict[str, PendingAction]:
+        """All known actions by id (shared with RecoveryManager)."""
+        return self._actions
+
+    def backoff(self, retry_count: int) -> timedelta:
+        """Delay before the next attempt after retry_count attempts."""
+        if retry_count < 1:
+            return timedelta(0)
+        delay = min(self._max_delay, self._base_delay * (2 ** (retry_count - 1)))
+        return timedelta(seconds=delay)
+
+    def _is_current(self, due_at: datetime, action_id: str) -> bool:
+        action = self._actions.get(action_id)
+        return (
+            action is not None
+            and action.can_retry
+            and action.next_attempt_at == due_at
+        )
+
+    def add(self, action: PendingAction) -> None:
+        """Register a new action, due at its next_attempt_at (or now)."""
+        if action.next_attempt_at is None:
+            action.next_attempt_at = datetime.now(timezone.utc)
+        self._actions[action.action_id] = action
+        self.schedule(action)
+
+    def schedule(self, action: PendingAction) -> None:
+        """Index action at its next_attempt_at and record its state."""
+        if action.can_retry and action.next_attempt_at is not None:
+            self._sequence += 1
+            heapq.heappush(self._heap, (action.next_attempt_at, self._sequence, action.action_id))
+        self.record(action)
+
+    def reschedule_after_failure(self, action: PendingAction, now: datetime) -> None:
+        """Set the backoff due time for a failed action and re-index it."""
+        if action.can_retry:
+            action.next_attempt_at = now + self.backoff(action.retry_count)
+        else:
+            action.next_attempt_at = None
+        self.schedule(action)
+
+    def due(self, now: datetime, limit: Optional[int] = None) -> list[PendingAction]:
+        """
+        Get actions due at or before now, earliest first.
+
+        Due actions stay queued until processed; only stale heap entries
+        are discarded.
+        """
+        found: list[tuple[datetime, int, str]] = []
+        while self._heap and (limit is None or len(found) < limit):
+            entry = self._heap[0]
+            if not self._is_current(entry[0], entry[2]):
+                heapq.heappop(self._heap)
+                continue
+            if entry[0] > now:
+                break
+            found.append(heapq.heappop(self._heap))
+        for entry in found:
+            heapq.heappush(self._heap, entry)
+        return [self._actions[action_id] for _, _, action_id in found]
+
+    def next_due_at(self) -> Optional[datetime]:
+        """Earliest due time of any retryable action."""
+        while self._heap and not self._is_current(self._heap[0][0], self._heap[0][2]):
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
+
+    def remove(self, action_ids: Iterable[str]) -> None:
+        """Forget actions (heap entries go stale and are dropped lazily)."""
+        removed = [a for a in action_ids if self._actions.pop(a, None) is not None]
+        if self._log_path is not None and removed:
+            self._append([{"action_id": a, "removed": True} for a in removed])
+            if self._log_lines > 2 * len(self._actions) + 64:
+                self._compact()
+
+    def record(self, action: PendingAction) -> None:
+        """Append the action's current state to the log."""
+        if self._log_path is not None:
+            self._append([action.to_dict()])
+
+    def _append(self, entries: list[dict[str, Any]]) -> None:
+        data = "".join(json.dumps(e, sort_keys=True) + "\n" for e in entries)
+        try:
+            with open(self._log_path, "a", encoding="utf-8") as f:
+                f.write(data)
+                f.flush()
+                if self._fsync:
+                    os.fsync(f.fileno())
+        except OSError as e:
+            raise RecoveryError(f"Failed to write action log: {e}") from e
+        self._log_lines += len(entries)
+
+    def _compact(self) -> None:
+        """Rewrite the log with one line per live action."""
+        tmp_path = self._log_path.with_suffix(".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                for action in self._actions.values():
+                    f.write(json.dumps(action.to_dict(), sort_keys=True) + "\n")
+                f.flush()
+                if self._fsync:
+                    os.fsync(f.fileno())
+            os.replace(tmp_path, self._log_path)
+        except OSError as e:
+            raise RecoveryError(f"Failed to compact action log: {e}") from e
+        self._log_lines = len(self._actions)
+
+    def load(self) -> dict[str, PendingAction]:
+        """
+        Rebuild actions and the heap from the action log.
+
+        Lines that parse as JSON but are not an object with a string
+        action_id are skipped, as is a torn final line.
+
+        Returns:
+            Actions by id, in first-queued order
+
+        Raises:
+            RecoveryError: If a log line other than a torn final line is corrupt
+        """
+        if self._log_path is None or not self._log_path.exists():
+            return self._actions
+        with open(self._log_path, "r", encoding="utf-8") as f:
+            lines = f.read().split("\n")
+        torn = lines.pop() != ""
+
+        latest: dict[str, Optional[dict[str, Any]]] = {}
+        for i, raw in enumerate(lines):
+            try:
+                entry = json.loads(raw)
+            except ValueError as e:
+                raise RecoveryError(f"Corrupt action log line {i + 1}") from e
+            if not isinstance(entry, dict) or not isinstance(entry.get("action_id"), str):
+                # Valid JSON but not an action record; it names no action
+                continue
+            latest[entry["action_id"]] = None if entry.get("removed") else entry
+        self._log_lines = len(lines)
+
+        for data in latest.values():
+            if data is None:
+                continue
+            action = PendingAction.from_dict(data)
+            if action.status == ActionStatus.IN_PROGRESS:
+                # Attempt was interrupted; its outcome is unknown, so replaying
+                # it could repeat a submission
+                action.status = ActionStatus.FAILED
+                action.last_error = "Interrupted before completion; outcome unknown"
+                action.next_attempt_at = None
+                action.needs_human_review = True
+            self._actions[action.action_id] = action
+            if action.can_retry and action.next_attempt_at is not None:
+                self._sequence += 1
+                heapq.heappush(
+                    self._heap, (action.next_attempt_at, self._sequence, action.action_id)
+                )
+        if torn:
+            # Drop the partial line so later appends start clean
+            self._compact()
+        return self._actions
+
+
 class RecoveryManager:
     """
     Manages state persistence and recovery.
@@ -126,17 +624,73 @@ class RecoveryManager:
     - Recovers pending work from persistent storage
     - Queues actions when network unavailable
     - Alerts human when recovery fails
+
+    Without a storage directory, states and actions live in memory only.
+    With one, states are journaled (see StateJournal), actions are logged
+    (see RetryQueue), and both are reloaded on construction.
     """
 
-    def __init__(self) -> None:
-        """Initialize recovery manager."""
+    def __init__(
+        self,
+        storage_dir: Optional[str | Path] = None,
+        snapshot_interval: int = 100,
+        fsync: bool = True,
+        retry_base_delay_seconds: float = 30.0,
+        retry_max_delay_seconds: float = 3600.0,
+    ) -> None:
+        """
+        Initialize recovery manager.
+
+        Args:
+            storage_dir: Directory for the state journal and action log
+                (None = memory only)
+            snapshot_interval: Journal entries between compacted snapshots
+            fsync: Flush journal and log writes to stable storage
+            retry_base_delay_seconds: Backoff before the first retry
+            retry_max_delay_seconds: Upper bound on retry backoff
+
+        Raises:
+            RecoveryError: If an existing journal or action log is corrupt
+        """
         self._saved_states: dict[str, PipelineState] = {}
-        self._pending_actions: dict[str, PendingAction] = {}
+        self._retry_queue = RetryQueue(
+            Path(storage_dir) / "actions.log" if storage_dir is not None else None,
+            retry_base_delay_seconds,
+            retry_max_delay_seconds,
+            fsync,
+        )
+        self._pending_actions: dict[str, PendingAction] = self._retry_queue.actions
         self._action_counter = 0
         self._state_counter = 0
         self._human_alerts: list[dict[str, Any]] = []
         self._action_handlers: dict[ActionType, Callable[[PendingAction], ActionResult]] = {}
 
+        self._journal: Optional[StateJournal] = None
+        # Hashes recorded at save time, checked when a reloaded state is first used
+        self._unverified_hashes: dict[str, str] = {}
+        if storage_dir is not None:
+            self._journal = StateJournal(storage_dir, snapshot_interval, fsync)
+            self._saved_states, self._unverified_hashes = self._journal.load()
+            self._retry_queue.load()
+            self._state_counter = self._max_id_number(self._saved_states, "state")
+            self._action_counter = self._max_id_number(self._pending_actions, "action")
+            for action in self.get_actions_needing_review():
+                self.alert_human(
+                    RecoveryError(f"Action {action.action_id} was interrupted; outcome unknown"),
+                    {"action_id": action.action_id, "action_type": action.action_type.value},
+                    severity="warning",
+                )
+
+    @staticmethod
+    def _max_id_number(items: dict[str, Any], prefix: str) -> int:
+        """Highest counter used by ids of the form '<prefix>-NNNNNN'."""
+        highest = 0
+        for item_id in items:
+            item_prefix, _, number = item_id.rpartition("-")
+            if item_prefix == prefix and number.isdigit():
+                highest = max(highest, int(number))
+        return highest
+
     def save_state(self, state: PipelineState) -> str:
         """
         Save current state to persistent storage.
@@ -146,10 +700,29 @@ class RecoveryManager:
 
         Returns:
             State ID for later recovery
+
+        Raises:
+            RecoveryError: If the state journal cannot be written
         """
+        if self._journal is not None:
+            self._journal.append(state)
         self._saved_states[state.state_id] = state
+        self._unverified_hashes.pop(state.state_id, None)
+        if self._journal is not None and self._journal.needs_compaction:
+            self._journal.compact(self._saved_states.values())
         return state.state_id
 
+    def _verified(self, state: PipelineState) -> PipelineState:
+        """Check a reloaded state against the hash recorded when it was saved."""
+        expected = self._unverified_hashes.get(state.state_id)
+        if expected is not None:
+            if state.compute_hash() != expected:
+                raise RecoveryError(
+                    f"State {state.state_id} failed integrity check on recovery"
+                )
+            del self._unverified_hashes[state.state_id]
+        return state
+
     def create_state(
         self,
         pending_drafts: Optional[list[dict[str, Any]]] = None,
@@ -193,22 +766,26 @@ class RecoveryManager:
 
         Returns:
             Recovered PipelineState or None if not found
+
+        Raises:
+            RecoveryError: If a reloaded state does not match its saved hash
         """
         if state_id:
-            return self._saved_states.get(state_id)
+            state = self._saved_states.get(state_id)
+            return self._verified(state) if state is not None else None
 
         # Return most recent state
         if not self._saved_states:
             return None
 
-        return max(
+        return self._verified(max(
             self._saved_states.values(),
             key=lambda s: s.created_at,
-        )
+        ))
 
     def get_all_states(self) -> list[PipelineState]:
         """Get all saved states."""
-        return list(self._saved_states.values())
+        return [self._verified(s) for s in self._saved_states.values()]
 
     def queue_action(
         self,
@@ -237,7 +814,7 @@ class RecoveryManager:
             max_retries=max_retries,
         )
 
-        self._pending_actions[action_id] = action
+        self._retry_queue.add(action)
         return action
 
     def get_pending_actions(self) -> list[PendingAction]:
@@ -247,6 +824,58 @@ class RecoveryManager:
             if a.status in (ActionStatus.PENDING, ActionStatus.FAILED) and a.can_retry
         ]
 
+    def get_actions_needing_review(self) -> list[PendingAction]:
+        """Get interrupted actions held until a human resolves them."""
+        return [a for a in self._pending_actions.values() if a.needs_human_review]
+
+    def resolve_interrupted_action(self, action_id: str, completed: bool) -> PendingAction:
+        """
+        Record a human's finding for an interrupted action.
+
+        Args:
+            action_id: ID of an action held for review
+            completed: True if the interrupted attempt took effect; False
+                to make the action due for retry now
+
+        Returns:
+            The resolved action
+
+        Raises:
+            ValueError: If the action is not held for review
+        """
+        action = self._pending_actions.get(action_id)
+        if action is None or not action.needs_human_review:
+            raise ValueError(f"Action not held for review: {action_id}")
+        action.needs_human_review = False
+        if completed:
+            action.status = ActionStatus.COMPLETED
+            action.next_attempt_at = None
+        else:
+            action.next_attempt_at = datetime.now(timezone.utc)
+        self._retry_queue.schedule(action)
+        return action
+
+    def get_due_actions(
+        self,
+        now: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> list[PendingAction]:
+        """
+        Get retryable actions whose next attempt is due, earliest first.
+
+        Args:
+            now: Reference time (default: current UTC time)
+            limit: Maximum number of actions to return
+
+        Returns:
+            Due PendingAction objects
+        """
+        return self._retry_queue.due(now or datetime.now(timezone.utc), limit)
+
+    def next_retry_at(self) -> Optional[datetime]:
+        """Get the earliest time any pending action becomes due."""
+        return self._retry_queue.next_due_at()
+
     def get_action(self, action_id: str) -> Optional[PendingAction]:
         """Get a specific action by ID."""
         return self._pending_actions.get(action_id)
@@ -292,6 +921,8 @@ class RecoveryManager:
         action.status = ActionStatus.IN_PROGRESS
         action.last_attempt_at = datetime.now(timezone.utc)
         action.retry_count += 1
+        # Logged before running, so a crash mid-attempt is seen on restart
+        self._retry_queue.record(action)
 
         try:
             handler = self._action_handlers[action.action_type]
@@ -299,15 +930,19 @@ class RecoveryManager:
 
             if result.success:
                 action.status = ActionStatus.COMPLETED
+                action.next_attempt_at = None
+                self._retry_queue.record(action)
             else:
                 action.status = ActionStatus.FAILED
                 action.last_error = result.error
+                self._retry_queue.reschedule_after_failure(action, action.last_attempt_at)
 
             return result
 
         except Exception as e:
             action.status = ActionStatus.FAILED
             action.last_error = str(e)
+            self._retry_queue.reschedule_after_failure(action, action.last_attempt_at)
 
             return ActionResult(
                 action_id=action_id,
@@ -316,15 +951,21 @@ class RecoveryManager:
                 error=str(e),
             )
 
-    def process_queue(self) -> list[ActionResult]:
+    def process_queue(self, now: Optional[datetime] = None) -> list[ActionResult]:
         """
-        Process all pending actions.
+        Process all pending actions that are due.
+
+        Failed actions are rescheduled with exponential backoff and are
+        not retried in the same pass.
+
+        Args:
+            now: Reference time (default: current UTC time)
 
         Returns:
             List of ActionResult objects
         """
         results = []
-        pending = self.get_pending_actions()
+        pending = self.get_due_actions(now)
 
         for action in pending:
             try:
@@ -387,8 +1028,7 @@ class RecoveryManager:
             if action.status == ActionStatus.COMPLETED
         ]
 
-        for action_id in completed:
-            del self._pending_actions[action_id]
+        self._retry_queue.remove(completed)
 
         return len(completed)
 
@@ -4,16 +4,25 @@ Legal Scope Validator - Ensures all actions are within legal authorization.
 This module validates that targets are within authorized scope before any action.
 It enforces legal boundaries and requires human confirmation for ambiguous cases.
 
+Each authorization document is compiled once into a CompiledScope (sorted
+IP interval tables, domain suffix sets and one combined exclusion regex) so
+per-target validation cost does not grow with the number of scope entries.
+
 CRITICAL: This validator causes HARD STOP on scope violations.
 Operating outside legal authorization is never acceptable.
 """
 
+from bisect import bisect_right
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Optional
 import fnmatch
 import ipaddress
+import os
+import re
+import threading
 from urllib.parse import urlparse
 
 from bounty_pipeline.errors import ScopeViolationError, AuthorizationExpiredError
@@ -49,6 +58,144 @@ class HumanConfirmationRequest:
     requested_at: datetime
 
 
+class CompiledScope:
+    """
+    Precompiled matchers for one AuthorizationDocument.
+
+    Decisions are identical to matching the raw document entries:
+    - IP ranges: merged, sorted (start, end) integer intervals per IP
+      version, searched with bisect
+    - Domains: exact-match set plus a set of ".suffix" strings checked
+      once per label boundary of the target
+    - Exclusions: all fnmatch globs translated into one alternation regex
+    - Ambiguity: one alternation regex for "authorized in domain" and a
+      joined haystack for "domain in authorized"
+    """
+
+    _SEPARATOR = "\x00"
+
+    def __init__(self, auth_doc: AuthorizationDocument) -> None:
+        """Compile the scope entries of auth_doc."""
+        self._authorized_domains = tuple(auth_doc.authorized_domains)
+        self._domain_set = frozenset(self._authorized_domains)
+
+        exact = set(self._authorized_domains)
+        suffixes = set()
+        for authorized in self._authorized_domains:
+            suffixes.add("." + authorized)
+            if authorized.startswith("*."):
+                exact.add(authorized[2:])
+                suffixes.add("." + authorized[2:])
+        self._exact_domains = frozenset(exact)
+        self._domain_suffixes = frozenset(suffixes)
+
+        self._ip_tables = self._compile_ip_ranges(auth_doc.authorized_ip_ranges)
+
+        self._exclusion_regex = None
+        if auth_doc.excluded_paths:
+            self._exclusion_regex = re.compile("|".join(
+                f"(?:{fnmatch.translate(os.path.normcase(p))})"
+                for p in auth_doc.excluded_paths
+            ))
+
+        self._ambiguity_regex = None
+        self._authorized_haystack = self._SEPARATOR.join(self._authorized_domains)
+        if self._authorized_domains:
+            self._ambiguity_regex = re.compile(
+                "|".join(re.escape(a) for a in self._authorized_domains)
+            )
+
+    @staticmethod
+    def _compile_ip_ranges(
+        ranges: tuple[str, ...],
+    ) -> dict[int, tuple[list[int], list[int]]]:
+        """Build merged interval tables keyed by IP version."""
+        intervals: dict[int, list[tuple[int, int]]] = {4: [], 6: []}
+        for range_str in ranges:
+            try:
+                network = ipaddress.ip_network(range_str, strict=False)
+                start = int(network.network_address)
+                end = int(network.broadcast_address)
+                version = network.version
+            except ValueError:
+                try:
+                    address = ipaddress.ip_address(range_str)
+                except ValueError:
+                    continue
+                start = end = int(address)
+                version = address.version
+            intervals[version].append((start, end))
+
+        tables = {}
+        for version, spans in intervals.items():
+            spans.sort()
+            starts: list[int] = []
+            ends: list[int] = []
+            for start, end in spans:
+                if ends and start <= ends[-1] + 1:
+                    ends[-1] = max(ends[-1], end)
+                else:
+                    starts.append(start)
+                    ends.append(end)
+            tables[version] = (starts, ends)
+        return tables
+
+    def is_excluded(self, parsed: dict) -> bool:
+        """Check path, domain and full target against the exclusion globs."""
+        if self._exclusion_regex is None:
+            return False
+        match = self._exclusion_regex.match
+        path = parsed.get("path", "")
+        domain = parsed.get("domain", "")
+        return bool(
+            (path and match(os.path.normcase(path)))
+            or (domain and match(os.path.normcase(domain)))
+            or match(os.path.normcase(parsed["original"]))
+        )
+
+    def is_authorized_domain(self, domain: Optional[str]) -> bool:
+        """Check domain against exact, wildcard and subdomain entries."""
+        if not domain:
+            return False
+        if domain in self._exact_domains:
+            return True
+        suffixes = self._domain_suffixes
+        position = domain.find(".")
+        while position != -1:
+            if domain[position:] in suffixes:
+                return True
+            position = domain.find(".", position + 1)
+        return False
+
+    def is_authorized_ip(self, ip_str: Optional[str]) -> bool:
+        """Check an IP address against the interval tables."""
+        if not ip_str:
+            return False
+        try:
+            ip = ipaddress.ip_address(ip_str)
+        except ValueError:
+            return False
+        starts, ends = self._ip_tables[ip.version]
+        value = int(ip)
+        index = bisect_right(starts, value) - 1
+        return index >= 0 and value <= ends[index]
+
+    def is_ambiguous(self, domain: Optional[str]) -> bool:
+        """Check for a partial (substring) match with any authorized domain."""
+        if not domain or self._ambiguity_regex is None:
+            return False
+        if domain in self._domain_set or self._SEPARATOR in domain:
+            # An exact entry must be skipped individually
+            return any(
+                (a in domain or domain in a) and domain != a
+                for a in self._authorized_domains
+            )
+        return (
+            self._ambiguity_regex.search(domain) is not None
+            or domain in self._authorized_haystack
+        )
+
+
 class LegalScopeValidator:
     """
     Validates that targets are within authorized scope.
@@ -64,6 +211,36 @@ class LegalScopeValidator:
     Operating outside legal authorization is never acceptable.
     """
 
+    def __init__(self, max_compiled_scopes: int = 64) -> None:
+        """
+        Initialize validator.
+
+        Args:
+            max_compiled_scopes: Authorization documents kept compiled (LRU)
+        """
+        self._max_compiled_scopes = max_compiled_scopes
+        self._compiled: OrderedDict[AuthorizationDocument, CompiledScope] = OrderedDict()
+        self._compiled_lock = threading.Lock()
+
+    def compile_scope(self, auth_doc: AuthorizationDocument) -> CompiledScope:
+        """
+        Get the compiled scope for auth_doc, compiling it on first use.
+
+        AuthorizationDocument is frozen, so a document's compiled form
+        never goes stale.
+        """
+        with self._compiled_lock:
+            compiled = self._compiled.get(auth_doc)
+            if compiled is not None:
+                self._compiled.move_to_end(auth_doc)
+                return compiled
+        compiled = CompiledScope(auth_doc)
+        with self._compiled_lock:
+            self._compiled[auth_doc] = compiled
+            while len(self._compiled) > self._max_compiled_scopes:
+                self._compiled.popitem(last=False)
+        return compiled
+
     def validate_target(
         self, target: str, auth_doc: AuthorizationDocument
     ) -> ScopeValidation:
@@ -98,16 +275,17 @@ class LegalScopeValidator:
 
         # Parse target to extract domain/IP
         parsed = self._parse_target(target)
+        compiled = self.compile_scope(auth_doc)
 
         # Check if target is in excluded paths
-        if self._is_excluded(parsed, auth_doc):
+        if compiled.is_excluded(parsed):
             raise ScopeViolationError(
                 f"Target {target} is in excluded paths for {auth_doc.program_name}. "
                 f"This target is explicitly out of scope."
             )
 
         # Check if target is in authorized domains
-        if self._is_authorized_domain(parsed, auth_doc):
+        if compiled.is_authorized_domain(parsed.get("domain")):
             return ScopeValidation(
                 decision=ScopeDecision.IN_SCOPE,
                 target=target,
@@ -115,7 +293,7 @@ class LegalScopeValidator:
             )
 
         # Check if target is in authorized IP ranges
-        if self._is_authorized_ip(parsed, auth_doc):
+        if compiled.is_authorized_ip(parsed.get("ip")):
             return ScopeValidation(
                 decision=ScopeDecision.IN_SCOPE,
                 target=target,
@@ -123,7 +301,7 @@ class LegalScopeValidator:
             )
 
         # Check if scope is ambiguous
-        if self._is_ambiguous(parsed, auth_doc):
+        if compiled.is_ambiguous(parsed.get("domain")):
             return ScopeValidation(
                 decision=ScopeDecision.AMBIGUOUS,
                 target=target,
@@ -166,86 +344,21 @@ class LegalScopeValidator:
 
     def _is_excluded(self, parsed: dict, auth_doc: AuthorizationDocument) -> bool:
         """Check if target is in excluded paths."""
-        path = parsed.get("path", "")
-        domain = parsed.get("domain", "")
-
-        for excluded in auth_doc.excluded_paths:
-            # Check path exclusion
-            if path and fnmatch.fnmatch(path, excluded):
-                return True
-            # Check domain exclusion
-            if domain and fnmatch.fnmatch(domain, excluded):
-                return True
-            # Check full target exclusion
-            if fnmatch.fnmatch(parsed["original"], excluded):
-                return True
-
-        return False
+        return self.compile_scope(auth_doc).is_excluded(parsed)
 
     def _is_authorized_domain(
         self, parsed: dict, auth_doc: AuthorizationDocument
     ) -> bool:
         """Check if target domain is authorized."""
-        domain = parsed.get("domain")
-        if not domain:
-            return False
-
-        for authorized in auth_doc.authorized_domains:
-            # Exact match
-            if domain == authorized:
-                return True
-            # Wildcard match (e.g., *.example.com)
-            if authorized.startswith("*."):
-                base_domain = authorized[2:]
-                if domain == base_domain or domain.endswith("." + base_domain):
-                    return True
-            # Subdomain match
-            if domain.endswith("." + authorized):
-                return True
-
-        return False
+        return self.compile_scope(auth_doc).is_authorized_domain(parsed.get("domain"))
 
     def _is_authorized_ip(self, parsed: dict, auth_doc: AuthorizationDocument) -> bool:
         """Check if target IP is in authorized ranges."""
-        ip_str = parsed.get("ip")
-        if not ip_str:
-            return False
-
-        try:
-            ip = ipaddress.ip_address(ip_str)
-        except ValueError:
-            return False
-
-        for range_str in auth_doc.authorized_ip_ranges:
-            try:
-                # Try as network
-                network = ipaddress.ip_network(range_str, strict=False)
-                if ip in network:
-                    return True
-            except ValueError:
-                # Try as single IP
-                try:
-                    if ip == ipaddress.ip_address(range_str):
-                        return True
-                except ValueError:
-                    continue
-
-        return False
+        return self.compile_scope(auth_doc).is_authorized_ip(parsed.get("ip"))
 
     def _is_ambiguous(self, parsed: dict, auth_doc: AuthorizationDocument) -> bool:
         """Check if scope determination is ambiguous."""
-        domain = parsed.get("domain")
-        if not domain:
-            return False
-
-        # Check for partial matches that might be ambiguous
-        for authorized in auth_doc.authorized_domains:
-            # Similar domain names might be ambiguous
-            if authorized in domain or domain in authorized:
-                if domain != authorized:
-                    return True
-
-        return False
+        return self.compile_scope(auth_doc).is_ambiguous(parsed.get("domain"))
 
     def is_ambiguous(self, target: str, auth_doc: AuthorizationDocument) -> bool:
         """
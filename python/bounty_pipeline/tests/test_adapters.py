@@ -9,13 +9,19 @@ Property tests validate:
 - Session management
 """
 
+import os
 import pytest
+import time
+from unittest.mock import patch
 from datetime import datetime, timezone, timedelta
 from hypothesis import given, strategies as st, settings
 
+from bounty_pipeline import adapters
 from bounty_pipeline.adapters import (
     PlatformType,
     EncryptedCredentials,
+    DerivedKeyCache,
+    get_derived_key_cache,
     AuthSession,
     PlatformSchema,
     PlatformAdapter,
@@ -300,6 +306,132 @@ class TestCredentialSecurity:
         assert encrypted.key_version == 2
 
 
+# =============================================================================
+# Derived Key Cache
+# =============================================================================
+
+
+class TestDerivedKeyCache:
+    """Derived Fernet keys are cached per (salt, secret) and zeroized."""
+
+    MASTER = b"test_master_secret_32_bytes_long"
+
+    def test_lru_eviction_zeroizes(self):
+        cache = DerivedKeyCache(max_entries=2)
+        cache.put(self.MASTER, b"salt-1", b"k" * 44)
+        held = cache._entries[cache._cache_key(self.MASTER, b"salt-1")]
+        cache.put(self.MASTER, b"salt-2", b"k" * 44)
+        cache.put(self.MASTER, b"salt-3", b"k" * 44)
+
+        assert len(cache) == 2
+        assert cache.get(self.MASTER, b"salt-1") is None
+        assert held == bytearray(44)
+
+    def test_keyed_by_secret_and_salt(self):
+        cache = DerivedKeyCache()
+        cache.put(self.MASTER, b"salt", b"a" * 44)
+
+        assert cache.get(self.MASTER, b"salt") == b"a" * 44
+        assert cache.get(b"another_master_secret_32_bytes__", b"salt") is None
+        assert cache.get(self.MASTER, b"other-salt") is None
+
+    def test_evict_and_clear(self):
+        cache = DerivedKeyCache()
+        cache.put(self.MASTER, b"s1", b"a" * 44)
+        cache.put(self.MASTER, b"s2", b"b" * 44)
+        held = list(cache._entries.values())
+
+        assert cache.evict(self.MASTER, b"s1") is True
+        assert cache.evict(self.MASTER, b"s1") is False
+        cache.clear()
+
+        assert len(cache) == 0
+        assert all(key == bytearray(44) for key in held)
+
+    def test_secret_not_stored(self):
+        cache = DerivedKeyCache()
+        cache.put(self.MASTER, b"salt", b"a" * 44)
+
+        for salt, fingerprint in cache._entries:
+            assert self.MASTER not in fingerprint
+        assert "test_master" not in repr(cache)
+
+    def test_wrong_key_not_cached(self):
+        encrypted = EncryptedCredentials.encrypt(
+            platform=PlatformType.HACKERONE,
+            api_key="key",
+            api_secret="secret",
+            master_secret=self.MASTER,
+        )
+        wrong = b"wrong_master_secret_32_bytes_xx"
+
+        with pytest.raises(ValueError):
+            encrypted.decrypt(wrong)
+        assert get_derived_key_cache().get(wrong, encrypted.salt) is None
+
+    def test_decrypt_after_cache_cleared(self):
+        encrypted = EncryptedCredentials.encrypt(
+            platform=PlatformType.HACKERONE,
+            api_key="key",
+            api_secret="secret",
+            master_secret=self.MASTER,
+        )
+        get_derived_key_cache().clear()
+
+        assert encrypted.decrypt(self.MASTER) == ("key", "secret")
+        assert get_derived_key_cache().get(self.MASTER, encrypted.salt) is not None
+
+    def test_warm_cache_decrypt_skips_pbkdf2(self):
+        """Warm-cache decrypt skips PBKDF2 entirely."""
+        encrypted = EncryptedCredentials.encrypt(
+            platform=PlatformType.HACKERONE,
+            api_key="key",
+            api_secret="secret",
+            master_secret=self.MASTER,
+        )
+        get_derived_key_cache().clear()
+
+        with patch.object(adapters, "PBKDF2HMAC", wraps=adapters.PBKDF2HMAC) as kdf:
+            encrypted.decrypt(self.MASTER)
+            assert kdf.call_count == 1
+            for _ in range(100):
+                assert encrypted.decrypt(self.MASTER) == ("key", "secret")
+            assert kdf.call_count == 1
+
+
+@pytest.mark.skipif(
+    os.environ.get("BOUNTY_PIPELINE_BENCHMARK") != "1",
+    reason="Benchmark requires BOUNTY_PIPELINE_BENCHMARK=1",
+)
+class TestDerivedKeyCacheBenchmark:
+    """Wall-clock cost of decrypt with a cold and a warm key cache."""
+
+    MASTER = b"test_master_secret_32_bytes_long"
+
+    def test_warm_cache_decrypt(self):
+        encrypted = EncryptedCredentials.encrypt(
+            platform=PlatformType.HACKERONE,
+            api_key="key",
+            api_secret="secret",
+            master_secret=self.MASTER,
+        )
+        get_derived_key_cache().clear()
+
+        start = time.perf_counter()
+        encrypted.decrypt(self.MASTER)
+        cold = time.perf_counter() - start
+
+        runs = 100
+        start = time.perf_counter()
+        for _ in range(runs):
+            encrypted.decrypt(self.MASTER)
+        warm = (time.perf_counter() - start) / runs
+
+        print(f"\nEncryptedCredentials.decrypt: cold {cold * 1000:.1f}ms, "
+              f"warm {warm * 1000:.3f}ms ({cold / warm:.0f}x)")
+        assert warm * 20 < cold
+
+
 # =============================================================================
 # Platform Adapter Tests
 # =============================================================================
@@ -16,7 +16,14 @@ from hypothesis import strategies as st
 
 from bounty_pipeline.errors import AuditIntegrityError
 from bounty_pipeline.types import AuditRecord
-from bounty_pipeline.audit import AuditTrail, GENESIS_HASH
+from bounty_pipeline.audit import (
+    AuditTrail,
+    GENESIS_HASH,
+    EMPTY_MERKLE_ROOT,
+    MerkleProof,
+    build_merkle_tree,
+    verify_inclusion_proof,
+)
 
 
 # ============================================================================
@@ -346,6 +353,138 @@ class TestAuditExport:
         assert export.chain_verified is True
 
 
+def _export_all(trail: AuditTrail):
+    now = datetime.now(timezone.utc)
+    return trail.export_for_compliance(
+        start=now - timedelta(hours=1),
+        end=now + timedelta(hours=1),
+    )
+
+
+def _trail_with(count: int) -> AuditTrail:
+    trail = AuditTrail()
+    for i in range(count):
+        trail.record(
+            action_type=f"action-{i % 3}",
+            actor="system",
+            outcome="success",
+            details={"step": i},
+        )
+    return trail
+
+
+class TestMerkleInclusionProofs:
+    """Merkle root and per-record inclusion proofs in compliance exports."""
+
+    @given(count=st.integers(min_value=1, max_value=40))
+    @settings(max_examples=30)
+    def test_every_exported_record_verifies(self, count: int) -> None:
+        """Each record verifies alone against the export root."""
+        export = _export_all(_trail_with(count))
+        assert len(export.inclusion_proofs) == count
+        for record in export.records:
+            proof = export.get_inclusion_proof(record.record_id)
+            assert verify_inclusion_proof(record, proof, export.merkle_root)
+            # O(log n) proof size
+            assert len(proof.siblings) <= max(1, (count - 1).bit_length())
+
+    @given(
+        count=st.integers(min_value=1, max_value=20),
+        data=st.data(),
+        field_name=st.sampled_from(["action_type", "actor", "outcome", "details", "previous_hash"]),
+    )
+    @settings(max_examples=50)
+    def test_tampered_record_fails(self, count: int, data, field_name: str) -> None:
+        """Changing any hashed field of a record fails verification."""
+        export = _export_all(_trail_with(count))
+        record = export.records[data.draw(st.integers(0, count - 1))]
+        proof = export.get_inclusion_proof(record.record_id)
+        replacement = {"tampered": True} if field_name == "details" else "tampered"
+        tampered = AuditRecord(**{**vars(record), field_name: replacement})
+        assert not verify_inclusion_proof(tampered, proof, export.merkle_root)
+
+    @given(count=st.integers(min_value=1, max_value=20), data=st.data())
+    @settings(max_examples=50)
+    def test_tampered_record_with_recomputed_hash_fails(self, count: int, data) -> None:
+        """A consistently re-hashed forgery is not under the exported root."""
+        export = _export_all(_trail_with(count))
+        record = export.records[data.draw(st.integers(0, count - 1))]
+        forged_hash = AuditRecord.compute_hash(
+            record_id=record.record_id,
+            timestamp=record.timestamp,
+            action_type=record.action_type,
+            actor=record.actor,
+            outcome="forged",
+            details=record.details,
+            previous_hash=record.previous_hash,
+        )
+        forged = AuditRecord(**{**vars(record), "outcome": "forged", "record_hash": forged_hash})
+        proof = export.get_inclusion_proof(record.record_id)
+        assert not verify_inclusion_proof(forged, proof, export.merkle_root)
+
+    @given(count=st.integers(min_value=2, max_value=20), data=st.data())
+    @settings(max_examples=50)
+    def test_tampered_proof_fails(self, count: int, data) -> None:
+        """Altered siblings, index or size fail verification."""
+        export = _export_all(_trail_with(count))
+        position = data.draw(st.integers(0, count - 1))
+        record = export.records[position]
+        proof = export.get_inclusion_proof(record.record_id)
+
+        flipped = list(proof.siblings)
+        k = data.draw(st.integers(0, len(flipped) - 1))
+        flipped[k] = ("1" if flipped[k][0] == "0" else "0") + flipped[k][1:]
+        assert not verify_inclusion_proof(
+            record, MerkleProof(position, count, tuple(flipped)), export.merkle_root)
+
+        other = data.draw(st.integers(0, count - 1).filter(lambda i: i != position))
+        assert not verify_inclusion_proof(
+            record, MerkleProof(other, count, proof.siblings), export.merkle_root)
+        assert not verify_inclusion_proof(
+            record, MerkleProof(position, count, proof.siblings[:-1]), export.merkle_root)
+        assert not verify_inclusion_proof(
+            record, MerkleProof(position, count, proof.siblings + (GENESIS_HASH,)),
+            export.merkle_root)
+
+    def test_proof_from_other_export_fails(self) -> None:
+        """A record does not verify against another export's root."""
+        first = _export_all(_trail_with(5))
+        second = _export_all(_trail_with(5))
+        record = first.records[2]
+        proof = first.get_inclusion_proof(record.record_id)
+        assert not verify_inclusion_proof(record, proof, second.merkle_root)
+
+    def test_proof_round_trips_through_json(self) -> None:
+        """Proofs survive JSON serialization for offline review."""
+        import json
+
+        export = _export_all(_trail_with(9))
+        record = export.records[8]
+        proof_json = json.dumps(export.get_inclusion_proof(record.record_id).to_dict())
+        proof = MerkleProof.from_dict(json.loads(proof_json))
+        assert verify_inclusion_proof(record, proof, export.merkle_root)
+
+    def test_root_independent_of_chain_walk(self) -> None:
+        """The root is a function of the exported record hashes only."""
+        export = _export_all(_trail_with(7))
+        root, proofs = build_merkle_tree([r.record_hash for r in export.records])
+        assert root == export.merkle_root
+        assert len(proofs) == 7
+
+    def test_empty_export(self) -> None:
+        """An empty export has the empty-tree root and no proofs."""
+        export = _export_all(AuditTrail())
+        assert export.merkle_root == EMPTY_MERKLE_ROOT
+        assert export.inclusion_proofs == {}
+
+    def test_invalid_proof_shape(self) -> None:
+        """Proofs with an out-of-range index are rejected."""
+        with pytest.raises(ValueError):
+            MerkleProof(leaf_index=3, tree_size=3, siblings=())
+        with pytest.raises(ValueError):
+            MerkleProof(leaf_index=0, tree_size=0, siblings=())
+
+
 class TestAuditQueries:
     """Test audit query functionality."""
 
@@ -8,12 +8,15 @@ Property tests validate:
   (preserve drafts, queue actions for retry)
 """
 
+import json
 import pytest
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from hypothesis import given, strategies as st, settings
 
 from bounty_pipeline.recovery import (
     RecoveryManager,
+    StateJournal,
+    RetryQueue,
     PipelineState,
     PendingAction,
     ActionResult,
@@ -436,3 +439,360 @@ class TestRetryLogic:
 
         pending = manager.get_pending_actions()
         assert action not in pending
+
+
+# =============================================================================
+# Durable State Journal Tests
+# =============================================================================
+
+
+def _audit(i: int) -> dict:
+    return {"record_id": f"rec-{i}", "action": "finding_validated", "index": i}
+
+
+class TestStateJournal:
+    """States survive restart via write-ahead log and snapshots."""
+
+    def _save_history(self, manager: RecoveryManager, count: int, step: int = 5) -> list:
+        states = []
+        audit: list = []
+        for n in range(count):
+            audit = audit + [_audit(len(audit) + j) for j in range(step)]
+            state = manager.create_state(
+                pending_drafts=[{"draft_id": f"d{n}"}],
+                audit_records=audit,
+                metadata={"checkpoint": n},
+            )
+            manager.save_state(state)
+            states.append(state)
+        return states
+
+    def test_restart_rebuilds_exact_states(self, tmp_path):
+        manager = RecoveryManager(storage_dir=tmp_path, snapshot_interval=1000)
+        states = self._save_history(manager, 10)
+
+        restarted = RecoveryManager(storage_dir=tmp_path)
+        recovered = restarted.get_all_states()
+        assert [s.state_id for s in recovered] == [s.state_id for s in states]
+        assert [s.compute_hash() for s in recovered] == [s.compute_hash() for s in states]
+        assert restarted.recover_state().state_id == states[-1].state_id
+
+    def test_save_appends_only_delta(self, tmp_path):
+        manager = RecoveryManager(storage_dir=tmp_path, snapshot_interval=1000)
+        self._save_history(manager, 20, step=3)
+
+        lines = (tmp_path / StateJournal.WAL_FILE).read_text().splitlines()
+        assert len(lines) == 20
+        records = [json.loads(l)["record"] for l in lines]
+        assert all(len(r["audit_append"]) == 3 for r in records)
+        assert records[-1]["audit_base"] == 57
+
+    def test_non_prefix_audit_written_in_full(self, tmp_path):
+        manager = RecoveryManager(storage_dir=tmp_path)
+        manager.save_state(manager.create_state(audit_records=[_audit(0), _audit(1)]))
+        rewritten = manager.create_state(audit_records=[_audit(9), _audit(1), _audit(2)])
+        manager.save_state(rewritten)
+
+        restarted = RecoveryManager(storage_dir=tmp_path)
+        assert restarted.recover_state(rewritten.state_id).audit_records == rewritten.audit_records
+
+    def test_compaction_snapshot_and_truncation(self, tmp_path):
+        manager = RecoveryManager(storage_dir=tmp_path, snapshot_interval=8)
+        states = self._save_history(manager, 20)
+
+        assert (tmp_path / StateJournal.SNAPSHOT_FILE).exists()
+        assert len((tmp_path / StateJournal.WAL_FILE).read_text().splitlines()) == 4
+
+        restarted = RecoveryManager(storage_dir=tmp_path, snapshot_interval=8)
+        assert [s.compute_hash() for s in restarted.get_all_states()] == [
+            s.compute_hash() for s in states
+        ]
+        # Delta chain continues across the snapshot boundary after restart
+        more = self._save_history(restarted, 3)
+        again = RecoveryManager(storage_dir=tmp_path)
+        assert again.recover_state(more[-1].state_id).compute_hash() == more[-1].compute_hash()
+
+    def test_resaved_state_replaces_previous(self, tmp_path):
+        manager = RecoveryManager(storage_dir=tmp_path)
+        state = manager.create_state(audit_records=[_audit(0)])
+        manager.save_state(state)
+        state.audit_records.append(_audit(1))
+        state.pending_reviews.append({"review_id": "r1"})
+        manager.save_state(state)
+
+        restarted = RecoveryManager(storage_dir=tmp_path)
+        assert len(restarted.get_all_states()) == 1
+        assert restarted.recover_state(state.state_id).compute_hash() == state.compute_hash()
+
+    def test_state_ids_continue_after_restart(self, tmp_path):
+        manager = RecoveryManager(storage_dir=tmp_path)
+        self._save_history(manager, 3)
+        restarted = RecoveryManager(storage_dir=tmp_path)
+        assert restarted.create_state().state_id == "state-000004"
+
+    def test_torn_tail_discarded(self, tmp_path):
+        manager = RecoveryManager(storage_dir=tmp_path)
+        states = self._save_history(manager, 3)
+        wal = tmp_path / StateJournal.WAL_FILE
+        with open(wal, "a") as f:
+            f.write('{"record": {"seq": 4, "sta')
+
+        restarted = RecoveryManager(storage_dir=tmp_path)
+        assert len(restarted.get_all_states()) == 3
+        # Next append starts on a clean line
+        self._save_history(restarted, 1)
+        assert len(RecoveryManager(storage_dir=tmp_path).get_all_states()) == 4
+        assert states[0].state_id in [s.state_id for s in restarted.get_all_states()]
+
+    def test_corrupt_middle_entry_rejected(self, tmp_path):
+        manager = RecoveryManager(storage_dir=tmp_path)
+        self._save_history(manager, 3)
+        wal = tmp_path / StateJournal.WAL_FILE
+        lines = wal.read_text().splitlines()
+        lines[1] = lines[1].replace("d1", "dX")
+        wal.write_text("\n".join(lines) + "\n")
+
+        with pytest.raises(RecoveryError):
+            RecoveryManager(storage_dir=tmp_path)
+
+    def test_hash_mismatch_detected_on_recovery(self, tmp_path):
+        manager = RecoveryManager(storage_dir=tmp_path)
+        state = manager.create_state(audit_records=[_audit(0)])
+        manager.save_state(state)
+        # Rewrite the entry with a consistent checksum but a wrong state hash
+        wal = tmp_path / StateJournal.WAL_FILE
+        record = json.loads(wal.read_text())["record"]
+        record["state_hash"] = "0" * 64
+        wal.write_text(json.dumps({"record": record, "checksum": StateJournal._checksum(record)}) + "\n")
+
+        restarted = RecoveryManager(storage_dir=tmp_path)
+        with pytest.raises(RecoveryError):
+            restarted.recover_state(state.state_id)
+
+    def test_memory_only_by_default(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        manager = RecoveryManager()
+        self._save_history(manager, 2)
+        assert list(tmp_path.iterdir()) == []
+
+    def test_invalid_snapshot_interval(self, tmp_path):
+        with pytest.raises(ValueError):
+            StateJournal(tmp_path, snapshot_interval=0)
+
+    @settings(max_examples=30, deadline=None)
+    @given(
+        steps=st.lists(
+            st.tuples(st.integers(min_value=0, max_value=4), st.booleans()),
+            min_size=1,
+            max_size=15,
+        ),
+        interval=st.integers(min_value=1, max_value=6),
+    )
+    def test_replay_matches_saved_states(self, tmp_path_factory, steps, interval):
+        """For any save sequence, restart yields identical states and hashes."""
+        directory = tmp_path_factory.mktemp("journal")
+        manager = RecoveryManager(storage_dir=directory, snapshot_interval=interval, fsync=False)
+        audit: list = []
+        for added, rewrite in steps:
+            if rewrite and audit:
+                audit = [dict(audit[0], rewritten=True)] + audit[1:]
+            audit = audit + [_audit(len(audit) + j) for j in range(added)]
+            manager.save_state(manager.create_state(audit_records=list(audit)))
+
+        restarted = RecoveryManager(storage_dir=directory)
+        assert [s.to_dict() for s in restarted.get_all_states()] == [
+            s.to_dict() for s in manager.get_all_states()
+        ]
+
+
+# =============================================================================
+# Delayed Retry Queue Tests
+# =============================================================================
+
+
+def _result(action: PendingAction, success: bool) -> ActionResult:
+    return ActionResult(
+        action_id=action.action_id,
+        success=success,
+        message="OK" if success else "Failed",
+        error=None if success else "Network error",
+    )
+
+
+class TestRetryQueue:
+    """Due-time ordered retries with backoff, persisted across restart."""
+
+    def test_failed_action_waits_for_backoff(self):
+        manager = RecoveryManager(retry_base_delay_seconds=10, retry_max_delay_seconds=100)
+        manager.register_handler(ActionType.SUBMIT, lambda a: _result(a, False))
+        action = manager.queue_action(ActionType.SUBMIT, {"id": "1"}, max_retries=5)
+
+        assert len(manager.process_queue()) == 1
+        attempted = action.last_attempt_at
+        assert action.next_attempt_at == attempted + timedelta(seconds=10)
+        # Not due again in the same pass
+        assert manager.process_queue(now=attempted + timedelta(seconds=9)) == []
+        assert manager.get_due_actions(now=attempted + timedelta(seconds=10)) == [action]
+        # Still pending, so it stays in the general pending view
+        assert manager.get_pending_actions() == [action]
+
+    def test_backoff_doubles_and_caps(self):
+        queue = RetryQueue(base_delay_seconds=5, max_delay_seconds=30)
+        assert [queue.backoff(n).total_seconds() for n in range(6)] == [0, 5, 10, 20, 30, 30]
+
+    def test_due_actions_earliest_first(self):
+        manager = RecoveryManager()
+        now = datetime.now(timezone.utc)
+        actions = [manager.queue_action(ActionType.SUBMIT, {"id": i}) for i in range(5)]
+        for offset, action in zip([40, 10, 30, 20, 50], actions):
+            action.next_attempt_at = now + timedelta(seconds=offset)
+            manager._retry_queue.schedule(action)
+
+        due = manager.get_due_actions(now=now + timedelta(seconds=35))
+        assert [a.payload["id"] for a in due] == [1, 3, 2]
+        assert [a.payload["id"] for a in manager.get_due_actions(now=now + timedelta(seconds=60), limit=2)] == [1, 3]
+        assert manager.next_retry_at() == now + timedelta(seconds=10)
+
+    def test_exhausted_and_completed_actions_leave_queue(self):
+        manager = RecoveryManager(retry_base_delay_seconds=0)
+        manager.register_handler(ActionType.SUBMIT, lambda a: _result(a, a.payload["ok"]))
+        ok = manager.queue_action(ActionType.SUBMIT, {"ok": True})
+        bad = manager.queue_action(ActionType.SUBMIT, {"ok": False}, max_retries=2)
+
+        manager.process_queue()
+        manager.process_queue()
+        assert ok.status == ActionStatus.COMPLETED
+        assert bad.retry_count == 2
+        assert manager.get_due_actions() == []
+        assert manager.next_retry_at() is None
+
+    def test_queue_survives_restart(self, tmp_path):
+        manager = RecoveryManager(storage_dir=tmp_path, retry_base_delay_seconds=60)
+        manager.register_handler(ActionType.SUBMIT, lambda a: _result(a, a.payload["ok"]))
+        done = manager.queue_action(ActionType.SUBMIT, {"ok": True})
+        failed = manager.queue_action(ActionType.SUBMIT, {"ok": False})
+        waiting = manager.queue_action(ActionType.UPDATE_STATUS, {"ok": True})
+        manager.process_action(done.action_id)
+        manager.process_action(failed.action_id)
+
+        restarted = RecoveryManager(storage_dir=tmp_path, retry_base_delay_seconds=60)
+        assert restarted.get_action(done.action_id).status == ActionStatus.COMPLETED
+        assert [a.action_id for a in restarted.get_due_actions()] == [waiting.action_id]
+        reloaded = restarted.get_action(failed.action_id)
+        assert reloaded.next_attempt_at == failed.next_attempt_at
+        assert reloaded.retry_count == 1
+
+        calls = []
+        restarted.register_handler(ActionType.SUBMIT, lambda a: calls.append(a.action_id) or _result(a, True))
+        restarted.register_handler(ActionType.UPDATE_STATUS, lambda a: calls.append(a.action_id) or _result(a, True))
+        restarted.process_queue(now=failed.next_attempt_at)
+        assert calls == [waiting.action_id, failed.action_id]
+        assert restarted.queue_action(ActionType.SUBMIT, {}).action_id == "action-000004"
+
+    def test_interrupted_attempt_held_for_review(self, tmp_path):
+        """An attempt cut off mid-way may have reached the platform; never replay it."""
+        manager = RecoveryManager(storage_dir=tmp_path)
+        action = manager.queue_action(ActionType.SUBMIT, {"id": "1"})
+
+        def crash(a: PendingAction) -> ActionResult:
+            raise KeyboardInterrupt
+
+        manager.register_handler(ActionType.SUBMIT, crash)
+        with pytest.raises(KeyboardInterrupt):
+            manager.process_action(action.action_id)
+
+        restarted = RecoveryManager(storage_dir=tmp_path)
+        reloaded = restarted.get_action(action.action_id)
+        assert reloaded.status == ActionStatus.FAILED
+        assert reloaded.needs_human_review
+        assert restarted.get_due_actions(datetime.now(timezone.utc) + timedelta(days=365)) == []
+        assert restarted.next_retry_at() is None
+        assert restarted.pending_count == 0
+        assert restarted.get_actions_needing_review() == [reloaded]
+        assert restarted.alert_count == 1
+        assert restarted.get_alerts()[0]["diagnostic"]["action_id"] == action.action_id
+
+        # Still held after another restart
+        assert RecoveryManager(storage_dir=tmp_path).get_due_actions() == []
+
+    def test_resolve_interrupted_action(self, tmp_path):
+        manager = RecoveryManager(storage_dir=tmp_path)
+        first = manager.queue_action(ActionType.SUBMIT, {"id": "1"})
+        second = manager.queue_action(ActionType.SUBMIT, {"id": "2"})
+
+        def crash(a: PendingAction) -> ActionResult:
+            raise KeyboardInterrupt
+
+        manager.register_handler(ActionType.SUBMIT, crash)
+        for action in (first, second):
+            with pytest.raises(KeyboardInterrupt):
+                manager.process_action(action.action_id)
+
+        restarted = RecoveryManager(storage_dir=tmp_path)
+        restarted.resolve_interrupted_action(first.action_id, completed=True)
+        restarted.resolve_interrupted_action(second.action_id, completed=False)
+        with pytest.raises(ValueError):
+            restarted.resolve_interrupted_action(second.action_id, completed=False)
+
+        reloaded = RecoveryManager(storage_dir=tmp_path)
+        assert reloaded.get_action(first.action_id).status == ActionStatus.COMPLETED
+        assert reloaded.get_actions_needing_review() == []
+        assert [a.action_id for a in reloaded.get_due_actions()] == [second.action_id]
+
+    def test_cleanup_compacts_log(self, tmp_path):
+        manager = RecoveryManager(storage_dir=tmp_path)
+        manager.register_handler(ActionType.SUBMIT, lambda a: _result(a, True))
+        for i in range(60):
+            manager.queue_action(ActionType.SUBMIT, {"id": i})
+        manager.process_queue()
+        manager.queue_action(ActionType.SUBMIT, {"id": "left"})
+        assert manager.cleanup_completed() == 60
+
+        log = tmp_path / "actions.log"
+        assert len(log.read_text().splitlines()) == 1
+        restarted = RecoveryManager(storage_dir=tmp_path)
+        assert [a.payload["id"] for a in restarted.get_pending_actions()] == ["left"]
+
+    def test_torn_log_line_ignored(self, tmp_path):
+        manager = RecoveryManager(storage_dir=tmp_path)
+        manager.queue_action(ActionType.SUBMIT, {"id": "1"})
+        with open(tmp_path / "actions.log", "a") as f:
+            f.write('{"action_id": "action-0000')
+        restarted = RecoveryManager(storage_dir=tmp_path)
+        assert restarted.pending_count == 1
+        restarted.queue_action(ActionType.SUBMIT, {"id": "2"})
+        assert RecoveryManager(storage_dir=tmp_path).pending_count == 2
+
+    def test_log_line_without_action_id_skipped(self, tmp_path):
+        manager = RecoveryManager(storage_dir=tmp_path)
+        manager.queue_action(ActionType.SUBMIT, {"id": "1"})
+        with open(tmp_path / "actions.log", "a") as f:
+            f.write('{"status": "pending"}\n[1, 2]\n{"action_id": null}\n')
+        manager.queue_action(ActionType.SUBMIT, {"id": "2"})
+        restarted = RecoveryManager(storage_dir=tmp_path)
+        assert sorted(a.payload["id"] for a in restarted.get_pending_actions()) == ["1", "2"]
+
+    def test_invalid_delays(self):
+        with pytest.raises(ValueError):
+            RetryQueue(base_delay_seconds=-1)
+        with pytest.raises(ValueError):
+            RetryQueue(base_delay_seconds=10, max_delay_seconds=5)
+
+    @settings(max_examples=50)
+    @given(offsets=st.lists(st.integers(min_value=0, max_value=1000), min_size=1, max_size=40),
+           cutoff=st.integers(min_value=0, max_value=1000))
+    def test_due_matches_linear_scan(self, offsets, cutoff):
+        """Heap pull returns exactly the actions a linear scan finds due."""
+        manager = RecoveryManager()
+        base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        for offset in offsets:
+            action = manager.queue_action(ActionType.SUBMIT, {})
+            action.next_attempt_at = base + timedelta(seconds=offset)
+            manager._retry_queue.schedule(action)
+
+        now = base + timedelta(seconds=cutoff)
+        expected = sorted(
+            (a.next_attempt_at, a.action_id)
+            for a in manager.get_pending_actions() if a.next_attempt_at <= now
+        )
+        assert [(a.next_attempt_at, a.action_id) for a in manager.get_due_actions(now)] == expected
@@ -6,6 +6,10 @@ Property tests for Legal Scope Validator.
 """
 
 from datetime import datetime, timedelta, timezone
+import fnmatch
+import ipaddress
+import os
+import time
 
 import pytest
 from hypothesis import given, settings, assume
@@ -13,7 +17,7 @@ from hypothesis import strategies as st
 
 from bounty_pipeline.errors import ScopeViolationError, AuthorizationExpiredError
 from bounty_pipeline.types import AuthorizationDocument
-from bounty_pipeline.scope import LegalScopeValidator, ScopeDecision
+from bounty_pipeline.scope import CompiledScope, LegalScopeValidator, ScopeDecision
 
 
 # ============================================================================
@@ -373,3 +377,234 @@ class TestTargetParsing:
         result = validator.validate_target("192.168.1.100", auth_doc)
 
         assert result.decision == ScopeDecision.IN_SCOPE
+
+
+# ============================================================================
+# Compiled Scope Tests
+# ============================================================================
+
+
+def _legacy_is_excluded(parsed: dict, auth_doc: AuthorizationDocument) -> bool:
+    """Original per-entry fnmatch loop."""
+    path = parsed.get("path", "")
+    domain = parsed.get("domain", "")
+    for excluded in auth_doc.excluded_paths:
+        if path and fnmatch.fnmatch(path, excluded):
+            return True
+        if domain and fnmatch.fnmatch(domain, excluded):
+            return True
+        if fnmatch.fnmatch(parsed["original"], excluded):
+            return True
+    return False
+
+
+def _legacy_is_authorized_domain(parsed: dict, auth_doc: AuthorizationDocument) -> bool:
+    """Original per-entry domain loop."""
+    domain = parsed.get("domain")
+    if not domain:
+        return False
+    for authorized in auth_doc.authorized_domains:
+        if domain == authorized:
+            return True
+        if authorized.startswith("*."):
+            base_domain = authorized[2:]
+            if domain == base_domain or domain.endswith("." + base_domain):
+                return True
+        if domain.endswith("." + authorized):
+            return True
+    return False
+
+
+def _legacy_is_authorized_ip(parsed: dict, auth_doc: AuthorizationDocument) -> bool:
+    """Original per-entry ip_network loop."""
+    ip_str = parsed.get("ip")
+    if not ip_str:
+        return False
+    try:
+        ip = ipaddress.ip_address(ip_str)
+    except ValueError:
+        return False
+    for range_str in auth_doc.authorized_ip_ranges:
+        try:
+            if ip in ipaddress.ip_network(range_str, strict=False):
+                return True
+        except ValueError:
+            try:
+                if ip == ipaddress.ip_address(range_str):
+                    return True
+            except ValueError:
+                continue
+    return False
+
+
+def _legacy_is_ambiguous(parsed: dict, auth_doc: AuthorizationDocument) -> bool:
+    """Original substring loop."""
+    domain = parsed.get("domain")
+    if not domain:
+        return False
+    for authorized in auth_doc.authorized_domains:
+        if authorized in domain or domain in authorized:
+            if domain != authorized:
+                return True
+    return False
+
+
+def _auth_doc(domains=(), ip_ranges=(), excluded=()) -> AuthorizationDocument:
+    now = datetime.now(timezone.utc)
+    return AuthorizationDocument(
+        program_name="test-program",
+        authorized_domains=tuple(domains),
+        authorized_ip_ranges=tuple(ip_ranges),
+        excluded_paths=tuple(excluded),
+        valid_from=now - timedelta(days=30),
+        valid_until=now + timedelta(days=30),
+        document_hash="a" * 64,
+    )
+
+
+_label = st.sampled_from(["a", "b", "ab", "api", "example", "ex", "com", "io", "*"])
+_domain = st.lists(_label, min_size=1, max_size=4).map(".".join)
+_ipv4 = st.integers(min_value=0, max_value=2**32 - 1).map(lambda i: str(ipaddress.IPv4Address(i)))
+_ipv6 = st.integers(min_value=0, max_value=2**128 - 1).map(lambda i: str(ipaddress.IPv6Address(i)))
+_ip_range = st.one_of(
+    st.tuples(_ipv4, st.integers(min_value=0, max_value=32)).map(lambda t: f"{t[0]}/{t[1]}"),
+    st.tuples(_ipv6, st.integers(min_value=0, max_value=128)).map(lambda t: f"{t[0]}/{t[1]}"),
+    _ipv4,
+    st.sampled_from(["not-an-ip", "10.0.0.0/33", "10.0.0.0/8"]),
+)
+_glob = st.one_of(
+    st.sampled_from(["/admin/*", "*.internal.*", "/api/v?/debug", "[ab]*", "*", "/x[!y]z"]),
+    _domain,
+)
+_target = st.one_of(
+    _domain,
+    _ipv4,
+    st.tuples(_domain, st.sampled_from(["", "/", "/admin/x", "/api/v1/debug", "/xaz"])).map(
+        lambda t: f"https://{t[0]}{t[1]}"
+    ),
+    st.sampled_from(["10.1.2.3", "::1", "192.168.1.100", "example.com:8443"]),
+)
+
+
+def _legacy_in_scope(parsed: dict, auth_doc: AuthorizationDocument) -> bool:
+    return not _legacy_is_excluded(parsed, auth_doc) and (
+        _legacy_is_authorized_domain(parsed, auth_doc)
+        or _legacy_is_authorized_ip(parsed, auth_doc)
+    )
+
+
+def _large_scope() -> tuple[AuthorizationDocument, list[str]]:
+    """A program with hundreds of scope entries and 2,000 in-scope targets."""
+    auth_doc = _auth_doc(
+        domains=[f"*.svc{i}.example.com" for i in range(300)]
+        + [f"app{i}.example.org" for i in range(100)],
+        ip_ranges=[f"10.{i // 256}.{i % 256}.0/24" for i in range(500)],
+        excluded=[f"/internal{i}/*" for i in range(100)]
+        + [f"*.staging{i}.example.com" for i in range(100)],
+    )
+    targets = (
+        [f"https://api.svc{i % 300}.example.com/v1/items/{i}" for i in range(1000)]
+        + [f"10.{(i % 500) // 256}.{(i % 500) % 256}.{i % 250 + 1}" for i in range(1000)]
+    )
+    return auth_doc, targets
+
+
+class TestCompiledScope:
+    """Compiled scope decisions match the original per-entry loops."""
+
+    @settings(max_examples=300)
+    @given(
+        domains=st.lists(st.one_of(_domain, _domain.map(lambda d: "*." + d)), max_size=6),
+        ip_ranges=st.lists(_ip_range, max_size=6),
+        excluded=st.lists(_glob, max_size=4),
+        target=_target,
+    )
+    def test_parity_with_original_matchers(self, domains, ip_ranges, excluded, target) -> None:
+        auth_doc = _auth_doc(domains, ip_ranges, excluded)
+        validator = LegalScopeValidator()
+        parsed = validator._parse_target(target)
+        compiled = CompiledScope(auth_doc)
+
+        assert compiled.is_excluded(parsed) == _legacy_is_excluded(parsed, auth_doc)
+        assert compiled.is_authorized_domain(parsed["domain"]) == _legacy_is_authorized_domain(parsed, auth_doc)
+        assert compiled.is_authorized_ip(parsed["ip"]) == _legacy_is_authorized_ip(parsed, auth_doc)
+        assert compiled.is_ambiguous(parsed["domain"]) == _legacy_is_ambiguous(parsed, auth_doc)
+
+    @settings(max_examples=200)
+    @given(
+        ip_ranges=st.lists(_ip_range, min_size=1, max_size=20),
+        probe=st.one_of(_ipv4, _ipv6),
+    )
+    def test_ip_interval_table_parity(self, ip_ranges, probe) -> None:
+        auth_doc = _auth_doc(ip_ranges=ip_ranges)
+        parsed = {"ip": probe}
+        assert CompiledScope(auth_doc).is_authorized_ip(probe) == _legacy_is_authorized_ip(parsed, auth_doc)
+
+    def test_overlapping_and_adjacent_ranges_merged(self) -> None:
+        compiled = CompiledScope(_auth_doc(ip_ranges=(
+            "10.0.0.0/25", "10.0.0.128/25", "10.0.0.64/26", "10.0.2.1",
+        )))
+        assert compiled._ip_tables[4] == (
+            [int(ipaddress.IPv4Address("10.0.0.0")), int(ipaddress.IPv4Address("10.0.2.1"))],
+            [int(ipaddress.IPv4Address("10.0.0.255")), int(ipaddress.IPv4Address("10.0.2.1"))],
+        )
+        assert compiled.is_authorized_ip("10.0.0.200")
+        assert not compiled.is_authorized_ip("10.0.1.0")
+        assert compiled.is_authorized_ip("10.0.2.1")
+
+    def test_ambiguity_when_target_equals_an_entry(self) -> None:
+        compiled = CompiledScope(_auth_doc(domains=("example.com", "example.com.evil")))
+        assert compiled.is_ambiguous("example.com")
+        assert not CompiledScope(_auth_doc(domains=("example.com",))).is_ambiguous("example.com")
+
+    def test_compiled_scope_reused_per_document(self) -> None:
+        validator = LegalScopeValidator(max_compiled_scopes=2)
+        docs = [_auth_doc(domains=(f"d{i}.com",)) for i in range(3)]
+        first = validator.compile_scope(docs[0])
+        assert validator.compile_scope(docs[0]) is first
+        validator.compile_scope(docs[1])
+        validator.compile_scope(docs[2])
+        assert validator.compile_scope(docs[0]) is not first
+
+    def test_large_scope_matches_legacy(self) -> None:
+        """A program with hundreds of entries decides like the legacy scan."""
+        auth_doc, targets = _large_scope()
+        validator = LegalScopeValidator()
+        expected = [
+            _legacy_in_scope(validator._parse_target(t), auth_doc) for t in targets
+        ]
+        results = [
+            validator.validate_target(t, auth_doc).decision == ScopeDecision.IN_SCOPE
+            for t in targets
+        ]
+        assert results == expected
+        assert all(results)
+
+
+@pytest.mark.skipif(
+    os.environ.get("BOUNTY_PIPELINE_BENCHMARK") != "1",
+    reason="Benchmark requires BOUNTY_PIPELINE_BENCHMARK=1",
+)
+class TestCompiledScopeBenchmark:
+    """Wall-clock comparison of compiled and legacy scope validation."""
+
+    def test_large_scope_throughput(self) -> None:
+        auth_doc, targets = _large_scope()
+        validator = LegalScopeValidator()
+        parsed_targets = [validator._parse_target(t) for t in targets]
+
+        start = time.perf_counter()
+        for parsed in parsed_targets:
+            _legacy_in_scope(parsed, auth_doc)
+        legacy_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for target in targets:
+            validator.validate_target(target, auth_doc)
+        compiled_elapsed = time.perf_counter() - start
+
+        print(f"\nScope validation ({len(targets)} targets, 500 CIDRs, 400 domains, "
+              f"200 globs): legacy {len(targets) / legacy_elapsed:,.0f}/s, "
+              f"compiled {len(targets) / compiled_elapsed:,.0f}/s "
+              f"({legacy_elapsed / compiled_elapsed:.0f}x)")
+        assert compiled_elapsed * 5 < legacy_elapsed
@@ -18,8 +18,10 @@ Phase-9 is ASSISTIVE ONLY. Human always clicks YES/NO.
 """
 
 from __future__ import annotations
+from collections import deque
 from datetime import datetime
-from typing import Optional, List, Any
+from itertools import islice
+from typing import Iterator, Optional, List, Any
 import uuid
 
 from browser_assistant.types import (
@@ -34,6 +36,102 @@ from browser_assistant.errors import (
 from browser_assistant.boundaries import Phase9BoundaryGuard
 
 
+class ObservationStore:
+    """
+    Fixed-capacity ring buffer of observations with id and URL indexes.
+    
+    When full, adding an observation evicts the oldest one (FIFO), and the
+    evicted observation is removed from both indexes. Add, evict and id
+    lookup are O(1).
+    
+    The URL index maps each URL to its observations, oldest first. Since
+    eviction is global FIFO, an evicted observation is always the oldest
+    entry for its URL.
+    """
+    
+    def __init__(self, capacity: int):
+        """
+        Initialize the store.
+        
+        Args:
+            capacity: Maximum observations retained.
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        self._ring: deque[BrowserObservation] = deque(maxlen=capacity)
+        self._by_id: dict[str, BrowserObservation] = {}
+        self._by_url: dict[str, deque[BrowserObservation]] = {}
+    
+    @property
+    def capacity(self) -> int:
+        return self._ring.maxlen
+    
+    @capacity.setter
+    def capacity(self, capacity: int) -> None:
+        """Resize, evicting the oldest observations that no longer fit."""
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        while len(self._ring) > capacity:
+            self._unindex(self._ring.popleft())
+        self._ring = deque(self._ring, maxlen=capacity)
+    
+    def __len__(self) -> int:
+        return len(self._ring)
+    
+    def __iter__(self) -> Iterator[BrowserObservation]:
+        """Iterate oldest first."""
+        return iter(self._ring)
+    
+    def __reversed__(self) -> Iterator[BrowserObservation]:
+        """Iterate newest first."""
+        return reversed(self._ring)
+    
+    def add(self, observation: BrowserObservation) -> Optional[BrowserObservation]:
+        """
+        Add an observation.
+        
+        Returns:
+            The evicted observation, if the store was full.
+        """
+        evicted = None
+        if len(self._ring) == self._ring.maxlen:
+            evicted = self._ring[0]
+            self._unindex(evicted)
+        self._ring.append(observation)
+        self._by_id[observation.observation_id] = observation
+        bucket = self._by_url.get(observation.url)
+        if bucket is None:
+            bucket = self._by_url[observation.url] = deque()
+        bucket.append(observation)
+        return evicted
+    
+    def _unindex(self, observation: BrowserObservation) -> None:
+        if self._by_id.get(observation.observation_id) is observation:
+            del self._by_id[observation.observation_id]
+        bucket = self._by_url.get(observation.url)
+        if bucket:
+            bucket.popleft()
+            if not bucket:
+                del self._by_url[observation.url]
+    
+    def get(self, observation_id: str) -> Optional[BrowserObservation]:
+        """Look up an observation by id."""
+        return self._by_id.get(observation_id)
+    
+    def for_url(self, url: str, limit: int) -> List[BrowserObservation]:
+        """Observations for an exact URL, newest first."""
+        bucket = self._by_url.get(url)
+        return list(islice(reversed(bucket), limit)) if bucket else []
+    
+    def clear(self) -> int:
+        """Remove all observations, returning how many were removed."""
+        count = len(self._ring)
+        self._ring.clear()
+        self._by_id.clear()
+        self._by_url.clear()
+        return count
+
+
 class BrowserObserver:
     """
     Passive observer of browser activity.
@@ -65,8 +163,15 @@ class BrowserObserver:
         Phase9BoundaryGuard.assert_no_network_execution()
         Phase9BoundaryGuard.assert_no_automation()
         
-        self._observations: List[BrowserObservation] = []
-        self._max_observations = 10000  # Prevent unbounded growth
+        self._observations = ObservationStore(capacity=10000)  # Prevent unbounded growth
+    
+    @property
+    def _max_observations(self) -> int:
+        return self._observations.capacity
+    
+    @_max_observations.setter
+    def _max_observations(self, value: int) -> None:
+        self._observations.capacity = value
     
     def receive_observation(
         self,
@@ -121,10 +226,8 @@ class BrowserObserver:
             no_modification_performed=True,  # Always True
         )
         
-        # Store observation (with size limit)
-        if len(self._observations) >= self._max_observations:
-            self._observations.pop(0)  # Remove oldest
-        self._observations.append(observation)
+        # Store observation (oldest evicted at the size limit)
+        self._observations.add(observation)
         
         return observation
     
@@ -174,10 +277,24 @@ class BrowserObserver:
         Returns:
             BrowserObservation if found, None otherwise.
         """
-        for obs in self._observations:
-            if obs.observation_id == observation_id:
-                return obs
-        return None
+        return self._observations.get(observation_id)
+    
+    def get_observations_for_url(
+        self,
+        url: str,
+        limit: int = 100,
+    ) -> List[BrowserObservation]:
+        """
+        Get observations recorded for an exact URL.
+        
+        Args:
+            url: URL as stored (credentials already redacted).
+            limit: Maximum observations to return.
+            
+        Returns:
+            List of observations for the URL (newest first).
+        """
+        return self._observations.for_url(url, limit)
     
     def get_recent_urls(self, limit: int = 10) -> List[str]:
         """
@@ -208,9 +325,7 @@ class BrowserObserver:
         Returns:
             Number of observations cleared.
         """
-        count = len(self._observations)
-        self._observations.clear()
-        return count
+        return self._observations.clear()
     
     def _sanitize_url(self, url: str) -> str:
         """
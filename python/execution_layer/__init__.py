@@ -78,6 +78,7 @@ from execution_layer.errors import (
     ResponseValidationError,
     PartialEvidenceError,
     RetryExhaustedError,
+    CircuitOpenError,
     HashChainVerificationError,
     AutomationDetectedError,
     BrowserCrashError,
@@ -108,7 +109,7 @@ from execution_layer.duplicate import DuplicateHandler
 from execution_layer.controller import ExecutionController, ExecutionControllerConfig
 from execution_layer.browser import BrowserEngine, BrowserConfig
 from execution_layer.browser_failure import BrowserFailureHandler, FailureType, RecoveryStrategy, FailureContext, PartialEvidence
-from execution_layer.mcp_client import MCPClient, MCPClientConfig
+from execution_layer.mcp_client import MCPClient, MCPClientConfig, MCPVerificationOutcome
 from execution_layer.pipeline_client import BountyPipelineClient, BountyPipelineConfig, DraftReport
 # Hardening components
 from execution_layer.manifest import ExecutionManifest, ManifestGenerator
@@ -117,9 +118,17 @@ from execution_layer.schemas import (
     PipelineDraftResponse,
     ResponseValidator,
 )
-from execution_layer.retry import RetryPolicy, RetryExecutor, RetryAttempt
+from execution_layer.retry import (
+    RetryPolicy,
+    RetryExecutor,
+    RetryAttempt,
+    RetryBudget,
+    CircuitBreaker,
+    CircuitState,
+)
 from execution_layer.request_logger import RequestLog, ResponseLog, RequestLogger
 from execution_layer.anti_detection import AutomationDetectionSignal, AntiDetectionObserver
+from execution_layer.console_capture import ConsoleCaptureConfig, ConsoleCaptureSink
 # Security remediation components (POST-PHASE-19)
 from execution_layer.security import (
     GovernanceViolation,
@@ -149,6 +158,7 @@ __all__ = [
     "PartialEvidence",
     "MCPClient",
     "MCPClientConfig",
+    "MCPVerificationOutcome",
     "BountyPipelineClient",
     "BountyPipelineConfig",
     "DraftReport",
@@ -210,6 +220,7 @@ __all__ = [
     "ResponseValidationError",
     "PartialEvidenceError",
     "RetryExhaustedError",
+    "CircuitOpenError",
     "HashChainVerificationError",
     "AutomationDetectedError",
     "BrowserCrashError",
@@ -228,11 +239,16 @@ __all__ = [
     "RetryPolicy",
     "RetryExecutor",
     "RetryAttempt",
+    "RetryBudget",
+    "CircuitBreaker",
+    "CircuitState",
     "RequestLog",
     "ResponseLog",
     "RequestLogger",
     "AutomationDetectionSignal",
     "AntiDetectionObserver",
+    "ConsoleCaptureConfig",
+    "ConsoleCaptureSink",
     # Security remediation (POST-PHASE-19)
     "GovernanceViolation",
     "validate_execution_id",
@@ -69,9 +69,93 @@ class AntiDetectionObserver:
         "i'm not a robot",
     ]
     
+    # Single in-page probe (OBSERVE ONLY). Reads navigator.webdriver and
+    # scans the serialized DOM for CAPTCHA indicators inside the page; only
+    # the first matching indicator crosses back, never the DOM itself.
+    PROBE_SCRIPT = """
+    (probe) => {
+        const root = document.documentElement;
+        const html = probe.indicators.length && root
+            ? root.outerHTML.toLowerCase()
+            : "";
+        const captcha = probe.indicators.find((i) => html.includes(i));
+        return {
+            webdriver: probe.webdriver ? Boolean(navigator.webdriver) : false,
+            captcha: captcha === undefined ? null : captcha,
+        };
+    }
+    """
+    
     def __init__(self) -> None:
         self._signals: list[AutomationDetectionSignal] = []
     
+    async def _probe(self, page, webdriver: bool, captcha: bool) -> dict:
+        """Run PROBE_SCRIPT in one round-trip; returns {webdriver, captcha}."""
+        result = await page.evaluate(
+            self.PROBE_SCRIPT,
+            {
+                "webdriver": webdriver,
+                "indicators": list(self.CAPTCHA_INDICATORS) if captcha else [],
+            },
+        )
+        if not isinstance(result, dict):
+            return {}
+        # Only indicators we asked for are reported, never page-supplied text
+        if result.get("captcha") not in self.CAPTCHA_INDICATORS:
+            result["captcha"] = None
+        return result
+    
+    def _record_webdriver(self, url: str) -> AutomationDetectionSignal:
+        signal = AutomationDetectionSignal(
+            signal_type="webdriver",
+            details="navigator.webdriver is true",
+            detected_at=datetime.now(timezone.utc),
+            url=url,
+        )
+        self._signals.append(signal)
+        logger.warning(f"Automation detection: {signal.details} at {url}")
+        return signal
+    
+    def _record_captcha(self, indicator: str, url: str) -> AutomationDetectionSignal:
+        signal = AutomationDetectionSignal(
+            signal_type="captcha",
+            details=f"CAPTCHA indicator detected: {indicator}",
+            detected_at=datetime.now(timezone.utc),
+            url=url,
+        )
+        self._signals.append(signal)
+        logger.warning(
+            f"CAPTCHA detected at {url} — NO BYPASS ATTEMPTED. "
+            f"Human intervention required."
+        )
+        return signal
+    
+    async def observe_page(self, page) -> list[AutomationDetectionSignal]:
+        """Check webdriver and CAPTCHA signals in a single page round-trip.
+        
+        Equivalent to check_detection_signals() followed by
+        detect_captcha(), without transferring the DOM to Python.
+        
+        OBSERVE ONLY — NO STEALTH, NO EVASION, NO BYPASS.
+        
+        Returns:
+            List of detected signals (empty if none)
+        """
+        signals: list[AutomationDetectionSignal] = []
+        url = page.url
+        
+        try:
+            result = await self._probe(page, webdriver=True, captcha=True)
+        except Exception as e:
+            logger.debug(f"Could not probe page for detection signals: {e}")
+            return signals
+        
+        if result.get("webdriver"):
+            signals.append(self._record_webdriver(url))
+        if result.get("captcha"):
+            signals.append(self._record_captcha(result["captcha"], url))
+        return signals
+    
     async def check_detection_signals(self, page) -> list[AutomationDetectionSignal]:
         """Check for automation detection signals.
         
@@ -87,15 +171,7 @@ class AntiDetectionObserver:
             # Check navigator.webdriver (OBSERVE ONLY)
             webdriver_detected = await page.evaluate("() => navigator.webdriver")
             if webdriver_detected:
-                signal = AutomationDetectionSignal(
-                    signal_type="webdriver",
-                    details="navigator.webdriver is true",
-                    detected_at=datetime.now(timezone.utc),
-                    url=url,
-                )
-                signals.append(signal)
-                self._signals.append(signal)
-                logger.warning(f"Automation detection: {signal.details} at {url}")
+                signals.append(self._record_webdriver(url))
         except Exception as e:
             logger.debug(f"Could not check webdriver signal: {e}")
         
@@ -104,28 +180,17 @@ class AntiDetectionObserver:
     async def detect_captcha(self, page) -> Optional[AutomationDetectionSignal]:
         """Detect CAPTCHA presence (observe only, NO bypass).
         
+        The DOM is scanned inside the page; only the matching indicator
+        is returned.
+        
         OBSERVE ONLY — NO STEALTH, NO EVASION, NO BYPASS.
         """
         url = page.url
         
         try:
-            page_content = await page.content()
-            page_content_lower = page_content.lower()
-            
-            for indicator in self.CAPTCHA_INDICATORS:
-                if indicator in page_content_lower:
-                    signal = AutomationDetectionSignal(
-                        signal_type="captcha",
-                        details=f"CAPTCHA indicator detected: {indicator}",
-                        detected_at=datetime.now(timezone.utc),
-                        url=url,
-                    )
-                    self._signals.append(signal)
-                    logger.warning(
-                        f"CAPTCHA detected at {url} — NO BYPASS ATTEMPTED. "
-                        f"Human intervention required."
-                    )
-                    return signal
+            result = await self._probe(page, webdriver=False, captcha=True)
+            if result.get("captcha"):
+                return self._record_captcha(result["captcha"], url)
         except Exception as e:
             logger.debug(f"Could not check for CAPTCHA: {e}")
         
@@ -28,6 +28,7 @@ from execution_layer.errors import (
 )
 from execution_layer.recovery import BrowserResilienceManager, ResilienceConfig
 from execution_layer.browser_launcher import BrowserLauncher, PlaywrightBrowserLauncher
+from execution_layer.console_capture import ConsoleCaptureConfig, ConsoleCaptureSink
 
 if TYPE_CHECKING:
     from execution_layer.browser_failure import BrowserFailureHandler
@@ -53,6 +54,12 @@ class BrowserConfig:
     max_restarts: int = 3
     enable_resilience: bool = False
     
+    # Console Capture Config
+    console_max_buffered_entries: int = 1000
+    console_repeat_sample_after: int = 50
+    console_repeat_sample_every: int = 100
+    console_line_index: bool = False
+    
     def __post_init__(self) -> None:
         # SECURITY GUARDRAIL: headless=False requires explicit approval
         if not self.headless and not self.headless_override_approved:
@@ -78,8 +85,8 @@ class BrowserSession:
     video_dir: Path
     screenshots_dir: Path
     started_at: datetime
+    console_capture: ConsoleCaptureSink
     screenshot_paths: list[Path] = field(default_factory=list)
-    console_logs: list[dict[str, Any]] = field(default_factory=list)
     
     # Track restart counts in session for evidence bundle reference
     failure_count: int = 0
@@ -117,6 +124,14 @@ class BrowserEngine:
         )
         self._resilience_manager = BrowserResilienceManager(resilience_config)
         
+        # Console capture (bounded, spills to per-session NDJSON)
+        self._console_config = ConsoleCaptureConfig(
+            max_buffered_entries=self._config.console_max_buffered_entries,
+            repeat_sample_after=self._config.console_repeat_sample_after,
+            repeat_sample_every=self._config.console_repeat_sample_every,
+            build_line_index=self._config.console_line_index,
+        )
+        
         # Ensure artifacts directory exists
         self._artifacts_path = Path(self._config.artifacts_dir)
         self._artifacts_path.mkdir(parents=True, exist_ok=True)
@@ -150,6 +165,7 @@ class BrowserEngine:
             har_dir = session_dir / "har"
             video_dir = session_dir / "videos"
             screenshots_dir = session_dir / "screenshots"
+            console_path = session_dir / "console" / f"{session_id}.ndjson"
             
             har_dir.mkdir(parents=True, exist_ok=True)
             screenshots_dir.mkdir(parents=True, exist_ok=True)
@@ -171,10 +187,11 @@ class BrowserEngine:
                 video_dir=video_dir,
                 screenshots_dir=screenshots_dir,
                 started_at=datetime.now(timezone.utc),
+                console_capture=ConsoleCaptureSink(console_path, self._console_config),
             )
             
             # Set up console log capture
-            page.on("console", lambda msg: session.console_logs.append({
+            page.on("console", lambda msg: session.console_capture.record({
                 "timestamp": datetime.now(timezone.utc).isoformat(),
                 "type": msg.type,
                 "text": msg.text,
@@ -264,7 +281,7 @@ class BrowserEngine:
                 "har_path": str(session.har_path) if session.har_path.exists() else None,
                 "video_path": str(video_path) if video_path else None,
                 "screenshot_paths": [str(p) for p in session.screenshot_paths],
-                "console_logs": session.console_logs,
+                "console_capture": session.console_capture.finalize(),
                 "started_at": session.started_at.isoformat(),
                 "stopped_at": datetime.now(timezone.utc).isoformat(),
                 "failure_count": session.failure_count,
@@ -347,7 +364,7 @@ class BrowserEngine:
         page.set_default_timeout(self._config.timeout_ms)
         
         # Restore console logging
-        page.on("console", lambda msg: session.console_logs.append({
+        page.on("console", lambda msg: session.console_capture.record({
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "type": msg.type,
             "text": msg.text,
@@ -0,0 +1,200 @@
+"""
+Execution Layer Console Capture
+
+Bounded console-log capture for browser sessions.
+
+Console messages are buffered in memory up to a fixed cap and then spilled
+in batches to a per-session NDJSON file. The file is hashed incrementally as
+it is written, so the whole console stream becomes a single hashed evidence
+artifact instead of one artifact per message.
+
+Repeated messages are counted and sampled: after a message has been seen
+``repeat_sample_after`` times, only every ``repeat_sample_every``-th further
+occurrence is written. Counters are kept so the drop is visible in evidence.
+
+The optional line index is a sidecar of fixed-width records (one unsigned
+64-bit big-endian byte offset per line), so line n is found with a single
+seek to n * record size.
+
+OBSERVE ONLY — NO STEALTH, NO EVASION, NO BYPASS.
+
+This system assists humans. It does not autonomously hunt, judge, or earn.
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+import hashlib
+import json
+import struct
+
+from execution_layer.errors import EvidenceCaptureError
+
+
+# One line-index record: byte offset of the line in the NDJSON file
+_INDEX_RECORD = struct.Struct(">Q")
+
+
+@dataclass
+class ConsoleCaptureConfig:
+    """Configuration for bounded console capture."""
+    max_buffered_entries: int = 1000  # Entries held in memory before spilling
+    repeat_sample_after: int = 50  # Identical messages always kept up to this count
+    repeat_sample_every: int = 100  # Then keep one of every N repeats
+    max_tracked_messages: int = 10000  # Cap on distinct messages with repeat counters
+    build_line_index: bool = False  # Write byte offset of every line to a sidecar
+
+    def __post_init__(self) -> None:
+        if self.max_buffered_entries < 1:
+            raise ValueError("max_buffered_entries must be >= 1")
+        if self.repeat_sample_after < 1:
+            raise ValueError("repeat_sample_after must be >= 1")
+        if self.repeat_sample_every < 1:
+            raise ValueError("repeat_sample_every must be >= 1")
+        if self.max_tracked_messages < 0:
+            raise ValueError("max_tracked_messages must be >= 0")
+
+
+@dataclass
+class ConsoleCaptureStats:
+    """Counters for a console capture sink."""
+    received: int = 0
+    written: int = 0
+    sampled_out: int = 0
+    spills: int = 0
+    repeat_counts: dict[str, int] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summary for evidence metadata (only messages that repeated)."""
+        return {
+            "received": self.received,
+            "written": self.written,
+            "sampled_out": self.sampled_out,
+            "spills": self.spills,
+            "repeated_messages": sum(1 for c in self.repeat_counts.values() if c > 1),
+        }
+
+
+class ConsoleCaptureSink:
+    """Memory-capped console sink that spills to an NDJSON file.
+
+    The NDJSON file and its SHA-256 are produced together: every byte written
+    to disk also feeds the running hash, so finalizing costs no extra read.
+    """
+
+    def __init__(self, path: Path, config: Optional[ConsoleCaptureConfig] = None) -> None:
+        self._config = config or ConsoleCaptureConfig()
+        self._path = Path(path)
+        self._index_path = self._path.with_name(self._path.name + ".idx")
+        self._buffer: list[bytes] = []
+        self._hasher = hashlib.sha256()
+        self._offset = 0
+        self._stats = ConsoleCaptureStats()
+        self._finalized = False
+
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        # Truncate any stale file from a previous run with the same session id
+        self._path.write_bytes(b"")
+        if self._config.build_line_index:
+            self._index_path.write_bytes(b"")
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def stats(self) -> ConsoleCaptureStats:
+        return self._stats
+
+    @staticmethod
+    def _message_key(entry: dict[str, Any]) -> str:
+        raw = f"{entry.get('type')}\x00{entry.get('text')}\x00{entry.get('location')}"
+        return hashlib.sha256(raw.encode("utf-8", "replace")).hexdigest()[:16]
+
+    def _should_keep(self, entry: dict[str, Any]) -> bool:
+        """Apply repeat sampling, updating dedup counters."""
+        counts = self._stats.repeat_counts
+        key = self._message_key(entry)
+        count = counts.get(key)
+        if count is None:
+            if len(counts) < self._config.max_tracked_messages:
+                counts[key] = 1
+            # Untracked messages are never sampled out
+            return True
+        count += 1
+        counts[key] = count
+        if count <= self._config.repeat_sample_after:
+            return True
+        return (count - self._config.repeat_sample_after) % self._config.repeat_sample_every == 0
+
+    def record(self, entry: dict[str, Any]) -> None:
+        """Record one console message."""
+        if self._finalized:
+            raise EvidenceCaptureError("Console capture already finalized")
+        self._stats.received += 1
+        if not self._should_keep(entry):
+            self._stats.sampled_out += 1
+            return
+        line = json.dumps(entry, sort_keys=True, default=str).encode("utf-8") + b"\n"
+        self._buffer.append(line)
+        self._stats.written += 1
+        if len(self._buffer) >= self._config.max_buffered_entries:
+            self.flush()
+
+    def flush(self) -> None:
+        """Spill buffered lines to disk in one write."""
+        if not self._buffer:
+            return
+        data = b"".join(self._buffer)
+        offsets: list[bytes] = []
+        if self._config.build_line_index:
+            position = self._offset
+            for line in self._buffer:
+                offsets.append(_INDEX_RECORD.pack(position))
+                position += len(line)
+        try:
+            with open(self._path, "ab") as f:
+                f.write(data)
+            if offsets:
+                with open(self._index_path, "ab") as f:
+                    f.write(b"".join(offsets))
+        except OSError as e:
+            raise EvidenceCaptureError(f"Console log spill failed: {e}") from e
+        self._hasher.update(data)
+        self._offset += len(data)
+        self._buffer.clear()
+        self._stats.spills += 1
+
+    def finalize(self) -> dict[str, Any]:
+        """Flush remaining lines and return the capture summary.
+
+        Safe to call more than once; later calls return the same summary.
+        """
+        if not self._finalized:
+            self.flush()
+            self._finalized = True
+        summary: dict[str, Any] = {
+            "path": str(self._path),
+            "content_hash": self._hasher.hexdigest(),
+            "size_bytes": self._offset,
+            "format": "ndjson",
+            **self._stats.to_dict(),
+        }
+        if self._config.build_line_index:
+            summary["index_path"] = str(self._index_path)
+        return summary
+
+
+def read_console_line(path: Path, index_path: Path, line_number: int) -> dict[str, Any]:
+    """Read a single console entry using the sidecar line index."""
+    if line_number < 0:
+        raise IndexError(f"Console line {line_number} out of range")
+    with open(index_path, "rb") as f:
+        f.seek(line_number * _INDEX_RECORD.size)
+        record = f.read(_INDEX_RECORD.size)
+    if len(record) < _INDEX_RECORD.size:
+        raise IndexError(f"Console line {line_number} out of range")
+    (offset,) = _INDEX_RECORD.unpack(record)
+    with open(path, "rb") as f:
+        f.seek(offset)
+        return json.loads(f.readline())
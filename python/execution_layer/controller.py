@@ -46,6 +46,7 @@ from execution_layer.pipeline_client import (
 )
 from execution_layer.throttle import ExecutionThrottle, ExecutionThrottleConfig
 from execution_layer.retention import EvidenceRetentionManager, EvidenceRetentionPolicy
+from execution_layer.request_logger import RequestLogger
 
 
 @dataclass
@@ -54,6 +55,10 @@ class ExecutionControllerConfig:
     
     MANDATORY: throttle_config and retention_policy are REQUIRED.
     HARD FAIL if missing.
+    
+    request_logger, if given, is shared by the MCP and Bounty Pipeline
+    clients. The controller closes each execution in it once the call
+    that logged for it has finished, so finished executions are spilled.
     """
     scope_config: ShopifyScopeConfig
     mcp_config: MCPClientConfig
@@ -62,6 +67,7 @@ class ExecutionControllerConfig:
     retention_policy: EvidenceRetentionPolicy  # REQUIRED
     browser_config: Optional[BrowserConfig] = None
     duplicate_config: Optional[DuplicateExplorationConfig] = None
+    request_logger: Optional[RequestLogger] = None
 
 
 class ExecutionController:
@@ -89,8 +95,10 @@ class ExecutionController:
         self._video_generator = VideoPoCGenerator()
         self._duplicate_handler = DuplicateHandler(config.duplicate_config)
         self._browser_engine = BrowserEngine(config.browser_config)
-        self._mcp_client = MCPClient(config.mcp_config)
-        self._pipeline_client = BountyPipelineClient(config.pipeline_config)
+        self._request_logger = config.request_logger
+        self._mcp_client = MCPClient(config.mcp_config, request_logger=self._request_logger)
+        self._pipeline_client = BountyPipelineClient(
+            config.pipeline_config, request_logger=self._request_logger)
         self._used_tokens: set[str] = set()
 
     def register_store_attestation(self, attestation: StoreOwnershipAttestation) -> None:
@@ -208,7 +216,10 @@ class ExecutionController:
 
     async def send_to_mcp(self, evidence_bundle: EvidenceBundle) -> MCPVerificationResult:
         """Send evidence to MCP for verification via REAL HTTP. HARD FAIL if unreachable."""
-        return await self._mcp_client.verify_evidence(evidence_bundle)
+        try:
+            return await self._mcp_client.verify_evidence(evidence_bundle)
+        finally:
+            self._close_execution_logs(evidence_bundle.execution_id)
     
     def generate_video_poc(self, finding_id: str, mcp_result: MCPVerificationResult,
                            evidence_bundle: EvidenceBundle) -> VideoPoC:
@@ -223,9 +234,12 @@ class ExecutionController:
     async def create_draft(self, finding_id: str, mcp_result: MCPVerificationResult,
                            evidence_bundle: EvidenceBundle, program_id: str) -> DraftReport:
         """Create draft report via REAL Bounty Pipeline API. DRAFT ONLY. HARD FAIL if unreachable."""
-        return await self._pipeline_client.create_draft(
-            finding_id=finding_id, mcp_result=mcp_result,
-            evidence_bundle=evidence_bundle, program_id=program_id)
+        try:
+            return await self._pipeline_client.create_draft(
+                finding_id=finding_id, mcp_result=mcp_result,
+                evidence_bundle=evidence_bundle, program_id=program_id)
+        finally:
+            self._close_execution_logs(evidence_bundle.execution_id)
     
     def start_duplicate_exploration(self, finding_id: str):
         """Start duplicate exploration for a finding."""
@@ -256,6 +270,14 @@ class ExecutionController:
         await self._browser_engine.cleanup()
         await self._mcp_client.close()
         await self._pipeline_client.close()
+        if self._request_logger is not None:
+            for execution_id in self._request_logger.open_executions:
+                self._request_logger.close_execution(execution_id)
+
+    def _close_execution_logs(self, execution_id: str) -> None:
+        """Spill the request logs of an execution whose call has finished."""
+        if self._request_logger is not None:
+            self._request_logger.close_execution(execution_id)
 
     def _validate_token(self, token: ExecutionToken, action: SafeAction) -> None:
         """Validate token for single action."""
@@ -302,6 +324,19 @@ class ExecutionController:
                 artifact_type=EvidenceType.VIDEO, content=video_content, file_path=video_path)
         
         console_logs: list[EvidenceArtifact] = []
+        console_capture = evidence_summary.get("console_capture")
+        if console_capture and Path(console_capture["path"]).exists():
+            # Single artifact for the whole NDJSON stream; hash computed while spilling
+            metadata = {k: v for k, v in console_capture.items()
+                        if k not in ("path", "content_hash")}
+            console_logs.append(EvidenceArtifact(
+                artifact_id=secrets.token_urlsafe(16),
+                artifact_type=EvidenceType.CONSOLE_LOG,
+                content_hash=console_capture["content_hash"],
+                captured_at=datetime.now(timezone.utc),
+                file_path=console_capture["path"],
+                metadata=metadata))
+        # Legacy per-entry summaries (callers building evidence_summary by hand)
         for log_entry in evidence_summary.get("console_logs", []):
             log_content = str(log_entry).encode()
             console_logs.append(EvidenceArtifact.create(
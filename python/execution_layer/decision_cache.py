@@ -0,0 +1,86 @@
+"""
+Phase-4.2: Egress Decision Cache
+
+Bounded LRU cache of egress decisions for DomainAllowList and PayloadGuard.
+
+A cache holds decisions made under exactly one rule set. The owner swaps
+in a new cache together with new rules in a single assignment, so a
+decision made under old rules is never served under new ones.
+
+Only the decision (allowed, reason, violations) is cached. Results are
+rebuilt with a fresh timestamp on every check, so audit records from a
+cache hit are identical to those of an uncached check.
+
+OBSERVE ONLY — NO STEALTH, NO EVASION, NO BYPASS.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, TypeVar
+
+
+DEFAULT_DECISION_CACHE_SIZE = 4096
+
+T = TypeVar('T')
+
+
+class DecisionCache:
+    """
+    Thread-safe bounded LRU map from a normalized request key to a decision.
+
+    A max_entries of 0 disables caching: every lookup computes.
+    """
+
+    __slots__ = ('_max_entries', '_entries', '_lock', 'hits', 'misses')
+
+    def __init__(self, max_entries: int = DEFAULT_DECISION_CACHE_SIZE) -> None:
+        """
+        Initialize DecisionCache.
+
+        Args:
+            max_entries: Maximum number of decisions kept (0 disables)
+        """
+        if max_entries < 0:
+            raise ValueError("max_entries must be non-negative")
+        self._max_entries = max_entries
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def max_entries(self) -> int:
+        """Get the cache bound."""
+        return self._max_entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], T]) -> T:
+        """
+        Return the cached decision for key, computing and storing it on a miss.
+
+        compute() runs outside the lock; it must be deterministic for key
+        under the rules this cache belongs to.
+        """
+        if not self._max_entries:
+            return compute()
+        with self._lock:
+            decision = self._entries.get(key)
+            if decision is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return decision
+            self.misses += 1
+        decision = compute()
+        with self._lock:
+            self._entries[key] = decision
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return decision
+
+    def clear(self) -> None:
+        """Drop all cached decisions."""
+        with self._lock:
+            self._entries.clear()
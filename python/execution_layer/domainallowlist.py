@@ -13,14 +13,20 @@ Constraints:
 - Fail-closed on violation
 - All decisions are auditable
 - Integrates ONLY with PayloadGuard
+
+Decisions are memoized in a bounded LRU cache keyed by normalized domain.
+Replacing the allow list swaps in fresh rules and an empty cache together.
 """
 
 import re
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Dict, List, Any, Optional, FrozenSet, Set
+from typing import Dict, List, Any, Optional, FrozenSet, Set, Tuple
 from urllib.parse import urlparse
 
+from execution_layer.decision_cache import DecisionCache, DEFAULT_DECISION_CACHE_SIZE
+from execution_layer.policy import Policy
+
 
 # Patterns for detecting IP literals
 IPV4_PATTERN = re.compile(
@@ -45,6 +51,10 @@ BLOCKED_DOMAINS: FrozenSet[str] = frozenset({
     '[::1]',
 })
 
+# Stands in for the caller's domain in cached reason templates. A null
+# byte is an escape attempt, so it never reaches a templated reason.
+_DOMAIN_MARK = '\x00'
+
 
 @dataclass
 class DomainCheckResult:
@@ -88,27 +98,67 @@ class DomainAllowList:
     - Mask errors
     """
     
-    __slots__ = ('_exact_domains', '_wildcard_suffixes')
+    __slots__ = ('_rules',)
     
-    def __init__(self, allowed_domains: List[str]) -> None:
+    def __init__(
+        self,
+        allowed_domains: List[str],
+        cache_size: int = DEFAULT_DECISION_CACHE_SIZE,
+    ) -> None:
         """
         Initialize Domain Allow-List.
         
         Args:
             allowed_domains: List of allowed domains.
                              Use *.example.com for wildcard subdomains.
+            cache_size: Maximum number of cached decisions (0 disables)
         """
-        self._exact_domains: Set[str] = set()
-        self._wildcard_suffixes: Set[str] = set()
+        self._rules = self._build_rules(allowed_domains, cache_size)
+    
+    @staticmethod
+    def _build_rules(
+        allowed_domains: List[str],
+        cache_size: int,
+    ) -> Tuple[Set[str], Set[str], DecisionCache]:
+        """Build (exact domains, wildcard suffixes, empty decision cache)."""
+        exact_domains: Set[str] = set()
+        wildcard_suffixes: Set[str] = set()
         
         for domain in allowed_domains:
             domain_lower = domain.lower().strip()
             if domain_lower.startswith('*.'):
                 # Wildcard rule: *.example.com -> .example.com
                 suffix = domain_lower[1:]  # Remove the *
-                self._wildcard_suffixes.add(suffix)
+                wildcard_suffixes.add(suffix)
             else:
-                self._exact_domains.add(domain_lower)
+                exact_domains.add(domain_lower)
+        
+        return exact_domains, wildcard_suffixes, DecisionCache(cache_size)
+    
+    @property
+    def decision_cache(self) -> DecisionCache:
+        """Get the decision cache for the current rules (for stats)."""
+        return self._rules[2]
+    
+    def set_allowed_domains(self, allowed_domains: List[str]) -> None:
+        """
+        Replace the allowed domains.
+        
+        The new rules and an empty decision cache are swapped in with a
+        single assignment; no check ever sees new rules with old decisions.
+        
+        Args:
+            allowed_domains: List of allowed domains (same format as __init__)
+        """
+        self._rules = self._build_rules(allowed_domains, self._rules[2].max_entries)
+    
+    def apply_policy(self, policy: Policy) -> None:
+        """Replace the allowed domains with those of a Policy."""
+        self.set_allowed_domains(list(policy.allowed_domains))
+    
+    def clear_cache(self) -> None:
+        """Drop all cached decisions (rules are unchanged)."""
+        self._rules[2].clear()
     
     def check(self, domain: Optional[str]) -> DomainCheckResult:
         """
@@ -119,6 +169,9 @@ class DomainAllowList:
         - Non-mutating
         - Fail-closed (any violation blocks)
         
+        Decisions are cached per normalized domain; the result (and its
+        audit dict) is identical to an uncached check.
+        
         Args:
             domain: The domain to check
             
@@ -141,57 +194,56 @@ class DomainAllowList:
             )
         
         domain_lower = domain.lower().strip()
+        # One read: rules and cache always belong together
+        exact_domains, wildcard_suffixes, cache = self._rules
+        allowed, reason = cache.get_or_compute(
+            domain_lower,
+            lambda: self._decide(domain_lower, exact_domains, wildcard_suffixes),
+        )
+        return DomainCheckResult(
+            allowed=allowed,
+            reason=reason.replace(_DOMAIN_MARK, domain),
+            domain=domain,
+        )
+    
+    def _decide(
+        self,
+        domain_lower: str,
+        exact_domains: Set[str],
+        wildcard_suffixes: Set[str],
+    ) -> Tuple[bool, str]:
+        """
+        Decide for a normalized domain.
         
+        Returns (allowed, reason template); the template holds _DOMAIN_MARK
+        where the domain as given by the caller is reported.
+        """
         # Check for escape attempts
         escape_result = self._check_escape_attempts(domain_lower)
         if escape_result:
-            return DomainCheckResult(
-                allowed=False,
-                reason=escape_result,
-                domain=domain,
-            )
+            return False, escape_result
         
         # Check for IP literals
         ip_result = self._check_ip_literal(domain_lower)
         if ip_result:
-            return DomainCheckResult(
-                allowed=False,
-                reason=ip_result,
-                domain=domain,
-            )
+            return False, ip_result
         
         # Check for blocked domains
         if domain_lower in BLOCKED_DOMAINS:
-            return DomainCheckResult(
-                allowed=False,
-                reason=f"Domain '{domain}' is blocked (reserved)",
-                domain=domain,
-            )
+            return False, f"Domain '{_DOMAIN_MARK}' is blocked (reserved)"
         
         # Check exact match
-        if domain_lower in self._exact_domains:
-            return DomainCheckResult(
-                allowed=True,
-                reason=f"Domain '{domain}' allowed (exact match)",
-                domain=domain,
-            )
+        if domain_lower in exact_domains:
+            return True, f"Domain '{_DOMAIN_MARK}' allowed (exact match)"
         
         # Check wildcard suffix match
-        for suffix in self._wildcard_suffixes:
+        for suffix in wildcard_suffixes:
             if domain_lower.endswith(suffix) and domain_lower != suffix[1:]:
                 # Must be a subdomain, not the base domain itself
-                return DomainCheckResult(
-                    allowed=True,
-                    reason=f"Domain '{domain}' allowed (wildcard match: *{suffix})",
-                    domain=domain,
-                )
+                return True, f"Domain '{_DOMAIN_MARK}' allowed (wildcard match: *{suffix})"
         
         # No match found - fail closed
-        return DomainCheckResult(
-            allowed=False,
-            reason=f"Domain '{domain}' not in allow-list",
-            domain=domain,
-        )
+        return False, f"Domain '{_DOMAIN_MARK}' not in allow-list"
     
     def check_url(self, url: str) -> DomainCheckResult:
         """
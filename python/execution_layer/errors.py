@@ -260,6 +260,16 @@ class RetryExhaustedError(ExecutionLayerError):
     pass
 
 
+class CircuitOpenError(RetryExhaustedError):
+    """Circuit breaker open for an operation — HARD FAIL.
+    
+    This error is raised when:
+    - Recent attempts of the operation failed repeatedly
+    - The circuit has not yet cooled down to admit a trial call
+    """
+    pass
+
+
 class HashChainVerificationError(ExecutionLayerError):
     """Hash chain verification failed — HARD FAIL.
     
@@ -11,13 +11,21 @@ This system assists humans. It does not autonomously hunt, judge, or earn.
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Optional, Any, TYPE_CHECKING
+from typing import Optional, Any, Sequence, TYPE_CHECKING
 from urllib.parse import urlparse
+import asyncio
 import json
 import time
 
 import httpx
 
+# HTTP/2 is optional: httpx needs the h2 package for it
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 from execution_layer.types import (
     EvidenceBundle,
     MCPVerificationResult,
@@ -62,8 +70,33 @@ class MCPClientConfig:
     verify_ssl: bool = True  # MANDATORY: True by default
     api_key: Optional[str] = None
     
+    # Batched verification (verify_evidence_many)
+    max_concurrency: int = 8  # In-flight requests; also sizes the connection pool
+    http2: bool = True  # Used only when the h2 package is installed
+    batch_endpoint: Optional[str] = None  # e.g. "/api/v1/verify/batch" if the server has one
+    batch_size: int = 50  # Bundles per batch-endpoint request
+    
     def __post_init__(self) -> None:
         _validate_https_url(self.base_url, "MCPClient")
+        if self.max_concurrency < 1:
+            raise ConfigurationError("MCPClient max_concurrency must be >= 1")
+        if self.batch_size < 1:
+            raise ConfigurationError("MCPClient batch_size must be >= 1")
+
+
+@dataclass(frozen=True)
+class MCPVerificationOutcome:
+    """Per-bundle outcome of verify_evidence_many.
+    
+    Exactly one of result or error is set.
+    """
+    bundle_id: str
+    result: Optional[MCPVerificationResult] = None
+    error: Optional[Exception] = None
+    
+    @property
+    def ok(self) -> bool:
+        return self.error is None
 
 
 class MCPClient:
@@ -81,12 +114,16 @@ class MCPClient:
         request_logger: Optional["RequestLogger"] = None,
         response_validator: Optional["ResponseValidator"] = None,
         retry_executor: Optional["RetryExecutor"] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
     ) -> None:
         self._config = config
         self._client: Optional[httpx.AsyncClient] = None
         self._request_logger = request_logger
         self._response_validator = response_validator
         self._retry_executor = retry_executor
+        self._transport = transport
+        # Set when the server answers 404/405 on the batch endpoint
+        self._batch_endpoint_unsupported = False
     
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client."""
@@ -100,9 +137,58 @@ class MCPClient:
                 timeout=self._config.timeout_seconds,
                 verify=self._config.verify_ssl,
                 headers=headers,
+                http2=self._config.http2 and HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_connections=self._config.max_concurrency,
+                    max_keepalive_connections=self._config.max_concurrency,
+                ),
+                transport=self._transport,
             )
         return self._client
     
+    @staticmethod
+    def _build_payload(evidence_bundle: EvidenceBundle) -> dict[str, Any]:
+        """Build the verification payload for one bundle."""
+        return {
+            "bundle_id": evidence_bundle.bundle_id,
+            "execution_id": evidence_bundle.execution_id,
+            "har_hash": evidence_bundle.har_file.content_hash if evidence_bundle.har_file else None,
+            "screenshot_hashes": [s.content_hash for s in evidence_bundle.screenshots],
+            "video_hash": evidence_bundle.video.content_hash if evidence_bundle.video else None,
+            "execution_trace": evidence_bundle.execution_trace,
+            "bundle_hash": evidence_bundle.bundle_hash,
+            "captured_at": evidence_bundle.created_at.isoformat() if evidence_bundle.created_at else None,
+        }
+    
+    def _parse_result(
+        self,
+        data: dict[str, Any],
+        evidence_bundle: EvidenceBundle,
+    ) -> MCPVerificationResult:
+        """Validate and parse one verification response object."""
+        # Validate response schema (lenient mode: warn on unexpected fields)
+        # ResponseValidationError is HARD FAIL for missing required fields
+        if self._response_validator is not None:
+            self._response_validator.validate_mcp_response(data)
+        
+        # Parse classification
+        classification_str = data.get("classification", "SIGNAL")
+        try:
+            classification = MCPClassification(classification_str)
+        except ValueError:
+            classification = MCPClassification.SIGNAL
+        
+        return MCPVerificationResult(
+            verification_id=data["verification_id"],
+            finding_id=data.get("finding_id", evidence_bundle.execution_id),
+            classification=classification,
+            invariant_violated=data.get("invariant_violated"),
+            proof_hash=data.get("proof_hash"),
+            verified_at=datetime.fromisoformat(data["verified_at"]) 
+                if "verified_at" in data 
+                else datetime.now(timezone.utc),
+        )
+    
     async def verify_evidence(
         self,
         evidence_bundle: EvidenceBundle,
@@ -132,17 +218,7 @@ class MCPClient:
                 execution_id=evidence_bundle.execution_id,
             )
         
-        # Prepare request payload
-        payload = {
-            "bundle_id": evidence_bundle.bundle_id,
-            "execution_id": evidence_bundle.execution_id,
-            "har_hash": evidence_bundle.har_file.content_hash if evidence_bundle.har_file else None,
-            "screenshot_hashes": [s.content_hash for s in evidence_bundle.screenshots],
-            "video_hash": evidence_bundle.video.content_hash if evidence_bundle.video else None,
-            "execution_trace": evidence_bundle.execution_trace,
-            "bundle_hash": evidence_bundle.bundle_hash,
-            "captured_at": evidence_bundle.captured_at.isoformat() if evidence_bundle.captured_at else None,
-        }
+        payload = self._build_payload(evidence_bundle)
         
         status_code: int = 0
         response_id: Optional[str] = None
@@ -169,31 +245,9 @@ class MCPClient:
                 )
             
             data = response.json()
-            
-            # Validate response schema (lenient mode: warn on unexpected fields)
-            # ResponseValidationError is HARD FAIL for missing required fields
-            if self._response_validator is not None:
-                self._response_validator.validate_mcp_response(data)
-            
-            # Parse classification
-            classification_str = data.get("classification", "SIGNAL")
-            try:
-                classification = MCPClassification(classification_str)
-            except ValueError:
-                classification = MCPClassification.SIGNAL
-            
+            result = self._parse_result(data, evidence_bundle)
             response_id = data.get("verification_id")
-            
-            return MCPVerificationResult(
-                verification_id=data["verification_id"],
-                finding_id=data.get("finding_id", evidence_bundle.execution_id),
-                classification=classification,
-                invariant_violated=data.get("invariant_violated"),
-                proof_hash=data.get("proof_hash"),
-                verified_at=datetime.fromisoformat(data["verified_at"]) 
-                    if "verified_at" in data 
-                    else datetime.now(timezone.utc),
-            )
+            return result
         
         try:
             # Execute with retry if retry_executor is provided
@@ -207,22 +261,8 @@ class MCPClient:
             
             return result
             
-        except httpx.ConnectError as e:
-            raise MCPConnectionError(
-                f"Failed to connect to MCP server at {self._config.base_url}: {e} — HARD FAIL"
-            ) from e
-        except httpx.TimeoutException as e:
-            raise MCPConnectionError(
-                f"MCP server request timed out after {self._config.timeout_seconds}s — HARD FAIL"
-            ) from e
-        except httpx.HTTPError as e:
-            raise MCPVerificationError(
-                f"HTTP error during MCP verification: {e}"
-            ) from e
-        except json.JSONDecodeError as e:
-            raise MCPVerificationError(
-                f"Invalid JSON response from MCP server: {e}"
-            ) from e
+        except (httpx.HTTPError, json.JSONDecodeError) as e:
+            raise self._wrap_http_error(e) from e
         finally:
             # Log response (post-call, non-blocking) - NO SENSITIVE DATA
             if self._request_logger is not None and request_id is not None:
@@ -234,6 +274,186 @@ class MCPClient:
                     response_id=response_id,
                 )
     
+    async def verify_evidence_many(
+        self,
+        evidence_bundles: Sequence[EvidenceBundle],
+    ) -> list[MCPVerificationOutcome]:
+        """Verify many evidence bundles over the shared HTTP client.
+        
+        Requests are pipelined with at most config.max_concurrency in
+        flight. If config.batch_endpoint is set, bundles are sent in chunks
+        of config.batch_size to that endpoint instead; a 404/405 from it
+        falls back to per-bundle requests for the rest of the client's life.
+        
+        Args:
+            evidence_bundles: Bundles to verify
+        
+        Returns:
+            One MCPVerificationOutcome per bundle, in input order. A failure
+            for one bundle is recorded in its outcome and does not affect
+            the others.
+        """
+        outcomes: list[Optional[MCPVerificationOutcome]] = [None] * len(evidence_bundles)
+        semaphore = asyncio.Semaphore(self._config.max_concurrency)
+        
+        async def _verify_single(index: int) -> None:
+            bundle = evidence_bundles[index]
+            async with semaphore:
+                try:
+                    result = await self.verify_evidence(bundle)
+                    outcomes[index] = MCPVerificationOutcome(bundle.bundle_id, result=result)
+                except Exception as e:
+                    outcomes[index] = MCPVerificationOutcome(bundle.bundle_id, error=e)
+        
+        async def _verify_chunk(indices: list[int]) -> None:
+            async with semaphore:
+                handled = await self._verify_batch_chunk(evidence_bundles, indices, outcomes)
+            if not handled:
+                await asyncio.gather(*(_verify_single(i) for i in indices))
+        
+        if self._config.batch_endpoint and not self._batch_endpoint_unsupported:
+            size = self._config.batch_size
+            chunks = [
+                list(range(start, min(start + size, len(evidence_bundles))))
+                for start in range(0, len(evidence_bundles), size)
+            ]
+            await asyncio.gather(*(_verify_chunk(chunk) for chunk in chunks))
+        else:
+            await asyncio.gather(*(_verify_single(i) for i in range(len(evidence_bundles))))
+        
+        return [outcome for outcome in outcomes if outcome is not None]
+    
+    async def _verify_batch_chunk(
+        self,
+        evidence_bundles: Sequence[EvidenceBundle],
+        indices: list[int],
+        outcomes: list[Optional[MCPVerificationOutcome]],
+    ) -> bool:
+        """Send one chunk to the batch endpoint and fill in its outcomes.
+        
+        The server answers {"results": [...]} in request order; each item is
+        either a verification response or {"error": "..."}.
+        
+        Returns:
+            False if the server does not support the batch endpoint and the
+            chunk must be sent per bundle instead.
+        """
+        if self._batch_endpoint_unsupported:
+            return False
+        
+        endpoint = self._config.batch_endpoint
+        bundles = [evidence_bundles[i] for i in indices]
+        client = await self._get_client()
+        
+        # Log one request per bundle so per-execution lookups stay complete
+        request_ids: list[Optional[str]] = [None] * len(bundles)
+        start_time = time.monotonic()
+        if self._request_logger is not None:
+            request_ids = [
+                self._request_logger.log_request(
+                    endpoint=endpoint,
+                    method="POST",
+                    execution_id=bundle.execution_id,
+                )
+                for bundle in bundles
+            ]
+        
+        status_code: int = 0
+        response_ids: list[Optional[str]] = [None] * len(bundles)
+        
+        async def _do_http_call() -> list[Any]:
+            """Inner HTTP call that can be retried."""
+            nonlocal status_code
+            
+            response = await client.post(
+                endpoint,
+                json={"bundles": [self._build_payload(b) for b in bundles]},
+            )
+            status_code = response.status_code
+            
+            if response.status_code in (404, 405):
+                return []
+            
+            if response.status_code == 503:
+                raise MCPConnectionError(
+                    f"MCP server unavailable (503) — HARD FAIL"
+                )
+            
+            if response.status_code != 200:
+                raise MCPVerificationError(
+                    f"MCP batch verification failed with status {response.status_code}: "
+                    f"{response.text}"
+                )
+            
+            items = response.json().get("results")
+            if not isinstance(items, list) or len(items) != len(bundles):
+                raise MCPVerificationError(
+                    f"MCP batch response must contain {len(bundles)} results"
+                )
+            return items
+        
+        try:
+            if self._retry_executor is not None:
+                items = await self._retry_executor.execute_with_retry(
+                    _do_http_call,
+                    operation_name="MCPClient.verify_evidence_many",
+                )
+            else:
+                items = await _do_http_call()
+            
+            if status_code in (404, 405):
+                self._batch_endpoint_unsupported = True
+                return False
+            
+            for position, (index, bundle, item) in enumerate(zip(indices, bundles, items)):
+                try:
+                    if not isinstance(item, dict):
+                        raise MCPVerificationError("MCP batch result must be an object")
+                    if "error" in item:
+                        raise MCPVerificationError(
+                            f"MCP verification failed for bundle {bundle.bundle_id}: "
+                            f"{item['error']}"
+                        )
+                    result = self._parse_result(item, bundle)
+                    response_ids[position] = item.get("verification_id")
+                    outcomes[index] = MCPVerificationOutcome(bundle.bundle_id, result=result)
+                except Exception as e:
+                    outcomes[index] = MCPVerificationOutcome(bundle.bundle_id, error=e)
+            return True
+            
+        except Exception as e:
+            error = self._wrap_http_error(e)
+            for index, bundle in zip(indices, bundles):
+                outcomes[index] = MCPVerificationOutcome(bundle.bundle_id, error=error)
+            return True
+        finally:
+            if self._request_logger is not None:
+                elapsed_ms = (time.monotonic() - start_time) * 1000
+                for request_id, response_id in zip(request_ids, response_ids):
+                    if request_id is not None:
+                        self._request_logger.log_response(
+                            request_id=request_id,
+                            status_code=status_code,
+                            response_time_ms=elapsed_ms,
+                            response_id=response_id,
+                        )
+    
+    def _wrap_http_error(self, e: Exception) -> Exception:
+        """Map transport errors to MCP errors (same mapping as verify_evidence)."""
+        if isinstance(e, httpx.ConnectError):
+            return MCPConnectionError(
+                f"Failed to connect to MCP server at {self._config.base_url}: {e} — HARD FAIL"
+            )
+        if isinstance(e, httpx.TimeoutException):
+            return MCPConnectionError(
+                f"MCP server request timed out after {self._config.timeout_seconds}s — HARD FAIL"
+            )
+        if isinstance(e, httpx.HTTPError):
+            return MCPVerificationError(f"HTTP error during MCP verification: {e}")
+        if isinstance(e, json.JSONDecodeError):
+            return MCPVerificationError(f"Invalid JSON response from MCP server: {e}")
+        return e
+    
     async def health_check(self) -> bool:
         """Check if MCP server is reachable.
         
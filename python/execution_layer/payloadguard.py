@@ -12,13 +12,20 @@ Constraints:
 - No retry logic
 - Fail-closed on violation
 - All decisions are auditable
+
+Decisions are memoized in a bounded LRU cache keyed by URL, method and
+header names, so a cache hit skips URL parsing entirely. Replacing the allowed methods swaps in fresh rules and an
+empty cache together.
 """
 
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Dict, List, Any, Optional, FrozenSet
+from typing import Dict, List, Any, Optional, FrozenSet, Tuple
 from urllib.parse import urlparse
 
+from execution_layer.decision_cache import DecisionCache, DEFAULT_DECISION_CACHE_SIZE
+from execution_layer.policy import Policy
+
 
 # Default allowed HTTP methods (safe methods only)
 DEFAULT_ALLOWED_METHODS: FrozenSet[str] = frozenset({
@@ -100,19 +107,52 @@ class PayloadGuard:
     - Mask errors
     """
     
-    __slots__ = ('_allowed_methods',)
+    __slots__ = ('_rules',)
     
     def __init__(
         self,
-        allowed_methods: Optional[FrozenSet[str]] = None
+        allowed_methods: Optional[FrozenSet[str]] = None,
+        cache_size: int = DEFAULT_DECISION_CACHE_SIZE,
     ) -> None:
         """
         Initialize PayloadGuard.
         
         Args:
             allowed_methods: Set of allowed HTTP methods (defaults to safe methods)
+            cache_size: Maximum number of cached decisions (0 disables)
+        """
+        self._rules: Tuple[FrozenSet[str], DecisionCache] = (
+            allowed_methods or DEFAULT_ALLOWED_METHODS,
+            DecisionCache(cache_size),
+        )
+    
+    @property
+    def decision_cache(self) -> DecisionCache:
+        """Get the decision cache for the current rules (for stats)."""
+        return self._rules[1]
+    
+    def set_allowed_methods(self, allowed_methods: Optional[FrozenSet[str]]) -> None:
         """
-        self._allowed_methods = allowed_methods or DEFAULT_ALLOWED_METHODS
+        Replace the allowed methods.
+        
+        The new methods and an empty decision cache are swapped in with a
+        single assignment; no check ever sees new rules with old decisions.
+        
+        Args:
+            allowed_methods: Set of allowed HTTP methods (None for defaults)
+        """
+        self._rules = (
+            allowed_methods or DEFAULT_ALLOWED_METHODS,
+            DecisionCache(self._rules[1].max_entries),
+        )
+    
+    def apply_policy(self, policy: Policy) -> None:
+        """Replace the allowed methods with those of a Policy."""
+        self.set_allowed_methods(frozenset(policy.allowed_methods))
+    
+    def clear_cache(self) -> None:
+        """Drop all cached decisions (rules are unchanged)."""
+        self._rules[1].clear()
     
     def check(self, spec: RequestSpec) -> CheckResult:
         """
@@ -123,20 +163,40 @@ class PayloadGuard:
         - Non-mutating
         - Fail-closed (any violation blocks)
         
+        Decisions are cached per (URL, method, header names); a hit skips
+        URL parsing, and the result (and its audit dict) is identical to
+        an uncached check.
+        
         Args:
             spec: The request specification to check
             
         Returns:
             CheckResult with allowed status and audit information
         """
-        violations: List[str] = []
-        
-        # Check URL validity and protocol
-        url_violations = self._check_url(spec.url)
-        violations.extend(url_violations)
+        # One read: rules and cache always belong together
+        allowed_methods, cache = self._rules
+        # Header names in order: violations are reported per name as given
+        key = (spec.url, spec.method, tuple(spec.headers))
+        allowed, reason, violations = cache.get_or_compute(
+            key,
+            lambda: self._decide(spec, allowed_methods),
+        )
+        return CheckResult(
+            allowed=allowed,
+            reason=reason,
+            violations=list(violations),
+        )
+    
+    def _decide(
+        self,
+        spec: RequestSpec,
+        allowed_methods: FrozenSet[str],
+    ) -> Tuple[bool, str, Tuple[str, ...]]:
+        """Decide for a request; returns (allowed, reason, violations)."""
+        violations: List[str] = self._check_url(spec.url)
         
         # Check HTTP method
-        method_violations = self._check_method(spec.method)
+        method_violations = self._check_method(spec.method, allowed_methods)
         violations.extend(method_violations)
         
         # Check headers for spoofing attempts
@@ -145,17 +205,13 @@ class PayloadGuard:
         
         # Fail-closed: any violation blocks the request
         if violations:
-            return CheckResult(
-                allowed=False,
-                reason=f"Request blocked: {'; '.join(violations)}",
-                violations=violations,
+            return (
+                False,
+                f"Request blocked: {'; '.join(violations)}",
+                tuple(violations),
             )
         
-        return CheckResult(
-            allowed=True,
-            reason="Request allowed",
-            violations=[],
-        )
+        return True, "Request allowed", ()
     
     def _check_url(self, url: str) -> List[str]:
         """Check URL for violations."""
@@ -188,7 +244,7 @@ class PayloadGuard:
         
         return violations
     
-    def _check_method(self, method: str) -> List[str]:
+    def _check_method(self, method: str, allowed_methods: FrozenSet[str]) -> List[str]:
         """Check HTTP method for violations."""
         violations: List[str] = []
         
@@ -197,10 +253,10 @@ class PayloadGuard:
             return violations
         
         method_upper = method.upper()
-        if method_upper not in self._allowed_methods:
+        if method_upper not in allowed_methods:
             violations.append(
                 f"HTTP method '{method}' not allowed. "
-                f"Allowed: {', '.join(sorted(self._allowed_methods))}"
+                f"Allowed: {', '.join(sorted(allowed_methods))}"
             )
         
         return violations
@@ -4,6 +4,10 @@ Execution Layer Bounty Pipeline Client
 REAL HTTP client for Phase-3 Bounty Pipeline. NO SIMULATION.
 All requests call the actual Bounty Pipeline API.
 
+Identical concurrent get_draft and health_check calls share one
+in-flight request, and drafts fetched within draft_cache_ttl_seconds are
+served from a small cache. create_draft is never coalesced or cached.
+
 CONSTRAINT: DRAFT-ONLY. No submission allowed.
 
 OBSERVE ONLY — NO STEALTH, NO EVASION, NO BYPASS.
@@ -11,10 +15,12 @@ OBSERVE ONLY — NO STEALTH, NO EVASION, NO BYPASS.
 This system assists humans. It does not autonomously hunt, judge, or earn.
 """
 
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone
-from typing import Optional, Any, TYPE_CHECKING
+from typing import Awaitable, Callable, Optional, Any, TYPE_CHECKING
 from urllib.parse import urlparse
+import asyncio
 import json
 import time
 
@@ -64,8 +70,28 @@ class BountyPipelineConfig:
     verify_ssl: bool = True  # MANDATORY: True by default
     api_key: Optional[str] = None
     
+    # Connection pool
+    max_connections: int = 10
+    max_keepalive_connections: int = 10
+    keepalive_expiry_seconds: float = 5.0
+    
+    # Recently fetched drafts (0 disables the cache)
+    draft_cache_ttl_seconds: float = 2.0
+    draft_cache_max_entries: int = 256
+    
     def __post_init__(self) -> None:
         _validate_https_url(self.base_url, "BountyPipelineClient")
+        if self.max_connections < 1:
+            raise ConfigurationError("BountyPipelineClient max_connections must be >= 1")
+        if not 0 <= self.max_keepalive_connections <= self.max_connections:
+            raise ConfigurationError(
+                "BountyPipelineClient max_keepalive_connections must be "
+                "between 0 and max_connections"
+            )
+        if self.draft_cache_ttl_seconds < 0:
+            raise ConfigurationError("BountyPipelineClient draft_cache_ttl_seconds must be >= 0")
+        if self.draft_cache_max_entries < 1:
+            raise ConfigurationError("BountyPipelineClient draft_cache_max_entries must be >= 1")
 
 
 @dataclass
@@ -97,12 +123,20 @@ class BountyPipelineClient:
         request_logger: Optional["RequestLogger"] = None,
         response_validator: Optional["ResponseValidator"] = None,
         retry_executor: Optional["RetryExecutor"] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        clock: Callable[[], float] = time.monotonic,
     ) -> None:
         self._config = config
         self._client: Optional[httpx.AsyncClient] = None
         self._request_logger = request_logger
         self._response_validator = response_validator
         self._retry_executor = retry_executor
+        self._transport = transport
+        self._clock = clock
+        # Coalesced in-flight reads, keyed by ("draft", draft_id) or ("health",)
+        self._in_flight: dict[tuple[str, ...], asyncio.Future] = {}
+        # draft_id -> (expires_at, draft), least recently used first
+        self._draft_cache: OrderedDict[str, tuple[float, DraftReport]] = OrderedDict()
     
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client."""
@@ -116,9 +150,64 @@ class BountyPipelineClient:
                 timeout=self._config.timeout_seconds,
                 verify=self._config.verify_ssl,
                 headers=headers,
+                limits=httpx.Limits(
+                    max_connections=self._config.max_connections,
+                    max_keepalive_connections=self._config.max_keepalive_connections,
+                    keepalive_expiry=self._config.keepalive_expiry_seconds,
+                ),
+                transport=self._transport,
             )
         return self._client
     
+    async def _coalesce(
+        self,
+        key: tuple[str, ...],
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Run fetch once for all concurrent callers with the same key.
+        
+        Every caller receives the same result or exception. A caller that
+        is cancelled does not cancel the shared request.
+        """
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fetch())
+            self._in_flight[key] = future
+            
+            def _forget(done: asyncio.Future) -> None:
+                if self._in_flight.get(key) is done:
+                    del self._in_flight[key]
+            
+            future.add_done_callback(_forget)
+        return await asyncio.shield(future)
+    
+    def _cached_draft(self, draft_id: str) -> Optional[DraftReport]:
+        """Return a fresh cached draft, dropping it if expired."""
+        entry = self._draft_cache.get(draft_id)
+        if entry is None:
+            return None
+        expires_at, draft = entry
+        if self._clock() >= expires_at:
+            del self._draft_cache[draft_id]
+            return None
+        self._draft_cache.move_to_end(draft_id)
+        return draft
+    
+    def _cache_draft(self, draft: DraftReport) -> None:
+        if self._config.draft_cache_ttl_seconds <= 0:
+            return
+        self._draft_cache[draft.draft_id] = (
+            self._clock() + self._config.draft_cache_ttl_seconds,
+            draft,
+        )
+        self._draft_cache.move_to_end(draft.draft_id)
+        while len(self._draft_cache) > self._config.draft_cache_max_entries:
+            self._draft_cache.popitem(last=False)
+    
+    def invalidate_draft(self, draft_id: str) -> None:
+        """Drop a draft from the cache so the next get_draft refetches it."""
+        self._draft_cache.pop(draft_id, None)
+    
     async def create_draft(
         self,
         finding_id: str,
@@ -264,6 +353,10 @@ class BountyPipelineClient:
     async def get_draft(self, draft_id: str) -> Optional[DraftReport]:
         """Get draft report by ID.
         
+        Served from the draft cache when fetched within
+        draft_cache_ttl_seconds; concurrent calls for the same draft_id
+        share one request.
+        
         Args:
             draft_id: Draft identifier
         
@@ -274,6 +367,16 @@ class BountyPipelineClient:
             BountyPipelineError: If request fails
             RetryExhaustedError: If all retry attempts fail (when retry_executor provided)
         """
+        draft = self._cached_draft(draft_id)
+        if draft is None:
+            draft = await self._coalesce(
+                ("draft", draft_id), lambda: self._fetch_draft(draft_id)
+            )
+        # Callers each get their own copy of the shared result
+        return replace(draft) if draft is not None else None
+    
+    async def _fetch_draft(self, draft_id: str) -> Optional[DraftReport]:
+        """Fetch a draft over HTTP and cache it."""
         client = await self._get_client()
         
         # Log request (pre-call, non-blocking) - NO SENSITIVE DATA
@@ -334,6 +437,8 @@ class BountyPipelineClient:
             else:
                 result = await _do_http_call()
             
+            if result is not None:
+                self._cache_draft(result)
             return result
             
         except httpx.HTTPError as e:
@@ -352,9 +457,15 @@ class BountyPipelineClient:
     async def health_check(self) -> bool:
         """Check if Bounty Pipeline is reachable.
         
+        Concurrent calls share one request.
+        
         Returns:
             True if Bounty Pipeline responds, False otherwise
         """
+        return await self._coalesce(("health",), self._check_health)
+    
+    async def _check_health(self) -> bool:
+        """Probe the health endpoint."""
         try:
             client = await self._get_client()
             response = await client.get("/health")
@@ -363,7 +474,8 @@ class BountyPipelineClient:
             return False
     
     async def close(self) -> None:
-        """Close the HTTP client."""
+        """Close the HTTP client and drop cached drafts."""
+        self._draft_cache.clear()
         if self._client and not self._client.is_closed:
             await self._client.aclose()
             self._client = None
@@ -4,6 +4,14 @@ Execution Layer Request/Response Logging
 Comprehensive logging of all API requests and responses.
 NO sensitive data (API keys, tokens) is logged.
 
+Entries are indexed by execution_id and request_id, so lookups cost
+O(results) rather than a scan of every entry. When a spill directory is
+configured, close_execution() moves an execution's entries out of memory
+into rotated JSONL segments and keeps only their byte ranges. Resident
+memory then holds only open executions. Responses that arrive after their
+execution was closed are appended to its spilled entries directly, and
+only the newest max_spill_segments segments are kept on disk.
+
 OBSERVE ONLY — NO STEALTH, NO EVASION, NO BYPASS.
 
 This system assists humans. It does not autonomously hunt, judge, or earn.
@@ -11,7 +19,10 @@ This system assists humans. It does not autonomously hunt, judge, or earn.
 
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Optional, Union
+from pathlib import Path
+from typing import Any, Optional, Union
+import json
+import os
 import secrets
 
 
@@ -35,17 +46,133 @@ class ResponseLog:
     timestamp: datetime
 
 
+LogEntry = Union[RequestLog, ResponseLog]
+
+
+def _entry_to_dict(seq: int, entry: LogEntry) -> dict[str, Any]:
+    """Serialize a log entry for a spill segment."""
+    data: dict[str, Any] = {"seq": seq, "timestamp": entry.timestamp.isoformat()}
+    if isinstance(entry, RequestLog):
+        data.update(
+            kind="request",
+            request_id=entry.request_id,
+            endpoint=entry.endpoint,
+            method=entry.method,
+            execution_id=entry.execution_id,
+        )
+    else:
+        data.update(
+            kind="response",
+            request_id=entry.request_id,
+            response_id=entry.response_id,
+            status_code=entry.status_code,
+            response_time_ms=entry.response_time_ms,
+        )
+    return data
+
+
+def _entry_from_dict(data: dict[str, Any]) -> tuple[int, LogEntry]:
+    """Deserialize a spill segment line."""
+    timestamp = datetime.fromisoformat(data["timestamp"])
+    if data["kind"] == "request":
+        entry: LogEntry = RequestLog(
+            request_id=data["request_id"],
+            timestamp=timestamp,
+            endpoint=data["endpoint"],
+            method=data["method"],
+            execution_id=data["execution_id"],
+        )
+    else:
+        entry = ResponseLog(
+            request_id=data["request_id"],
+            response_id=data["response_id"],
+            status_code=data["status_code"],
+            response_time_ms=data["response_time_ms"],
+            timestamp=timestamp,
+        )
+    return data["seq"], entry
+
+
+@dataclass(frozen=True)
+class _SpilledBlock:
+    """Byte range of one execution's entries within a spill segment."""
+    segment: Path
+    offset: int
+    length: int
+
+
 class RequestLogger:
     """Log API requests and responses.
     
     SECURITY: NO sensitive data (API keys, tokens) is logged.
     
+    Responses are attributed to the execution of their request, even when
+    that execution was already closed. Entries with no execution (requests
+    logged without one, responses whose request was never logged or whose
+    segment was already evicted) are visible only through get_all_logs()
+    and, while resident, get_logs_for_request(). With a spill directory
+    they are spilled once max_unattributed_entries accumulate.
+    
+    Retention: when a new segment would exceed max_spill_segments, the
+    oldest segment is deleted and its entries are dropped from every
+    lookup, including get_all_logs().
+    
     OBSERVE ONLY — NO STEALTH, NO EVASION, NO BYPASS.
     """
     
-    def __init__(self) -> None:
-        self._logs: list[Union[RequestLog, ResponseLog]] = []
-
+    SEGMENT_PREFIX = "request-log-"
+    
+    def __init__(
+        self,
+        spill_dir: Optional[Union[str, Path]] = None,
+        segment_max_bytes: int = 4 * 1024 * 1024,
+        max_spill_segments: int = 64,
+        max_unattributed_entries: int = 1024,
+    ) -> None:
+        """Initialize logger.
+        
+        Args:
+            spill_dir: Directory for JSONL spill segments. Without it,
+                closed executions stay in memory.
+            segment_max_bytes: Size after which a new segment is started
+            max_spill_segments: Segments kept on disk; the oldest is
+                deleted when a new one would exceed this
+            max_unattributed_entries: Resident entries with no execution
+                after which they are spilled
+        """
+        if segment_max_bytes < 1:
+            raise ValueError("segment_max_bytes must be >= 1")
+        if max_spill_segments < 1:
+            raise ValueError("max_spill_segments must be >= 1")
+        if max_unattributed_entries < 1:
+            raise ValueError("max_unattributed_entries must be >= 1")
+        self._spill_dir = Path(spill_dir) if spill_dir is not None else None
+        self._segment_max_bytes = segment_max_bytes
+        self._max_spill_segments = max_spill_segments
+        self._max_unattributed = max_unattributed_entries
+        self._seq = 0
+        # Resident entries in arrival order, keyed by sequence number
+        self._logs: dict[int, LogEntry] = {}
+        self._by_execution: dict[Optional[str], list[int]] = {}
+        self._by_request: dict[str, list[int]] = {}
+        # Execution of each request still awaiting its response
+        self._request_execution: dict[str, str] = {}
+        self._spilled: dict[str, list[_SpilledBlock]] = {}
+        self._segments: list[Path] = []
+        self._segment_size = 0
+        self._segments_created = 0
+    
+    def _append(self, entry: LogEntry, execution_id: Optional[str]) -> int:
+        """Store an entry and index it."""
+        seq = self._seq
+        self._seq += 1
+        self._logs[seq] = entry
+        self._by_execution.setdefault(execution_id, []).append(seq)
+        self._by_request.setdefault(entry.request_id, []).append(seq)
+        if execution_id is None and len(self._by_execution[None]) >= self._max_unattributed:
+            self._spill(None)
+        return seq
+    
     def log_request(
         self,
         endpoint: str,
@@ -64,7 +191,9 @@ class RequestLogger:
             method=method,
             execution_id=execution_id,
         )
-        self._logs.append(log_entry)
+        if execution_id is not None:
+            self._request_execution[request_id] = execution_id
+        self._append(log_entry, execution_id)
         return request_id
     
     def log_response(
@@ -85,33 +214,153 @@ class RequestLogger:
             response_time_ms=response_time_ms,
             timestamp=datetime.now(timezone.utc),
         )
-        self._logs.append(log_entry)
+        # Answered; any later response is attributed to no execution
+        execution_id = self._request_execution.pop(request_id, None)
+        self._append(log_entry, execution_id)
+        if (
+            execution_id is not None
+            and execution_id in self._spilled
+            and len(self._by_execution[execution_id]) == 1
+        ):
+            # Late response for a closed execution: spill it right away
+            self.close_execution(execution_id)
     
     def get_logs_for_execution(
         self,
         execution_id: str,
     ) -> list[Union[RequestLog, ResponseLog]]:
-        """Get all logs for an execution."""
-        result: list[Union[RequestLog, ResponseLog]] = []
-        request_ids: set[str] = set()
+        """Get all logs for an execution (resident and spilled)."""
+        entries = [
+            (seq, self._logs[seq]) for seq in self._by_execution.get(execution_id, ())
+        ]
+        for block in self._spilled.get(execution_id, ()):
+            entries.extend(self._read_block(block))
+        entries.sort(key=lambda item: (item[1].timestamp, item[0]))
+        return [entry for _, entry in entries]
+    
+    def get_logs_for_request(self, request_id: str) -> list[Union[RequestLog, ResponseLog]]:
+        """Get the resident request and response logs for a request_id."""
+        return [self._logs[seq] for seq in self._by_request.get(request_id, ())]
+    
+    def close_execution(self, execution_id: str) -> int:
+        """Mark an execution finished and spill its entries to disk.
+        
+        Without a spill directory this is a no-op. Entries logged for the
+        execution afterwards stay resident until it is closed again.
+        
+        Returns:
+            Number of entries spilled
+        """
+        return self._spill(execution_id)
+    
+    def _spill(self, execution_id: Optional[str]) -> int:
+        """Move an execution's resident entries into the current segment.
         
-        # Find all request logs for this execution
-        for log in self._logs:
-            if isinstance(log, RequestLog) and log.execution_id == execution_id:
-                result.append(log)
-                request_ids.add(log.request_id)
+        Entries with no execution are written but not indexed; only
+        get_all_logs() reads them back.
+        """
+        seqs = self._by_execution.get(execution_id)
+        if self._spill_dir is None or not seqs:
+            return 0
         
-        # Find all response logs for those requests
-        for log in self._logs:
-            if isinstance(log, ResponseLog) and log.request_id in request_ids:
-                result.append(log)
+        payload = b"".join(
+            json.dumps(_entry_to_dict(seq, self._logs[seq]), sort_keys=True).encode() + b"\n"
+            for seq in seqs
+        )
+        segment = self._current_segment(len(payload))
+        with open(segment, "ab") as f:
+            f.write(payload)
+        if execution_id is not None:
+            self._spilled.setdefault(execution_id, []).append(
+                _SpilledBlock(segment=segment, offset=self._segment_size, length=len(payload))
+            )
+        self._segment_size += len(payload)
         
-        return sorted(result, key=lambda x: x.timestamp)
+        del self._by_execution[execution_id]
+        for seq in seqs:
+            entry = self._logs.pop(seq)
+            request_seqs = self._by_request.get(entry.request_id)
+            if request_seqs is not None:
+                request_seqs.remove(seq)
+                if not request_seqs:
+                    del self._by_request[entry.request_id]
+        return len(seqs)
+    
+    def _current_segment(self, incoming_bytes: int) -> Path:
+        """Return the segment to append to, rotating when it is full."""
+        if not self._segments or (
+            self._segment_size > 0
+            and self._segment_size + incoming_bytes > self._segment_max_bytes
+        ):
+            if len(self._segments) >= self._max_spill_segments:
+                self._evict_oldest_segment()
+            self._spill_dir.mkdir(parents=True, exist_ok=True)
+            segment = self._spill_dir / (
+                f"{self.SEGMENT_PREFIX}{os.getpid()}-{id(self):x}-{self._segments_created:06d}.jsonl"
+            )
+            segment.write_bytes(b"")
+            self._segments.append(segment)
+            self._segments_created += 1
+            self._segment_size = 0
+        return self._segments[-1]
+    
+    def _evict_oldest_segment(self) -> None:
+        """Delete the oldest segment and forget the blocks stored in it."""
+        segment = self._segments.pop(0)
+        segment.unlink(missing_ok=True)
+        evicted: set[str] = set()
+        for execution_id in list(self._spilled):
+            blocks = [b for b in self._spilled[execution_id] if b.segment != segment]
+            if blocks:
+                self._spilled[execution_id] = blocks
+            else:
+                del self._spilled[execution_id]
+                evicted.add(execution_id)
+        # Requests of fully evicted executions no longer wait for a response
+        evicted -= self._by_execution.keys()
+        if evicted:
+            self._request_execution = {
+                request_id: execution_id
+                for request_id, execution_id in self._request_execution.items()
+                if execution_id not in evicted
+            }
+    
+    @staticmethod
+    def _read_block(block: _SpilledBlock) -> list[tuple[int, LogEntry]]:
+        """Read one spilled execution block."""
+        with open(block.segment, "rb") as f:
+            f.seek(block.offset)
+            data = f.read(block.length)
+        return [_entry_from_dict(json.loads(line)) for line in data.splitlines()]
+    
+    @property
+    def resident_count(self) -> int:
+        """Number of log entries held in memory."""
+        return len(self._logs)
+    
+    @property
+    def open_executions(self) -> list[str]:
+        """Executions with entries not yet spilled."""
+        return [execution_id for execution_id in self._by_execution if execution_id is not None]
     
     def get_all_logs(self) -> list[Union[RequestLog, ResponseLog]]:
-        """Get all logs for audit."""
-        return list(self._logs)
+        """Get all logs for audit, in the order they were logged."""
+        entries = list(self._logs.items())
+        for segment in self._segments:
+            with open(segment, "rb") as f:
+                entries.extend(_entry_from_dict(json.loads(line)) for line in f)
+        entries.sort(key=lambda item: item[0])
+        return [entry for _, entry in entries]
     
     def clear_logs(self) -> None:
-        """Clear all logs."""
+        """Clear all logs, including spilled segments."""
         self._logs.clear()
+        self._by_execution.clear()
+        self._by_request.clear()
+        self._request_execution.clear()
+        self._spilled.clear()
+        for segment in self._segments:
+            segment.unlink(missing_ok=True)
+        self._segments.clear()
+        self._segment_size = 0
+        self._segments_created = 0
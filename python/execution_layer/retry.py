@@ -3,18 +3,30 @@ Execution Layer Retry Policy
 
 Explicit timeout and retry policies with exponential backoff.
 
+Retries use full-jitter backoff (a uniform delay between zero and the
+exponential cap) so concurrent callers do not retry in lockstep. Each
+operation name has a circuit breaker that fails fast while a dependency
+is down and lets a single trial call through after a cool-down. A token
+retry budget, which can be shared between executors, caps retries relative
+to successes. Attempt history is kept in a bounded buffer.
+
 OBSERVE ONLY — NO STEALTH, NO EVASION, NO BYPASS.
 
 This system assists humans. It does not autonomously hunt, judge, or earn.
 """
 
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from enum import Enum
 from typing import TypeVar, Callable, Awaitable, Optional
 import asyncio
 import logging
+import random
+import threading
+import time
 
-from execution_layer.errors import RetryExhaustedError
+from execution_layer.errors import CircuitOpenError, RetryExhaustedError
 
 
 logger = logging.getLogger(__name__)
@@ -35,6 +47,37 @@ class RetryPolicy:
     # Status codes to NOT retry (client errors)
     no_retry_status_codes: tuple[int, ...] = (400, 401, 403, 404, 405, 422)
     
+    # Delay drawn uniformly from [0, exponential delay] when True
+    full_jitter: bool = True
+    
+    # Per-operation circuit breaker
+    circuit_failure_threshold: int = 5  # Consecutive failed attempts to open
+    circuit_reset_timeout_seconds: float = 30.0  # Open time before a trial call
+    circuit_half_open_max_calls: int = 1  # Concurrent trial calls when half-open
+    
+    # Retry budget (used when the executor is not given a shared one)
+    retry_budget_max_tokens: float = 10.0  # Each retry spends one token
+    retry_budget_token_ratio: float = 0.1  # Tokens earned per success
+    
+    # Attempt records kept for audit
+    max_history: int = 1000
+    
+    def __post_init__(self) -> None:
+        if self.max_retries < 0:
+            raise ValueError("max_retries must be >= 0")
+        if self.circuit_failure_threshold < 1:
+            raise ValueError("circuit_failure_threshold must be >= 1")
+        if self.circuit_reset_timeout_seconds < 0:
+            raise ValueError("circuit_reset_timeout_seconds must be >= 0")
+        if self.circuit_half_open_max_calls < 1:
+            raise ValueError("circuit_half_open_max_calls must be >= 1")
+        if self.retry_budget_max_tokens < 0:
+            raise ValueError("retry_budget_max_tokens must be >= 0")
+        if self.retry_budget_token_ratio < 0:
+            raise ValueError("retry_budget_token_ratio must be >= 0")
+        if self.max_history < 1:
+            raise ValueError("max_history must be >= 1")
+    
     def should_retry_status(self, status_code: int) -> bool:
         """Check if status code should trigger retry."""
         if status_code in self.no_retry_status_codes:
@@ -53,15 +96,210 @@ class RetryAttempt:
     error: Optional[str] = None
 
 
+class CircuitState(Enum):
+    """Circuit breaker state."""
+    CLOSED = "closed"  # Calls pass through
+    OPEN = "open"  # Calls fail fast
+    HALF_OPEN = "half_open"  # Limited trial calls decide whether to close
+
+
+class CircuitBreaker:
+    """Circuit breaker for one operation.
+    
+    Opens after ``failure_threshold`` consecutive failures. Once
+    ``reset_timeout_seconds`` have passed it moves to half-open and admits
+    up to ``half_open_max_calls`` trial calls. A successful trial closes
+    the circuit and a failed trial reopens it.
+    """
+    
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout_seconds: float = 30.0,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._failure_threshold = failure_threshold
+        self._reset_timeout_seconds = reset_timeout_seconds
+        self._half_open_max_calls = half_open_max_calls
+        self._clock = clock
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._trial_calls = 0
+        self._lock = threading.Lock()
+    
+    def _current_state(self) -> CircuitState:
+        """Refresh an expired open circuit to half-open (lock held)."""
+        if (
+            self._state == CircuitState.OPEN
+            and self._clock() - self._opened_at >= self._reset_timeout_seconds
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._trial_calls = 0
+        return self._state
+    
+    @property
+    def state(self) -> CircuitState:
+        """Current state (an expired open circuit reports half-open)."""
+        with self._lock:
+            return self._current_state()
+    
+    def retry_after_seconds(self) -> float:
+        """Seconds until an open circuit admits a trial call."""
+        with self._lock:
+            if self._current_state() != CircuitState.OPEN:
+                return 0.0
+            return max(0.0, self._opened_at + self._reset_timeout_seconds - self._clock())
+    
+    def allow(self) -> bool:
+        """Check whether a call may proceed (reserves a half-open trial).
+        
+        Every allowed call must be settled with record_success(),
+        record_failure() or release().
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == CircuitState.CLOSED:
+                return True
+            if state == CircuitState.HALF_OPEN and self._trial_calls < self._half_open_max_calls:
+                self._trial_calls += 1
+                return True
+            return False
+    
+    def release(self) -> None:
+        """Give back a reserved trial without an outcome (e.g. cancellation)."""
+        with self._lock:
+            if self._state == CircuitState.HALF_OPEN and self._trial_calls > 0:
+                self._trial_calls -= 1
+    
+    def record_success(self) -> None:
+        """Record a successful call."""
+        with self._lock:
+            self._state = CircuitState.CLOSED
+            self._consecutive_failures = 0
+            self._trial_calls = 0
+    
+    def record_failure(self) -> None:
+        """Record a failed call."""
+        with self._lock:
+            self._consecutive_failures += 1
+            if (
+                self._state == CircuitState.HALF_OPEN
+                or self._consecutive_failures >= self._failure_threshold
+            ):
+                self._state = CircuitState.OPEN
+                self._opened_at = self._clock()
+                self._trial_calls = 0
+
+
+class RetryBudget:
+    """Token bucket limiting retries relative to successful calls.
+    
+    Every retry spends one token and every success earns ``token_ratio``
+    tokens, up to ``max_tokens``. While a dependency is failing, retries
+    therefore stop once the bucket is empty instead of multiplying load.
+    One budget may be shared by several executors.
+    """
+    
+    def __init__(self, max_tokens: float = 10.0, token_ratio: float = 0.1) -> None:
+        if max_tokens < 0:
+            raise ValueError("max_tokens must be >= 0")
+        if token_ratio < 0:
+            raise ValueError("token_ratio must be >= 0")
+        self._max_tokens = max_tokens
+        self._token_ratio = token_ratio
+        self._tokens = max_tokens
+        self._lock = threading.Lock()
+    
+    @property
+    def tokens(self) -> float:
+        """Tokens currently available."""
+        return self._tokens
+    
+    def try_acquire(self) -> bool:
+        """Spend a token for a retry; False if the budget is exhausted."""
+        with self._lock:
+            if self._tokens < 1.0:
+                return False
+            self._tokens -= 1.0
+            return True
+    
+    def record_success(self) -> None:
+        """Earn tokens for a successful call."""
+        with self._lock:
+            self._tokens = min(self._max_tokens, self._tokens + self._token_ratio)
+
+
 class RetryExecutor:
     """Execute operations with retry policy.
     
     OBSERVE ONLY — NO STEALTH, NO EVASION, NO BYPASS.
     """
     
-    def __init__(self, policy: Optional[RetryPolicy] = None) -> None:
+    def __init__(
+        self,
+        policy: Optional[RetryPolicy] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        """Initialize executor.
+        
+        Args:
+            policy: Retry policy (defaults to RetryPolicy())
+            retry_budget: Budget shared with other executors; by default
+                one is created from the policy
+            clock: Monotonic clock for circuit breakers
+            sleep: Coroutine used for backoff delays
+            rng: Random source for jitter
+        """
         self._policy = policy or RetryPolicy()
-        self._attempts: list[RetryAttempt] = []
+        self._budget = retry_budget or RetryBudget(
+            max_tokens=self._policy.retry_budget_max_tokens,
+            token_ratio=self._policy.retry_budget_token_ratio,
+        )
+        self._clock = clock
+        self._sleep = sleep
+        self._rng = rng or random.Random()
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._attempts: deque[RetryAttempt] = deque(maxlen=self._policy.max_history)
+    
+    def get_circuit_breaker(self, operation_name: str) -> CircuitBreaker:
+        """Get (or create) the circuit breaker for an operation."""
+        breaker = self._breakers.get(operation_name)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                failure_threshold=self._policy.circuit_failure_threshold,
+                reset_timeout_seconds=self._policy.circuit_reset_timeout_seconds,
+                half_open_max_calls=self._policy.circuit_half_open_max_calls,
+                clock=self._clock,
+            )
+            self._breakers[operation_name] = breaker
+        return breaker
+    
+    @property
+    def retry_budget(self) -> RetryBudget:
+        """The retry budget used by this executor."""
+        return self._budget
+    
+    def _record(
+        self,
+        attempt: int,
+        delay: float,
+        success: bool,
+        error: Optional[str] = None,
+        reason: Optional[str] = None,
+    ) -> None:
+        self._attempts.append(RetryAttempt(
+            attempt_number=attempt,
+            timestamp=datetime.now(timezone.utc),
+            delay_seconds=delay,
+            reason=reason or ("initial" if attempt == 0 else "retry"),
+            success=success,
+            error=error,
+        ))
     
     async def execute_with_retry(
         self,
@@ -71,44 +309,64 @@ class RetryExecutor:
         """Execute operation with retry policy.
         
         Raises:
-            RetryExhaustedError: After all retries fail (HARD FAIL)
+            CircuitOpenError: If the operation's circuit is open (HARD FAIL)
+            RetryExhaustedError: After all retries fail or the retry
+                budget runs out (HARD FAIL)
         """
+        breaker = self.get_circuit_breaker(operation_name)
         last_error: Optional[Exception] = None
         
         for attempt in range(self._policy.max_retries + 1):
-            delay = self._calculate_delay(attempt) if attempt > 0 else 0.0
-            
-            if delay > 0:
-                logger.info(
-                    f"Retry {attempt}/{self._policy.max_retries} for {operation_name} "
-                    f"after {delay:.2f}s delay"
+            if not breaker.allow():
+                self._record(attempt, 0.0, False, reason="circuit_open",
+                             error=f"Circuit open for {operation_name}")
+                raise CircuitOpenError(
+                    f"Circuit open for {operation_name}; retry after "
+                    f"{breaker.retry_after_seconds():.1f}s. "
+                    f"Last error: {last_error} — HARD FAIL"
                 )
-                await asyncio.sleep(delay)
             
             try:
-                result = await operation()
-                self._attempts.append(RetryAttempt(
-                    attempt_number=attempt,
-                    timestamp=datetime.now(timezone.utc),
-                    delay_seconds=delay,
-                    reason="initial" if attempt == 0 else "retry",
-                    success=True,
-                ))
-                return result
-            except Exception as e:
-                last_error = e
-                self._attempts.append(RetryAttempt(
-                    attempt_number=attempt,
-                    timestamp=datetime.now(timezone.utc),
-                    delay_seconds=delay,
-                    reason="initial" if attempt == 0 else "retry",
-                    success=False,
-                    error=str(e),
-                ))
-                logger.warning(
-                    f"Attempt {attempt + 1}/{self._policy.max_retries + 1} "
-                    f"for {operation_name} failed: {e}"
-                )
+                delay = 0.0
+                if attempt > 0:
+                    if not self._budget.try_acquire():
+                        self._record(attempt, 0.0, False, reason="budget_exhausted",
+                                     error="Retry budget exhausted")
+                        raise RetryExhaustedError(
+                            f"Retry budget exhausted after {attempt} attempts for "
+                            f"{operation_name}. Last error: {last_error} — HARD FAIL"
+                        )
+                    delay = self._backoff_delay(attempt)
+                
+                if delay > 0:
+                    logger.info(
+                        f"Retry {attempt}/{self._policy.max_retries} for {operation_name} "
+                        f"after {delay:.2f}s delay"
+                    )
+                    await self._sleep(delay)
+                
+                try:
+                    result = await operation()
+                except Exception as e:
+                    last_error = e
+                    breaker.record_failure()
+                    self._record(attempt, delay, False, error=str(e))
+                    logger.warning(
+                        f"Attempt {attempt + 1}/{self._policy.max_retries + 1} "
+                        f"for {operation_name} failed: {e}"
+                    )
+                    continue
+            except BaseException:
+                # Budget exhausted or cancelled (CancelledError is a
+                # BaseException): the call has no outcome, so give back a
+                # reserved half-open trial instead of leaking it
+                breaker.release()
+                raise
+            
+            breaker.record_success()
+            self._budget.record_success()
+            self._record(attempt, delay, True)
+            return result
         
         raise RetryExhaustedError(
             f"All {self._policy.max_retries + 1} attempts for {operation_name} "
@@ -124,8 +382,15 @@ class RetryExecutor:
         )
         return min(delay, self._policy.max_delay_seconds)
     
+    def _backoff_delay(self, attempt: int) -> float:
+        """Delay before an attempt: full jitter over the exponential delay."""
+        delay = self._calculate_delay(attempt)
+        if self._policy.full_jitter:
+            delay = self._rng.uniform(0.0, delay)
+        return delay
+    
     def get_attempts(self) -> list[RetryAttempt]:
-        """Get all retry attempts for audit."""
+        """Get retained retry attempts for audit (most recent max_history)."""
         return list(self._attempts)
     
     def clear_attempts(self) -> None:
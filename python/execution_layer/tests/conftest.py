@@ -65,9 +65,8 @@ def browser_config():
 def throttle_config():
     """Default throttle config for tests."""
     return ExecutionThrottleConfig(
-        max_requests_per_minute=60,
-        max_requests_per_hour=600,
-        cooldown_seconds=1,
+        min_delay_per_action_seconds=0.5,
+        max_actions_per_host_per_minute=60,
     )
 
 
@@ -75,9 +74,8 @@ def throttle_config():
 def retention_policy():
     """Default retention policy for tests."""
     return EvidenceRetentionPolicy(
-        max_age_days=30,
-        max_total_size_mb=1000,
-        cleanup_interval_hours=24,
+        max_total_disk_mb=1000,
+        ttl_days=30,
     )
 
 
@@ -0,0 +1,167 @@
+"""
+Test AntiDetectionObserver in-page probe
+
+The combined probe checks navigator.webdriver and every CAPTCHA indicator
+in one page round-trip, without transferring the DOM, and reports the
+same signals as the separate checks.
+
+OBSERVE ONLY — NO STEALTH, NO EVASION, NO BYPASS.
+"""
+
+import asyncio
+import json
+import os
+import shutil
+import subprocess
+import pytest
+
+from execution_layer.anti_detection import AntiDetectionObserver
+
+
+PAGES = [
+    "<html><body>Welcome</body></html>",
+    "<html><body><div class='g-recaptcha'></div></body></html>",
+    "<html><body><p>Please VERIFY YOU ARE HUMAN</p></body></html>",
+    "<html><body><iframe src='https://hcaptcha.com/x'></iframe></body></html>",
+    "<html><body>Security Challenge ahead</body></html>",
+    "<html><body>I'm not a robot</body></html>",
+]
+
+
+class FakePage:
+    """Page stand-in that evaluates the probe contract in Python."""
+
+    def __init__(self, html: str, webdriver: bool = False) -> None:
+        self.url = "https://example.com/app"
+        self.html = html
+        self.webdriver = webdriver
+        self.evaluate_calls = 0
+        self.content_calls = 0
+
+    async def content(self) -> str:
+        self.content_calls += 1
+        return self.html
+
+    async def evaluate(self, script: str, arg=None):
+        self.evaluate_calls += 1
+        if arg is None:
+            return self.webdriver
+        html = self.html.lower() if arg["indicators"] else ""
+        captcha = next((i for i in arg["indicators"] if i in html), None)
+        return {
+            "webdriver": bool(self.webdriver) if arg["webdriver"] else False,
+            "captcha": captcha,
+        }
+
+
+class BrokenPage(FakePage):
+    async def evaluate(self, script: str, arg=None):
+        raise RuntimeError("Execution context was destroyed")
+
+
+def _legacy_captcha(html: str):
+    """Reference: the original full-content scan."""
+    lower = html.lower()
+    for indicator in AntiDetectionObserver.CAPTCHA_INDICATORS:
+        if indicator in lower:
+            return indicator
+    return None
+
+
+def _details(signals):
+    return [(s.signal_type, s.details, s.url) for s in signals]
+
+
+class TestObservePage:
+    """Test the single round-trip probe."""
+
+    @pytest.mark.parametrize("html", PAGES)
+    @pytest.mark.parametrize("webdriver", [False, True])
+    def test_matches_separate_checks(self, html, webdriver):
+        separate = AntiDetectionObserver()
+        separate_page = FakePage(html, webdriver)
+
+        async def run_separate():
+            signals = await separate.check_detection_signals(separate_page)
+            captcha = await separate.detect_captcha(separate_page)
+            return signals + ([captcha] if captcha else [])
+
+        expected = asyncio.run(run_separate())
+
+        combined = AntiDetectionObserver()
+        page = FakePage(html, webdriver)
+        signals = asyncio.run(combined.observe_page(page))
+
+        assert _details(signals) == _details(expected)
+        assert _details(combined.get_signals()) == _details(separate.get_signals())
+        assert page.evaluate_calls == 1
+        assert page.content_calls == 0
+
+    @pytest.mark.parametrize("html", PAGES)
+    def test_detect_captcha_matches_content_scan(self, html):
+        observer = AntiDetectionObserver()
+        page = FakePage(html)
+        signal = asyncio.run(observer.detect_captcha(page))
+        expected = _legacy_captcha(html)
+        if expected is None:
+            assert signal is None
+        else:
+            assert signal.details == f"CAPTCHA indicator detected: {expected}"
+        assert page.content_calls == 0
+
+    def test_probe_failure_yields_no_signals(self):
+        observer = AntiDetectionObserver()
+        page = BrokenPage(PAGES[1], webdriver=True)
+        assert asyncio.run(observer.observe_page(page)) == []
+        assert asyncio.run(observer.detect_captcha(page)) is None
+        assert observer.get_signals() == []
+
+    def test_unknown_indicator_from_page_ignored(self):
+        class TamperedPage(FakePage):
+            async def evaluate(self, script, arg=None):
+                return {"webdriver": False, "captcha": "<script>x</script>"}
+
+        observer = AntiDetectionObserver()
+        assert asyncio.run(observer.observe_page(TamperedPage(""))) == []
+
+    def test_captcha_signal_stops_execution(self):
+        observer = AntiDetectionObserver()
+        signals = asyncio.run(observer.observe_page(FakePage(PAGES[1])))
+        assert observer.should_stop(signals) is True
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node is not installed")
+class TestProbeScript:
+    """Run the real PROBE_SCRIPT against a minimal DOM shim."""
+
+    def _run(self, html: str, webdriver, probe: dict) -> dict:
+        source = (
+            "const document = {documentElement: {outerHTML: %s}};\n"
+            "const navigator = {webdriver: %s};\n"
+            "console.log(JSON.stringify((%s)(%s)));\n"
+        ) % (
+            json.dumps(html),
+            json.dumps(webdriver),
+            AntiDetectionObserver.PROBE_SCRIPT,
+            json.dumps(probe),
+        )
+        completed = subprocess.run(
+            ["node", "-e", source], capture_output=True, text=True, timeout=30,
+            env={**os.environ, "NODE_OPTIONS": ""},
+        )
+        assert completed.returncode == 0, completed.stderr
+        return json.loads(completed.stdout)
+
+    @pytest.mark.parametrize("html", PAGES)
+    def test_script_matches_content_scan(self, html):
+        probe = {"webdriver": True, "indicators": AntiDetectionObserver.CAPTCHA_INDICATORS}
+        result = self._run(html, True, probe)
+        assert result == {"webdriver": True, "captcha": _legacy_captcha(html)}
+
+    def test_script_skips_disabled_checks(self):
+        result = self._run(PAGES[1], True, {"webdriver": False, "indicators": []})
+        assert result == {"webdriver": False, "captcha": None}
+
+    def test_undefined_webdriver_is_false(self):
+        result = self._run(PAGES[0], None, {"webdriver": True, "indicators": ["captcha"]})
+        assert result == {"webdriver": False, "captcha": None}
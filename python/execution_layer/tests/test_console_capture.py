@@ -0,0 +1,153 @@
+"""
+Test Console Capture
+
+Bounded console-log capture: memory cap, NDJSON spill, single hashed
+artifact, repeat sampling and optional line index.
+
+CATEGORY B MITIGATION: Uses FakeBrowserLauncher to avoid real browser dependency.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import pytest
+import uuid
+
+from execution_layer.browser import BrowserConfig, BrowserEngine
+from execution_layer.browser_launcher import FakeBrowserLauncher
+from execution_layer.console_capture import (
+    ConsoleCaptureConfig,
+    ConsoleCaptureSink,
+    read_console_line,
+)
+from execution_layer.errors import EvidenceCaptureError
+from execution_layer.types import EvidenceType
+
+
+def _entry(i: int, text: str = None) -> dict:
+    return {"type": "log", "text": text or f"message {i}", "location": None}
+
+
+class TestConsoleCaptureSink:
+    """Test ConsoleCaptureSink standalone."""
+
+    def test_buffer_spills_at_cap(self, tmp_path):
+        sink = ConsoleCaptureSink(tmp_path / "s.ndjson", ConsoleCaptureConfig(max_buffered_entries=10))
+        for i in range(25):
+            sink.record(_entry(i))
+        assert sink.stats.spills == 2
+        assert len(sink._buffer) == 5
+        summary = sink.finalize()
+        assert summary["written"] == 25
+        assert summary["spills"] == 3
+        lines = (tmp_path / "s.ndjson").read_bytes().splitlines()
+        assert [json.loads(l)["text"] for l in lines] == [f"message {i}" for i in range(25)]
+
+    def test_hash_matches_file(self, tmp_path):
+        path = tmp_path / "s.ndjson"
+        sink = ConsoleCaptureSink(path, ConsoleCaptureConfig(max_buffered_entries=7))
+        for i in range(50):
+            sink.record(_entry(i))
+        summary = sink.finalize()
+        content = path.read_bytes()
+        assert summary["content_hash"] == hashlib.sha256(content).hexdigest()
+        assert summary["size_bytes"] == len(content)
+
+    def test_repeated_messages_are_sampled(self, tmp_path):
+        config = ConsoleCaptureConfig(repeat_sample_after=5, repeat_sample_every=10)
+        sink = ConsoleCaptureSink(tmp_path / "s.ndjson", config)
+        for i in range(105):
+            sink.record(_entry(i, text="same"))
+        summary = sink.finalize()
+        # 5 kept outright, then one per 10 of the remaining 100
+        assert summary["received"] == 105
+        assert summary["written"] == 15
+        assert summary["sampled_out"] == 90
+        assert summary["repeated_messages"] == 1
+        assert max(sink.stats.repeat_counts.values()) == 105
+
+    def test_untracked_messages_never_sampled(self, tmp_path):
+        config = ConsoleCaptureConfig(repeat_sample_after=1, max_tracked_messages=0)
+        sink = ConsoleCaptureSink(tmp_path / "s.ndjson", config)
+        for i in range(20):
+            sink.record(_entry(i, text="same"))
+        assert sink.finalize()["written"] == 20
+
+    def test_line_index(self, tmp_path):
+        path = tmp_path / "s.ndjson"
+        config = ConsoleCaptureConfig(max_buffered_entries=3, build_line_index=True)
+        sink = ConsoleCaptureSink(path, config)
+        for i in range(10):
+            sink.record(_entry(i))
+        summary = sink.finalize()
+        index_path = tmp_path / "s.ndjson.idx"
+        assert summary["index_path"] == str(index_path)
+        assert index_path.stat().st_size == 10 * 8
+        for i in range(10):
+            assert read_console_line(path, index_path, i)["text"] == f"message {i}"
+        for out_of_range in (10, -1):
+            with pytest.raises(IndexError):
+                read_console_line(path, index_path, out_of_range)
+
+    def test_record_after_finalize_rejected(self, tmp_path):
+        sink = ConsoleCaptureSink(tmp_path / "s.ndjson")
+        sink.record(_entry(0))
+        first = sink.finalize()
+        assert sink.finalize() == first
+        with pytest.raises(EvidenceCaptureError):
+            sink.record(_entry(1))
+
+    def test_invalid_config(self):
+        with pytest.raises(ValueError):
+            ConsoleCaptureConfig(max_buffered_entries=0)
+        with pytest.raises(ValueError):
+            ConsoleCaptureConfig(repeat_sample_every=0)
+
+
+class _FakeConsoleMessage:
+    def __init__(self, text: str) -> None:
+        self.type = "log"
+        self.text = text
+        self.location = None
+
+
+class TestBrowserEngineConsoleCapture:
+    """Test console capture wiring in BrowserEngine."""
+
+    @pytest.fixture
+    def engine(self, tmp_path, monkeypatch):
+        # Evidence file paths must be relative (RISK-X1)
+        monkeypatch.chdir(tmp_path)
+        config = BrowserConfig(
+            artifacts_dir="artifacts",
+            per_action_delay_seconds=0,
+            console_max_buffered_entries=100,
+        )
+        return BrowserEngine(config=config, launcher=FakeBrowserLauncher())
+
+    def test_console_bundled_as_single_artifact(self, engine, controller):
+        execution_id = str(uuid.uuid4())
+
+        async def run():
+            session = await engine.start_session("sess-1", execution_id)
+            for handler in session.page._console_handlers:
+                for i in range(1000):
+                    handler(_FakeConsoleMessage(f"tick {i}"))
+            return await engine.stop_session("sess-1")
+
+        summary = asyncio.run(run())
+        capture = summary["console_capture"]
+        assert capture["written"] == 1000
+        assert capture["spills"] == 10
+
+        bundle = asyncio.run(controller._build_evidence_bundle(execution_id, summary))
+        assert len(bundle.console_logs) == 1
+        artifact = bundle.console_logs[0]
+        assert artifact.artifact_type == EvidenceType.CONSOLE_LOG
+        assert artifact.content is None
+        assert artifact.file_path == os.path.join(
+            "artifacts", execution_id, "console", "sess-1.ndjson")
+        with open(artifact.file_path, "rb") as f:
+            assert artifact.content_hash == hashlib.sha256(f.read()).hexdigest()
+        assert artifact.metadata["received"] == 1000
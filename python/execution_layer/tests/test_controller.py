@@ -9,8 +9,11 @@ CATEGORY B MITIGATION: Uses FakeBrowserLauncher to avoid real browser dependency
 
 import asyncio
 import pytest
+import uuid
 from datetime import datetime, timezone
 
+import httpx
+
 from execution_layer.types import (
     SafeActionType,
     SafeAction,
@@ -31,6 +34,7 @@ from execution_layer.browser import BrowserConfig, BrowserEngine
 from execution_layer.browser_launcher import FakeBrowserLauncher
 from execution_layer.throttle import ExecutionThrottleConfig
 from execution_layer.retention import EvidenceRetentionPolicy
+from execution_layer.request_logger import RequestLogger, RequestLog, ResponseLog
 from execution_layer.errors import (
     ScopeViolationError,
     UnsafeActionError,
@@ -577,3 +581,56 @@ class TestAuditIntegration:
             await controller.cleanup()
         
         asyncio.run(run_test())
+
+
+class TestRequestLogTeardown:
+    """Test that the controller spills executions once their calls finish."""
+    
+    @pytest.fixture
+    def request_logger(self, tmp_path):
+        return RequestLogger(spill_dir=tmp_path)
+    
+    @pytest.fixture
+    def controller(self, request_logger):
+        return ExecutionController(ExecutionControllerConfig(
+            scope_config=ShopifyScopeConfig(
+                researcher_store_domains=frozenset({"my-store.myshopify.com"}),
+                require_store_attestation=False,
+            ),
+            mcp_config=MCPClientConfig(base_url="https://localhost:8080"),
+            pipeline_config=BountyPipelineConfig(base_url="https://localhost:8081"),
+            throttle_config=ExecutionThrottleConfig(min_delay_per_action_seconds=0.5),
+            retention_policy=EvidenceRetentionPolicy(max_total_disk_mb=100, ttl_days=7),
+            request_logger=request_logger,
+        ))
+    
+    @staticmethod
+    def _verify(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={
+            "verification_id": "v-1",
+            "finding_id": "f-1",
+            "classification": "BUG",
+            "verified_at": "2026-01-01T00:00:00+00:00",
+        })
+    
+    def test_send_to_mcp_spills_execution(self, controller, request_logger):
+        controller._mcp_client._transport = httpx.MockTransport(self._verify)
+        bundle = EvidenceBundle(bundle_id="b1", execution_id=str(uuid.uuid4())).finalize()
+        
+        async def run():
+            try:
+                await controller.send_to_mcp(bundle)
+            finally:
+                await controller.cleanup()
+        
+        asyncio.run(run())
+        assert request_logger.resident_count == 0
+        logs = request_logger.get_logs_for_execution(bundle.execution_id)
+        assert [type(l) for l in logs] == [RequestLog, ResponseLog]
+    
+    def test_cleanup_closes_open_executions(self, controller, request_logger):
+        request_logger.log_request("/api/v1/verify", "POST", execution_id="e1")
+        assert request_logger.open_executions == ["e1"]
+        asyncio.run(controller.cleanup())
+        assert request_logger.resident_count == 0
+        assert len(request_logger.get_logs_for_execution("e1")) == 1
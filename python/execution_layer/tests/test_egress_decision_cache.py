@@ -0,0 +1,244 @@
+"""
+Test egress decision caching
+
+Bounded LRU decision cache for DomainAllowList and PayloadGuard: cached
+results match uncached ones, rule changes invalidate atomically, and
+repeated checks skip the rule walk and URL parsing. The microbenchmark
+runs only with EXECUTION_LAYER_BENCHMARK=1.
+
+OBSERVE ONLY — NO STEALTH, NO EVASION, NO BYPASS.
+"""
+
+import os
+import threading
+import time
+import pytest
+
+from execution_layer.decision_cache import DecisionCache
+from execution_layer.domainallowlist import DomainAllowList
+from execution_layer.payloadguard import PayloadGuard, RequestSpec
+from execution_layer.policy import Policy
+
+
+ALLOWED = ['example.com', '*.example.com', '*.test.org', 'api.other.net']
+
+DOMAINS = [
+    'example.com', 'EXAMPLE.com', 'a.example.com', 'A.Example.COM', ' example.com ',
+    'test.org', 'x.test.org', 'api.other.net', 'evil.com', 'localhost',
+    '10.0.0.1', '8.8.8.8', '[::1]', '[2001:db8::1]', 'a@b.com', 'a%2eb.com',
+    'a\\b.com', 'a\x00.com', '', None,
+]
+
+SPECS = [
+    RequestSpec('https://example.com/a', 'GET', {}),
+    RequestSpec('https://example.com/b', 'get', {'Accept': 'x'}),
+    RequestSpec('http://example.com/', 'POST', {'X-Forwarded-For': '1.2.3.4'}),
+    RequestSpec('https://example.com/', 'DELETE', {'Host': 'a', 'Via': 'b'}),
+    RequestSpec('https://example.com/', 'DELETE', {'Via': 'b', 'Host': 'a'}),
+    RequestSpec('', 'PUT', {}),
+    RequestSpec('example.com/path', 'GET', {}),
+    RequestSpec('https:///nohost', '', {}),
+]
+
+
+def _audit(result):
+    """Audit dict without the per-check timestamp."""
+    record = result.to_dict()
+    del record['timestamp']
+    return record
+
+
+class TestDecisionCache:
+    """Test the LRU cache itself."""
+
+    def test_lru_eviction(self):
+        cache = DecisionCache(max_entries=2)
+        for key in ('a', 'b', 'a', 'c'):
+            cache.get_or_compute(key, lambda: key.upper())
+        assert (cache.hits, cache.misses, len(cache)) == (1, 3, 2)
+        # 'b' was least recently used
+        assert cache.get_or_compute('b', lambda: 'recomputed') == 'recomputed'
+        assert cache.get_or_compute('a', lambda: 'recomputed') == 'recomputed'
+
+    def test_disabled(self):
+        cache = DecisionCache(max_entries=0)
+        calls = []
+        for _ in range(3):
+            cache.get_or_compute('k', lambda: calls.append(1) or 'v')
+        assert len(calls) == 3
+        assert len(cache) == 0
+
+    def test_negative_size_rejected(self):
+        with pytest.raises(ValueError):
+            DecisionCache(max_entries=-1)
+
+
+class TestDomainAllowListCache:
+    """Cached domain decisions."""
+
+    def test_cached_audit_matches_uncached(self):
+        cached = DomainAllowList(ALLOWED)
+        uncached = DomainAllowList(ALLOWED, cache_size=0)
+        for _ in range(3):
+            for domain in DOMAINS:
+                assert _audit(cached.check(domain)) == _audit(uncached.check(domain))
+        assert cached.decision_cache.hits > 0
+        assert uncached.decision_cache.hits == 0
+
+    def test_case_variants_share_entry_but_report_own_domain(self):
+        allow_list = DomainAllowList(ALLOWED)
+        first = allow_list.check('a.example.com')
+        second = allow_list.check('A.Example.COM')
+        assert allow_list.decision_cache.hits == 1
+        assert first.domain == 'a.example.com'
+        assert second.domain == 'A.Example.COM'
+        assert "'A.Example.COM'" in second.reason
+
+    def test_fresh_timestamp_per_check(self):
+        allow_list = DomainAllowList(ALLOWED)
+        first = allow_list.check('example.com')
+        second = allow_list.check('example.com')
+        assert first is not second
+        assert second.timestamp >= first.timestamp
+
+    def test_set_allowed_domains_invalidates(self):
+        allow_list = DomainAllowList(['example.com'])
+        assert allow_list.check('new.com').allowed is False
+        old_cache = allow_list.decision_cache
+        allow_list.set_allowed_domains(['new.com'])
+        assert allow_list.decision_cache is not old_cache
+        assert len(allow_list.decision_cache) == 0
+        assert allow_list.check('new.com').allowed is True
+        assert allow_list.check('example.com').allowed is False
+
+    def test_apply_policy(self):
+        allow_list = DomainAllowList(['example.com'])
+        allow_list.check('x.policy.com')
+        allow_list.apply_policy(Policy(10, ['*.policy.com'], ['GET']))
+        assert allow_list.check('x.policy.com').allowed is True
+
+    def test_clear_cache(self):
+        allow_list = DomainAllowList(ALLOWED)
+        allow_list.check('example.com')
+        allow_list.clear_cache()
+        assert len(allow_list.decision_cache) == 0
+        assert allow_list.check('example.com').allowed is True
+
+    def test_cache_bounded(self):
+        allow_list = DomainAllowList(ALLOWED, cache_size=8)
+        for i in range(100):
+            allow_list.check(f'h{i}.example.com')
+        assert len(allow_list.decision_cache) == 8
+
+    def test_swap_during_concurrent_checks(self):
+        allow_list = DomainAllowList(['a.com'])
+        stop = threading.Event()
+        mismatches = []
+
+        def checker():
+            while not stop.is_set():
+                result = allow_list.check('a.com')
+                if result.allowed != (result.reason == "Domain 'a.com' allowed (exact match)"):
+                    mismatches.append(result)
+
+        threads = [threading.Thread(target=checker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for i in range(200):
+            allow_list.set_allowed_domains(['a.com'] if i % 2 else ['b.com'])
+        stop.set()
+        for thread in threads:
+            thread.join()
+        allow_list.set_allowed_domains(['b.com'])
+        assert mismatches == []
+        assert allow_list.check('a.com').allowed is False
+
+
+class TestPayloadGuardCache:
+    """Cached request decisions."""
+
+    def test_cached_audit_matches_uncached(self):
+        cached = PayloadGuard()
+        uncached = PayloadGuard(cache_size=0)
+        for _ in range(3):
+            for spec in SPECS:
+                assert _audit(cached.check(spec)) == _audit(uncached.check(spec))
+        assert cached.decision_cache.hits > 0
+
+    def test_repeated_request_skips_url_parsing(self, monkeypatch):
+        import execution_layer.payloadguard as payloadguard
+        original_urlparse = payloadguard.urlparse
+        calls = []
+
+        def counting_urlparse(url):
+            calls.append(url)
+            return original_urlparse(url)
+
+        monkeypatch.setattr(payloadguard, 'urlparse', counting_urlparse)
+        guard = PayloadGuard()
+        spec = RequestSpec('https://example.com/item/1', 'GET', {'Accept': 'x'})
+        for _ in range(10):
+            assert guard.check(spec).allowed is True
+        assert calls == ['https://example.com/item/1']
+        assert guard.decision_cache.misses == 1
+        assert guard.decision_cache.hits == 9
+
+    def test_header_values_do_not_affect_key(self):
+        guard = PayloadGuard()
+        guard.check(RequestSpec('https://example.com/', 'GET', {'Via': 'a'}))
+        result = guard.check(RequestSpec('https://example.com/', 'GET', {'Via': 'b'}))
+        assert guard.decision_cache.hits == 1
+        assert result.allowed is False
+
+    def test_violations_list_not_shared(self):
+        guard = PayloadGuard()
+        spec = RequestSpec('http://example.com/', 'GET', {})
+        guard.check(spec).violations.append('tampered')
+        assert guard.check(spec).violations == ['Only HTTPS allowed, got: http']
+
+    def test_set_allowed_methods_invalidates(self):
+        guard = PayloadGuard()
+        spec = RequestSpec('https://example.com/', 'PUT', {})
+        assert guard.check(spec).allowed is False
+        guard.set_allowed_methods(frozenset({'PUT'}))
+        assert guard.check(spec).allowed is True
+        guard.apply_policy(Policy(10, ['example.com'], ['get']))
+        assert guard.check(spec).allowed is False
+        assert "Allowed: GET" in guard.check(spec).reason
+
+
+@pytest.mark.skipif(
+    os.environ.get("EXECUTION_LAYER_BENCHMARK") != "1",
+    reason="Benchmark requires EXECUTION_LAYER_BENCHMARK=1",
+)
+class TestDecisionCacheBenchmark:
+    """Microbenchmark: repeated checks are cheaper with the cache."""
+
+    ITERATIONS = 20000
+
+    def _time(self, fn) -> float:
+        fn()  # Warm up (and fill the cache)
+        start = time.perf_counter()
+        for _ in range(self.ITERATIONS):
+            fn()
+        return time.perf_counter() - start
+
+    def test_domain_allow_list_speedup(self):
+        rules = [f'*.tenant{i}.example' for i in range(200)]
+        cached = DomainAllowList(rules)
+        uncached = DomainAllowList(rules, cache_size=0)
+        # Not allowed: walks every wildcard suffix when uncached
+        uncached_time = self._time(lambda: uncached.check('api.unknown.net'))
+        cached_time = self._time(lambda: cached.check('api.unknown.net'))
+        print(f"DomainAllowList: uncached {uncached_time:.3f}s, cached {cached_time:.3f}s")
+        assert cached_time < uncached_time
+
+    def test_payload_guard_speedup(self):
+        spec = RequestSpec('https://example.com/api/v1/items?id=5', 'GET',
+                           {'Accept': 'application/json', 'User-Agent': 'ua'})
+        cached = PayloadGuard()
+        uncached = PayloadGuard(cache_size=0)
+        uncached_time = self._time(lambda: uncached.check(spec))
+        cached_time = self._time(lambda: cached.check(spec))
+        print(f"PayloadGuard: uncached {uncached_time:.3f}s, cached {cached_time:.3f}s")
+        assert cached_time < uncached_time
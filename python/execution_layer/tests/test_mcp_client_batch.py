@@ -0,0 +1,154 @@
+"""
+Test MCPClient.verify_evidence_many
+
+Batched evidence verification against a local stand-in MCP server
+(httpx.MockTransport). No network access.
+"""
+
+import asyncio
+import json
+import uuid
+import pytest
+
+import httpx
+
+from execution_layer.errors import ConfigurationError, MCPVerificationError
+from execution_layer.mcp_client import MCPClient, MCPClientConfig
+from execution_layer.request_logger import RequestLogger, RequestLog, ResponseLog
+from execution_layer.types import EvidenceBundle, MCPClassification
+
+
+class StandInMCPServer:
+    """In-process MCP server: per-bundle and optional batch verify endpoints."""
+
+    def __init__(self, delay: float = 0.01, batch: bool = True, fail_bundles=()) -> None:
+        self.delay = delay
+        self.batch = batch
+        self.fail_bundles = set(fail_bundles)
+        self.requests: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def _verify(self, payload: dict) -> dict:
+        if payload["bundle_id"] in self.fail_bundles:
+            return {"error": "invalid evidence"}
+        return {
+            "verification_id": f"v-{payload['bundle_id']}",
+            "finding_id": payload["execution_id"],
+            "classification": "BUG",
+            "verified_at": "2026-01-01T00:00:00+00:00",
+        }
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request.url.path)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            body = json.loads(request.content)
+            if request.url.path == "/api/v1/verify":
+                result = self._verify(body)
+                if "error" in result:
+                    return httpx.Response(422, json=result)
+                return httpx.Response(200, json=result)
+            if request.url.path == "/api/v1/verify/batch" and self.batch:
+                return httpx.Response(
+                    200, json={"results": [self._verify(b) for b in body["bundles"]]})
+            return httpx.Response(404, json={"detail": "not found"})
+        finally:
+            self.in_flight -= 1
+
+
+def _bundles(n: int) -> list[EvidenceBundle]:
+    return [
+        EvidenceBundle(bundle_id=f"b{i}", execution_id=str(uuid.uuid4())).finalize()
+        for i in range(n)
+    ]
+
+
+def _client(server: StandInMCPServer, **config_kwargs) -> MCPClient:
+    config = MCPClientConfig(base_url="https://mcp.test", **config_kwargs)
+    return MCPClient(config, transport=httpx.MockTransport(server.handler))
+
+
+class TestVerifyEvidenceMany:
+    """Test pipelined and batched verification."""
+
+    def test_results_in_input_order(self):
+        server = StandInMCPServer()
+        client = _client(server, max_concurrency=4)
+        bundles = _bundles(20)
+        outcomes = asyncio.run(client.verify_evidence_many(bundles))
+        assert [o.bundle_id for o in outcomes] == [b.bundle_id for b in bundles]
+        assert all(o.ok for o in outcomes)
+        assert outcomes[3].result.verification_id == "v-b3"
+        assert outcomes[3].result.classification == MCPClassification.BUG
+        assert len(server.requests) == 20
+
+    def test_concurrency_limit_respected(self):
+        server = StandInMCPServer(delay=0.02)
+        client = _client(server, max_concurrency=3)
+        asyncio.run(client.verify_evidence_many(_bundles(12)))
+        assert server.max_in_flight == 3
+
+    def test_per_bundle_errors(self):
+        server = StandInMCPServer(fail_bundles={"b1", "b4"})
+        client = _client(server)
+        outcomes = asyncio.run(client.verify_evidence_many(_bundles(6)))
+        assert [o.ok for o in outcomes] == [True, False, True, True, False, True]
+        assert isinstance(outcomes[1].error, MCPVerificationError)
+        assert outcomes[1].result is None
+
+    def test_batch_endpoint(self):
+        server = StandInMCPServer(fail_bundles={"b2"})
+        client = _client(server, batch_endpoint="/api/v1/verify/batch", batch_size=4)
+        bundles = _bundles(10)
+        outcomes = asyncio.run(client.verify_evidence_many(bundles))
+        assert server.requests == ["/api/v1/verify/batch"] * 3
+        assert [o.bundle_id for o in outcomes] == [b.bundle_id for b in bundles]
+        assert [o.ok for o in outcomes].count(False) == 1
+        assert "invalid evidence" in str(outcomes[2].error)
+
+    def test_batch_endpoint_fallback_when_unsupported(self):
+        server = StandInMCPServer(batch=False)
+        client = _client(server, batch_endpoint="/api/v1/verify/batch", batch_size=5,
+                         max_concurrency=1)
+        outcomes = asyncio.run(client.verify_evidence_many(_bundles(10)))
+        assert all(o.ok for o in outcomes)
+        # One failed batch probe, then per-bundle requests only
+        assert server.requests.count("/api/v1/verify/batch") == 1
+        assert server.requests.count("/api/v1/verify") == 10
+
+    def test_batch_transport_error_fails_whole_chunk(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("refused", request=request)
+
+        config = MCPClientConfig(base_url="https://mcp.test",
+                                 batch_endpoint="/api/v1/verify/batch", batch_size=2)
+        client = MCPClient(config, transport=httpx.MockTransport(handler))
+        outcomes = asyncio.run(client.verify_evidence_many(_bundles(3)))
+        assert not any(o.ok for o in outcomes)
+        assert "HARD FAIL" in str(outcomes[0].error)
+
+    def test_request_logging_per_bundle(self):
+        server = StandInMCPServer()
+        logger = RequestLogger()
+        config = MCPClientConfig(base_url="https://mcp.test",
+                                 batch_endpoint="/api/v1/verify/batch")
+        client = MCPClient(config, request_logger=logger,
+                           transport=httpx.MockTransport(server.handler))
+        bundles = _bundles(3)
+        asyncio.run(client.verify_evidence_many(bundles))
+        logs = logger.get_logs_for_execution(bundles[0].execution_id)
+        assert [type(l) for l in logs] == [RequestLog, ResponseLog]
+        assert logs[1].response_id == "v-b0"
+
+    def test_empty_input(self):
+        client = _client(StandInMCPServer())
+        assert asyncio.run(client.verify_evidence_many([])) == []
+
+    def test_invalid_config(self):
+        with pytest.raises(ConfigurationError):
+            MCPClientConfig(base_url="https://mcp.test", max_concurrency=0)
+        with pytest.raises(ConfigurationError):
+            MCPClientConfig(base_url="https://mcp.test", batch_size=0)
@@ -0,0 +1,262 @@
+"""
+Test BountyPipelineClient pooling and coalescing
+
+Connection-pool limits, in-flight coalescing of get_draft and
+health_check, and the short-TTL draft cache, against a local stand-in
+Bounty Pipeline (httpx.MockTransport). No network access.
+"""
+
+import asyncio
+import uuid
+from datetime import datetime, timezone
+import pytest
+
+import httpx
+
+from execution_layer.errors import BountyPipelineError, ConfigurationError
+from execution_layer.pipeline_client import BountyPipelineClient, BountyPipelineConfig
+from execution_layer.request_logger import RequestLogger
+from execution_layer.types import EvidenceBundle, MCPClassification, MCPVerificationResult
+
+
+class StandInPipeline:
+    """In-process Bounty Pipeline with draft and health endpoints."""
+
+    def __init__(self, delay: float = 0.02, fail_status: int = 0) -> None:
+        self.delay = delay
+        self.fail_status = fail_status
+        self.requests: list[tuple[str, str]] = []
+        self.drafts_created = 0
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append((request.method, request.url.path))
+        await asyncio.sleep(self.delay)
+        if self.fail_status:
+            return httpx.Response(self.fail_status, json={"detail": "error"})
+        path = request.url.path
+        if path == "/health":
+            return httpx.Response(200, json={"status": "ok"})
+        if path == "/api/v1/drafts" and request.method == "POST":
+            self.drafts_created += 1
+            return httpx.Response(201, json={
+                "draft_id": f"d{self.drafts_created}",
+                "status": "draft",
+                "created_at": "2026-01-01T00:00:00+00:00",
+            })
+        if path.startswith("/api/v1/drafts/"):
+            draft_id = path.rsplit("/", 1)[-1]
+            if draft_id == "missing":
+                return httpx.Response(404, json={"detail": "not found"})
+            return httpx.Response(200, json={
+                "draft_id": draft_id,
+                "finding_id": "f1",
+                "program_id": "p1",
+                "status": "draft",
+                "created_at": "2026-01-01T00:00:00+00:00",
+            })
+        return httpx.Response(404, json={"detail": "not found"})
+
+    def count(self, method: str, path: str) -> int:
+        return self.requests.count((method, path))
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _client(server: StandInPipeline, clock=None, request_logger=None, **config_kwargs):
+    config = BountyPipelineConfig(base_url="https://pipeline.test", **config_kwargs)
+    kwargs = {"clock": clock} if clock is not None else {}
+    return BountyPipelineClient(
+        config,
+        request_logger=request_logger,
+        transport=httpx.MockTransport(server.handler),
+        **kwargs,
+    )
+
+
+def _bug_result() -> MCPVerificationResult:
+    return MCPVerificationResult(
+        verification_id="v1",
+        finding_id="f1",
+        classification=MCPClassification.BUG,
+        invariant_violated="AUTH_001",
+        proof_hash="abc",
+        verified_at=datetime.now(timezone.utc),
+    )
+
+
+class TestCoalescing:
+    """Identical in-flight reads share one request."""
+
+    def test_concurrent_get_draft_single_request(self):
+        server = StandInPipeline()
+        client = _client(server)
+
+        async def run():
+            return await asyncio.gather(*(client.get_draft("d42") for _ in range(10)))
+
+        drafts = asyncio.run(run())
+        assert server.count("GET", "/api/v1/drafts/d42") == 1
+        assert all(d.draft_id == "d42" for d in drafts)
+        # Each caller has its own copy
+        assert len({id(d) for d in drafts}) == 10
+
+    def test_different_drafts_not_coalesced(self):
+        server = StandInPipeline()
+        client = _client(server)
+
+        async def run():
+            return await asyncio.gather(*(client.get_draft(f"d{i % 3}") for i in range(9)))
+
+        asyncio.run(run())
+        assert len(server.requests) == 3
+
+    def test_concurrent_health_checks_single_request(self):
+        server = StandInPipeline()
+        client = _client(server)
+
+        async def run():
+            return await asyncio.gather(*(client.health_check() for _ in range(5)))
+
+        assert asyncio.run(run()) == [True] * 5
+        assert server.count("GET", "/health") == 1
+
+    def test_errors_shared_and_not_cached(self):
+        server = StandInPipeline(fail_status=500)
+        client = _client(server)
+
+        async def run():
+            return await asyncio.gather(
+                *(client.get_draft("d1") for _ in range(4)), return_exceptions=True
+            )
+
+        results = asyncio.run(run())
+        assert all(isinstance(r, BountyPipelineError) for r in results)
+        assert len(server.requests) == 1
+        server.fail_status = 0
+        assert asyncio.run(client.get_draft("d1")).draft_id == "d1"
+        assert len(server.requests) == 2
+
+    def test_cancelled_caller_does_not_cancel_shared_request(self):
+        server = StandInPipeline(delay=0.05)
+        client = _client(server)
+
+        async def run():
+            first = asyncio.ensure_future(client.get_draft("d1"))
+            second = asyncio.ensure_future(client.get_draft("d1"))
+            await asyncio.sleep(0.01)
+            first.cancel()
+            return await second
+
+        assert asyncio.run(run()).draft_id == "d1"
+        assert len(server.requests) == 1
+
+    def test_one_log_entry_per_network_request(self):
+        server = StandInPipeline()
+        logger = RequestLogger()
+        client = _client(server, request_logger=logger)
+
+        async def run():
+            await asyncio.gather(*(client.get_draft("d7") for _ in range(6)))
+
+        asyncio.run(run())
+        assert len(logger.get_all_logs()) == 2  # One request, one response
+
+
+class TestDraftCache:
+    """Recently fetched drafts are served from a TTL cache."""
+
+    def test_cache_hit_within_ttl(self):
+        server = StandInPipeline(delay=0)
+        clock = FakeClock()
+        client = _client(server, clock=clock, draft_cache_ttl_seconds=5.0)
+        asyncio.run(client.get_draft("d1"))
+        clock.now = 4.9
+        asyncio.run(client.get_draft("d1"))
+        assert len(server.requests) == 1
+        clock.now = 5.0
+        asyncio.run(client.get_draft("d1"))
+        assert len(server.requests) == 2
+
+    def test_not_found_is_not_cached(self):
+        server = StandInPipeline(delay=0)
+        client = _client(server)
+        assert asyncio.run(client.get_draft("missing")) is None
+        assert asyncio.run(client.get_draft("missing")) is None
+        assert len(server.requests) == 2
+
+    def test_cache_disabled(self):
+        server = StandInPipeline(delay=0)
+        client = _client(server, draft_cache_ttl_seconds=0)
+        asyncio.run(client.get_draft("d1"))
+        asyncio.run(client.get_draft("d1"))
+        assert len(server.requests) == 2
+
+    def test_cache_bounded_and_invalidated(self):
+        server = StandInPipeline(delay=0)
+        client = _client(server, draft_cache_max_entries=2)
+        for draft_id in ("a", "b", "c"):
+            asyncio.run(client.get_draft(draft_id))
+        assert list(client._draft_cache) == ["b", "c"]
+        client.invalidate_draft("c")
+        asyncio.run(client.get_draft("c"))
+        assert server.count("GET", "/api/v1/drafts/c") == 2
+
+    def test_cached_copy_is_isolated(self):
+        server = StandInPipeline(delay=0)
+        client = _client(server)
+        first = asyncio.run(client.get_draft("d1"))
+        first.status = "mutated"
+        assert asyncio.run(client.get_draft("d1")).status == "draft"
+
+
+class TestCreateDraftNotCoalesced:
+    """create_draft is always exactly one request per call."""
+
+    def test_concurrent_create_draft(self):
+        server = StandInPipeline()
+        client = _client(server)
+        bundle = EvidenceBundle(bundle_id="b1", execution_id=str(uuid.uuid4())).finalize()
+
+        async def run():
+            return await asyncio.gather(*(
+                client.create_draft("f1", _bug_result(), bundle, "p1") for _ in range(5)
+            ))
+
+        drafts = asyncio.run(run())
+        assert server.count("POST", "/api/v1/drafts") == 5
+        assert len({d.draft_id for d in drafts}) == 5
+
+
+class TestPoolConfig:
+    """Connection-pool limits are applied and validated."""
+
+    def test_limits_applied(self, monkeypatch):
+        captured = {}
+        real_client = httpx.AsyncClient
+
+        def capture(**kwargs):
+            captured.update(kwargs)
+            return real_client(**kwargs)
+
+        monkeypatch.setattr(httpx, "AsyncClient", capture)
+        client = _client(StandInPipeline(), max_connections=3,
+                         max_keepalive_connections=2, keepalive_expiry_seconds=1.5)
+        asyncio.run(client.health_check())
+        limits = captured["limits"]
+        assert (limits.max_connections, limits.max_keepalive_connections,
+                limits.keepalive_expiry) == (3, 2, 1.5)
+
+    def test_invalid_config(self):
+        with pytest.raises(ConfigurationError):
+            BountyPipelineConfig(base_url="https://p.test", max_connections=0)
+        with pytest.raises(ConfigurationError):
+            BountyPipelineConfig(base_url="https://p.test", max_connections=2,
+                                 max_keepalive_connections=3)
+        with pytest.raises(ConfigurationError):
+            BountyPipelineConfig(base_url="https://p.test", draft_cache_ttl_seconds=-1)
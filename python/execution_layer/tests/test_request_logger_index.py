@@ -0,0 +1,226 @@
+"""
+Test RequestLogger indexing and spill
+
+Per-execution and per-request-id indexes, spilling closed executions to
+rotated JSONL segments, segment retention, and bounded resident memory.
+
+OBSERVE ONLY — NO STEALTH, NO EVASION, NO BYPASS.
+"""
+
+import pytest
+
+from execution_layer.request_logger import RequestLogger, RequestLog, ResponseLog
+
+
+def _naive_logs_for_execution(logs, execution_id):
+    """Reference lookup: the original two-pass scan."""
+    request_ids = {
+        l.request_id for l in logs
+        if isinstance(l, RequestLog) and l.execution_id == execution_id
+    }
+    result = [
+        l for l in logs
+        if (isinstance(l, RequestLog) and l.execution_id == execution_id)
+        or (isinstance(l, ResponseLog) and l.request_id in request_ids)
+    ]
+    return sorted(result, key=lambda x: x.timestamp)
+
+
+def _run(logger, executions=20, requests_per_execution=5, close=()):
+    """Interleave requests across executions; close some as they finish."""
+    pending = []
+    for i in range(requests_per_execution):
+        for e in range(executions):
+            request_id = logger.log_request("/api/v1/verify", "POST", execution_id=f"exec-{e}")
+            pending.append(request_id)
+        for request_id in pending:
+            logger.log_response(request_id, 200, 12.5, response_id=f"resp-{request_id}")
+        pending.clear()
+    for e in close:
+        logger.close_execution(f"exec-{e}")
+
+
+class TestRequestLoggerIndex:
+    """Test indexed lookups."""
+
+    def test_lookup_matches_full_scan(self):
+        logger = RequestLogger()
+        _run(logger)
+        logger.log_response("unknown-request", 500, 1.0)
+        all_logs = logger.get_all_logs()
+        for e in range(20):
+            assert logger.get_logs_for_execution(f"exec-{e}") == \
+                _naive_logs_for_execution(all_logs, f"exec-{e}")
+        assert logger.get_logs_for_execution("missing") == []
+
+    def test_lookup_by_request_id(self):
+        logger = RequestLogger()
+        request_id = logger.log_request("/health", "GET", execution_id="e1")
+        logger.log_response(request_id, 204, 3.0)
+        logs = logger.get_logs_for_request(request_id)
+        assert [type(l) for l in logs] == [RequestLog, ResponseLog]
+        assert logger.get_logs_for_request("missing") == []
+
+    def test_close_without_spill_dir_keeps_entries(self):
+        logger = RequestLogger()
+        _run(logger, executions=3, requests_per_execution=2, close=range(3))
+        assert logger.resident_count == 12
+        assert len(logger.get_logs_for_execution("exec-0")) == 4
+
+
+class TestRequestLoggerSpill:
+    """Test spilling closed executions to disk."""
+
+    def test_spilled_lookup_matches_resident(self, tmp_path):
+        reference = RequestLogger()
+        _run(reference)
+        spilling = RequestLogger(spill_dir=tmp_path)
+        _run(spilling, close=range(0, 20, 2))
+
+        # Request ids and timestamps differ between runs; compare the rest
+        shape = lambda logs: [
+            (type(l), getattr(l, "endpoint", None), getattr(l, "status_code", None))
+            for l in logs
+        ]
+        for e in range(20):
+            assert shape(spilling.get_logs_for_execution(f"exec-{e}")) == \
+                shape(reference.get_logs_for_execution(f"exec-{e}"))
+        # Round trip preserves every field
+        spilled = spilling.get_logs_for_execution("exec-0")
+        assert spilled[0].execution_id == "exec-0"
+        assert spilled[0].timestamp.tzinfo is not None
+        assert spilled[1].response_id == f"resp-{spilled[0].request_id}"
+
+    def test_resident_memory_bounded(self, tmp_path):
+        logger = RequestLogger(spill_dir=tmp_path)
+        for e in range(200):
+            execution_id = f"exec-{e}"
+            for _ in range(5):
+                request_id = logger.log_request("/api/v1/verify", "POST", execution_id)
+                logger.log_response(request_id, 200, 1.0)
+            logger.close_execution(execution_id)
+            assert logger.resident_count == 0
+        assert not logger._by_request
+        assert not logger._request_execution
+        assert len(logger.get_logs_for_execution("exec-150")) == 10
+
+    def test_segments_rotate(self, tmp_path):
+        logger = RequestLogger(spill_dir=tmp_path, segment_max_bytes=2048)
+        _run(logger, executions=30, requests_per_execution=3, close=range(30))
+        segments = sorted(tmp_path.glob(f"{RequestLogger.SEGMENT_PREFIX}*.jsonl"))
+        assert len(segments) > 1
+        # A block never straddles segments
+        for segment in segments[:-1]:
+            assert segment.stat().st_size <= 2048
+        assert len(logger.get_logs_for_execution("exec-29")) == 6
+
+    def test_get_all_logs_in_logged_order(self, tmp_path):
+        reference = RequestLogger()
+        _run(reference, executions=5, requests_per_execution=3)
+        logger = RequestLogger(spill_dir=tmp_path, segment_max_bytes=1024)
+        _run(logger, executions=5, requests_per_execution=3, close=[3, 1])
+        kinds = lambda logs: [(type(l), getattr(l, "execution_id", None)) for l in logs]
+        all_logs = logger.get_all_logs()
+        assert kinds(all_logs) == kinds(reference.get_all_logs())
+        timestamps = [l.timestamp for l in all_logs]
+        assert timestamps == sorted(timestamps)
+
+    def test_entries_after_close_are_merged(self, tmp_path):
+        logger = RequestLogger(spill_dir=tmp_path)
+        first = logger.log_request("/a", "GET", "e1")
+        logger.close_execution("e1")
+        second = logger.log_request("/b", "GET", "e1")
+        logger.log_response(second, 200, 1.0)
+        logs = logger.get_logs_for_execution("e1")
+        assert [l.request_id for l in logs] == [first, second, second]
+        assert logger.close_execution("e1") == 2
+        assert len(logger.get_logs_for_execution("e1")) == 3
+
+    def test_clear_removes_segments(self, tmp_path):
+        logger = RequestLogger(spill_dir=tmp_path)
+        _run(logger, executions=3, requests_per_execution=2, close=range(3))
+        logger.clear_logs()
+        assert logger.get_all_logs() == []
+        assert logger.get_logs_for_execution("exec-0") == []
+        assert list(tmp_path.iterdir()) == []
+
+    def test_late_response_joins_spilled_execution(self, tmp_path):
+        logger = RequestLogger(spill_dir=tmp_path)
+        answered = logger.log_request("/a", "GET", "e1")
+        logger.log_response(answered, 200, 1.0)
+        pending = logger.log_request("/b", "GET", "e1")
+        assert logger.close_execution("e1") == 3
+
+        logger.log_response(pending, 504, 30000.0)
+        assert logger.resident_count == 0
+        assert logger.open_executions == []
+        logs = logger.get_logs_for_execution("e1")
+        assert [l.request_id for l in logs] == [answered, answered, pending, pending]
+        assert logs[-1].status_code == 504
+        assert not logger._request_execution
+
+        # A duplicate response has no request waiting for it
+        logger.log_response(pending, 200, 1.0)
+        assert len(logger.get_logs_for_execution("e1")) == 4
+        assert logger.resident_count == 1
+
+    def test_unattributed_entries_bounded(self, tmp_path):
+        """Requests logged without an execution (draft fetches) are spilled too."""
+        logger = RequestLogger(spill_dir=tmp_path, max_unattributed_entries=100)
+        for i in range(20000):
+            request_id = logger.log_request(f"/api/v1/drafts/{i}", "GET", execution_id=None)
+            logger.log_response(request_id, 200, 1.0)
+            assert logger.resident_count < 100
+        assert not logger._request_execution
+        assert not logger._spilled
+        all_logs = logger.get_all_logs()
+        assert len(all_logs) == 40000
+        assert all_logs[-2].endpoint == "/api/v1/drafts/19999"
+
+    def test_response_releases_pending_request(self, tmp_path):
+        logger = RequestLogger(spill_dir=tmp_path)
+        request_id = logger.log_request("/a", "GET", "e1")
+        assert logger._request_execution == {request_id: "e1"}
+        logger.log_response(request_id, 200, 1.0)
+        assert not logger._request_execution
+        assert len(logger.get_logs_for_execution("e1")) == 2
+
+    def test_invalid_segment_size(self, tmp_path):
+        with pytest.raises(ValueError):
+            RequestLogger(spill_dir=tmp_path, segment_max_bytes=0)
+
+
+class TestRequestLoggerRetention:
+    """Test the spill segment cap."""
+
+    def test_oldest_segments_evicted(self, tmp_path):
+        logger = RequestLogger(spill_dir=tmp_path, segment_max_bytes=1024, max_spill_segments=3)
+        _run(logger, executions=30, requests_per_execution=3, close=range(30))
+        segments = list(tmp_path.glob(f"{RequestLogger.SEGMENT_PREFIX}*.jsonl"))
+        assert len(segments) == 3
+        assert logger.get_logs_for_execution("exec-0") == []
+        assert len(logger.get_logs_for_execution("exec-29")) == 6
+        all_logs = logger.get_all_logs()
+        assert {l.execution_id for l in all_logs if isinstance(l, RequestLog)} == \
+            {e for e in logger._spilled}
+        assert "exec-0" not in logger._spilled
+
+    def test_eviction_drops_pending_requests(self, tmp_path):
+        logger = RequestLogger(spill_dir=tmp_path, segment_max_bytes=1, max_spill_segments=1)
+        pending = logger.log_request("/a", "GET", "e1")
+        logger.close_execution("e1")
+        logger.log_request("/b", "GET", "e2")
+        logger.close_execution("e2")
+        assert logger.get_logs_for_execution("e1") == []
+        assert pending not in logger._request_execution
+        # Its response is kept, but under no execution
+        logger.log_response(pending, 200, 1.0)
+        assert logger.get_logs_for_request(pending)[0].status_code == 200
+        assert logger.get_logs_for_execution("e1") == []
+
+    def test_invalid_segment_cap(self, tmp_path):
+        with pytest.raises(ValueError):
+            RequestLogger(spill_dir=tmp_path, max_spill_segments=0)
+        with pytest.raises(ValueError):
+            RequestLogger(spill_dir=tmp_path, max_unattributed_entries=0)
+
@@ -289,6 +289,7 @@ class TestRetryAttemptsLoggedToAudit:
             max_retries=2,
             base_delay_seconds=0.05,
             exponential_base=2.0,
+            full_jitter=False,
         )
         executor = RetryExecutor(policy)
         
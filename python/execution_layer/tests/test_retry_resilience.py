@@ -0,0 +1,306 @@
+"""
+Test RetryExecutor resilience
+
+Full-jitter backoff, per-operation circuit breaker, shared retry budget
+and bounded attempt history. All timing runs on a fake clock.
+
+OBSERVE ONLY — NO STEALTH, NO EVASION, NO BYPASS.
+"""
+
+import asyncio
+import random
+import pytest
+
+from execution_layer.errors import CircuitOpenError, RetryExhaustedError
+from execution_layer.retry import (
+    CircuitBreaker,
+    CircuitState,
+    RetryBudget,
+    RetryExecutor,
+    RetryPolicy,
+)
+
+
+class FakeClock:
+    """Monotonic clock advanced only by sleep() or advance()."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _executor(clock: FakeClock, **policy_kwargs) -> RetryExecutor:
+    policy_kwargs.setdefault("base_delay_seconds", 1.0)
+    return RetryExecutor(
+        RetryPolicy(**policy_kwargs),
+        clock=clock,
+        sleep=clock.sleep,
+        rng=random.Random(7),
+    )
+
+
+def _flaky(failures: int):
+    """Operation that fails `failures` times, then succeeds."""
+    calls = [0]
+
+    async def operation():
+        calls[0] += 1
+        if calls[0] <= failures:
+            raise ConnectionError(f"down {calls[0]}")
+        return "ok"
+
+    return operation, calls
+
+
+async def _down():
+    raise ConnectionError("endpoint down")
+
+
+class TestFullJitter:
+    """Test full-jitter backoff."""
+
+    def test_delays_within_exponential_cap(self):
+        clock = FakeClock()
+        executor = _executor(clock, max_retries=6, max_delay_seconds=10.0,
+                             circuit_failure_threshold=100)
+        with pytest.raises(RetryExhaustedError):
+            asyncio.run(executor.execute_with_retry(_down, "op"))
+        caps = [min(1.0 * 2 ** i, 10.0) for i in range(6)]
+        assert len(clock.sleeps) == 6
+        for delay, cap in zip(clock.sleeps, caps):
+            assert 0.0 <= delay <= cap
+        # Jitter actually spreads the delays
+        assert clock.sleeps != caps
+
+    def test_seeded_jitter_is_reproducible(self):
+        runs = []
+        for _ in range(2):
+            clock = FakeClock()
+            with pytest.raises(RetryExhaustedError):
+                asyncio.run(_executor(clock).execute_with_retry(_down, "op"))
+            runs.append(clock.sleeps)
+        assert runs[0] == runs[1]
+
+    def test_concurrent_callers_do_not_retry_in_lockstep(self):
+        clock = FakeClock()
+        executor = RetryExecutor(
+            RetryPolicy(max_retries=1, circuit_failure_threshold=100),
+            clock=clock, sleep=clock.sleep, rng=random.Random(1),
+        )
+
+        async def run():
+            await asyncio.gather(
+                *(executor.execute_with_retry(_flaky(1)[0], f"op-{i}") for i in range(10))
+            )
+
+        asyncio.run(run())
+        assert len(set(clock.sleeps)) == 10
+
+    def test_jitter_disabled(self):
+        clock = FakeClock()
+        executor = _executor(clock, max_retries=3, full_jitter=False)
+        with pytest.raises(RetryExhaustedError):
+            asyncio.run(executor.execute_with_retry(_down, "op"))
+        assert clock.sleeps == [1.0, 2.0, 4.0]
+
+
+class TestCircuitBreaker:
+    """Test per-operation circuit breaker."""
+
+    def test_opens_after_consecutive_failures(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout_seconds=10.0, clock=clock)
+        for _ in range(2):
+            breaker.record_failure()
+        assert breaker.state == CircuitState.CLOSED
+        breaker.record_success()
+        for _ in range(3):
+            breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+        assert not breaker.allow()
+        assert breaker.retry_after_seconds() == 10.0
+
+    def test_half_open_trial_closes_or_reopens(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout_seconds=5.0,
+                                 half_open_max_calls=2, clock=clock)
+        breaker.record_failure()
+        clock.advance(5.0)
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.allow() and breaker.allow()
+        assert not breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+
+        clock.advance(5.0)
+        assert breaker.allow()
+        breaker.record_success()
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.allow()
+
+    def test_executor_fails_fast_while_open(self):
+        clock = FakeClock()
+        executor = _executor(clock, max_retries=10, circuit_failure_threshold=3,
+                             circuit_reset_timeout_seconds=60.0)
+        operation, calls = _flaky(100)
+        with pytest.raises(CircuitOpenError):
+            asyncio.run(executor.execute_with_retry(operation, "submit"))
+        assert calls[0] == 3
+
+        # Still open: no call reaches the dependency
+        with pytest.raises(CircuitOpenError) as exc_info:
+            asyncio.run(executor.execute_with_retry(operation, "submit"))
+        assert calls[0] == 3
+        assert isinstance(exc_info.value, RetryExhaustedError)
+        assert executor.get_attempts()[-1].reason == "circuit_open"
+
+        # Other operations have their own breaker
+        assert asyncio.run(executor.execute_with_retry(_flaky(0)[0], "verify")) == "ok"
+
+    def test_executor_recovers_after_reset_timeout(self):
+        clock = FakeClock()
+        executor = _executor(clock, max_retries=10, circuit_failure_threshold=2,
+                             circuit_reset_timeout_seconds=30.0)
+        operation, calls = _flaky(2)
+        with pytest.raises(CircuitOpenError):
+            asyncio.run(executor.execute_with_retry(operation, "submit"))
+        clock.advance(30.0)
+        assert executor.get_circuit_breaker("submit").state == CircuitState.HALF_OPEN
+        assert asyncio.run(executor.execute_with_retry(operation, "submit")) == "ok"
+        assert executor.get_circuit_breaker("submit").state == CircuitState.CLOSED
+
+    def test_failed_trial_reopens_without_retrying(self):
+        clock = FakeClock()
+        executor = _executor(clock, max_retries=5, circuit_failure_threshold=2,
+                             circuit_reset_timeout_seconds=30.0)
+        operation, calls = _flaky(100)
+        with pytest.raises(CircuitOpenError):
+            asyncio.run(executor.execute_with_retry(operation, "submit"))
+        clock.advance(30.0)
+        with pytest.raises(CircuitOpenError):
+            asyncio.run(executor.execute_with_retry(operation, "submit"))
+        # One trial call, then open again
+        assert calls[0] == 3
+
+    def test_cancelled_trial_releases_slot(self):
+        clock = FakeClock()
+        executor = _executor(clock, max_retries=5, circuit_failure_threshold=2,
+                             circuit_reset_timeout_seconds=30.0)
+        with pytest.raises(CircuitOpenError):
+            asyncio.run(executor.execute_with_retry(_flaky(100)[0], "submit"))
+        clock.advance(30.0)
+        breaker = executor.get_circuit_breaker("submit")
+        assert breaker.state == CircuitState.HALF_OPEN
+
+        async def hang():
+            await asyncio.Event().wait()
+
+        async def cancelled_trial():
+            await asyncio.wait_for(executor.execute_with_retry(hang, "submit"), 0.01)
+
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(cancelled_trial())
+
+        # The trial slot is free again: the next call is admitted and closes it
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert asyncio.run(executor.execute_with_retry(_flaky(0)[0], "submit")) == "ok"
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_release_only_frees_reserved_trials(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout_seconds=5.0, clock=clock)
+        breaker.release()  # Closed: nothing to release
+        assert breaker.state == CircuitState.CLOSED
+        breaker.record_failure()
+        clock.advance(5.0)
+        assert breaker.allow()
+        assert not breaker.allow()
+        breaker.release()
+        breaker.release()
+        assert breaker.allow()
+        assert not breaker.allow()
+
+
+class TestRetryBudget:
+    """Test the token retry budget."""
+
+    def test_budget_limits_retries(self):
+        clock = FakeClock()
+        budget = RetryBudget(max_tokens=3, token_ratio=0.5)
+        executor = RetryExecutor(
+            RetryPolicy(max_retries=10, circuit_failure_threshold=100),
+            retry_budget=budget, clock=clock, sleep=clock.sleep,
+        )
+        operation, calls = _flaky(100)
+        with pytest.raises(RetryExhaustedError, match="budget"):
+            asyncio.run(executor.execute_with_retry(operation, "op"))
+        assert calls[0] == 4  # Initial attempt plus three budgeted retries
+        assert budget.tokens == 0
+
+        # Successes earn tokens back
+        asyncio.run(executor.execute_with_retry(_flaky(0)[0], "other"))
+        asyncio.run(executor.execute_with_retry(_flaky(0)[0], "other"))
+        assert budget.tokens == 1.0
+        assert asyncio.run(executor.execute_with_retry(_flaky(1)[0], "other")) == "ok"
+
+    def test_budget_shared_between_executors(self):
+        clock = FakeClock()
+        budget = RetryBudget(max_tokens=4, token_ratio=0.0)
+        executors = [
+            RetryExecutor(RetryPolicy(max_retries=3, circuit_failure_threshold=100),
+                          retry_budget=budget, clock=clock, sleep=clock.sleep)
+            for _ in range(2)
+        ]
+        first, first_calls = _flaky(100)
+        second, second_calls = _flaky(100)
+        with pytest.raises(RetryExhaustedError):
+            asyncio.run(executors[0].execute_with_retry(first, "op"))
+        with pytest.raises(RetryExhaustedError, match="budget"):
+            asyncio.run(executors[1].execute_with_retry(second, "op"))
+        assert first_calls[0] == 4
+        assert second_calls[0] == 2
+        assert executors[1].retry_budget is budget
+
+    def test_budget_capped_at_max_tokens(self):
+        budget = RetryBudget(max_tokens=2, token_ratio=1.0)
+        for _ in range(5):
+            budget.record_success()
+        assert budget.tokens == 2
+
+
+class TestBoundedHistory:
+    """Test bounded attempt history."""
+
+    def test_history_keeps_most_recent(self):
+        clock = FakeClock()
+        executor = _executor(clock, max_history=5)
+        for _ in range(20):
+            asyncio.run(executor.execute_with_retry(_flaky(0)[0], "op"))
+        attempts = executor.get_attempts()
+        assert len(attempts) == 5
+        assert all(a.success for a in attempts)
+
+
+class TestPolicyValidation:
+    """Test RetryPolicy validation."""
+
+    @pytest.mark.parametrize("kwargs", [
+        {"max_retries": -1},
+        {"circuit_failure_threshold": 0},
+        {"circuit_half_open_max_calls": 0},
+        {"retry_budget_max_tokens": -1},
+        {"max_history": 0},
+    ])
+    def test_invalid_policy(self, kwargs):
+        with pytest.raises(ValueError):
+            RetryPolicy(**kwargs)
@@ -62,6 +62,7 @@ from governance_friction.errors import (
     AutomationAttempt,
     FrictionBypassAttempt,
     ReadOnlyViolation,
+    FrictionStoreCorrupted,
 )
 
 # Components
@@ -70,9 +71,11 @@ from governance_friction.deliberation import DeliberationTimer
 from governance_friction.edit_checker import ForcedEditChecker
 from governance_friction.challenge import ChallengeQuestionGenerator, ChallengeAnswerValidator
 from governance_friction.rubber_stamp import RubberStampDetector
+from governance_friction.quantile_sketch import QuantileSketch
 from governance_friction.cooldown import CooldownEnforcer
 from governance_friction.audit_completeness import AuditCompletenessChecker
 from governance_friction.audit import FrictionAuditLogger
+from governance_friction.store import FrictionStore
 from governance_friction.coordinator import FrictionCoordinator
 
 __all__ = [
@@ -101,6 +104,7 @@ __all__ = [
     "AutomationAttempt",
     "FrictionBypassAttempt",
     "ReadOnlyViolation",
+    "FrictionStoreCorrupted",
     # Components
     "Phase10BoundaryGuard",
     "DeliberationTimer",
@@ -108,8 +112,10 @@ __all__ = [
     "ChallengeQuestionGenerator",
     "ChallengeAnswerValidator",
     "RubberStampDetector",
+    "QuantileSketch",
     "CooldownEnforcer",
     "AuditCompletenessChecker",
     "FrictionAuditLogger",
+    "FrictionStore",
     "FrictionCoordinator",
 ]
@@ -7,9 +7,13 @@ Append-only, tamper-evident audit log for friction actions.
 import hashlib
 import time
 import uuid
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, TYPE_CHECKING
 
 from governance_friction.types import FrictionAction, AuditEntry
+from governance_friction.errors import FrictionStoreCorrupted
+
+if TYPE_CHECKING:
+    from governance_friction.store import FrictionStore
 
 
 class FrictionAuditLogger:
@@ -20,13 +24,33 @@ class FrictionAuditLogger:
     - Entries are append-only (no modifications)
     - Hash chain provides tamper detection
     - All friction actions are recorded
+    - With a store, each entry is journaled durably before it is added,
+      and the chain is reloaded and verified on restart
     """
     
-    def __init__(self):
-        """Initialize the audit logger."""
+    def __init__(self, store: Optional["FrictionStore"] = None):
+        """
+        Initialize the audit logger.
+        
+        Args:
+            store: Optional durable store; its journal is loaded and the
+                   chain continues from its last entry
+                   
+        Raises:
+            FrictionStoreCorrupted: If the journaled chain does not verify
+        """
         self._entries: List[AuditEntry] = []
         self._entries_by_decision: Dict[str, List[AuditEntry]] = {}
         self._last_hash: str = "genesis"
+        self._store = store
+        
+        if store is not None:
+            for entry in store.load_audit_entries():
+                self._append(entry)
+            if not self.verify_chain():
+                raise FrictionStoreCorrupted(
+                    str(store.directory), "audit hash chain does not verify"
+                )
     
     def log_action(
         self,
@@ -72,18 +96,25 @@ class FrictionAuditLogger:
             entry_hash=entry_hash,
         )
         
+        # Durable first: an entry is in memory only once it is journaled
+        if self._store is not None:
+            self._store.append_audit_entry(entry)
+        
+        self._append(entry)
+        return entry
+    
+    def _append(self, entry: AuditEntry) -> None:
+        """Append an entry to the in-memory chain and index."""
         # Append to log (append-only)
         self._entries.append(entry)
         
         # Index by decision
-        if decision_id not in self._entries_by_decision:
-            self._entries_by_decision[decision_id] = []
-        self._entries_by_decision[decision_id].append(entry)
+        if entry.decision_id not in self._entries_by_decision:
+            self._entries_by_decision[entry.decision_id] = []
+        self._entries_by_decision[entry.decision_id].append(entry)
         
         # Update last hash
-        self._last_hash = entry_hash
-        
-        return entry
+        self._last_hash = entry.entry_hash
     
     def get_entries(self, decision_id: str) -> List[AuditEntry]:
         """
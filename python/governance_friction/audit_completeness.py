@@ -144,6 +144,19 @@ class AuditCompletenessChecker:
         completeness = self.check_completeness(decision_id)
         return completeness.is_complete
     
+    def get_recorded_items(self, decision_id: str) -> List[str]:
+        """
+        Get the audit items recorded so far (sorted).
+        
+        Args:
+            decision_id: Unique identifier for the decision
+            
+        Returns:
+            List of recorded item names
+        """
+        state = self._audit_state.get(decision_id, {})
+        return sorted(item for item, recorded in state.items() if recorded)
+    
     def clear_audit(self, decision_id: str) -> None:
         """
         Clear audit state for a decision.
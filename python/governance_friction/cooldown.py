@@ -138,6 +138,18 @@ class CooldownEnforcer:
         
         return completed
     
+    def restore_cooldown(self, state: CooldownState) -> None:
+        """
+        Re-register an active cooldown restored from durable storage.
+        
+        The state's start_monotonic must already be rebased onto this
+        process's clock, crediting only proven elapsed time.
+        
+        Args:
+            state: The active CooldownState to resume
+        """
+        self._active_cooldowns[state.decision_id] = state
+    
     def cancel_cooldown(self, decision_id: str) -> None:
         """
         Cancel an active cooldown without completing it.
@@ -3,9 +3,14 @@ Phase-10: Governance & Friction Layer - Friction Coordinator
 
 Main orchestrator that coordinates all friction mechanisms.
 Enforces order: deliberation → edit → challenge → cooldown → audit check
+
+With a FrictionStore, every open flow is snapshotted durably on each
+state change and restored on restart. Running timers resume with only
+the elapsed time proven at the last checkpoint (see store.py).
 """
 
-from typing import Dict, Optional
+from dataclasses import asdict
+from typing import Any, Dict, Optional
 
 from governance_friction.types import (
     FrictionState,
@@ -15,6 +20,7 @@ from governance_friction.types import (
     CooldownState,
     AuditCompleteness,
     FrictionAction,
+    WarningLevel,
 )
 from governance_friction.errors import (
     DeliberationTimeViolation,
@@ -22,6 +28,7 @@ from governance_friction.errors import (
     ChallengeNotAnswered,
     CooldownViolation,
     AuditIncomplete,
+    FrictionStoreCorrupted,
 )
 from governance_friction.deliberation import DeliberationTimer
 from governance_friction.edit_checker import ForcedEditChecker
@@ -31,6 +38,7 @@ from governance_friction.cooldown import CooldownEnforcer
 from governance_friction.audit_completeness import AuditCompletenessChecker
 from governance_friction.audit import FrictionAuditLogger
 from governance_friction.boundaries import Phase10BoundaryGuard
+from governance_friction.store import FrictionStore, clock_checkpoint, credited_elapsed
 
 
 class FrictionCoordinator:
@@ -46,8 +54,18 @@ class FrictionCoordinator:
     Flow: deliberation → edit → challenge → cooldown → audit check
     """
     
-    def __init__(self):
-        """Initialize the friction coordinator."""
+    def __init__(self, store: Optional[FrictionStore] = None):
+        """
+        Initialize the friction coordinator.
+        
+        Args:
+            store: Optional durable store. Open flows and the audit chain
+                   are restored from it and kept up to date in it.
+                   
+        Raises:
+            FrictionStoreCorrupted: If stored flows or the audit chain
+                                    cannot be trusted
+        """
         # Validate boundaries on initialization
         Phase10BoundaryGuard.validate_all()
         
@@ -59,10 +77,24 @@ class FrictionCoordinator:
         self._rubber_stamp = RubberStampDetector()
         self._cooldown = CooldownEnforcer()
         self._audit_checker = AuditCompletenessChecker()
-        self._audit_logger = FrictionAuditLogger()
+        self._audit_logger = FrictionAuditLogger(store=store)
         
         # Track friction state per decision
         self._friction_states: Dict[str, FrictionState] = {}
+        
+        # decision_id -> timer name -> clock checkpoint at timer start
+        self._timer_starts: Dict[str, Dict[str, Dict[str, float]]] = {}
+        
+        self._store = store
+        if store is not None:
+            for snapshot in store.load_flows():
+                try:
+                    self._restore_flow(snapshot)
+                except (KeyError, TypeError, ValueError) as e:
+                    raise FrictionStoreCorrupted(
+                        str(store.directory),
+                        f"flow {snapshot.get('decision_id')!r}: {e!r}",
+                    ) from e
     
     def start_friction(
         self,
@@ -86,6 +118,9 @@ class FrictionCoordinator:
         
         # Start deliberation
         deliberation = self._deliberation.start_deliberation(decision_id)
+        self._timer_starts[decision_id] = {
+            "deliberation": self._timer_start(deliberation.start_monotonic),
+        }
         self._audit_logger.log_action(
             FrictionAction.DELIBERATION_START,
             decision_id,
@@ -116,6 +151,7 @@ class FrictionCoordinator:
             challenge=challenge,
         )
         self._friction_states[decision_id] = state
+        self._persist(decision_id)
         
         return state
     
@@ -164,6 +200,7 @@ class FrictionCoordinator:
             is_friction_complete=state.is_friction_complete,
         )
         self._friction_states[decision_id] = state
+        self._persist(decision_id)
         
         return state
     
@@ -217,6 +254,7 @@ class FrictionCoordinator:
             is_friction_complete=state.is_friction_complete,
         )
         self._friction_states[decision_id] = state
+        self._persist(decision_id)
         
         return state
     
@@ -268,6 +306,9 @@ class FrictionCoordinator:
         
         # Start cooldown
         cooldown = self._cooldown.start_cooldown(decision_id)
+        self._timer_starts[decision_id]["cooldown"] = self._timer_start(
+            cooldown.start_monotonic
+        )
         self._audit_logger.log_action(
             FrictionAction.COOLDOWN_START,
             decision_id,
@@ -286,6 +327,7 @@ class FrictionCoordinator:
             is_friction_complete=state.is_friction_complete,
         )
         self._friction_states[decision_id] = state
+        self._persist(decision_id)
         
         return state
     
@@ -349,8 +391,132 @@ class FrictionCoordinator:
         )
         self._friction_states[decision_id] = state
         
+        # Flow is closed; its record lives on in the audit journal
+        self._timer_starts.pop(decision_id, None)
+        if self._store is not None:
+            self._store.delete_flow(decision_id)
+        
         return state
     
+    def checkpoint(self) -> None:
+        """
+        Durably checkpoint every open flow.
+        
+        Elapsed deliberation and cooldown time is credited after a restart
+        only up to the last checkpoint; call this periodically to bound
+        how much elapsed time a crash can cost.
+        """
+        for decision_id, state in self._friction_states.items():
+            if not state.is_friction_complete:
+                self._persist(decision_id)
+    
+    @staticmethod
+    def _timer_start(start_monotonic: float) -> Dict[str, float]:
+        """Clock checkpoint for a timer that started at start_monotonic."""
+        now = clock_checkpoint()
+        return {
+            "wall": now["wall"] - (now["monotonic"] - start_monotonic),
+            "monotonic": start_monotonic,
+        }
+    
+    def _persist(self, decision_id: str) -> None:
+        """Snapshot one open flow to the store (no-op without a store)."""
+        if self._store is None:
+            return
+        state = self._friction_states[decision_id]
+        warning = state.rubber_stamp_warning
+        self._store.save_flow({
+            "decision_id": decision_id,
+            "checkpoint": clock_checkpoint(),
+            "timer_starts": self._timer_starts[decision_id],
+            "original_content": self._edit_checker.get_original_content(decision_id),
+            "edit_verified": state.edit_verified,
+            "challenge": asdict(state.challenge) if state.challenge else None,
+            "deliberation": asdict(state.deliberation) if state.deliberation else None,
+            "cooldown": asdict(state.cooldown) if state.cooldown else None,
+            "rubber_stamp_warning": (
+                {**asdict(warning), "warning_level": warning.warning_level.name}
+                if warning else None
+            ),
+            "audit_items": self._audit_checker.get_recorded_items(decision_id),
+        })
+    
+    def _restore_flow(self, snapshot: Dict[str, Any]) -> None:
+        """
+        Rebuild one open flow from its snapshot.
+        
+        Running timers are rebased onto this process's monotonic clock,
+        crediting only the elapsed time proven at the snapshot checkpoint.
+        """
+        decision_id = snapshot["decision_id"]
+        checkpoint = snapshot["checkpoint"]
+        timer_starts = snapshot["timer_starts"]
+        now = clock_checkpoint()
+        restored_starts: Dict[str, Dict[str, float]] = {}
+        credited: Dict[str, float] = {}
+        
+        def rebase(timer: str) -> float:
+            elapsed = credited_elapsed(timer_starts[timer], checkpoint)
+            credited[f"{timer}_credited_seconds"] = elapsed
+            restored_starts[timer] = {
+                "wall": now["wall"] - elapsed,
+                "monotonic": now["monotonic"] - elapsed,
+            }
+            return now["monotonic"] - elapsed
+        
+        deliberation = DeliberationRecord(**snapshot["deliberation"])
+        if deliberation.end_monotonic is None:
+            deliberation = DeliberationRecord(
+                decision_id=decision_id,
+                start_monotonic=rebase("deliberation"),
+            )
+            self._deliberation.restore_deliberation(deliberation)
+        
+        cooldown = None
+        if snapshot["cooldown"] is not None:
+            cooldown = CooldownState(**snapshot["cooldown"])
+            if not cooldown.is_complete:
+                cooldown = CooldownState(
+                    decision_id=decision_id,
+                    start_monotonic=rebase("cooldown"),
+                    duration_seconds=cooldown.duration_seconds,
+                )
+                self._cooldown.restore_cooldown(cooldown)
+        
+        challenge = None
+        if snapshot["challenge"] is not None:
+            challenge = ChallengeQuestion(**snapshot["challenge"])
+            self._challenge_validator.register_challenge(challenge)
+        
+        warning = None
+        if snapshot["rubber_stamp_warning"] is not None:
+            warning = RubberStampWarning(**{
+                **snapshot["rubber_stamp_warning"],
+                "warning_level": WarningLevel[snapshot["rubber_stamp_warning"]["warning_level"]],
+            })
+        
+        if snapshot["original_content"] is not None:
+            self._edit_checker.register_content(decision_id, snapshot["original_content"])
+        self._audit_checker.initialize_audit(decision_id)
+        for item in snapshot["audit_items"]:
+            self._audit_checker.record_item(decision_id, item)
+        
+        self._friction_states[decision_id] = FrictionState(
+            decision_id=decision_id,
+            deliberation=deliberation,
+            edit_verified=snapshot["edit_verified"],
+            challenge=challenge,
+            rubber_stamp_warning=warning,
+            cooldown=cooldown,
+        )
+        self._timer_starts[decision_id] = {**timer_starts, **restored_starts}
+        self._audit_logger.log_action(
+            FrictionAction.FLOW_RESTORED,
+            decision_id,
+            credited,
+        )
+        self._persist(decision_id)
+    
     def get_state(self, decision_id: str) -> Optional[FrictionState]:
         """
         Get current friction state for a decision.
@@ -139,6 +139,18 @@ class DeliberationTimer:
         
         return completed
     
+    def restore_deliberation(self, record: DeliberationRecord) -> None:
+        """
+        Re-register an active deliberation restored from durable storage.
+        
+        The record's start_monotonic must already be rebased onto this
+        process's clock, crediting only proven elapsed time.
+        
+        Args:
+            record: The active DeliberationRecord to resume
+        """
+        self._active_deliberations[record.decision_id] = record
+    
     def cancel_deliberation(self, decision_id: str) -> None:
         """
         Cancel an active deliberation without completing it.
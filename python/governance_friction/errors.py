@@ -152,3 +152,18 @@ class ReadOnlyViolation(Phase10BoundaryViolation):
             violation_type="read_only",
             details=f"Attempted write operation '{operation}' on read-only phase: {phase}"
         )
+
+
+class FrictionStoreCorrupted(Phase10Error):
+    """
+    Raised when the durable friction store cannot be trusted.
+    
+    A flow snapshot that does not parse, or an audit journal whose hash
+    chain does not verify, is never restored (fail closed).
+    """
+    def __init__(self, path: str, reason: str):
+        self.path = path
+        self.reason = reason
+        super().__init__(
+            f"Friction store corrupted at {path}: {reason}"
+        )
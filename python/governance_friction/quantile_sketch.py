@@ -0,0 +1,218 @@
+"""
+Phase-10: Governance & Friction Layer - Quantile Sketch
+
+Constant-memory, mergeable quantile sketch for deliberation times.
+
+Values are counted in logarithmic buckets (DDSketch-style). Bucket i on
+the positive side covers (gamma^(i-1), gamma^i] with
+gamma = (1 + alpha) / (1 - alpha), so every value in a bucket is within
+relative distance alpha of the bucket's representative value.
+
+ERROR BOUND:
+- Ranks are exact: counts per bucket are exact, so the bucket holding
+  the k-th smallest value is always found.
+- Values are approximate: quantile() returns a value within relative
+  error alpha of the exact order statistic (up to float rounding).
+  Values with magnitude below MIN_INDEXABLE_VALUE share one zero bucket
+  (absolute error < MIN_INDEXABLE_VALUE).
+- Memory is bounded by max_buckets. If the value range needs more
+  buckets, the highest buckets are merged downward; only quantiles that
+  fall in the merged top range lose the bound.
+
+ADVISORY ONLY - used for statistics, never for blocking decisions.
+"""
+
+import math
+from typing import Dict, Iterable, Optional, Tuple
+
+
+# Values with magnitude below this share the zero bucket
+MIN_INDEXABLE_VALUE: float = 1e-9
+
+
+class QuantileSketch:
+    """
+    Mergeable log-bucket quantile sketch with relative accuracy alpha.
+
+    Sketches with the same alpha can be merged; the result is identical
+    to a sketch that saw both streams.
+    """
+
+    DEFAULT_RELATIVE_ACCURACY = 0.01
+    DEFAULT_MAX_BUCKETS = 2048
+
+    __slots__ = (
+        "_alpha", "_gamma", "_log_gamma", "_max_buckets",
+        "_positive", "_negative", "_zero_count", "_count",
+        "_min", "_max",
+    )
+
+    def __init__(
+        self,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+        max_buckets: int = DEFAULT_MAX_BUCKETS,
+    ):
+        """
+        Initialize an empty sketch.
+
+        Args:
+            relative_accuracy: alpha, the relative value error bound (0 < alpha < 1)
+            max_buckets: Upper bound on stored buckets (memory bound)
+        """
+        if not 0.0 < relative_accuracy < 1.0:
+            raise ValueError("relative_accuracy must be in (0, 1)")
+        if max_buckets < 2:
+            raise ValueError("max_buckets must be at least 2")
+        self._alpha = relative_accuracy
+        self._gamma = (1.0 + relative_accuracy) / (1.0 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._max_buckets = max_buckets
+        self._positive: Dict[int, int] = {}
+        self._negative: Dict[int, int] = {}
+        self._zero_count = 0
+        self._count = 0
+        self._min = math.inf
+        self._max = -math.inf
+
+    @property
+    def relative_accuracy(self) -> float:
+        """Get alpha, the relative value error bound."""
+        return self._alpha
+
+    @property
+    def count(self) -> int:
+        """Get the number of values added."""
+        return self._count
+
+    @property
+    def bucket_count(self) -> int:
+        """Get the number of stored buckets (excluding the zero bucket)."""
+        return len(self._positive) + len(self._negative)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _index(self, magnitude: float) -> int:
+        return math.ceil(math.log(magnitude) / self._log_gamma)
+
+    def _value(self, index: int) -> float:
+        return 2.0 * self._gamma ** index / (self._gamma + 1.0)
+
+    def bucket_key(self, value: float) -> Tuple[int, int]:
+        """
+        Get a sortable key for the bucket a value falls in.
+
+        key(a) < key(b) implies a < b; equal keys mean a and b are within
+        the sketch's resolution of each other.
+        """
+        if value >= MIN_INDEXABLE_VALUE:
+            return (1, self._index(value))
+        if value <= -MIN_INDEXABLE_VALUE:
+            return (-1, -self._index(-value))
+        return (0, 0)
+
+    def add(self, value: float, count: int = 1) -> None:
+        """Add a value (count times)."""
+        sign, index = self.bucket_key(value)
+        if sign > 0:
+            self._positive[index] = self._positive.get(index, 0) + count
+        elif sign < 0:
+            self._negative[-index] = self._negative.get(-index, 0) + count
+        else:
+            self._zero_count += count
+        self._count += count
+        self._min = min(self._min, value)
+        self._max = max(self._max, value)
+        if self.bucket_count > self._max_buckets:
+            self._collapse()
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """
+        Merge another sketch into this one.
+
+        Raises:
+            ValueError: If the sketches have different relative accuracy
+        """
+        if other._alpha != self._alpha:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        for index, count in other._positive.items():
+            self._positive[index] = self._positive.get(index, 0) + count
+        for index, count in other._negative.items():
+            self._negative[index] = self._negative.get(index, 0) + count
+        self._zero_count += other._zero_count
+        self._count += other._count
+        self._min = min(self._min, other._min)
+        self._max = max(self._max, other._max)
+        while self.bucket_count > self._max_buckets:
+            self._collapse()
+
+    def _collapse(self) -> None:
+        """Merge the highest bucket into the next one down."""
+        if len(self._positive) >= 2:
+            top, below = sorted(self._positive)[-2:][::-1]
+            self._positive[below] += self._positive.pop(top)
+        elif self._positive:
+            self._zero_count += self._positive.pop(max(self._positive))
+        else:
+            # Highest negative bucket is the smallest magnitude
+            lowest = min(self._negative)
+            self._zero_count += self._negative.pop(lowest)
+
+    def _ordered_buckets(self) -> Iterable[Tuple[Tuple[int, int], int]]:
+        """Yield (bucket key, count) in ascending value order."""
+        for index in sorted(self._negative, reverse=True):
+            yield (-1, -index), self._negative[index]
+        if self._zero_count:
+            yield (0, 0), self._zero_count
+        for index in sorted(self._positive):
+            yield (1, index), self._positive[index]
+
+    def bucket_key_at_rank(self, rank: int) -> Optional[Tuple[int, int]]:
+        """
+        Get the bucket key holding the rank-th smallest value (0-based).
+
+        Returns:
+            Bucket key, or None if the sketch has fewer than rank + 1 values
+        """
+        if rank < 0 or rank >= self._count:
+            return None
+        seen = 0
+        for key, count in self._ordered_buckets():
+            seen += count
+            if seen > rank:
+                return key
+        return None
+
+    def value_at_rank(self, rank: int) -> Optional[float]:
+        """
+        Estimate the rank-th smallest value (0-based).
+
+        Returns:
+            Value within relative error alpha of the exact order statistic,
+            or None if out of range
+        """
+        key = self.bucket_key_at_rank(rank)
+        if key is None:
+            return None
+        sign, index = key
+        if sign > 0:
+            value = self._value(index)
+        elif sign < 0:
+            value = -self._value(-index)
+        else:
+            value = 0.0
+        # Observed extremes are exact; never report beyond them
+        return min(max(value, self._min), self._max)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate the q-quantile (0 <= q <= 1) as the value at rank floor(q * n).
+
+        Returns:
+            Estimated value, or None if the sketch is empty
+        """
+        if not 0.0 <= q <= 1.0:
+            raise ValueError("q must be in [0, 1]")
+        if not self._count:
+            return None
+        return self.value_at_rank(min(int(q * self._count), self._count - 1))
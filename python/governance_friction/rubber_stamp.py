@@ -3,12 +3,17 @@ Phase-10: Governance & Friction Layer - Rubber-Stamp Detector
 
 Identifies patterns of hasty confirmation.
 ADVISORY ONLY - does NOT block decisions.
+
+Per-reviewer statistics are streamed into constant-size accumulators
+(running sum/min/max, a QuantileSketch and a short ring buffer of
+timestamps), so analysis cost does not grow with a reviewer's history.
 """
 
 import time
-from collections import defaultdict
-from typing import Dict, List, Optional
+from collections import defaultdict, deque
+from typing import Deque, Dict, Optional, Tuple
 
+from governance_friction.quantile_sketch import QuantileSketch
 from governance_friction.types import (
     RubberStampWarning,
     WarningLevel,
@@ -16,6 +21,68 @@ from governance_friction.types import (
 )
 
 
+class ReviewerAccumulator:
+    """
+    Constant-memory running statistics for one reviewer.
+    
+    Holds the decision count, running sum, min and max of deliberation
+    times, a QuantileSketch of all deliberation times, the most recent
+    deliberation, and the last `window` confirmation timestamps.
+    """
+    
+    __slots__ = (
+        "count", "total", "minimum", "maximum",
+        "last_deliberation", "recent_timestamps", "sketch",
+    )
+    
+    def __init__(
+        self,
+        window: int,
+        relative_accuracy: float = QuantileSketch.DEFAULT_RELATIVE_ACCURACY,
+    ):
+        """
+        Initialize an empty accumulator.
+        
+        Args:
+            window: Number of recent timestamps kept for rapid-succession checks
+            relative_accuracy: Relative error bound of the quantile sketch
+        """
+        self.count = 0
+        self.total = 0.0
+        self.minimum = 0.0
+        self.maximum = 0.0
+        self.last_deliberation = 0.0
+        self.recent_timestamps: Deque[float] = deque(maxlen=window)
+        self.sketch = QuantileSketch(relative_accuracy)
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def append(self, entry: Tuple[float, float]) -> None:
+        """
+        Fold one (timestamp, deliberation_seconds) confirmation in.
+        
+        Args:
+            entry: (monotonic timestamp, deliberation_seconds)
+        """
+        timestamp, deliberation_seconds = entry
+        if self.count:
+            self.minimum = min(self.minimum, deliberation_seconds)
+            self.maximum = max(self.maximum, deliberation_seconds)
+        else:
+            self.minimum = self.maximum = deliberation_seconds
+        self.count += 1
+        self.total += deliberation_seconds
+        self.last_deliberation = deliberation_seconds
+        self.recent_timestamps.append(timestamp)
+        self.sketch.add(deliberation_seconds)
+    
+    @property
+    def mean(self) -> float:
+        """Get the mean deliberation time (0.0 if empty)."""
+        return self.total / self.count if self.count else 0.0
+
+
 class RubberStampDetector:
     """
     Detects patterns of hasty confirmation (rubber-stamping).
@@ -36,10 +103,19 @@ class RubberStampDetector:
     RAPID_SUCCESSION_COUNT = 3
     PERCENTILE_THRESHOLD = 10  # Below 10th percentile is flagged
     
+    # Relative error of the percentile estimate. The below-percentile check
+    # never flags a deliberation the exact computation would not flag; it
+    # can miss one that is within this fraction of the exact threshold.
+    PERCENTILE_RELATIVE_ACCURACY = 0.01
+    
     def __init__(self):
         """Initialize the rubber-stamp detector."""
-        # reviewer_id -> list of (timestamp, deliberation_seconds)
-        self._reviewer_history: Dict[str, List[tuple]] = defaultdict(list)
+        # reviewer_id -> streaming accumulator of (timestamp, deliberation_seconds)
+        self._reviewer_history: Dict[str, ReviewerAccumulator] = defaultdict(
+            lambda: ReviewerAccumulator(
+                self.RAPID_SUCCESSION_COUNT, self.PERCENTILE_RELATIVE_ACCURACY
+            )
+        )
     
     def record_confirmation(
         self,
@@ -73,8 +149,8 @@ class RubberStampDetector:
         Returns:
             RubberStampWarning (ADVISORY ONLY)
         """
-        history = self._reviewer_history.get(reviewer_id, [])
-        decision_count = len(history)
+        history = self._reviewer_history.get(reviewer_id)
+        decision_count = len(history) if history is not None else 0
         
         # Cold-start safety: No warnings for new reviewers
         if decision_count < MIN_DECISIONS_FOR_ANALYSIS:
@@ -89,8 +165,7 @@ class RubberStampDetector:
             )
         
         # Calculate statistics
-        deliberation_times = [d for _, d in history]
-        avg_deliberation = sum(deliberation_times) / len(deliberation_times)
+        avg_deliberation = history.mean
         
         # Check for rapid succession
         rapid_succession = self._detect_rapid_succession(history)
@@ -124,37 +199,38 @@ class RubberStampDetector:
     
     def _detect_rapid_succession(
         self,
-        history: List[tuple],
+        history: ReviewerAccumulator,
     ) -> bool:
         """
         Detect rapid succession pattern.
         
         Args:
-            history: List of (timestamp, deliberation_seconds)
+            history: Reviewer accumulator (ring buffer of recent timestamps)
             
         Returns:
             True if rapid succession detected
         """
-        if len(history) < self.RAPID_SUCCESSION_COUNT:
+        timestamps = history.recent_timestamps
+        if len(timestamps) < self.RAPID_SUCCESSION_COUNT:
             return False
         
-        # Check last N confirmations
-        recent = history[-self.RAPID_SUCCESSION_COUNT:]
-        timestamps = [t for t, _ in recent]
-        
-        # Check if all within threshold
+        # Check if the last N confirmations are all within threshold
         time_span = timestamps[-1] - timestamps[0]
         return time_span < self.RAPID_SUCCESSION_THRESHOLD_SECONDS
     
     def _detect_below_percentile(
         self,
-        history: List[tuple],
+        history: ReviewerAccumulator,
     ) -> bool:
         """
         Detect below-percentile deliberation.
         
+        The most recent deliberation is flagged only if it lies in a
+        strictly lower sketch bucket than the threshold percentile, so a
+        flag always agrees with the exact sorted-history computation.
+        
         Args:
-            history: List of (timestamp, deliberation_seconds)
+            history: Reviewer accumulator
             
         Returns:
             True if recent deliberation is below threshold percentile
@@ -162,15 +238,36 @@ class RubberStampDetector:
         if len(history) < 2:
             return False
         
-        deliberation_times = sorted([d for _, d in history])
-        
-        # Calculate percentile threshold
-        percentile_index = max(0, int(len(deliberation_times) * self.PERCENTILE_THRESHOLD / 100))
-        threshold = deliberation_times[percentile_index]
+        # Same rank as the exact computation: sorted(times)[n * P // 100]
+        percentile_index = max(0, int(len(history) * self.PERCENTILE_THRESHOLD / 100))
+        threshold_bucket = history.sketch.bucket_key_at_rank(percentile_index)
         
         # Check if most recent is below threshold
-        _, recent_deliberation = history[-1]
-        return recent_deliberation < threshold
+        recent_bucket = history.sketch.bucket_key(history.last_deliberation)
+        return recent_bucket < threshold_bucket
+    
+    def get_deliberation_percentile(
+        self,
+        reviewer_id: str,
+        percentile: float,
+    ) -> Optional[float]:
+        """
+        Estimate a reviewer's deliberation-time percentile.
+        
+        The estimate is within PERCENTILE_RELATIVE_ACCURACY (relative) of
+        the exact value at rank floor(n * percentile / 100).
+        
+        Args:
+            reviewer_id: ID of the reviewer
+            percentile: Percentile in [0, 100]
+            
+        Returns:
+            Estimated deliberation seconds, or None if no history
+        """
+        history = self._reviewer_history.get(reviewer_id)
+        if history is None:
+            return None
+        return history.sketch.quantile(percentile / 100)
     
     def get_reviewer_statistics(
         self,
@@ -185,7 +282,7 @@ class RubberStampDetector:
         Returns:
             Dictionary of statistics
         """
-        history = self._reviewer_history.get(reviewer_id, [])
+        history = self._reviewer_history.get(reviewer_id)
         
         if not history:
             return {
@@ -195,13 +292,11 @@ class RubberStampDetector:
                 "max_deliberation": 0.0,
             }
         
-        deliberation_times = [d for _, d in history]
-        
         return {
-            "decision_count": len(history),
-            "average_deliberation": sum(deliberation_times) / len(deliberation_times),
-            "min_deliberation": min(deliberation_times),
-            "max_deliberation": max(deliberation_times),
+            "decision_count": history.count,
+            "average_deliberation": history.mean,
+            "min_deliberation": history.minimum,
+            "max_deliberation": history.maximum,
         }
     
     def clear_history(self, reviewer_id: str) -> None:
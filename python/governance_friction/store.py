@@ -0,0 +1,236 @@
+"""
+Phase-10: Governance & Friction Layer - Durable Friction Store
+
+Local, crash-durable storage for open friction flows and the friction
+audit chain.
+
+Layout under the store directory:
+- flows/<sha256(decision_id)>.json: one snapshot per open flow, replaced
+  atomically (write temp file, fsync, rename) on every state change
+- audit.jsonl: append-only audit journal, one AuditEntry per line,
+  fsync'd before log_action returns
+
+Every snapshot carries a checkpoint of both clocks (time.time() and
+time.monotonic()). Restoring credits only the elapsed time proven at the
+last checkpoint; time between that checkpoint and the restart is never
+credited.
+
+SECURITY: The store never relaxes friction. A corrupt snapshot or a
+broken audit chain raises FrictionStoreCorrupted instead of restoring.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from governance_friction.errors import FrictionStoreCorrupted
+from governance_friction.types import AuditEntry, FrictionAction
+
+
+STORE_FORMAT_VERSION = 1
+
+
+def clock_checkpoint() -> Dict[str, float]:
+    """Read both clocks at one point in time."""
+    return {"wall": time.time(), "monotonic": time.monotonic()}
+
+
+def credited_elapsed(
+    start: Dict[str, float],
+    checkpoint: Dict[str, float],
+) -> float:
+    """
+    Elapsed seconds between two clock checkpoints, conservatively.
+
+    The smaller of the wall-clock and monotonic deltas is credited, and
+    never less than zero, so a clock that jumped forward cannot
+    over-credit a timer.
+    """
+    monotonic_elapsed = checkpoint["monotonic"] - start["monotonic"]
+    wall_elapsed = checkpoint["wall"] - start["wall"]
+    return max(0.0, min(monotonic_elapsed, wall_elapsed))
+
+
+class FrictionStore:
+    """
+    Crash-durable local store for friction flows and the audit journal.
+
+    SECURITY: This store:
+    - Writes flow snapshots atomically (no torn snapshots)
+    - Appends audit entries durably and never rewrites them
+    - Fails closed on corruption
+    """
+
+    FLOWS_DIR = "flows"
+    AUDIT_JOURNAL = "audit.jsonl"
+
+    def __init__(self, directory: str):
+        """
+        Initialize the store, creating its directory if needed.
+
+        Args:
+            directory: Local directory owned by this store
+        """
+        self._directory = Path(directory)
+        self._flows_dir = self._directory / self.FLOWS_DIR
+        self._flows_dir.mkdir(parents=True, exist_ok=True)
+        self._journal_path = self._directory / self.AUDIT_JOURNAL
+
+    @property
+    def directory(self) -> Path:
+        """Get the store directory."""
+        return self._directory
+
+    def _flow_path(self, decision_id: str) -> Path:
+        digest = hashlib.sha256(decision_id.encode("utf-8")).hexdigest()
+        return self._flows_dir / f"{digest}.json"
+
+    def save_flow(self, snapshot: Dict[str, Any]) -> None:
+        """
+        Durably replace the snapshot of one flow.
+
+        Args:
+            snapshot: JSON-serializable flow snapshot with a decision_id
+        """
+        path = self._flow_path(snapshot["decision_id"])
+        record = {"version": STORE_FORMAT_VERSION, **snapshot}
+        fd, tmp_path = tempfile.mkstemp(dir=self._flows_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(record, f, sort_keys=True)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        self._fsync_directory(self._flows_dir)
+
+    def delete_flow(self, decision_id: str) -> None:
+        """
+        Remove the snapshot of a finished flow.
+
+        Args:
+            decision_id: Unique identifier for the decision
+        """
+        try:
+            self._flow_path(decision_id).unlink()
+        except FileNotFoundError:
+            return
+        self._fsync_directory(self._flows_dir)
+
+    def load_flows(self) -> List[Dict[str, Any]]:
+        """
+        Load every open flow snapshot.
+
+        Returns:
+            List of snapshots
+
+        Raises:
+            FrictionStoreCorrupted: If a snapshot cannot be parsed
+        """
+        snapshots = []
+        for path in sorted(self._flows_dir.glob("*.json")):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    record = json.load(f)
+                if record.get("version") != STORE_FORMAT_VERSION:
+                    raise ValueError(f"unsupported version {record.get('version')!r}")
+                if self._flow_path(record["decision_id"]) != path:
+                    raise ValueError("snapshot does not match its file name")
+            except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+                raise FrictionStoreCorrupted(str(path), str(e)) from e
+            del record["version"]
+            snapshots.append(record)
+        return snapshots
+
+    def append_audit_entry(self, entry: AuditEntry) -> None:
+        """
+        Durably append one audit entry to the journal.
+
+        Args:
+            entry: The entry just added to the in-memory chain
+        """
+        line = json.dumps({
+            "entry_id": entry.entry_id,
+            "decision_id": entry.decision_id,
+            "action": entry.action.name,
+            "timestamp_monotonic": entry.timestamp_monotonic,
+            "details": [list(item) for item in entry.details],
+            "previous_hash": entry.previous_hash,
+            "entry_hash": entry.entry_hash,
+        }, sort_keys=True)
+        with open(self._journal_path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def load_audit_entries(self) -> List[AuditEntry]:
+        """
+        Load the audit journal in append order.
+
+        A final line without a newline is a write torn by a crash; it was
+        never acknowledged and is dropped.
+
+        Returns:
+            List of AuditEntry
+
+        Raises:
+            FrictionStoreCorrupted: If a complete line cannot be parsed
+        """
+        try:
+            with open(self._journal_path, "rb") as f:
+                content = f.read()
+        except FileNotFoundError:
+            return []
+
+        complete_length = content.rfind(b"\n") + 1
+        if complete_length < len(content):
+            # Cut the torn tail so later appends start on a clean line
+            with open(self._journal_path, "r+b") as f:
+                f.truncate(complete_length)
+                f.flush()
+                os.fsync(f.fileno())
+
+        try:
+            complete = content[:complete_length].decode("utf-8").split("\n")[:-1]
+        except UnicodeDecodeError as e:
+            raise FrictionStoreCorrupted(str(self._journal_path), str(e)) from e
+
+        entries = []
+        for number, line in enumerate(complete, start=1):
+            try:
+                record = json.loads(line)
+                entries.append(AuditEntry(
+                    entry_id=record["entry_id"],
+                    decision_id=record["decision_id"],
+                    action=FrictionAction[record["action"]],
+                    timestamp_monotonic=record["timestamp_monotonic"],
+                    details=tuple(tuple(item) for item in record["details"]),
+                    previous_hash=record["previous_hash"],
+                    entry_hash=record["entry_hash"],
+                ))
+            except (ValueError, KeyError, TypeError) as e:
+                raise FrictionStoreCorrupted(
+                    str(self._journal_path), f"line {number}: {e}"
+                ) from e
+        return entries
+
+    @staticmethod
+    def _fsync_directory(directory: Path) -> None:
+        """Persist a rename or unlink in a directory (best effort)."""
+        try:
+            fd = os.open(directory, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
@@ -0,0 +1,198 @@
+"""
+Tests for Phase-10 rubber-stamp streaming statistics.
+
+Validates:
+- Streaming statistics match the exact computation on recorded histories
+- Percentile estimates stay within the documented relative error
+- Below-percentile flags never disagree with the exact computation
+  except within the documented error band
+- Memory per reviewer does not grow with history length
+"""
+
+import random
+
+import pytest
+from hypothesis import given, strategies as st
+
+from governance_friction.quantile_sketch import QuantileSketch
+from governance_friction.rubber_stamp import RubberStampDetector
+from governance_friction.types import WarningLevel, MIN_DECISIONS_FOR_ANALYSIS
+
+
+ALPHA = RubberStampDetector.PERCENTILE_RELATIVE_ACCURACY
+
+deliberations = st.floats(min_value=0.0, max_value=1e5, allow_nan=False)
+gaps = st.floats(min_value=0.0, max_value=60.0, allow_nan=False)
+histories = st.lists(st.tuples(gaps, deliberations), min_size=0, max_size=200)
+
+
+def _exact_level(history: list) -> tuple:
+    """Reference: the original full-history computation."""
+    if len(history) < MIN_DECISIONS_FOR_ANALYSIS:
+        return WarningLevel.NONE, None
+    recent = history[-RubberStampDetector.RAPID_SUCCESSION_COUNT:]
+    rapid = (
+        len(history) >= RubberStampDetector.RAPID_SUCCESSION_COUNT
+        and recent[-1][0] - recent[0][0] < RubberStampDetector.RAPID_SUCCESSION_THRESHOLD_SECONDS
+    )
+    times = sorted(d for _, d in history)
+    index = max(0, int(len(times) * RubberStampDetector.PERCENTILE_THRESHOLD / 100))
+    threshold = times[index]
+    below = history[-1][1] < threshold
+    if rapid and below:
+        return WarningLevel.HIGH, threshold
+    if rapid:
+        return WarningLevel.MEDIUM, threshold
+    if below:
+        return WarningLevel.LOW, threshold
+    return WarningLevel.NONE, threshold
+
+
+def _record(detector: RubberStampDetector, reviewer_id: str, entries) -> list:
+    """Record (gap, deliberation) entries with synthetic timestamps."""
+    history = []
+    timestamp = 1000.0
+    for gap, deliberation in entries:
+        timestamp += gap
+        detector._reviewer_history[reviewer_id].append((timestamp, deliberation))
+        history.append((timestamp, deliberation))
+    return history
+
+
+def _within(estimate: float, exact: float, alpha: float = ALPHA) -> bool:
+    return abs(estimate - exact) <= alpha * abs(exact) + 1e-9
+
+
+class TestStreamingMatchesExact:
+    """Streaming results agree with the exact computation."""
+
+    @given(entries=histories)
+    def test_statistics_exact(self, entries):
+        detector = RubberStampDetector()
+        history = _record(detector, "r", entries)
+        stats = detector.get_reviewer_statistics("r")
+        assert stats["decision_count"] == len(history)
+        if history:
+            times = [d for _, d in history]
+            assert stats["average_deliberation"] == sum(times) / len(times)
+            assert stats["min_deliberation"] == min(times)
+            assert stats["max_deliberation"] == max(times)
+
+    @given(entries=histories)
+    def test_warning_level_matches_exact(self, entries):
+        detector = RubberStampDetector()
+        history = _record(detector, "r", entries)
+        warning = detector.analyze_pattern("r")
+        expected, threshold = _exact_level(history)
+        if warning.warning_level != expected:
+            # Only a below-percentile miss, within the documented band
+            assert expected in (WarningLevel.LOW, WarningLevel.HIGH)
+            assert warning.warning_level == {
+                WarningLevel.LOW: WarningLevel.NONE,
+                WarningLevel.HIGH: WarningLevel.MEDIUM,
+            }[expected]
+            assert _within(history[-1][1], threshold, 3 * ALPHA)
+        if history:
+            times = [d for _, d in history]
+            assert warning.average_deliberation_seconds == (
+                sum(times) / len(times) if len(history) >= MIN_DECISIONS_FOR_ANALYSIS else 0.0
+            )
+
+    @given(entries=st.lists(st.tuples(gaps, deliberations), min_size=1, max_size=300),
+           percentile=st.integers(min_value=0, max_value=100))
+    def test_percentile_within_error_bound(self, entries, percentile):
+        detector = RubberStampDetector()
+        history = _record(detector, "r", entries)
+        times = sorted(d for _, d in history)
+        exact = times[min(int(len(times) * percentile / 100), len(times) - 1)]
+        estimate = detector.get_deliberation_percentile("r", percentile)
+        assert _within(estimate, exact)
+
+    def test_recorded_long_history(self):
+        """A long, realistic history matches exactly at every step."""
+        rng = random.Random(1234)
+        detector = RubberStampDetector()
+        history = []
+        timestamp = 0.0
+        disagreements = 0
+        for i in range(5000):
+            timestamp += rng.choice([2.0, 5.0, 30.0, 120.0])
+            deliberation = rng.lognormvariate(3.0, 1.0)
+            detector._reviewer_history["r"].append((timestamp, deliberation))
+            history.append((timestamp, deliberation))
+            if i % 50 == 0:
+                expected, _ = _exact_level(history)
+                if detector.analyze_pattern("r").warning_level != expected:
+                    disagreements += 1
+        assert disagreements <= 2
+
+
+class TestConstantMemory:
+    """Per-reviewer state is bounded."""
+
+    def test_state_does_not_grow(self):
+        detector = RubberStampDetector()
+        rng = random.Random(7)
+        for i in range(20000):
+            detector.record_confirmation("r", f"d{i}", rng.uniform(1.0, 600.0))
+        accumulator = detector._reviewer_history["r"]
+        assert len(accumulator.recent_timestamps) == RubberStampDetector.RAPID_SUCCESSION_COUNT
+        # log(600) / log(gamma) buckets at most
+        assert accumulator.sketch.bucket_count < 400
+        assert detector.get_reviewer_statistics("r")["decision_count"] == 20000
+
+    def test_clear_history_resets_accumulator(self, reviewer_id):
+        detector = RubberStampDetector()
+        for i in range(MIN_DECISIONS_FOR_ANALYSIS):
+            detector.record_confirmation(reviewer_id, f"d{i}", 8.0)
+        detector.clear_history(reviewer_id)
+        assert detector.get_deliberation_percentile(reviewer_id, 50) is None
+        assert detector.analyze_pattern(reviewer_id).is_cold_start is True
+
+
+class TestQuantileSketch:
+    """Test the mergeable quantile sketch."""
+
+    def test_merge_equals_single_stream(self):
+        rng = random.Random(3)
+        values = [rng.expovariate(0.1) for _ in range(2000)]
+        whole = QuantileSketch()
+        left, right = QuantileSketch(), QuantileSketch()
+        for i, value in enumerate(values):
+            whole.add(value)
+            (left if i % 2 else right).add(value)
+        left.merge(right)
+        for q in (0.0, 0.1, 0.5, 0.9, 1.0):
+            assert left.quantile(q) == whole.quantile(q)
+        assert left.count == whole.count
+
+    def test_merge_rejects_different_accuracy(self):
+        with pytest.raises(ValueError):
+            QuantileSketch(0.01).merge(QuantileSketch(0.02))
+
+    def test_zero_and_negative_values(self):
+        sketch = QuantileSketch()
+        for value in (-5.0, -1.0, 0.0, 0.0, 2.0, 8.0):
+            sketch.add(value)
+        assert _within(sketch.value_at_rank(0), -5.0)
+        assert sketch.value_at_rank(2) == 0.0
+        assert _within(sketch.value_at_rank(5), 8.0)
+        assert sketch.bucket_key(-1.0) < sketch.bucket_key(0.0) < sketch.bucket_key(2.0)
+
+    def test_bucket_cap_bounds_memory(self):
+        sketch = QuantileSketch(max_buckets=16)
+        for exponent in range(-6, 10):
+            for mantissa in (1.0, 2.0, 5.0):
+                sketch.add(mantissa * 10 ** exponent)
+        assert sketch.bucket_count <= 16
+        # Low quantiles keep the bound when only the top is collapsed
+        assert _within(sketch.quantile(0.0), 1e-6)
+
+    def test_empty_and_invalid(self):
+        sketch = QuantileSketch()
+        assert sketch.quantile(0.5) is None
+        assert sketch.value_at_rank(0) is None
+        with pytest.raises(ValueError):
+            sketch.quantile(1.5)
+        with pytest.raises(ValueError):
+            QuantileSketch(relative_accuracy=0.0)
@@ -0,0 +1,226 @@
+"""
+Tests for Phase-10 durable friction store.
+
+Validates:
+- Open friction flows survive a restart
+- Restored timers are credited only the elapsed time proven at the last
+  checkpoint (never over-credited)
+- The audit hash chain keeps verifying across restarts
+- Corruption fails closed
+"""
+
+import json
+import time
+from unittest.mock import patch
+
+import pytest
+
+from governance_friction.coordinator import FrictionCoordinator
+from governance_friction.errors import (
+    CooldownViolation,
+    DeliberationTimeViolation,
+    ForcedEditViolation,
+    FrictionStoreCorrupted,
+)
+from governance_friction.store import FrictionStore, credited_elapsed
+from governance_friction.types import FrictionAction, MIN_DELIBERATION_SECONDS
+
+
+CONTENT = "Original vulnerability report content."
+EDITED = "Edited vulnerability report content with reviewer changes."
+ANSWER = "The evidence is the captured request and response pair."
+
+
+class FakeClocks:
+    """Controllable wall and monotonic clocks."""
+
+    def __init__(self, monkeypatch, wall: float = 1_700_000_000.0, monotonic: float = 100.0):
+        self.wall = wall
+        self.monotonic = monotonic
+        monkeypatch.setattr(time, "time", lambda: self.wall)
+        monkeypatch.setattr(time, "monotonic", lambda: self.monotonic)
+
+    def advance(self, seconds: float) -> None:
+        self.wall += seconds
+        self.monotonic += seconds
+
+    def reboot(self, downtime: float) -> None:
+        """Process restart on a new boot: monotonic clock starts over."""
+        self.wall += downtime
+        self.monotonic = 7.0
+
+
+@pytest.fixture(autouse=True)
+def no_import_guard():
+    """
+    Boundary import validation is tested in test_boundaries.py; the test
+    process itself has network modules loaded.
+    """
+    with patch('governance_friction.coordinator.Phase10BoundaryGuard.validate_all'):
+        yield
+
+
+@pytest.fixture
+def clocks(monkeypatch):
+    return FakeClocks(monkeypatch)
+
+
+@pytest.fixture
+def store_dir(tmp_path):
+    return str(tmp_path / "friction-store")
+
+
+def _start(coordinator, decision_id="decision-1"):
+    return coordinator.start_friction(decision_id, CONTENT, {"type": "evidence"})
+
+
+class TestRestoreDeliberation:
+    """Deliberation time is credited conservatively."""
+
+    def test_only_checkpointed_time_is_credited(self, clocks, store_dir):
+        coordinator = FrictionCoordinator(store=FrictionStore(store_dir))
+        _start(coordinator)
+        clocks.advance(3.0)
+        coordinator.checkpoint()
+        clocks.advance(30.0)  # Not checkpointed before the crash
+        clocks.reboot(downtime=600.0)
+
+        restored = FrictionCoordinator(store=FrictionStore(store_dir))
+        assert restored.get_state("decision-1") is not None
+        clocks.advance(1.0)
+        with pytest.raises(DeliberationTimeViolation) as exc_info:
+            restored.complete_deliberation("decision-1", "reviewer-1")
+        assert exc_info.value.elapsed_seconds == pytest.approx(4.0)
+
+        clocks.advance(MIN_DELIBERATION_SECONDS - 4.0)
+        state = restored.complete_deliberation("decision-1", "reviewer-1")
+        assert state.deliberation.elapsed_seconds == pytest.approx(MIN_DELIBERATION_SECONDS)
+
+    def test_restart_without_reboot_does_not_credit_downtime(self, clocks, store_dir):
+        coordinator = FrictionCoordinator(store=FrictionStore(store_dir))
+        _start(coordinator)
+        clocks.advance(60.0)  # Monotonic keeps running across the restart
+
+        restored = FrictionCoordinator(store=FrictionStore(store_dir))
+        with pytest.raises(DeliberationTimeViolation):
+            restored.complete_deliberation("decision-1", "reviewer-1")
+
+    def test_wall_clock_jump_not_credited(self, clocks, store_dir):
+        coordinator = FrictionCoordinator(store=FrictionStore(store_dir))
+        _start(coordinator)
+        clocks.monotonic += 2.0
+        clocks.wall += 3600.0  # Wall clock stepped forward
+        coordinator.checkpoint()
+        clocks.reboot(downtime=5.0)
+
+        restored = FrictionCoordinator(store=FrictionStore(store_dir))
+        entry = restored.get_audit_entries("decision-1")[-1]
+        assert entry.action == FrictionAction.FLOW_RESTORED
+        assert dict(entry.details)["deliberation_credited_seconds"] == pytest.approx(2.0)
+
+    def test_credited_elapsed_takes_smaller_clock(self):
+        start = {"wall": 1000.0, "monotonic": 50.0}
+        assert credited_elapsed(start, {"wall": 1010.0, "monotonic": 54.0}) == 4.0
+        assert credited_elapsed(start, {"wall": 1002.0, "monotonic": 54.0}) == 2.0
+        # Wall clock stepped backwards: nothing credited
+        assert credited_elapsed(start, {"wall": 990.0, "monotonic": 54.0}) == 0.0
+
+
+class TestRestoreProgress:
+    """Edit, challenge and cooldown progress survive a restart."""
+
+    def test_full_flow_across_restarts(self, clocks, store_dir):
+        coordinator = FrictionCoordinator(store=FrictionStore(store_dir))
+        _start(coordinator)
+        coordinator.submit_edit("decision-1", EDITED)
+        clocks.reboot(downtime=10.0)
+
+        coordinator = FrictionCoordinator(store=FrictionStore(store_dir))
+        state = coordinator.get_state("decision-1")
+        assert state.edit_verified is True
+        coordinator.submit_challenge_answer("decision-1", ANSWER)
+        clocks.advance(MIN_DELIBERATION_SECONDS)
+        coordinator.complete_deliberation("decision-1", "reviewer-1")
+        clocks.advance(1.0)
+        coordinator.checkpoint()
+        clocks.reboot(downtime=10.0)
+
+        coordinator = FrictionCoordinator(store=FrictionStore(store_dir))
+        state = coordinator.get_state("decision-1")
+        assert state.challenge.is_answered is True
+        assert state.deliberation.is_complete is True
+        with pytest.raises(CooldownViolation):
+            coordinator.complete_friction("decision-1")
+        clocks.advance(2.0)
+        state = coordinator.complete_friction("decision-1")
+        assert state.can_proceed is True
+        assert coordinator.verify_audit_chain() is True
+
+        # Completed flows are not restored
+        assert FrictionCoordinator(store=FrictionStore(store_dir)).get_state("decision-1") is None
+
+    def test_original_content_restored_for_edit_check(self, clocks, store_dir):
+        _start(FrictionCoordinator(store=FrictionStore(store_dir)))
+        restored = FrictionCoordinator(store=FrictionStore(store_dir))
+        with pytest.raises(ForcedEditViolation):
+            restored.submit_edit("decision-1", CONTENT + "   ")
+
+    def test_without_store_nothing_is_written(self, clocks, tmp_path):
+        coordinator = FrictionCoordinator()
+        _start(coordinator)
+        coordinator.checkpoint()
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestAuditChainAcrossRestart:
+    """The audit hash chain is durable and verifies after restarts."""
+
+    def test_chain_continues(self, clocks, store_dir):
+        coordinator = FrictionCoordinator(store=FrictionStore(store_dir))
+        _start(coordinator, "decision-1")
+        _start(coordinator, "decision-2")
+        before = coordinator.get_audit_entries("decision-1")
+
+        restored = FrictionCoordinator(store=FrictionStore(store_dir))
+        restored.submit_edit("decision-1", EDITED)
+        assert restored.verify_audit_chain() is True
+        entries = restored.get_audit_entries("decision-1")
+        assert entries[:len(before)] == before
+        assert [e.action for e in entries[len(before):]] == [
+            FrictionAction.FLOW_RESTORED,
+            FrictionAction.EDIT_VERIFIED,
+        ]
+        assert FrictionCoordinator(store=FrictionStore(store_dir)).verify_audit_chain() is True
+
+    def test_tampered_journal_fails_closed(self, clocks, store_dir):
+        store = FrictionStore(store_dir)
+        _start(FrictionCoordinator(store=store))
+        journal = store.directory / FrictionStore.AUDIT_JOURNAL
+        lines = journal.read_text().splitlines()
+        record = json.loads(lines[0])
+        record["details"] = [["start_monotonic", 0.0]]
+        lines[0] = json.dumps(record)
+        journal.write_text("\n".join(lines) + "\n")
+        with pytest.raises(FrictionStoreCorrupted):
+            FrictionCoordinator(store=FrictionStore(store_dir))
+
+    def test_torn_final_line_dropped(self, clocks, store_dir):
+        store = FrictionStore(store_dir)
+        coordinator = FrictionCoordinator(store=store)
+        _start(coordinator)
+        journal = store.directory / FrictionStore.AUDIT_JOURNAL
+        with open(journal, "a") as f:
+            f.write('{"entry_id": "torn')
+
+        restored = FrictionCoordinator(store=FrictionStore(store_dir))
+        assert restored.verify_audit_chain() is True
+        restored.submit_edit("decision-1", EDITED)
+        assert FrictionCoordinator(store=FrictionStore(store_dir)).verify_audit_chain() is True
+
+    def test_corrupt_flow_snapshot_fails_closed(self, clocks, store_dir):
+        store = FrictionStore(store_dir)
+        _start(FrictionCoordinator(store=store))
+        snapshot = next((store.directory / FrictionStore.FLOWS_DIR).glob("*.json"))
+        snapshot.write_text("{not json")
+        with pytest.raises(FrictionStoreCorrupted):
+            FrictionCoordinator(store=FrictionStore(store_dir))
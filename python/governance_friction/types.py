@@ -44,6 +44,7 @@ class FrictionAction(Enum):
     AUDIT_COMPLETENESS_CHECK = auto()
     BOUNDARY_CHECK = auto()
     FRICTION_COMPLETE = auto()
+    FLOW_RESTORED = auto()
 
 
 class WarningLevel(Enum):
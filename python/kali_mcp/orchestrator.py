@@ -3,6 +3,7 @@ Hunt Orchestrator - Coordinates bug bounty hunting workflows.
 """
 
 import asyncio
+import heapq
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -35,6 +36,14 @@ class WorkflowStatus(Enum):
     PAUSED = auto()
 
 
+class WorkflowCycleError(ValueError):
+    """Raised when workflow step dependencies form a cycle."""
+
+    def __init__(self, cycle: List[str]):
+        self.cycle = cycle
+        super().__init__(f"Workflow dependency cycle: {' -> '.join(cycle)}")
+
+
 @dataclass
 class WorkflowStep:
     """Single step in a hunting workflow."""
@@ -59,9 +68,18 @@ class WorkflowResult:
 
 
 class WorkflowEngine:
-    """Executes multi-phase hunting workflows."""
+    """
+    Executes multi-phase hunting workflows.
 
-    def __init__(self):
+    Steps in a phase run in dependency order. With max_parallel > 1,
+    steps whose dependencies have completed run concurrently, up to
+    max_parallel at a time.
+    """
+
+    def __init__(self, max_parallel: int = 1):
+        if max_parallel < 1:
+            raise ValueError("max_parallel must be at least 1")
+        self.max_parallel = max_parallel
         self._steps: Dict[str, WorkflowStep] = {}
         self._results: Dict[str, WorkflowResult] = {}
 
@@ -130,25 +148,146 @@ class WorkflowEngine:
         self._results[step_name] = result
         return result
 
+    def plan_phase(self, phase: HuntPhase) -> List[str]:
+        """
+        Order the steps of a phase so every step follows its dependencies.
+
+        Only dependencies on steps within the same phase are ordered;
+        others are checked against earlier results when the step runs.
+        Ties are broken by registration order, so a phase registered in
+        a valid order keeps that order.
+
+        Raises:
+            WorkflowCycleError: If the phase's dependencies form a cycle
+        """
+        phase_steps = [s for s in self._steps.values() if s.phase == phase]
+        index = {s.name: i for i, s in enumerate(phase_steps)}
+        pending = {
+            s.name: {d for d in s.dependencies if d in index}
+            for s in phase_steps
+        }
+        dependents: Dict[str, List[str]] = {s.name: [] for s in phase_steps}
+        for name, deps in pending.items():
+            for dep in deps:
+                dependents[dep].append(name)
+
+        ready = [index[name] for name, deps in pending.items() if not deps]
+        heapq.heapify(ready)
+        order: List[str] = []
+        while ready:
+            name = phase_steps[heapq.heappop(ready)].name
+            order.append(name)
+            for dependent in dependents[name]:
+                pending[dependent].discard(name)
+                if not pending[dependent]:
+                    heapq.heappush(ready, index[dependent])
+
+        if len(order) < len(phase_steps):
+            raise WorkflowCycleError(self._find_cycle(pending))
+        return order
+
+    @staticmethod
+    def _find_cycle(pending: Dict[str, set]) -> List[str]:
+        """Return one cycle among steps left unscheduled by plan_phase."""
+        # Every unscheduled step waits on another unscheduled step, so
+        # following any chain of dependencies must revisit a step.
+        name = next(n for n, deps in pending.items() if deps)
+        path: List[str] = []
+        seen: Dict[str, int] = {}
+        while name not in seen:
+            seen[name] = len(path)
+            path.append(name)
+            name = min(pending[name])
+        return path[seen[name]:] + [name]
+
     async def execute_phase(
         self,
         phase: HuntPhase,
         context: Dict[str, Any],
+        max_parallel: Optional[int] = None,
     ) -> List[WorkflowResult]:
-        """Execute all steps in a phase."""
-        phase_steps = [s for s in self._steps.values() if s.phase == phase]
-        results = []
-        
-        for step in phase_steps:
-            result = await self.execute_step(step.name, context)
-            results.append(result)
-            
-            # Stop on failure unless step is optional
-            if result.status == WorkflowStatus.FAILED:
-                logger.warning(f"Phase {phase.name} step {step.name} failed")
-                break
-        
-        return results
+        """
+        Execute all steps in a phase.
+
+        The phase stops at the first failed step: no further steps are
+        started, steps already running are allowed to finish, and the
+        results of every step that ran are returned in plan order.
+
+        Args:
+            phase: Phase to execute
+            context: Context passed to every step handler
+            max_parallel: Concurrency cap (defaults to the engine's)
+
+        Raises:
+            WorkflowCycleError: If the phase's dependencies form a cycle
+                (raised before any step runs)
+        """
+        order = self.plan_phase(phase)
+        limit = self.max_parallel if max_parallel is None else max_parallel
+        if limit < 1:
+            raise ValueError("max_parallel must be at least 1")
+
+        if limit == 1:
+            results = []
+            for name in order:
+                result = await self.execute_step(name, context)
+                results.append(result)
+
+                # Stop on failure unless step is optional
+                if result.status == WorkflowStatus.FAILED:
+                    logger.warning(f"Phase {phase.name} step {name} failed")
+                    break
+            return results
+
+        return await self._execute_concurrent(phase, order, context, limit)
+
+    async def _execute_concurrent(
+        self,
+        phase: HuntPhase,
+        order: List[str],
+        context: Dict[str, Any],
+        limit: int,
+    ) -> List[WorkflowResult]:
+        """Run planned steps as their in-phase dependencies complete."""
+        position = {name: i for i, name in enumerate(order)}
+        waiting = {
+            name: {d for d in self._steps[name].dependencies if d in position}
+            for name in order
+        }
+        ready = [position[name] for name, deps in waiting.items() if not deps]
+        heapq.heapify(ready)
+        running: Dict[asyncio.Task, str] = {}
+        finished: Dict[str, WorkflowResult] = {}
+        failed = False
+
+        try:
+            while running or (ready and not failed):
+                while ready and not failed and len(running) < limit:
+                    name = order[heapq.heappop(ready)]
+                    task = asyncio.ensure_future(self.execute_step(name, context))
+                    running[task] = name
+
+                done, _ = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in sorted(done, key=lambda t: position[running[t]]):
+                    name = running.pop(task)
+                    result = task.result()
+                    finished[name] = result
+                    if result.status == WorkflowStatus.FAILED:
+                        logger.warning(f"Phase {phase.name} step {name} failed")
+                        failed = True
+                        continue
+                    for dependent, deps in waiting.items():
+                        if name in deps:
+                            deps.discard(name)
+                            if not deps:
+                                heapq.heappush(ready, position[dependent])
+        finally:
+            for task in running:
+                task.cancel()
+
+        return [finished[name] for name in order if name in finished]
 
     def get_results(self) -> Dict[str, WorkflowResult]:
         """Get all workflow results."""
@@ -296,8 +435,8 @@ class HuntOrchestrator:
     tool selection, and finding aggregation.
     """
 
-    def __init__(self):
-        self.workflow_engine = WorkflowEngine()
+    def __init__(self, max_parallel: int = 1):
+        self.workflow_engine = WorkflowEngine(max_parallel=max_parallel)
         self.tool_selector = ToolSelector()
         self.target_analyzer = TargetAnalyzer()
         self._active_sessions: Dict[str, HuntSession] = {}
@@ -7,7 +7,7 @@ import json
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Awaitable
+from typing import Any, Callable, Dict, List, Optional, Awaitable, Tuple, Union
 import uuid
 
 from .types import (
@@ -30,6 +30,9 @@ class ToolDefinition:
     description: str
     input_schema: Dict[str, Any]
     handler: Callable[..., Awaitable[Dict[str, Any]]]
+    # Read-only tools never change session state and are not queued
+    # behind other calls on the same session
+    read_only: bool = False
 
 
 @dataclass
@@ -87,11 +90,88 @@ class ToolRegistry:
         return len(self._tools)
 
 
+class FindingIndex:
+    """
+    Index over session findings by severity, classification and target.
+
+    Findings are indexed incrementally as they are appended to
+    ``session.findings``. If the list is replaced or shrinks, the
+    session's index is rebuilt on the next query. Findings replaced in
+    place at an existing position are not detected.
+    """
+
+    def __init__(self):
+        # session_id -> (findings list, indexed count, field -> value -> positions)
+        self._entries: Dict[str, Tuple[List[Finding], int, Dict[str, Dict[Any, List[int]]]]] = {}
+
+    @staticmethod
+    def _keys(finding: Finding) -> Dict[str, Any]:
+        return {
+            "severity": finding.severity.value,
+            "classification": finding.classification.value,
+            "target": finding.target,
+        }
+
+    def _refresh(self, session: HuntSession) -> Dict[str, Dict[Any, List[int]]]:
+        """Index any findings appended since the last query."""
+        entry = self._entries.get(session.id)
+        if entry is None or entry[0] is not session.findings or entry[1] > len(session.findings):
+            entry = (session.findings, 0, {"severity": {}, "classification": {}, "target": {}})
+        findings, indexed, fields = entry
+        for position in range(indexed, len(findings)):
+            for name, value in self._keys(findings[position]).items():
+                fields[name].setdefault(value, []).append(position)
+        self._entries[session.id] = (findings, len(findings), fields)
+        return fields
+
+    def query(
+        self,
+        session: HuntSession,
+        severity: Optional[str] = None,
+        classification: Optional[str] = None,
+        target: Optional[str] = None,
+    ) -> List[Finding]:
+        """
+        Get a session's findings matching every given filter.
+
+        Args:
+            session: Session whose findings are queried
+            severity: Severity value (e.g. "high"), or None for any
+            classification: Classification value, or None for any
+            target: Finding target, or None for any
+
+        Returns:
+            Matching findings in the order they were added
+        """
+        fields = self._refresh(session)
+        filters = {"severity": severity, "classification": classification, "target": target}
+        postings = [
+            fields[name].get(value, [])
+            for name, value in filters.items()
+            if value is not None
+        ]
+        if not postings:
+            return list(session.findings)
+        postings.sort(key=len)
+        positions = postings[0]
+        for other in postings[1:]:
+            if not positions:
+                break
+            members = set(other)
+            positions = [p for p in positions if p in members]
+        return [session.findings[p] for p in positions]
+
+    def discard(self, session_id: str) -> None:
+        """Drop the index for a session."""
+        self._entries.pop(session_id, None)
+
+
 class SessionManager:
     """Manages hunting sessions."""
 
     def __init__(self):
         self._sessions: Dict[str, HuntSession] = {}
+        self.finding_index = FindingIndex()
 
     def create_session(
         self,
@@ -116,11 +196,30 @@ class SessionManager:
         """Get all active sessions."""
         return [s for s in self._sessions.values() if s.is_active]
 
+    def query_findings(
+        self,
+        session_id: str,
+        severity: Optional[str] = None,
+        classification: Optional[str] = None,
+        target: Optional[str] = None,
+    ) -> Optional[List[Finding]]:
+        """Get a session's findings through the index (None if no session)."""
+        session = self._sessions.get(session_id)
+        if not session:
+            return None
+        return self.finding_index.query(
+            session,
+            severity=severity,
+            classification=classification,
+            target=target,
+        )
+
     def close_session(self, session_id: str) -> bool:
         """Close a session."""
         session = self._sessions.get(session_id)
         if session:
             session.complete()
+            self.finding_index.discard(session_id)
             logger.info(f"Closed session: {session_id}")
             return True
         return False
@@ -180,10 +279,16 @@ class MCPServer:
     and hunting capabilities to AI systems.
     """
 
-    def __init__(self):
+    def __init__(self, max_concurrent_requests: int = 16):
+        if max_concurrent_requests < 1:
+            raise ValueError("max_concurrent_requests must be at least 1")
         self.tool_registry = ToolRegistry()
         self.session_manager = SessionManager()
         self.formatter = ResponseFormatter()
+        self.max_concurrent_requests = max_concurrent_requests
+        self._request_slots: Optional[asyncio.Semaphore] = None
+        # session_id -> completion future of the last request queued for it
+        self._session_tails: Dict[str, asyncio.Future] = {}
         self._setup_default_tools()
 
     def _setup_default_tools(self) -> None:
@@ -208,6 +313,7 @@ class MCPServer:
             description="List all hunting sessions",
             input_schema={"type": "object", "properties": {}},
             handler=self._handle_list_sessions,
+            read_only=True,
         ))
 
         self.tool_registry.register(ToolDefinition(
@@ -221,6 +327,7 @@ class MCPServer:
                 "required": ["session_id"],
             },
             handler=self._handle_get_session,
+            read_only=True,
         ))
 
         # Reconnaissance tools
@@ -285,14 +392,126 @@ class MCPServer:
                         "enum": ["bug", "signal", "no_issue", "all"],
                         "description": "Filter by classification",
                     },
+                    "severity": {
+                        "type": "string",
+                        "enum": [s.value for s in Severity],
+                        "description": "Filter by severity",
+                    },
+                    "target": {"type": "string", "description": "Filter by finding target"},
                 },
                 "required": ["session_id"],
             },
             handler=self._handle_get_findings,
+            read_only=True,
         ))
 
     async def handle_request(self, request: MCPRequest) -> MCPResponse:
-        """Handle an MCP request."""
+        """
+        Handle an MCP request.
+
+        Requests may be handled concurrently. Tool calls that name a
+        session_id run one at a time per session, in the order they
+        were received. Read-only tools skip the queue.
+        """
+        session_id = None
+        if request.method == "tools/call":
+            name = request.params.get("name")
+            tool = self.tool_registry.get(name) if isinstance(name, str) else None
+            arguments = request.params.get("arguments")
+            if isinstance(arguments, dict) and not (tool and tool.read_only):
+                session_id = arguments.get("session_id")
+        if not isinstance(session_id, str):
+            return await self._dispatch(request)
+
+        # Claim this session's next slot before the first await so that
+        # arrival order is preserved.
+        previous = self._session_tails.get(session_id)
+        done = asyncio.get_running_loop().create_future()
+        self._session_tails[session_id] = done
+        try:
+            if previous is not None:
+                await asyncio.shield(previous)
+            return await self._dispatch(request)
+        finally:
+            done.set_result(None)
+            if self._session_tails.get(session_id) is done:
+                del self._session_tails[session_id]
+
+    async def handle_batch(self, requests: List[MCPRequest]) -> List[MCPResponse]:
+        """Handle several requests concurrently; responses keep input order."""
+        return list(await asyncio.gather(*(self.handle_request(r) for r in requests)))
+
+    async def handle_message(
+        self, message: Union[str, bytes, Dict[str, Any], List[Any]]
+    ) -> Optional[Union[Dict[str, Any], List[Dict[str, Any]]]]:
+        """
+        Handle a JSON-RPC 2.0 message: a single request or a batch array.
+
+        Requests without an id are notifications and get no response.
+
+        Returns:
+            Response dict, list of response dicts for a batch, or None if
+            the message held only notifications
+        """
+        if isinstance(message, (str, bytes)):
+            try:
+                message = json.loads(message)
+            except ValueError as e:
+                return MCPResponse(
+                    id=None, error=self.formatter.format_error(-32700, f"Parse error: {e}")
+                ).to_dict()
+
+        if not isinstance(message, list):
+            responses = await self._handle_entries([message])
+            return responses[0] if responses else None
+        if not message:
+            return MCPResponse(
+                id=None, error=self.formatter.format_error(-32600, "Invalid Request: empty batch")
+            ).to_dict()
+        return await self._handle_entries(message) or None
+
+    async def _handle_entries(self, entries: List[Any]) -> List[Dict[str, Any]]:
+        """Dispatch decoded JSON-RPC entries concurrently."""
+        invalid: Dict[int, MCPResponse] = {}
+        requests: List[Tuple[int, MCPRequest, bool]] = []
+        for position, entry in enumerate(entries):
+            if (
+                not isinstance(entry, dict)
+                or not isinstance(entry.get("method"), str)
+                or not isinstance(entry.get("params", {}), dict)
+            ):
+                request_id = entry.get("id") if isinstance(entry, dict) else None
+                invalid[position] = MCPResponse(
+                    id=request_id,
+                    error=self.formatter.format_error(-32600, "Invalid Request"),
+                )
+                continue
+            requests.append((
+                position,
+                MCPRequest(
+                    id=entry.get("id"),
+                    method=entry["method"],
+                    params=entry.get("params", {}),
+                ),
+                "id" not in entry,
+            ))
+
+        responses = await self.handle_batch([request for _, request, _ in requests])
+        by_position = dict(invalid)
+        for (position, _, notification), response in zip(requests, responses):
+            if not notification:
+                by_position[position] = response
+        return [by_position[p].to_dict() for p in sorted(by_position)]
+
+    async def _dispatch(self, request: MCPRequest) -> MCPResponse:
+        """Run a request under the server's concurrency limit."""
+        if self._request_slots is None:
+            self._request_slots = asyncio.Semaphore(self.max_concurrent_requests)
+        async with self._request_slots:
+            return await self._process_request(request)
+
+    async def _process_request(self, request: MCPRequest) -> MCPResponse:
+        """Process a single request."""
         try:
             if request.method == "tools/list":
                 return MCPResponse(
@@ -427,19 +646,19 @@ class MCPServer:
         self,
         session_id: str,
         classification: str = "all",
+        severity: Optional[str] = None,
+        target: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Handle get_findings tool call."""
-        session = self.session_manager.get_session(session_id)
-        if not session:
+        findings = self.session_manager.query_findings(
+            session_id,
+            severity=severity,
+            classification=None if classification == "all" else classification,
+            target=target,
+        )
+        if findings is None:
             return {"error": f"Session not found: {session_id}"}
         
-        findings = session.findings
-        if classification != "all":
-            findings = [
-                f for f in findings
-                if f.classification.value == classification
-            ]
-        
         return {
             "session_id": session_id,
             "findings": [self.formatter.format_finding(f) for f in findings],
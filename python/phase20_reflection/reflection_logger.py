@@ -3,18 +3,39 @@ Phase-20 Reflection Logger: Audit Logging
 
 Logs reflection records to audit trail.
 NO content analysis. NO background threads. NO async processing.
+
+The audit file is JSON Lines, shared by every process that logs
+reflections. Appends take an exclusive advisory lock and write each line
+with a single write call, so concurrent writers never interleave lines.
+After a restart, load_session_index() rebuilds which sessions already
+have a reflection from the audit file. It remembers how far it has read,
+so later calls (and lookups that miss) read only lines appended since,
+including lines from other processes. Only session ids are kept;
+reflection content is never retained or indexed.
 """
 
 import json
+import os
 from pathlib import Path
 from typing import Optional
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
 from .types import ReflectionRecord
 
 
 # In-memory storage for session lookups (append-only)
 _reflection_store: dict[str, list[ReflectionRecord]] = {}
 
+# Session ids with a reflection in an audit file (ids only, no content)
+_session_index: set[str] = set()
+
+# Bytes of complete lines already read into _session_index, per audit file
+_audit_offsets: dict[Path, int] = {}
+
 
 def log_reflection(
     record: ReflectionRecord,
@@ -48,6 +69,8 @@ def _append_to_audit_file(record: ReflectionRecord, audit_path: Path) -> None:
     Append record to audit file in JSON Lines format.
     
     This is append-only. Records cannot be modified or deleted.
+    The line is written under an exclusive lock with one write call and
+    fsync'd before returning.
     """
     record_dict = {
         "session_id": record.session_id,
@@ -61,9 +84,76 @@ def _append_to_audit_file(record: ReflectionRecord, audit_path: Path) -> None:
         "human_initiated": record.human_initiated,
         "actor": record.actor,
     }
+    line = (json.dumps(record_dict) + "\n").encode("utf-8")
+    
+    fd = os.open(audit_path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        # A writer that crashed mid-line leaves a torn tail; end it so this
+        # record starts on its own line
+        size = os.fstat(fd).st_size
+        if size > 0:
+            os.lseek(fd, size - 1, os.SEEK_SET)
+            if os.read(fd, 1) != b"\n":
+                line = b"\n" + line
+        written = os.write(fd, line)
+        while written < len(line):
+            written += os.write(fd, line[written:])
+        os.fsync(fd)
+    finally:
+        # Closing the descriptor releases the lock
+        os.close(fd)
+
+
+def load_session_index(audit_path: Path) -> int:
+    """
+    Rebuild the session index from an audit file.
+    
+    The first call reads the whole file; later calls resume at the byte
+    offset where the previous one stopped, so sessions appended since
+    (by this or any other process) are picked up without re-reading.
+    
+    Only the session_id of each line is kept. Lines that cannot be
+    parsed (such as a line torn by a crash) are skipped, so they never
+    count as a reflection. An unterminated final line is left unread.
+    
+    Args:
+        audit_path: Path to the JSON Lines audit file.
+        
+    Returns:
+        Number of distinct sessions found in the newly read lines.
+        
+    Note:
+        This does NOT analyze or index reflection content.
+    """
+    path = Path(audit_path).resolve()
+    offset = _audit_offsets.get(path, 0)
+    
+    sessions: set[str] = set()
+    try:
+        with open(path, "rb") as f:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_SH)
+            if os.fstat(f.fileno()).st_size < offset:
+                offset = 0  # File was replaced or truncated; start over
+            f.seek(offset)
+            for raw_line in f:
+                if not raw_line.endswith(b"\n"):
+                    break
+                offset += len(raw_line)
+                try:
+                    session_id = json.loads(raw_line).get("session_id")
+                except (ValueError, AttributeError):
+                    continue
+                if isinstance(session_id, str) and session_id:
+                    sessions.add(session_id)
+    except FileNotFoundError:
+        offset = 0
     
-    with open(audit_path, "a", encoding="utf-8") as f:
-        f.write(json.dumps(record_dict) + "\n")
+    _session_index.update(sessions)
+    _audit_offsets[path] = offset
+    return len(sessions)
 
 
 def has_reflection_for_session(session_id: str) -> bool:
@@ -74,13 +164,22 @@ def has_reflection_for_session(session_id: str) -> bool:
         session_id: UUID of the session.
         
     Returns:
-        True if any reflection (including decline) exists.
+        True if any reflection (including decline) exists, either logged
+        by this process or found in an audit file passed to
+        load_session_index(). On a miss, lines appended to those files
+        since they were last read are loaded before answering.
         
     Note:
         This does NOT analyze the reflection content.
         It only checks for existence.
     """
-    return session_id in _reflection_store and len(_reflection_store[session_id]) > 0
+    if session_id in _session_index:
+        return True
+    if session_id in _reflection_store and len(_reflection_store[session_id]) > 0:
+        return True
+    for path in list(_audit_offsets):
+        load_session_index(path)
+    return session_id in _session_index
 
 
 def clear_store_for_testing() -> None:
@@ -90,6 +189,8 @@ def clear_store_for_testing() -> None:
     This should only be called in test fixtures.
     """
     _reflection_store.clear()
+    _session_index.clear()
+    _audit_offsets.clear()
 
 
 # NO search_reflections function exists
@@ -47,6 +47,7 @@ from .diff_generator import (
     DiffResult,
     generate_diff,
     extract_symbols_from_diff,
+    extract_symbols_from_sources,
 )
 
 from .patch_applicator import (
@@ -82,6 +83,7 @@ __all__ = [
     # Diff
     "generate_diff",
     "extract_symbols_from_diff",
+    "extract_symbols_from_sources",
     # Application
     "apply_patch",
     # Logging
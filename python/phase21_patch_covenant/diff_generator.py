@@ -4,9 +4,19 @@ Phase-21 Diff Generator: Human-readable diff generation.
 This module provides ONLY diff generation — NO analysis or scoring.
 """
 
+import ast
 import re
 from dataclasses import dataclass
 
+from .myers_diff import Opcode, myers_opcodes
+
+
+# Marks a final line without a trailing newline (GNU diff / git format)
+NO_NEWLINE_MARKER = "\\ No newline at end of file\n"
+
+# Files whose symbols are taken from the syntax tree
+PYTHON_SUFFIXES = (".py", ".pyi")
+
 
 @dataclass(frozen=True)
 class DiffResult:
@@ -30,7 +40,11 @@ class DiffResult:
     """Number of lines removed."""
 
 
-def generate_diff(old_content: str, new_content: str) -> DiffResult:
+def generate_diff(
+    old_content: str,
+    new_content: str,
+    filename: str | None = None,
+) -> DiffResult:
     """
     Generate human-readable diff between old and new content.
     
@@ -41,38 +55,44 @@ def generate_diff(old_content: str, new_content: str) -> DiffResult:
     - Does NOT score changes
     - Does NOT recommend actions
     
+    Lines are split on "\\n" only, as patch tools read them. A final line
+    without a newline is followed by a "\\ No newline at end of file"
+    marker, so the diff reproduces new_content exactly.
+    
+    For Python files (filename ending in .py or .pyi), symbols are taken
+    from the syntax trees of both images, as qualified names of the
+    symbols enclosing each changed line. Other files, and Python that
+    does not parse, use the regex path (extract_symbols_from_diff).
+    
     Args:
         old_content: Original content.
         new_content: New content.
+        filename: Optional path of the file, used in the diff headers
+            and to select syntax-tree symbol extraction.
         
     Returns:
         DiffResult with diff text and metadata.
     """
-    import difflib
-    
-    old_lines = old_content.splitlines(keepends=True)
-    new_lines = new_content.splitlines(keepends=True)
+    old_lines = _split_lines(old_content)
+    new_lines = _split_lines(new_content)
+    opcodes = myers_opcodes(old_lines, new_lines)
     
-    diff = difflib.unified_diff(
+    diff_lines, lines_added, lines_removed = _unified_diff(
         old_lines,
         new_lines,
-        fromfile="a/file",
-        tofile="b/file",
+        opcodes,
+        fromfile=f"a/{filename or 'file'}",
+        tofile=f"b/{filename or 'file'}",
     )
     
-    diff_text = "".join(diff)
-    
-    # Count added/removed lines
-    lines_added = 0
-    lines_removed = 0
-    for line in diff_text.splitlines():
-        if line.startswith("+") and not line.startswith("+++"):
-            lines_added += 1
-        elif line.startswith("-") and not line.startswith("---"):
-            lines_removed += 1
+    diff_text = "".join(diff_lines)
     
     # Extract symbols (structural only — no semantic analysis)
-    symbols = extract_symbols_from_diff(diff_text)
+    symbols: list[str] | None = None
+    if filename is not None and filename.endswith(PYTHON_SUFFIXES):
+        symbols = extract_symbols_from_sources(old_content, new_content, opcodes)
+    if symbols is None:
+        symbols = extract_symbols_from_diff(diff_text)
     
     return DiffResult(
         diff_text=diff_text,
@@ -82,6 +102,100 @@ def generate_diff(old_content: str, new_content: str) -> DiffResult:
     )
 
 
+def _split_lines(content: str) -> list[str]:
+    """Split content into lines on "\\n" only, keeping line endings."""
+    lines = content.split("\n")
+    last = lines.pop()
+    lines = [line + "\n" for line in lines]
+    if last:
+        lines.append(last)
+    return lines
+
+
+def _format_range(start: int, stop: int) -> str:
+    """Format a hunk range like difflib / GNU diff."""
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return str(beginning)
+    if not length:
+        beginning -= 1
+    return f"{beginning},{length}"
+
+
+def _grouped_opcodes(opcodes: list[Opcode], context: int) -> list[list[Opcode]]:
+    """Group opcodes into hunks with context lines (as difflib does)."""
+    codes = list(opcodes) or [("equal", 0, 1, 0, 1)]
+    if codes[0][0] == "equal":
+        tag, i1, i2, j1, j2 = codes[0]
+        codes[0] = tag, max(i1, i2 - context), i2, max(j1, j2 - context), j2
+    if codes[-1][0] == "equal":
+        tag, i1, i2, j1, j2 = codes[-1]
+        codes[-1] = tag, i1, min(i2, i1 + context), j1, min(j2, j1 + context)
+    
+    groups: list[list[Opcode]] = []
+    group: list[Opcode] = []
+    for tag, i1, i2, j1, j2 in codes:
+        if tag == "equal" and i2 - i1 > 2 * context:
+            group.append((tag, i1, min(i2, i1 + context), j1, min(j2, j1 + context)))
+            groups.append(group)
+            group = []
+            i1, j1 = max(i1, i2 - context), max(j1, j2 - context)
+        group.append((tag, i1, i2, j1, j2))
+    if group and not (len(group) == 1 and group[0][0] == "equal"):
+        groups.append(group)
+    return groups
+
+
+def _unified_diff(
+    old_lines: list[str],
+    new_lines: list[str],
+    opcodes: list[Opcode],
+    fromfile: str,
+    tofile: str,
+    context: int = 3,
+) -> tuple[list[str], int, int]:
+    """
+    Build unified diff lines, counting added and removed lines as they
+    are emitted.
+    
+    Returns:
+        (diff lines, lines added, lines removed)
+    """
+    out: list[str] = []
+    lines_added = 0
+    lines_removed = 0
+    
+    def emit(prefix: str, line: str) -> None:
+        out.append(prefix + line)
+        if not line.endswith("\n"):
+            out.append("\n" + NO_NEWLINE_MARKER)
+    
+    for group in _grouped_opcodes(opcodes, context):
+        if not out:
+            out.append(f"--- {fromfile}\n")
+            out.append(f"+++ {tofile}\n")
+        first, last = group[0], group[-1]
+        old_range = _format_range(first[1], last[2])
+        new_range = _format_range(first[3], last[4])
+        out.append(f"@@ -{old_range} +{new_range} @@\n")
+        for tag, i1, i2, j1, j2 in group:
+            if tag == "equal":
+                for line in old_lines[i1:i2]:
+                    emit(" ", line)
+                continue
+            if tag in {"replace", "delete"}:
+                for line in old_lines[i1:i2]:
+                    emit("-", line)
+                lines_removed += i2 - i1
+            if tag in {"replace", "insert"}:
+                for line in new_lines[j1:j2]:
+                    emit("+", line)
+                lines_added += j2 - j1
+    
+    return out, lines_added, lines_removed
+
+
 def extract_symbols_from_diff(diff_text: str) -> list[str]:
     """
     Extract symbol names from diff text.
@@ -130,3 +244,117 @@ def extract_symbols_from_diff(diff_text: str) -> list[str]:
     
     return unique_symbols
 
+
+def extract_symbols_from_sources(
+    old_content: str,
+    new_content: str,
+    opcodes: list[Opcode] | None = None,
+) -> list[str] | None:
+    """
+    Extract modified symbol names from Python pre- and post-images.
+    
+    This is STRUCTURAL extraction only:
+    - Parses each image once with ast (no execution)
+    - Maps every removed line (old image) and added line (new image) to
+      the innermost enclosing function, class or module/class-level
+      assignment, e.g. "Client.fetch" or "TIMEOUT"
+    - Decorators and multi-line signatures belong to their symbol, and
+      a symbol whose body changed is reported even if its def line did not
+    - Does NOT analyze symbol meaning
+    - Does NOT score symbol importance
+    
+    Args:
+        old_content: Original Python source.
+        new_content: New Python source.
+        opcodes: Line opcodes between the images, if already computed.
+        
+    Returns:
+        List of qualified symbol names in diff order, or None if either
+        image is not parseable Python (callers fall back to
+        extract_symbols_from_diff).
+    """
+    old_owners = _line_owners(old_content)
+    new_owners = _line_owners(new_content)
+    if old_owners is None or new_owners is None:
+        return None
+    if opcodes is None:
+        opcodes = myers_opcodes(_split_lines(old_content), _split_lines(new_content))
+    
+    seen: set[str] = set()
+    symbols: list[str] = []
+    for tag, i1, i2, j1, j2 in opcodes:
+        if tag == "equal":
+            continue
+        # Line numbers are 1-based; owners[0] is unused
+        for owner in old_owners[i1 + 1:i2 + 1] + new_owners[j1 + 1:j2 + 1]:
+            for name in owner:
+                if name not in seen:
+                    seen.add(name)
+                    symbols.append(name)
+    return symbols
+
+
+def _line_owners(source: str) -> list[tuple[str, ...]] | None:
+    """
+    Map each 1-based line number to its innermost enclosing symbol(s).
+    
+    A line holds several names only for an assignment such as "a, b = ...".
+    
+    Returns None if the source is not parseable Python.
+    """
+    # The Python tokenizer also ends lines at a lone "\r", so its line
+    # numbers would not match the diff's lines
+    if "\r" in source.replace("\r\n", ""):
+        return None
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError, RecursionError):
+        return None
+    
+    owners: list[tuple[str, ...]] = [()] * (source.count("\n") + 2)
+    # Outer symbols are filled first so inner ones overwrite them.
+    # Assignments inside functions are locals and belong to the function.
+    stack: list[tuple[ast.AST, str, bool]] = [(tree, "", False)]
+    while stack:
+        node, prefix, in_function = stack.pop()
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                name = prefix + child.name
+                start = min([child.lineno] + [d.lineno for d in child.decorator_list])
+                _fill_owner(owners, start, child.end_lineno, (name,))
+                is_function = not isinstance(child, ast.ClassDef)
+                stack.append((child, name + ".", in_function or is_function))
+            elif isinstance(child, (ast.Assign, ast.AnnAssign, ast.AugAssign)):
+                if in_function:
+                    continue
+                targets = child.targets if isinstance(child, ast.Assign) else [child.target]
+                names = tuple(prefix + name for name in _assigned_names(targets))
+                if names:
+                    _fill_owner(owners, child.lineno, child.end_lineno, names)
+            elif isinstance(child, (ast.stmt, ast.excepthandler, ast.match_case)):
+                # Blocks (if/try/with/for) may hold nested symbols
+                stack.append((child, prefix, in_function))
+    return owners
+
+
+def _fill_owner(
+    owners: list[tuple[str, ...]],
+    start: int,
+    end: int | None,
+    names: tuple[str, ...],
+) -> None:
+    """Assign lines start..end (inclusive) to symbol names."""
+    end = start if end is None else end
+    owners[start:end + 1] = [names] * (end - start + 1)
+
+
+def _assigned_names(targets: list[ast.expr]) -> list[str]:
+    """Plain names bound by assignment targets (tuples unpacked)."""
+    names: list[str] = []
+    for target in targets:
+        if isinstance(target, ast.Name):
+            if target.id not in {"self", "cls", "_", "__"}:
+                names.append(target.id)
+        elif isinstance(target, (ast.Tuple, ast.List)):
+            names.extend(_assigned_names(list(target.elts)))
+    return names
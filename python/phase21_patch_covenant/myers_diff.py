@@ -0,0 +1,249 @@
+"""
+Phase-21 Myers Diff: Linear-space line diff engine.
+
+This module provides ONLY line matching for diff generation — NO analysis
+or scoring.
+
+The engine is Myers' O((N+M)D) difference algorithm with the linear-space
+refinement (middle-snake bisection), run iteratively so deep inputs never
+hit the recursion limit. Before bisecting:
+- lines are interned to integers, so comparisons are integer compares
+- the common prefix and suffix of every region are matched directly
+- lines that occur on only one side are set aside; they can never be
+  matched, so this does not change the result, and it keeps D small for
+  files where most changed lines are new
+
+Repeated lines (generated code, lockfiles, minified bundles) do not
+degrade the engine: its cost depends on the edit distance D only.
+
+When a bisection needs more than its cost limit of edit steps, the
+region is split at the furthest point either search has reached. The
+result is then still a correct edit script, only not guaranteed minimal.
+"""
+
+from math import isqrt
+from typing import Sequence
+
+
+# Minimum edit steps searched per bisection before splitting heuristically
+MIN_COST_LIMIT = 256
+
+# Opcode tuple: (tag, i1, i2, j1, j2) as in difflib.SequenceMatcher
+Opcode = tuple[str, int, int, int, int]
+
+
+def myers_opcodes(a: Sequence[str], b: Sequence[str]) -> list[Opcode]:
+    """
+    Compute edit opcodes turning line sequence a into line sequence b.
+
+    Args:
+        a: Old lines.
+        b: New lines.
+
+    Returns:
+        Opcodes ("equal", "replace", "delete", "insert") with the same
+        meaning as difflib.SequenceMatcher.get_opcodes().
+    """
+    ids: dict[str, int] = {}
+    a_ids = [ids.setdefault(line, len(ids)) for line in a]
+    b_ids = [ids.setdefault(line, len(ids)) for line in b]
+    return _opcodes(_matching_pairs(a_ids, b_ids), len(a_ids), len(b_ids))
+
+
+def _matching_pairs(a: list[int], b: list[int]) -> list[tuple[int, int, int]]:
+    """Matching blocks (i, j, n) in ascending order, without a sentinel."""
+    n, m = len(a), len(b)
+
+    prefix = 0
+    while prefix < n and prefix < m and a[prefix] == b[prefix]:
+        prefix += 1
+    suffix = 0
+    while (suffix < n - prefix and suffix < m - prefix
+           and a[n - 1 - suffix] == b[m - 1 - suffix]):
+        suffix += 1
+
+    # Lines present on one side only are always edits; set them aside
+    b_present = set(b[prefix:m - suffix])
+    a_present = set(a[prefix:n - suffix])
+    a_keep = [i for i in range(prefix, n - suffix) if a[i] in b_present]
+    b_keep = [j for j in range(prefix, m - suffix) if b[j] in a_present]
+
+    inner = _bisect_diff([a[i] for i in a_keep], [b[j] for j in b_keep])
+
+    blocks: list[tuple[int, int, int]] = []
+    if prefix:
+        blocks.append((0, 0, prefix))
+    for i, j, length in inner:
+        for step in range(length):
+            x, y = a_keep[i + step], b_keep[j + step]
+            if blocks:
+                bi, bj, bn = blocks[-1]
+                if bi + bn == x and bj + bn == y:
+                    blocks[-1] = (bi, bj, bn + 1)
+                    continue
+            blocks.append((x, y, 1))
+    if suffix:
+        start_i, start_j = n - suffix, m - suffix
+        if blocks:
+            bi, bj, bn = blocks[-1]
+            if bi + bn == start_i and bj + bn == start_j:
+                blocks[-1] = (bi, bj, bn + suffix)
+                return blocks
+        blocks.append((start_i, start_j, suffix))
+    return blocks
+
+
+def _bisect_diff(a: list[int], b: list[int]) -> list[tuple[int, int, int]]:
+    """Matching blocks of a and b using iterative Myers bisection."""
+    blocks: list[tuple[int, int, int]] = []
+    stack = [(0, len(a), 0, len(b))]
+    while stack:
+        alo, ahi, blo, bhi = stack.pop()
+
+        # Match the common prefix and suffix of the region directly
+        start = alo
+        while alo < ahi and blo < bhi and a[alo] == b[blo]:
+            alo += 1
+            blo += 1
+        if alo > start:
+            blocks.append((start, blo - (alo - start), alo - start))
+        end = ahi
+        while alo < ahi and blo < bhi and a[ahi - 1] == b[bhi - 1]:
+            ahi -= 1
+            bhi -= 1
+        if end > ahi:
+            blocks.append((ahi, bhi, end - ahi))
+        if alo == ahi or blo == bhi:
+            continue
+
+        split = _middle_split(a, alo, ahi, b, blo, bhi)
+        if split is None:
+            continue  # Whole region is a replacement
+        x, y = split
+        if (x, y) == (alo, blo) or (x, y) == (ahi, bhi):
+            continue  # No progress; treat as a replacement
+        # Push the right half first so the left half is handled first
+        stack.append((x, ahi, y, bhi))
+        stack.append((alo, x, blo, y))
+    blocks.sort()
+    return blocks
+
+
+def _middle_split(
+    a: list[int], alo: int, ahi: int,
+    b: list[int], blo: int, bhi: int,
+) -> tuple[int, int] | None:
+    """
+    Find a point on an optimal edit path through the region.
+
+    Runs the forward and backward searches until they overlap. Returns
+    None if no split makes progress (the region is a pure replacement).
+    """
+    n, m = ahi - alo, bhi - blo
+    max_d = (n + m + 1) // 2
+    cost_limit = max(MIN_COST_LIMIT, 2 * isqrt(n + m))
+    # Diagonals never leave [-d, d], so the arrays need only cover the
+    # steps actually searched, not the whole region
+    reach = min(max_d, cost_limit + 1)
+    offset = reach + 1
+    size = 2 * reach + 3
+    # forward[k]: furthest x on diagonal k = x - y (region coordinates)
+    forward = [-1] * size
+    # backward[k]: furthest distance from the end on reversed diagonal k
+    backward = [-1] * size
+    forward[offset + 1] = 0
+    backward[offset + 1] = 0
+    delta = n - m
+    odd = delta % 2 != 0
+    k1_start = k1_end = k2_start = k2_end = 0
+
+    for d in range(max_d + 1):
+        if d > cost_limit:
+            return _furthest_split(forward, backward, offset, d - 1,
+                                   k1_start, k1_end, k2_start, k2_end, n, m,
+                                   alo, blo)
+
+        for k1 in range(-d + k1_start, d + 1 - k1_end, 2):
+            index = offset + k1
+            if k1 == -d or (k1 != d and forward[index - 1] < forward[index + 1]):
+                x1 = forward[index + 1]
+            else:
+                x1 = forward[index - 1] + 1
+            y1 = x1 - k1
+            while x1 < n and y1 < m and a[alo + x1] == b[blo + y1]:
+                x1 += 1
+                y1 += 1
+            forward[index] = x1
+            if x1 > n:
+                k1_end += 2
+            elif y1 > m:
+                k1_start += 2
+            elif odd:
+                k2_index = offset + delta - k1
+                if 0 <= k2_index < size and backward[k2_index] != -1:
+                    if x1 >= n - backward[k2_index]:
+                        return alo + x1, blo + y1
+
+        for k2 in range(-d + k2_start, d + 1 - k2_end, 2):
+            index = offset + k2
+            if k2 == -d or (k2 != d and backward[index - 1] < backward[index + 1]):
+                x2 = backward[index + 1]
+            else:
+                x2 = backward[index - 1] + 1
+            y2 = x2 - k2
+            while x2 < n and y2 < m and a[ahi - 1 - x2] == b[bhi - 1 - y2]:
+                x2 += 1
+                y2 += 1
+            backward[index] = x2
+            if x2 > n:
+                k2_end += 2
+            elif y2 > m:
+                k2_start += 2
+            elif not odd:
+                k1_index = offset + delta - k2
+                if 0 <= k1_index < size and forward[k1_index] != -1:
+                    x1 = forward[k1_index]
+                    y1 = x1 - (k1_index - offset)
+                    if x1 >= n - x2:
+                        return alo + x1, blo + y1
+    return None
+
+
+def _furthest_split(
+    forward: list[int], backward: list[int], offset: int, d: int,
+    k1_start: int, k1_end: int, k2_start: int, k2_end: int,
+    n: int, m: int, alo: int, blo: int,
+) -> tuple[int, int] | None:
+    """Split at the point either search has advanced furthest (heuristic)."""
+    best_progress = 0
+    best: tuple[int, int] | None = None
+    for k1 in range(-d + k1_start, d + 1 - k1_end, 2):
+        x = forward[offset + k1]
+        y = x - k1
+        if 0 <= x <= n and 0 <= y <= m and x + y > best_progress:
+            best_progress, best = x + y, (x, y)
+    for k2 in range(-d + k2_start, d + 1 - k2_end, 2):
+        x = backward[offset + k2]
+        y = x - k2
+        if 0 <= x <= n and 0 <= y <= m and x + y > best_progress:
+            best_progress, best = x + y, (n - x, m - y)
+    if best is None or best_progress >= n + m:
+        return None
+    return alo + best[0], blo + best[1]
+
+
+def _opcodes(blocks: list[tuple[int, int, int]], n: int, m: int) -> list[Opcode]:
+    """Convert matching blocks to difflib-style opcodes."""
+    opcodes: list[Opcode] = []
+    i = j = 0
+    for bi, bj, size in blocks + [(n, m, 0)]:
+        if i < bi and j < bj:
+            opcodes.append(("replace", i, bi, j, bj))
+        elif i < bi:
+            opcodes.append(("delete", i, bi, j, bj))
+        elif j < bj:
+            opcodes.append(("insert", i, bi, j, bj))
+        if size:
+            opcodes.append(("equal", bi, bi + size, bj, bj + size))
+        i, j = bi + size, bj + size
+    return opcodes
@@ -0,0 +1,266 @@
+"""
+Phase-21 Diff Generator Tests
+
+Tests verifying generated diffs are valid unified diffs that reproduce
+the new content exactly, including on large inputs. Wall-clock
+benchmarks run only with PHASE21_BENCHMARK=1.
+"""
+
+import difflib
+import os
+import random
+import shutil
+import subprocess
+import time
+from pathlib import Path
+
+import pytest
+from hypothesis import given, settings, strategies as st
+
+from phase21_patch_covenant.diff_generator import generate_diff
+from phase21_patch_covenant.myers_diff import myers_opcodes
+
+
+def apply_unified_diff(old_content: str, diff_text: str) -> str:
+    """
+    Strict reference applier for single-file unified diffs.
+
+    Every context and removed line must match the old content exactly,
+    and every hunk header must match its body.
+    """
+    if not diff_text:
+        return old_content
+    old_lines = old_content.split("\n")
+    old_lines = [line + "\n" for line in old_lines[:-1]] + (
+        [old_lines[-1]] if old_lines[-1] else []
+    )
+    lines = diff_text.split("\n")
+    assert lines.pop() == ""
+    assert lines[0] == "--- a/file" and lines[1] == "+++ b/file"
+
+    result: list[str] = []
+    position = 0
+    index = 2
+    while index < len(lines):
+        header = lines[index]
+        assert header.startswith("@@ -") and header.endswith(" @@")
+        old_range, new_range = header[4:-3].split(" +")
+        old_start, _, old_count = old_range.partition(",")
+        new_start, _, new_count = new_range.partition(",")
+        old_count = int(old_count) if old_count else 1
+        new_count = int(new_count) if new_count else 1
+        hunk_start = int(old_start) - (1 if old_count else 0)
+        assert hunk_start >= position
+        result.extend(old_lines[position:hunk_start])
+        position = hunk_start
+        index += 1
+
+        seen_old = seen_new = 0
+        while index < len(lines) and not lines[index].startswith("@@"):
+            body = lines[index]
+            tag, text = body[0], body[1:] + "\n"
+            if index + 1 < len(lines) and lines[index + 1] == "\\ No newline at end of file":
+                text = text[:-1]
+                index += 1
+            if tag in " -":
+                assert old_lines[position] == text
+                position += 1
+                seen_old += 1
+            if tag in " +":
+                result.append(text)
+                seen_new += 1
+            assert tag in " -+"
+            index += 1
+        assert (seen_old, seen_new) == (old_count, new_count)
+
+    result.extend(old_lines[position:])
+    return "".join(result)
+
+
+def _counts(diff_text: str) -> tuple[int, int]:
+    """Reference: count added and removed lines from the diff text."""
+    added = removed = 0
+    for line in diff_text.splitlines():
+        if line.startswith("+") and not line.startswith("+++"):
+            added += 1
+        elif line.startswith("-") and not line.startswith("---"):
+            removed += 1
+    return added, removed
+
+
+def _lockfile(package_count: int) -> list[str]:
+    """Lockfile-like content: many short, heavily repeated lines."""
+    lines: list[str] = []
+    for i in range(package_count):
+        lines += [
+            f'"pkg-{i}": {{\n',
+            '  "version": "1.0.0",\n',
+            '  "integrity": "sha512-AAAA",\n',
+            '  "dependencies": {\n',
+            '  },\n',
+            '},\n',
+        ]
+    return lines
+
+
+def _mutate(lines: list[str], edits: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    lines = list(lines)
+    for _ in range(edits):
+        position = rng.randrange(len(lines))
+        choice = rng.random()
+        if choice < 0.33:
+            del lines[position]
+        elif choice < 0.66:
+            lines.insert(position, f"inserted {rng.random()}\n")
+        else:
+            lines[position] = '  "version": "2.0.0",\n'
+    return lines
+
+
+line_text = st.text(alphabet="ab \t\r", max_size=3)
+contents = st.lists(
+    st.one_of(st.sampled_from(["x", "y", ""]), line_text), max_size=40
+).map("\n".join)
+
+
+class TestRoundTrip:
+    """Diffs reproduce the new content exactly."""
+
+    @settings(max_examples=300, deadline=None)
+    @given(old=contents, new=contents)
+    def test_round_trip(self, old: str, new: str) -> None:
+        result = generate_diff(old, new)
+        assert apply_unified_diff(old, result.diff_text) == new
+        assert (result.lines_added, result.lines_removed) == _counts(result.diff_text)
+
+    @settings(max_examples=200, deadline=None)
+    @given(old=st.lists(st.sampled_from("abc"), max_size=30),
+           new=st.lists(st.sampled_from("abc"), max_size=30))
+    def test_edit_script_is_minimal(self, old: list[str], new: list[str]) -> None:
+        """Below the cost limit the matched lines form a longest common subsequence."""
+        opcodes = myers_opcodes(old, new)
+        matched = sum(i2 - i1 for tag, i1, i2, _, _ in opcodes if tag == "equal")
+        # Longest common subsequence by dynamic programming
+        lcs = [[0] * (len(new) + 1) for _ in range(len(old) + 1)]
+        for i in range(len(old) - 1, -1, -1):
+            for j in range(len(new) - 1, -1, -1):
+                lcs[i][j] = (lcs[i + 1][j + 1] + 1 if old[i] == new[j]
+                             else max(lcs[i + 1][j], lcs[i][j + 1]))
+        assert matched == lcs[0][0]
+
+    def test_missing_final_newline(self) -> None:
+        result = generate_diff("a\nb\nc", "a\nb\nc\n")
+        assert result.diff_text == (
+            "--- a/file\n+++ b/file\n@@ -1,3 +1,3 @@\n a\n b\n-c\n"
+            "\\ No newline at end of file\n+c\n"
+        )
+        assert (result.lines_added, result.lines_removed) == (1, 1)
+
+    def test_carriage_returns_stay_inside_lines(self) -> None:
+        old = "a\rb\nc\r\n"
+        new = "a\rb\nd\r\n"
+        result = generate_diff(old, new)
+        assert (result.lines_added, result.lines_removed) == (1, 1)
+        assert apply_unified_diff(old, result.diff_text) == new
+
+    def test_identical_content_has_empty_diff(self) -> None:
+        result = generate_diff("same\n", "same\n")
+        assert result.diff_text == ""
+        assert (result.lines_added, result.lines_removed) == (0, 0)
+
+    def test_matches_difflib_format(self) -> None:
+        """With an unambiguous alignment the output equals difflib's."""
+        old = [f"line {i}\n" for i in range(40)]
+        new = list(old)
+        new[5] = "changed 5\n"
+        del new[20]
+        new.insert(33, "added\n")
+        expected = "".join(difflib.unified_diff(old, new, "a/file", "b/file"))
+        assert generate_diff("".join(old), "".join(new)).diff_text == expected
+
+    @pytest.mark.skipif(shutil.which("patch") is None, reason="patch is not installed")
+    def test_gnu_patch_accepts_diff(self, tmp_path: Path) -> None:
+        old = "".join(_lockfile(300))
+        new = "".join(_mutate(_lockfile(300), 60, seed=5)).rstrip("\n")
+        target = tmp_path / "file"
+        target.write_text(old)
+        diff_text = generate_diff(old, new).diff_text
+        completed = subprocess.run(
+            ["patch", "--quiet", "--force", str(target)],
+            input=diff_text, capture_output=True, text=True, timeout=60,
+        )
+        assert completed.returncode == 0, completed.stdout + completed.stderr
+        assert target.read_text() == new
+
+
+class TestLargeInputs:
+    """Round trips on 100k-line inputs."""
+
+    LINE_COUNT = 100_000
+
+    @pytest.mark.parametrize("edits", [10, 1000])
+    def test_lockfile_round_trip(self, edits: int) -> None:
+        old = _lockfile(self.LINE_COUNT // 6)
+        new = _mutate(old, edits, seed=edits)
+        result = generate_diff("".join(old), "".join(new))
+        assert apply_unified_diff("".join(old), result.diff_text) == "".join(new)
+        assert (result.lines_added, result.lines_removed) == _counts(result.diff_text)
+
+    def test_repeated_lines_round_trip(self) -> None:
+        old = ["x\n", "y\n", "\n"] * (self.LINE_COUNT // 3)
+        new = _mutate(old, 300, seed=3)
+        result = generate_diff("".join(old), "".join(new))
+        assert apply_unified_diff("".join(old), result.diff_text) == "".join(new)
+
+    def test_unrelated_files(self) -> None:
+        """Lines that occur on one side only are all edits."""
+        old = [f"old {i}\n" for i in range(self.LINE_COUNT)]
+        new = [f"new {i}\n" for i in range(self.LINE_COUNT)]
+        result = generate_diff("".join(old), "".join(new))
+        assert (result.lines_added, result.lines_removed) == (self.LINE_COUNT, self.LINE_COUNT)
+
+
+@pytest.mark.skipif(
+    os.environ.get("PHASE21_BENCHMARK") != "1",
+    reason="Benchmark requires PHASE21_BENCHMARK=1",
+)
+class TestLargeInputBenchmark:
+    """Wall-clock benchmarks on 100k-line inputs."""
+
+    LINE_COUNT = 100_000
+
+    def _time(self, old: list[str], new: list[str]) -> float:
+        start = time.perf_counter()
+        generate_diff("".join(old), "".join(new))
+        return time.perf_counter() - start
+
+    @pytest.mark.parametrize("edits", [10, 1000])
+    def test_lockfile(self, edits: int) -> None:
+        old = _lockfile(self.LINE_COUNT // 6)
+        elapsed = self._time(old, _mutate(old, edits, seed=edits))
+        print(f"\nlockfile, {edits} edits: {elapsed:.3f}s")
+        assert elapsed < 10.0
+
+    def test_faster_than_difflib_on_lockfile(self) -> None:
+        old = _lockfile(self.LINE_COUNT // 6)
+        new = _mutate(old, 1000, seed=11)
+        elapsed = self._time(old, new)
+        start = time.perf_counter()
+        "".join(difflib.unified_diff(old, new, "a/file", "b/file"))
+        difflib_elapsed = time.perf_counter() - start
+        print(f"\nmyers {elapsed:.3f}s, difflib {difflib_elapsed:.3f}s")
+        assert elapsed * 5 < difflib_elapsed
+
+    def test_repeated_lines(self) -> None:
+        old = ["x\n", "y\n", "\n"] * (self.LINE_COUNT // 3)
+        elapsed = self._time(old, _mutate(old, 300, seed=3))
+        print(f"\nrepeated lines: {elapsed:.3f}s")
+        assert elapsed < 10.0
+
+    def test_unrelated_files(self) -> None:
+        old = [f"old {i}\n" for i in range(self.LINE_COUNT)]
+        new = [f"new {i}\n" for i in range(self.LINE_COUNT)]
+        elapsed = self._time(old, new)
+        print(f"\nunrelated files: {elapsed:.3f}s")
+        assert elapsed < 10.0
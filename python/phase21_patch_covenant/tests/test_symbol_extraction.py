@@ -0,0 +1,155 @@
+"""
+Phase-21 Symbol Extraction Tests
+
+Tests verifying syntax-tree symbol extraction for Python diffs:
+- Changed lines map to their innermost enclosing qualified symbol
+- Non-Python files and unparseable Python use the regex path
+- Each image is parsed only once per diff
+"""
+
+import ast
+from unittest.mock import patch
+
+from phase21_patch_covenant.diff_generator import (
+    extract_symbols_from_diff,
+    extract_symbols_from_sources,
+    generate_diff,
+)
+from phase21_patch_covenant.symbol_validator import validate_symbols
+from phase21_patch_covenant.types import SymbolConstraints
+
+
+OLD_SOURCE = '''\
+import functools
+
+TIMEOUT = 30
+RETRIES, BACKOFF = 3, 1.5
+
+
+@functools.lru_cache
+def cached_lookup(key):
+    return key
+
+
+class Client:
+    default_host = "localhost"
+
+    def fetch(
+        self,
+        url,
+    ):
+        response = self._get(url)
+        return response
+
+    def close(self):
+        pass
+
+
+if True:
+    def conditional_helper():
+        return 1
+'''
+
+
+def _symbols(new_source: str) -> tuple[str, ...]:
+    return generate_diff(OLD_SOURCE, new_source, filename="client.py").symbols_modified
+
+
+class TestSyntaxTreeExtraction:
+    """Changed lines map to qualified enclosing symbols."""
+
+    def test_body_change_reports_method(self) -> None:
+        """A body change is found even though the def line is unchanged."""
+        new = OLD_SOURCE.replace("return response", "return response.json()")
+        assert _symbols(new) == ("Client.fetch",)
+
+    def test_multi_line_signature(self) -> None:
+        new = OLD_SOURCE.replace("        url,\n", "        url,\n        timeout=None,\n")
+        assert _symbols(new) == ("Client.fetch",)
+
+    def test_decorator_change(self) -> None:
+        new = OLD_SOURCE.replace("@functools.lru_cache", "@functools.cache")
+        assert _symbols(new) == ("cached_lookup",)
+
+    def test_module_and_class_assignments(self) -> None:
+        new = (OLD_SOURCE.replace("TIMEOUT = 30", "TIMEOUT = 60")
+               .replace('"localhost"', '"example.com"')
+               .replace("3, 1.5", "5, 2.0"))
+        assert _symbols(new) == ("TIMEOUT", "RETRIES", "BACKOFF", "Client.default_host")
+
+    def test_local_assignment_belongs_to_function(self) -> None:
+        new = OLD_SOURCE.replace("response = self._get(url)", "response = self._post(url)")
+        assert _symbols(new) == ("Client.fetch",)
+
+    def test_removed_and_added_symbols(self) -> None:
+        new = OLD_SOURCE.replace(
+            "    def close(self):\n        pass\n",
+            "    def shutdown(self):\n        pass\n",
+        )
+        assert _symbols(new) == ("Client.close", "Client.shutdown")
+
+    def test_symbol_inside_block(self) -> None:
+        new = OLD_SOURCE.replace("return 1", "return 2")
+        assert _symbols(new) == ("conditional_helper",)
+
+    def test_import_change_has_no_symbol(self) -> None:
+        new = OLD_SOURCE.replace("import functools", "import functools as ft")
+        assert _symbols(new) == ()
+
+    def test_validation_sees_every_symbol(self) -> None:
+        """A method the regex path misses is blocked by the allowlist."""
+        new = OLD_SOURCE.replace("return response", "return eval(response)")
+        constraints = SymbolConstraints(
+            allowlist=frozenset({"cached_lookup"}),
+            denylist=frozenset(),
+            version="1.0.0",
+        )
+        assert extract_symbols_from_diff(generate_diff(OLD_SOURCE, new).diff_text) == []
+        result = validate_symbols(list(_symbols(new)), constraints)
+        assert result.passed is False
+        assert result.blocked_symbols == ("Client.fetch",)
+
+
+class TestFallback:
+    """Non-Python and unparseable sources use the regex path."""
+
+    def test_non_python_file_uses_regex(self) -> None:
+        old = "def a():\n    pass\n"
+        new = "def b():\n    pass\n"
+        result = generate_diff(old, new, filename="notes.txt")
+        assert result.symbols_modified == ("a", "b")
+        assert result.diff_text.startswith("--- a/notes.txt\n+++ b/notes.txt\n")
+
+    def test_unparseable_python_uses_regex(self) -> None:
+        old = "def a(:\n    x = 1\n"
+        new = "def a(:\n    x = 2\n"
+        assert extract_symbols_from_sources(old, new) is None
+        assert generate_diff(old, new, filename="broken.py").symbols_modified == ("x",)
+
+    def test_lone_carriage_return_uses_regex(self) -> None:
+        old = "def a():\r    return 1\n"
+        new = "def a():\r    return 2\n"
+        assert extract_symbols_from_sources(old, new) is None
+
+    def test_without_filename_behaviour_unchanged(self) -> None:
+        new = OLD_SOURCE.replace("TIMEOUT = 30", "TIMEOUT = 60")
+        result = generate_diff(OLD_SOURCE, new)
+        assert result.symbols_modified == ("TIMEOUT",)
+        assert result.diff_text.startswith("--- a/file\n+++ b/file\n")
+
+
+class TestParseOnce:
+    """Each image is parsed exactly once per diff."""
+
+    def test_large_file_parsed_once_per_image(self) -> None:
+        functions = [f"def function_{i}(value):\n    return value + {i}\n\n" for i in range(20000)]
+        old = "".join(functions)
+        functions[123] = functions[123].replace("+ 123", "- 123")
+        functions[19000] = functions[19000].replace("+ 19000", "* 2")
+        new = "".join(functions)
+
+        with patch("phase21_patch_covenant.diff_generator.ast.parse",
+                   side_effect=ast.parse) as parse:
+            result = generate_diff(old, new, filename="big.py")
+        assert parse.call_count == 2
+        assert result.symbols_modified == ("function_123", "function_19000")
@@ -21,6 +21,7 @@ from kali_mcp.orchestrator import (
     WorkflowStep,
     WorkflowResult,
     WorkflowStatus,
+    WorkflowCycleError,
     ToolSelector,
     TargetAnalyzer,
 )
@@ -227,6 +228,131 @@ class TestWorkflowEngine:
         assert len(engine._results) == 0
 
 
+class TestWorkflowScheduling:
+    """Tests for dependency-ordered and concurrent phase execution."""
+
+    @staticmethod
+    def _engine(graph, max_parallel=1, delay=0.0, fail=(), log=None):
+        """Build an engine from a {name: [dependencies]} mapping."""
+        engine = WorkflowEngine(max_parallel=max_parallel)
+        state = {"running": 0, "peak": 0}
+
+        def make_handler(name):
+            async def handler(context):
+                state["running"] += 1
+                state["peak"] = max(state["peak"], state["running"])
+                if log is not None:
+                    log.append(("start", name))
+                try:
+                    await asyncio.sleep(delay)
+                    if name in fail:
+                        raise ValueError(f"{name} failed")
+                    return {"step": name}
+                finally:
+                    state["running"] -= 1
+                    if log is not None:
+                        log.append(("end", name))
+            return handler
+
+        for name, deps in graph.items():
+            engine.register_step(WorkflowStep(
+                name=name,
+                phase=HuntPhase.RECONNAISSANCE,
+                handler=make_handler(name),
+                dependencies=deps,
+            ))
+        return engine, state
+
+    def test_plan_keeps_valid_registration_order(self):
+        engine, _ = self._engine({"a": [], "b": ["a"], "c": [], "d": ["b", "c"]})
+        assert engine.plan_phase(HuntPhase.RECONNAISSANCE) == ["a", "b", "c", "d"]
+
+    def test_plan_reorders_out_of_order_registration(self):
+        engine, _ = self._engine({"late": ["early"], "early": []})
+        assert engine.plan_phase(HuntPhase.RECONNAISSANCE) == ["early", "late"]
+
+    @pytest.mark.asyncio
+    async def test_cycle_reported_before_any_step_runs(self):
+        log = []
+        engine, _ = self._engine({"a": [], "b": ["d"], "c": ["b"], "d": ["c"]}, log=log)
+        with pytest.raises(WorkflowCycleError) as exc_info:
+            await engine.execute_phase(HuntPhase.RECONNAISSANCE, {}, max_parallel=4)
+        assert sorted(exc_info.value.cycle[:-1]) == ["b", "c", "d"]
+        assert exc_info.value.cycle[0] == exc_info.value.cycle[-1]
+        assert log == []
+
+    def test_self_dependency_is_a_cycle(self):
+        engine, _ = self._engine({"a": ["a"]})
+        with pytest.raises(WorkflowCycleError):
+            engine.plan_phase(HuntPhase.RECONNAISSANCE)
+
+    @pytest.mark.asyncio
+    async def test_independent_steps_run_concurrently(self):
+        graph = {f"recon_{i}": [] for i in range(6)}
+        graph["merge"] = list(graph)
+        engine, state = self._engine(graph, max_parallel=3, delay=0.02)
+        results = await engine.execute_phase(HuntPhase.RECONNAISSANCE, {})
+        assert [r.step_name for r in results] == list(graph)
+        assert all(r.status == WorkflowStatus.COMPLETED for r in results)
+        assert state["peak"] == 3
+
+    @pytest.mark.asyncio
+    async def test_dependencies_finish_before_dependents_start(self):
+        log = []
+        graph = {"a": [], "b": [], "c": ["a"], "d": ["c", "b"]}
+        engine, _ = self._engine(graph, max_parallel=4, delay=0.01, log=log)
+        await engine.execute_phase(HuntPhase.RECONNAISSANCE, {})
+        for name, deps in graph.items():
+            for dep in deps:
+                assert log.index(("end", dep)) < log.index(("start", name))
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("fail", [set(), {"a"}, {"c"}, {"e"}])
+    async def test_concurrent_matches_sequential(self, fail):
+        graph = {"a": [], "b": ["a"], "c": [], "d": ["b", "c"], "e": ["d"]}
+        outcomes = []
+        for max_parallel in (1, 4):
+            engine, _ = self._engine(graph, max_parallel=max_parallel, fail=fail)
+            results = await engine.execute_phase(HuntPhase.RECONNAISSANCE, {})
+            outcomes.append({
+                r.step_name: (r.status, r.output, r.error) for r in results
+            })
+        sequential, concurrent = outcomes
+        if not fail:
+            assert concurrent == sequential
+            return
+        # Both modes report the failing step identically and stop; steps
+        # that ran in both modes have identical outcomes.
+        failed = [n for n, o in sequential.items() if o[0] == WorkflowStatus.FAILED]
+        assert failed == [n for n, o in concurrent.items() if o[0] == WorkflowStatus.FAILED]
+        for name in set(sequential) & set(concurrent):
+            assert concurrent[name] == sequential[name]
+        assert "e" not in concurrent or "e" in fail
+
+    @pytest.mark.asyncio
+    async def test_failure_stops_new_steps(self):
+        log = []
+        graph = {"slow": [], "bad": [], "after": ["slow"]}
+        engine, _ = self._engine(graph, max_parallel=2, fail={"bad"}, log=log)
+        results = await engine.execute_phase(HuntPhase.RECONNAISSANCE, {})
+        assert {r.step_name: r.status for r in results} == {
+            "slow": WorkflowStatus.COMPLETED,
+            "bad": WorkflowStatus.FAILED,
+        }
+        assert ("start", "after") not in log
+
+    @pytest.mark.asyncio
+    async def test_dependency_from_earlier_phase(self):
+        engine, _ = self._engine({"a": ["missing"], "b": []}, max_parallel=2)
+        results = await engine.execute_phase(HuntPhase.RECONNAISSANCE, {})
+        assert results[0].step_name == "a"
+        assert "dependency" in results[0].error.lower()
+
+    def test_invalid_max_parallel(self):
+        with pytest.raises(ValueError):
+            WorkflowEngine(max_parallel=0)
+
+
 # ============================================================================
 # Property Test 9.2: Target-Appropriate Scanning Strategy Selection
 # **Validates: Requirements 2.1**
@@ -25,6 +25,7 @@ from kali_mcp.server import (
     SessionManager,
     ResponseFormatter,
     ToolDefinition,
+    FindingIndex,
 )
 from kali_mcp.types import (
     Target,
@@ -515,6 +516,237 @@ class TestServerToolHandlers:
             await server.handle_tool_call("nonexistent_tool", {})
 
 
+class TestBatchRequests:
+    """Tests for JSON-RPC batches and concurrent dispatch."""
+
+    @staticmethod
+    def _register_slow_tool(server, log, delay=0.02):
+        async def handler(label: str, session_id=None):
+            log.append(("start", label))
+            await asyncio.sleep(delay)
+            log.append(("end", label))
+            return {"label": label}
+
+        server.tool_registry.register(ToolDefinition(
+            name="slow",
+            description="Slow test tool",
+            input_schema={"type": "object", "properties": {}},
+            handler=handler,
+        ))
+
+    @staticmethod
+    def _call(request_id, label, session_id=None):
+        arguments = {"label": label}
+        if session_id is not None:
+            arguments["session_id"] = session_id
+        return {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "method": "tools/call",
+            "params": {"name": "slow", "arguments": arguments},
+        }
+
+    @pytest.mark.asyncio
+    async def test_batch_responses_in_request_order(self):
+        server = MCPServer()
+        log = []
+        self._register_slow_tool(server, log)
+        batch = [self._call(i, f"r{i}") for i in range(5)]
+        responses = await server.handle_message(batch)
+        assert [r["id"] for r in responses] == list(range(5))
+        assert [r["result"]["label"] for r in responses] == [f"r{i}" for i in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_independent_requests_run_concurrently(self):
+        server = MCPServer()
+        log = []
+        self._register_slow_tool(server, log)
+        await server.handle_message([self._call(i, f"r{i}") for i in range(4)])
+        # Every request starts before any finishes
+        assert [event for event, _ in log[:4]] == ["start"] * 4
+
+    @pytest.mark.asyncio
+    async def test_same_session_requests_keep_order(self):
+        server = MCPServer()
+        log = []
+        self._register_slow_tool(server, log)
+        batch = [
+            self._call(1, "a1", session_id="A"),
+            self._call(2, "b1", session_id="B"),
+            self._call(3, "a2", session_id="A"),
+            self._call(4, "a3", session_id="A"),
+        ]
+        await server.handle_message(batch)
+        session_a = [entry for entry in log if entry[1].startswith("a")]
+        assert session_a == [
+            ("start", "a1"), ("end", "a1"),
+            ("start", "a2"), ("end", "a2"),
+            ("start", "a3"), ("end", "a3"),
+        ]
+        # Session B is not held up behind session A
+        assert log.index(("start", "b1")) < log.index(("end", "a1"))
+        assert not server._session_tails
+
+    @pytest.mark.asyncio
+    async def test_session_order_across_separate_calls(self):
+        server = MCPServer()
+        log = []
+        self._register_slow_tool(server, log)
+        requests = [
+            MCPRequest(id=str(i), method="tools/call",
+                       params={"name": "slow", "arguments": {"label": f"s{i}", "session_id": "S"}})
+            for i in range(3)
+        ]
+        await asyncio.gather(*(server.handle_request(r) for r in requests))
+        assert [label for event, label in log if event == "start"] == ["s0", "s1", "s2"]
+
+    @pytest.mark.asyncio
+    async def test_read_only_poll_not_queued_behind_session(self):
+        server = MCPServer()
+        log = []
+        self._register_slow_tool(server, log, delay=0.2)
+        created = await server.handle_tool_call("create_session", {"target_domain": "example.com"})
+        session_id = created["session_id"]
+        poll = {
+            "jsonrpc": "2.0",
+            "id": 2,
+            "method": "tools/call",
+            "params": {"name": "get_findings", "arguments": {"session_id": session_id}},
+        }
+        slow = asyncio.ensure_future(server.handle_message(self._call(1, "scan", session_id)))
+        await asyncio.sleep(0)
+        response = await server.handle_message(poll)
+        assert response["result"]["total"] == 0
+        # The poll finished while the slow call was still running
+        assert log == [("start", "scan")]
+        assert not slow.done()
+        await slow
+        assert not server._session_tails
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit(self):
+        server = MCPServer(max_concurrent_requests=2)
+        log = []
+        self._register_slow_tool(server, log)
+        await server.handle_message([self._call(i, f"r{i}") for i in range(4)])
+        running = peak = 0
+        for event, _ in log:
+            running += 1 if event == "start" else -1
+            peak = max(peak, running)
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_notifications_and_invalid_entries(self):
+        server = MCPServer()
+        notification = {"jsonrpc": "2.0", "method": "tools/list"}
+        responses = await server.handle_message(
+            [notification, 42, {"jsonrpc": "2.0", "id": 7, "method": "tools/list"}]
+        )
+        assert [r["id"] for r in responses] == [None, 7]
+        assert responses[0]["error"]["code"] == -32600
+        assert "tools" in responses[1]["result"]
+        assert await server.handle_message([notification]) is None
+
+    @pytest.mark.asyncio
+    async def test_single_request_and_parse_errors(self):
+        server = MCPServer()
+        response = await server.handle_message('{"jsonrpc": "2.0", "id": "x", "method": "tools/list"}')
+        assert response["id"] == "x"
+        assert (await server.handle_message("{not json"))["error"]["code"] == -32700
+        assert (await server.handle_message([]))["error"]["code"] == -32600
+
+    def test_invalid_concurrency_limit(self):
+        with pytest.raises(ValueError):
+            MCPServer(max_concurrent_requests=0)
+
+
+class TestFindingIndex:
+    """Tests for indexed finding queries."""
+
+    @staticmethod
+    def _populate(session, count=60):
+        severities = list(Severity)
+        classifications = list(FindingClassification)
+        for i in range(count):
+            finding = create_test_finding(
+                severity=severities[i % len(severities)],
+                classification=classifications[i % len(classifications)],
+            )
+            finding.target = f"host{i % 4}.example.com"
+            session.add_finding(finding)
+
+    @staticmethod
+    def _scan(session, severity=None, classification=None, target=None):
+        return [
+            f for f in session.findings
+            if (severity is None or f.severity.value == severity)
+            and (classification is None or f.classification.value == classification)
+            and (target is None or f.target == target)
+        ]
+
+    @given(
+        severity=st.sampled_from([None] + [s.value for s in Severity]),
+        classification=st.sampled_from([None] + [c.value for c in FindingClassification]),
+        target=st.sampled_from([None, "host1.example.com", "missing.example.com"]),
+    )
+    @settings(max_examples=50)
+    def test_query_matches_linear_scan(self, severity, classification, target):
+        session = create_test_session()
+        self._populate(session)
+        index = FindingIndex()
+        assert index.query(session, severity, classification, target) == self._scan(
+            session, severity, classification, target
+        )
+
+    def test_appended_findings_are_indexed(self):
+        session = create_test_session()
+        index = FindingIndex()
+        self._populate(session, count=10)
+        assert len(index.query(session, severity="high")) == 2
+        self._populate(session, count=10)
+        assert len(index.query(session, severity="high")) == 4
+        assert index.query(session, severity="high") == self._scan(session, severity="high")
+
+    def test_replaced_or_shrunk_list_rebuilds(self):
+        session = create_test_session()
+        index = FindingIndex()
+        self._populate(session, count=10)
+        index.query(session)
+        session.findings.pop()
+        assert index.query(session, severity="high") == self._scan(session, severity="high")
+        session.findings = session.findings[:3]
+        assert index.query(session, severity="high") == self._scan(session, severity="high")
+
+    def test_close_session_drops_index(self):
+        manager = SessionManager()
+        session = manager.create_session(target=Target(domain="example.com"))
+        self._populate(session, count=10)
+        manager.query_findings(session.id, severity="high")
+        assert session.id in manager.finding_index._entries
+        manager.close_session(session.id)
+        assert session.id not in manager.finding_index._entries
+        # Closed sessions stay queryable; the index is rebuilt on demand
+        assert manager.query_findings(session.id, severity="high") == self._scan(
+            session, severity="high"
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_findings_filters(self):
+        server = MCPServer()
+        created = await server.handle_tool_call("create_session", {"target_domain": "example.com"})
+        session = server.session_manager.get_session(created["session_id"])
+        self._populate(session)
+        result = await server.handle_tool_call("get_findings", {
+            "session_id": session.id,
+            "classification": "bug",
+            "severity": "critical",
+            "target": "host0.example.com",
+        })
+        expected = self._scan(session, "critical", "bug", "host0.example.com")
+        assert result["total"] == len(expected) > 0
+        assert [f["id"] for f in result["findings"]] == [f.id for f in expected]
+
+
 class TestIntegration:
     """Integration tests for MCP server."""
 